@@ -12,6 +12,7 @@ from .managers.account_manager import AccountManager
 from .managers.transaction_manager import TransactionManager
 from .managers.admin_manager import AdminManager
 from .managers.scheduler_manager import SchedulerManager
+from .utils.ledger_writer import close_ledger_writer
 
 
 class BankSystem:
@@ -83,6 +84,9 @@ class BankSystem:
             if hasattr(self, 'scheduler_manager') and self.scheduler_manager:
                 self.scheduler_manager.stop()
             
+            # 대기 중인 거래 원장 그룹 커밋
+            close_ledger_writer()
+            
             # 데이터베이스 연결 종료
             close_database_connection()
             
@@ -156,7 +160,10 @@ class BankSystem:
             print("✅ 계좌관리\t\t✅ 이자관리\t\t✅ 시스템관리\t\t✅ 기타")
             print("=" * 120)
             print("1. 전체계좌조회\t\t3. 수동이자지급\t\t5. 스케줄러상태\t\t6. 로그아웃")
-            print("2. 사용자별계좌조회\t\t4. 이자지급내역조회\t\t0. 종료")
+            print("2. 사용자별계좌조회\t\t4. 이자지급내역조회\t\t7. 쿼리통계\t\t0. 종료")
+            print("\t\t\t\t\t\t\t\t8. 보고서내보내기")
+            print("\t\t\t\t\t\t\t\t9. 대량등록")
+            print("\t\t\t\t\t\t\t\t10. 원장대사")
             print("=" * 120)
             choice = input("메뉴선택: ").strip()
             
@@ -177,10 +184,22 @@ class BankSystem:
                 self.list()
             elif choice == "6":
                 self.logout()
+            elif choice == "7":
+                self.show_query_stats()
+                self.list()
+            elif choice == "8":
+                self.admin_manager.export_reports()
+                self.list()
+            elif choice == "9":
+                self.admin_manager.import_customers()
+                self.list()
+            elif choice == "10":
+                self.admin_manager.reconcile_ledger()
+                self.list()
             elif choice == "0":
                 self.exit()
             else:
-                print("0 ~ 6번의 숫자만 입력이 가능합니다.")
+                print("0 ~ 10번의 숫자만 입력이 가능합니다.")
                 self.menu()
         
         else:
@@ -238,8 +257,12 @@ class BankSystem:
             if self.scheduler_manager.is_running():
                 print("상태: 실행 중")
                 print(self.scheduler_manager.get_next_execution_info())
-                print("실행 시간: 매월 마지막 날 오후 2시")
-                print("실행 내용: 모든 계좌 이자 일괄 지급")
+                print("-" * 120)
+                print(f"{'작업':<30} {'다음 실행':<22} {'마지막 실행':<22} {'결과':<20}")
+                for job in self.scheduler_manager.get_jobs():
+                    last_run = job.last_run.strftime('%Y-%m-%d %H:%M:%S') if job.last_run else '-'
+                    print(f"{job.description:<30} {job.due_time.strftime('%Y-%m-%d %H:%M:%S'):<22} "
+                          f"{last_run:<22} {job.last_result or '-':<20}")
             else:
                 print("상태: 중지됨")
         else:
@@ -248,6 +271,38 @@ class BankSystem:
         print("=" * 120)
         input("엔터키를 누르면 메뉴로 돌아갑니다.")
     
+    def show_query_stats(self):
+        """SQL 문장별 실행 통계 및 느린 쿼리 로그 표시"""
+        print("\n[쿼리 통계]")
+        print("=" * 120)
+        print(self.db.get_query_report(limit=20))
+        print("-" * 120)
+        print(f"전체 DB 왕복: {self.db.get_round_trip_count(current_thread_only=False):,}회")
+        
+        pool_stats = self.db.get_pool_stats()
+        if pool_stats:
+            print(f"세션 풀: 사용 중 {pool_stats['busy']} / 열림 {pool_stats['open']} "
+                  f"(최대 {pool_stats['max']}), 평균 대기 {pool_stats['avg_wait_time'] * 1000:.2f}ms")
+        
+        # DB 서버 기준 파싱 통계 (Oracle V$SQL, SQLite는 없음)
+        try:
+            server_stats = self.db.get_server_parse_stats(limit=10)
+        except Exception as e:
+            print(f"서버 파싱 통계 조회 오류: {e}")
+            server_stats = None
+        
+        if server_stats:
+            print("-" * 120)
+            print(f"{'서버 문장':<50} {'실행':>10} {'파싱':>10} {'하드 파싱':>10}")
+            for item in server_stats:
+                label = item['name'] or (item['sql_text'] or '')[:48]
+                print(f"{label:<50} {item['executions']:>10,} {item['parse_calls']:>10,} {item['loads']:>10,}")
+        print("=" * 120)
+        
+        if self.user_manager.input_helper.input_yes_no("통계를 초기화하시겠습니까?"):
+            self.db.reset_query_stats()
+            print("쿼리 통계가 초기화되었습니다.")
+    
     def execute_manual_interest_payment(self):
         """수동 이자 지급"""
         print("\n[수동 이자 지급]")
@@ -0,0 +1,10 @@
+"""
+배치 실행 진입점
+- pay_interest: 이자 병렬 지급 (월말 배치)
+- import_customers: 사용자/계좌 대량 등록 (CSV/엑셀)
+- reconcile: 원장-잔액 대사 (야간 배치)
+- export_reports: 관리자 보고서 내보내기 (CSV, Parquet/Arrow)
+
+각 모듈은 python -m으로 실행하므로 여기서 미리 가져오지 않음
+(매니저 패키지 안에서 실행하면 패키지 초기화 때 이미 가져온 모듈을 다시 실행하게 됨)
+"""
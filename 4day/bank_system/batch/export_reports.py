@@ -0,0 +1,45 @@
+"""
+관리자 보고서 내보내기 실행 진입점 (야간 배치용)
+실행: python -m bank_system.batch.export_reports accounts --format csv --output accounts.csv
+      python -m bank_system.batch.export_reports transactions --start 2025-01-01 --end 2025-02-01 --format parquet
+"""
+
+import argparse
+from datetime import datetime, timedelta
+from ..database import configure_database_connection, close_database_connection
+from ..utils.report_exporter import ReportExporter
+
+
+def main():
+    """보고서 내보내기 실행 (야간 배치용)"""
+    parser = argparse.ArgumentParser(description="관리자 보고서 내보내기")
+    parser.add_argument('report', choices=list(ReportExporter.REPORTS))
+    parser.add_argument('--format', choices=ReportExporter.FORMATS, default='csv')
+    parser.add_argument('--output', default=None, help="출력 파일 경로 (기본값: EXPORT_CONFIG['output_dir'])")
+    parser.add_argument('--start', default=None, help="거래내역 시작일 (YYYY-MM-DD, 기본값: 어제)")
+    parser.add_argument('--end', default=None, help="거래내역 종료일 (YYYY-MM-DD, 해당 일 미포함, 기본값: 오늘)")
+    parser.add_argument('--chunk-size', type=int, default=None)
+    parser.add_argument('--backend', choices=['oracle', 'sqlite'], default=None,
+                        help="저장소 백엔드 (기본값: DATABASE_CONFIG['backend'])")
+    parser.add_argument('--sqlite-path', default=None, help="SQLite DB 파일 경로")
+    args = parser.parse_args()
+
+    start_date = end_date = None
+    if args.report == 'transactions':
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        end_date = datetime.strptime(args.end, '%Y-%m-%d') if args.end else today
+        start_date = datetime.strptime(args.start, '%Y-%m-%d') if args.start else end_date - timedelta(days=1)
+
+    options = {'path': args.sqlite_path} if args.backend == 'sqlite' and args.sqlite_path else {}
+    configure_database_connection(args.backend, **options)
+
+    try:
+        exporter = ReportExporter(args.chunk_size)
+        result = exporter.export(args.report, args.output, args.format, start_date, end_date)
+        print(f"{result['path']}: {result['rows']:,}행, {result['chunks']:,}개 청크, {result['elapsed']:.2f}초")
+    finally:
+        close_database_connection()
+
+
+if __name__ == "__main__":
+    main()
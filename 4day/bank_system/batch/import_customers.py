@@ -0,0 +1,45 @@
+"""
+사용자/계좌 대량 등록 실행 진입점 (제휴사 고객 이전용, 파일 형식은 ImportManager 참고)
+실행: python -m bank_system.batch.import_customers customers.csv --rejects customers_rejects.csv
+      python -m bank_system.batch.import_customers customers.xlsx --sheet 고객
+"""
+
+import argparse
+from typing import Dict, Any
+from ..database import configure_database_connection, close_database_connection
+from ..managers.import_manager import ImportManager
+
+
+def main():
+    """사용자/계좌 대량 등록 실행 (제휴사 고객 이전용)"""
+    parser = argparse.ArgumentParser(description="사용자/계좌 대량 등록")
+    parser.add_argument('path', help="입력 파일 (.csv 또는 .xlsx)")
+    parser.add_argument('--rejects', default=None, help="거부 파일 경로 (기본값: 입력파일_rejects.csv)")
+    parser.add_argument('--sheet', default=None, help="엑셀 시트 이름 (기본값: 첫 번째 시트)")
+    parser.add_argument('--encoding', default=None, help="CSV 인코딩 (기본값: IMPORT_CONFIG)")
+    parser.add_argument('--batch-size', type=int, default=None)
+    parser.add_argument('--backend', choices=['oracle', 'sqlite'], default=None,
+                        help="저장소 백엔드 (기본값: DATABASE_CONFIG['backend'])")
+    parser.add_argument('--sqlite-path', default=None, help="SQLite DB 파일 경로")
+    args = parser.parse_args()
+
+    options = {'path': args.sqlite_path} if args.backend == 'sqlite' and args.sqlite_path else {}
+    configure_database_connection(args.backend, **options)
+
+    def progress(state: Dict[str, Any]):
+        print(f"{state['rows']:,}행: 사용자 {state['users']:,}명, 계좌 {state['accounts']:,}개, "
+              f"거부 {state['rejected']:,}행 ({state['elapsed']:.1f}초)")
+
+    try:
+        importer = ImportManager(args.batch_size)
+        result = importer.import_file(args.path, args.rejects, args.sheet, args.encoding, progress)
+        print(f"완료: {result['rows']:,}행, 사용자 {result['users']:,}명, 계좌 {result['accounts']:,}개, "
+              f"거부 {result['rejected']:,}행, {result['elapsed']:.2f}초")
+        if result['rejects_path']:
+            print(f"거부 파일: {result['rejects_path']}")
+    finally:
+        close_database_connection()
+
+
+if __name__ == "__main__":
+    main()
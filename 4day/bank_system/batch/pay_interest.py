@@ -0,0 +1,38 @@
+"""
+이자 병렬 지급 실행 진입점 (월말 배치용)
+실행: python -m bank_system.batch.pay_interest --workers 8   (중단된 실행이 있으면 이어서 지급)
+      python -m bank_system.batch.pay_interest --workers 4 --backend sqlite --sqlite-path bank.db
+      (지급을 끝내지 못하면 종료 코드 1)
+"""
+
+import argparse
+from ..database import configure_database_connection, close_database_connection
+from ..managers.admin_manager import AdminManager
+
+
+def main():
+    """이자 병렬 지급 실행 (월말 배치용, 실패한 청크/구간이 있거나 다른 실행이 진행 중이면 종료 코드 1)"""
+    parser = argparse.ArgumentParser(description="이자 병렬 지급")
+    parser.add_argument('--workers', type=int, default=None, help="작업 프로세스 수 (기본값: BATCH_CONFIG)")
+    parser.add_argument('--chunk-size', type=int, default=None)
+    parser.add_argument('--admin-id', default="BATCH_INTEREST")
+    parser.add_argument('--backend', choices=['oracle', 'sqlite'], default=None,
+                        help="저장소 백엔드 (기본값: DATABASE_CONFIG['backend'])")
+    parser.add_argument('--sqlite-path', default=None, help="SQLite DB 파일 경로")
+    args = parser.parse_args()
+
+    options = {'path': args.sqlite_path} if args.backend == 'sqlite' and args.sqlite_path else {}
+    configure_database_connection(args.backend, **options)
+
+    try:
+        completed = AdminManager().execute_interest_payment(args.admin_id, confirm=False,
+                                                            chunk_size=args.chunk_size, workers=args.workers)
+    finally:
+        close_database_connection()
+
+    if not completed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+원장-잔액 대사 실행 진입점 (야간 배치용)
+실행: python -m bank_system.batch.reconcile --workers 8
+      python -m bank_system.batch.reconcile --backend sqlite --sqlite-path bank.db --output recon.csv
+      (불일치가 있거나 실패한 구간이 있으면 종료 코드 1)
+"""
+
+import argparse
+from ..database import configure_database_connection, close_database_connection
+from ..managers.reconciliation_manager import ReconciliationManager
+
+
+def main():
+    """원장 대사 실행 (야간 배치용, 불일치나 실패한 구간이 있으면 종료 코드 1)"""
+    parser = argparse.ArgumentParser(description="원장-잔액 대사")
+    parser.add_argument('--workers', type=int, default=None, help="작업 프로세스 수 (기본값: RECONCILE_CONFIG)")
+    parser.add_argument('--output', default=None, help="불일치 보고서 경로 (기본값: EXPORT_CONFIG['output_dir'])")
+    parser.add_argument('--tolerance', type=float, default=None, help="금액 비교 허용 오차")
+    parser.add_argument('--backend', choices=['oracle', 'sqlite'], default=None,
+                        help="저장소 백엔드 (기본값: DATABASE_CONFIG['backend'])")
+    parser.add_argument('--sqlite-path', default=None, help="SQLite DB 파일 경로")
+    args = parser.parse_args()
+
+    options = {'path': args.sqlite_path} if args.backend == 'sqlite' and args.sqlite_path else {}
+    configure_database_connection(args.backend, **options)
+
+    try:
+        result = ReconciliationManager(args.workers, args.tolerance).run(args.output)
+        ReconciliationManager.print_result(result)
+    finally:
+        close_database_connection()
+
+    if result['discrepancies'] or result['failed_shards']:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
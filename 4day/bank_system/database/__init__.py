@@ -1,11 +1,25 @@
 """
 데이터베이스 관련 모듈
 - connection: 데이터베이스 연결 관리
+- async_connection: 비동기 데이터베이스 연결 관리 (asyncio)
+- backend: 저장소 백엔드 (Oracle, SQLite)
+- query_stats: SQL 문장별 실행 통계 및 느린 쿼리 로그
 - config: 데이터베이스 설정 및 SQL 쿼리
 """
 
-from .connection import DatabaseConnection, get_database_connection, close_database_connection
-from .config import DATABASE_CONFIG, POOL_CONFIG, SQLQueries
+from .connection import (DatabaseConnection, get_database_connection, close_database_connection,
+                         configure_database_connection)
+from .async_connection import (AsyncDatabaseConnection, get_async_database_connection,
+                               open_async_database_connection, close_async_database_connection)
+from .backend import DatabaseBackend, OracleBackend, create_backend
+from .config import (DATABASE_CONFIG, SQLITE_CONFIG, POOL_CONFIG, BATCH_CONFIG, CACHE_CONFIG,
+                     PAGE_CONFIG, QUERY_STATS_CONFIG, SERVER_CONFIG, LEDGER_CONFIG, EXPORT_CONFIG, IMPORT_CONFIG,
+                     RECONCILE_CONFIG, SCHEDULER_CONFIG, SQLQueries)
+from .query_stats import QueryStats
 
 __all__ = ['DatabaseConnection', 'get_database_connection', 'close_database_connection', 
-           'DATABASE_CONFIG', 'POOL_CONFIG', 'SQLQueries']
+           'configure_database_connection', 'AsyncDatabaseConnection', 'get_async_database_connection',
+           'open_async_database_connection', 'close_async_database_connection', 'DatabaseBackend', 'OracleBackend',
+           'create_backend', 'DATABASE_CONFIG', 'SQLITE_CONFIG', 'POOL_CONFIG', 'BATCH_CONFIG', 'CACHE_CONFIG', 'PAGE_CONFIG', 
+           'QUERY_STATS_CONFIG', 'SERVER_CONFIG', 'LEDGER_CONFIG', 'EXPORT_CONFIG', 'IMPORT_CONFIG', 'RECONCILE_CONFIG',
+           'SCHEDULER_CONFIG', 'SQLQueries', 'QueryStats']
@@ -0,0 +1,422 @@
+"""
+비동기 데이터베이스 연결 관리 클래스
+DatabaseConnection의 작업 단위(transaction)와 조회/갱신 API를 코루틴으로 제공
+(python-oracledb의 create_pool_async 기반, 이벤트 루프 하나에서 여러 요청의 DB 작업을 스레드 없이 동시에 진행)
+
+- 항상 세션 풀을 사용 (요청마다 세션을 대여/반납, 동시에 진행되는 작업 수는 POOL_CONFIG['max'])
+- 트랜잭션에 고정한 연결은 스레드가 아니라 태스크별로 보관 (contextvars)
+- SQLite 백엔드는 연결 작업을 풀 전용 스레드에서 실행하는 풀로 같은 인터페이스 제공 (개발/테스트용)
+"""
+
+import contextvars
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List
+from .config import POOL_CONFIG, QUERY_STATS_CONFIG
+from .backend import DatabaseBackend, create_backend
+from .query_stats import QueryStats, StatementCacheTracker, query_name
+
+
+class AsyncDatabaseConnection:
+    """비동기 세션 풀로 데이터베이스 작업을 처리하는 클래스 (한 이벤트 루프에서 사용)"""
+
+    def __init__(self, backend: DatabaseBackend, pool_config: Optional[Dict[str, Any]] = None):
+        """
+        비동기 데이터베이스 연결 정보 초기화
+
+        Args:
+            backend: 저장소 백엔드 (create_async_pool 지원 필요)
+            pool_config: 세션 풀 설정 (기본값: POOL_CONFIG)
+        """
+        self.backend = backend
+        self.pool_config = dict(POOL_CONFIG if pool_config is None else pool_config)
+        self.pool = None
+
+        # 트랜잭션 중인 태스크가 고정(pin)한 연결과 태스크별 DB 왕복 횟수
+        self._pinned = contextvars.ContextVar(f"async_db_pinned_{id(self)}", default=None)
+        self._task_round_trips = contextvars.ContextVar(f"async_db_round_trips_{id(self)}", default=0)
+        self._session = contextvars.ContextVar(f"async_db_session_{id(self)}", default=None)  # get_cursor 블록의 세션
+
+        # 세션 대여 통계와 전체 DB 왕복 횟수 (이벤트 루프 하나에서만 갱신하므로 잠금 불필요)
+        self._acquire_count = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._round_trips = 0
+
+        # SQL 문장별 실행 통계 (비활성화 시 None)
+        self.query_stats: Optional[QueryStats] = None
+        if QUERY_STATS_CONFIG.get('enabled', False):
+            self.query_stats = QueryStats(
+                QUERY_STATS_CONFIG.get('slow_query_ms', 200),
+                QUERY_STATS_CONFIG.get('slow_log_size', 100)
+            )
+        self.statement_cache = StatementCacheTracker(backend.statement_cache_size)
+
+        self.logger = logging.getLogger(__name__)
+
+    async def connect(self) -> bool:
+        """
+        비동기 세션 풀 생성 및 접속 확인
+
+        Returns:
+            bool: 연결 성공 여부
+        """
+        try:
+            self.pool = self.backend.create_async_pool(self.pool_config)
+
+            # 접속 정보 오류를 첫 요청이 아니라 시작 시점에 확인
+            async with self.get_cursor() as cursor:
+                await cursor.execute(self.backend.ping_query)
+                await cursor.fetchall()
+
+            self.logger.info(f"은행 계좌 시스템 DB 비동기 세션 풀 생성 성공! ({self.backend.name})")
+            return True
+
+        except self.backend.DatabaseError as e:
+            self.logger.error(f"데이터베이스 연결 실패: {e}")
+        except Exception as e:
+            self.logger.error(f"예상치 못한 오류: {e}")
+
+        await self.disconnect()
+        return False
+
+    async def disconnect(self):
+        """비동기 세션 풀 종료"""
+        try:
+            if self.pool:
+                await self.pool.close(force=True)
+                self.pool = None
+                self.logger.info("데이터베이스 비동기 세션 풀이 정상적으로 종료되었습니다.")
+        except self.backend.DatabaseError as e:
+            self.logger.error(f"DB 연결 종료 중 오류: {e}")
+
+    async def is_connected(self) -> bool:
+        """연결 상태 확인"""
+        try:
+            if self.pool:
+                async with self.get_cursor() as cursor:
+                    await cursor.execute(self.backend.ping_query)
+                    await cursor.fetchall()
+                return True
+        except Exception:
+            pass
+        return False
+
+    @asynccontextmanager
+    async def acquire_connection(self):
+        """
+        작업에 사용할 연결 대여
+
+        현재 태스크가 transaction() 안에 있으면 고정된 연결을 사용하고,
+        아니면 세션 풀에서 세션을 빌려 작업 후 반납
+
+        Usage:
+            async with db.acquire_connection() as connection:
+                cursor = connection.cursor()
+        """
+        pinned = self._pinned.get()
+        if pinned is not None:
+            yield pinned
+            return
+
+        connection = await self._acquire()
+        try:
+            self.backend.prepare_connection(connection)
+            yield connection
+        finally:
+            await self.pool.release(connection)
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        하나의 작업 단위를 트랜잭션으로 실행
+
+        블록 동안 풀 세션 하나를 현재 태스크에 고정하고, 블록이 끝나면 한 번 커밋하고
+        예외나 취소(CancelledError) 시 롤백한다.
+        이미 트랜잭션 안에서 호출되면 바깥 트랜잭션에 합류한다.
+        (블록 안에서 만든 태스크는 고정된 연결을 물려받으므로 트랜잭션 안에서 동시에 쿼리를 실행하지 않음)
+
+        Usage:
+            async with db.transaction():
+                await db.execute_update(SQLQueries.UPDATE_ACCOUNT_BALANCE, params)
+                await db.execute_many(SQLQueries.INSERT_TRANSACTION, params_list)
+        """
+        pinned = self._pinned.get()
+        if pinned is not None:
+            yield pinned
+            return
+
+        connection = await self._acquire()
+        try:
+            await self.backend.begin_async(connection)
+        except BaseException:
+            await self.pool.release(connection)
+            raise
+
+        token = self._pinned.set(connection)
+        try:
+            yield connection
+            self._count_round_trip()
+            await connection.commit()
+        except BaseException:
+            self._count_round_trip()
+            await connection.rollback()
+            raise
+        finally:
+            self._pinned.reset(token)
+            await self.pool.release(connection)
+
+    def in_transaction(self) -> bool:
+        """현재 태스크가 transaction() 블록 안에 있는지 확인"""
+        return self._pinned.get() is not None
+
+    async def _acquire(self):
+        """세션 풀에서 세션 대여 및 대기 시간 기록"""
+        if self.pool is None:
+            raise Exception("데이터베이스에 연결되지 않았습니다.")
+
+        start = time.perf_counter()
+        connection = await self.pool.acquire()
+        wait_time = time.perf_counter() - start
+
+        self._acquire_count += 1
+        self._total_wait_time += wait_time
+        if wait_time > self._max_wait_time:
+            self._max_wait_time = wait_time
+        return connection
+
+    def _count_round_trip(self):
+        """DB 왕복 1회 기록"""
+        self._task_round_trips.set(self._task_round_trips.get() + 1)
+        self._round_trips += 1
+
+    def _record(self, query: str, start: float, rows: int):
+        """문장 실행 통계 기록 (현재 get_cursor 블록의 세션 문장 캐시로 파싱 여부 판단)"""
+        if self.query_stats is not None:
+            parsed = not self.statement_cache.lookup(self._session.get(), query)
+            self.query_stats.record(query_name(query), time.perf_counter() - start, rows, 1, parsed)
+
+    def get_round_trip_count(self, current_task_only: bool = True) -> int:
+        """
+        DB 왕복 횟수 조회 (작업 전후 값의 차이로 작업당 왕복 횟수 측정)
+
+        Args:
+            current_task_only: True면 현재 태스크의 횟수, False면 전체 횟수
+
+        Returns:
+            int: 누적 왕복 횟수
+        """
+        return self._task_round_trips.get() if current_task_only else self._round_trips
+
+    def get_query_report(self, limit: Optional[int] = None, sort_by: str = 'total_time') -> str:
+        """SQL 문장별 통계와 느린 쿼리 로그를 표 형식 문자열로 반환"""
+        if self.query_stats is None:
+            return "쿼리 통계가 비활성화되어 있습니다. (QUERY_STATS_CONFIG['enabled'])"
+        return self.query_stats.format_report(limit, sort_by)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        세션 풀 통계 조회
+
+        Returns:
+            Dict: 풀 사용 현황 (busy, open, 대기 시간 등), 연결 전이면 빈 딕셔너리
+        """
+        if self.pool is None:
+            return {}
+
+        return {
+            'busy': self.pool.busy,
+            'open': self.pool.opened,
+            'min': self.pool.min,
+            'max': self.pool.max,
+            'acquire_count': self._acquire_count,
+            'total_wait_time': self._total_wait_time,
+            'avg_wait_time': self._total_wait_time / self._acquire_count if self._acquire_count else 0.0,
+            'max_wait_time': self._max_wait_time
+        }
+
+    @asynccontextmanager
+    async def get_cursor(self):
+        """
+        비동기 커서 관리
+
+        Usage:
+            async with db.get_cursor() as cursor:
+                await cursor.execute(SQLQueries.SELECT_ACCOUNT_BY_ID, params)
+                rows = await cursor.fetchall()
+        """
+        async with self.acquire_connection() as connection:
+            cursor = connection.cursor()
+            token = self._session.set(self.backend.session_key(connection))
+            try:
+                yield cursor
+            finally:
+                self._session.reset(token)
+                cursor.close()
+
+    async def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        SELECT 쿼리 실행
+
+        Args:
+            query: SQL 쿼리
+            params: 쿼리 매개변수
+
+        Returns:
+            List[Dict]: 쿼리 결과 (소문자 컬럼명 딕셔너리)
+        """
+        try:
+            async with self.get_cursor() as cursor:
+                self._count_round_trip()
+                start = time.perf_counter()
+                if params:
+                    await cursor.execute(query, params)
+                else:
+                    await cursor.execute(query)
+
+                columns = [desc[0].lower() for desc in cursor.description]
+                rows = await cursor.fetchall()
+                self._record(query, start, len(rows))
+                return [dict(zip(columns, row)) for row in rows]
+
+        except self.backend.DatabaseError as e:
+            self.logger.error(f"쿼리 실행 실패: {e}")
+            raise
+
+    async def execute_update(self, query: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """
+        INSERT, UPDATE, DELETE 쿼리 실행
+
+        Args:
+            query: SQL 쿼리
+            params: 쿼리 매개변수
+
+        Returns:
+            int: 영향받은 행 수
+        """
+        try:
+            async with self.get_cursor() as cursor:
+                self._count_round_trip()
+                start = time.perf_counter()
+                if params:
+                    await cursor.execute(query, params)
+                else:
+                    await cursor.execute(query)
+
+                self._record(query, start, max(cursor.rowcount or 0, 0))
+                return cursor.rowcount
+
+        except self.backend.DatabaseError as e:
+            self.logger.error(f"업데이트 실행 실패: {e}")
+            raise
+
+    async def execute_many(self, query: str, params_list: List[Dict[str, Any]]) -> int:
+        """
+        여러 행을 한 번에 처리하는 쿼리 실행
+
+        Args:
+            query: SQL 쿼리
+            params_list: 매개변수 리스트
+
+        Returns:
+            int: 처리된 행 수
+        """
+        try:
+            async with self.get_cursor() as cursor:
+                self._count_round_trip()
+                start = time.perf_counter()
+                await cursor.executemany(query, params_list)
+                self._record(query, start, max(cursor.rowcount or 0, 0))
+                return cursor.rowcount
+
+        except self.backend.DatabaseError as e:
+            self.logger.error(f"배치 실행 실패: {e}")
+            raise
+
+    async def execute_returning(self, cursor, query: str, params: Dict[str, Any],
+                                returning: Dict[str, type]) -> List[tuple]:
+        """
+        RETURNING ... INTO 절이 있는 DML 실행 (백엔드별 방식으로 결과 행 조회)
+
+        Args:
+            cursor: get_cursor()로 얻은 커서
+            query: DML 쿼리
+            params: 입력 매개변수
+            returning: RETURNING INTO 출력 변수 이름과 타입 (예: {'out_balance': float})
+
+        Returns:
+            List[tuple]: 변경된 행마다 RETURNING 컬럼 값 튜플
+        """
+        self._count_round_trip()
+        start = time.perf_counter()
+        rows = await self.backend.execute_returning_async(cursor, query, params, returning)
+        self._record(query, start, len(rows))
+        return rows
+
+    async def next_sequence_values(self, sequence_name: str, count: int) -> List[int]:
+        """
+        시퀀스 값 count개를 한 번의 왕복으로 예약
+
+        Args:
+            sequence_name: 시퀀스 이름 (예: 'seq_transaction')
+            count: 예약할 값 개수
+
+        Returns:
+            List[int]: 예약된 시퀀스 값 (오름차순)
+        """
+        try:
+            async with self.get_cursor() as cursor:
+                self._count_round_trip()
+                return sorted(await self.backend.next_sequence_values_async(cursor, sequence_name, count))
+
+        except self.backend.DatabaseError as e:
+            self.logger.error(f"시퀀스 조회 실패: {e}")
+            raise
+
+
+# 전역 비동기 데이터베이스 연결 인스턴스 (이벤트 루프 안에서 open_async_database_connection으로 생성)
+_async_db_connection: Optional[AsyncDatabaseConnection] = None
+
+
+async def open_async_database_connection(backend_name: Optional[str] = None,
+                                         **options) -> AsyncDatabaseConnection:
+    """
+    전역 비동기 데이터베이스 연결 생성 (비동기 매니저 생성 전에 이벤트 루프 안에서 호출)
+
+    Args:
+        backend_name: 백엔드 이름 ('oracle' 또는 'sqlite', 기본값: DATABASE_CONFIG['backend'])
+        **options: 백엔드 설정 덮어쓰기 (예: path='bench.db')
+
+    Returns:
+        AsyncDatabaseConnection: 비동기 데이터베이스 연결 객체
+    """
+    global _async_db_connection
+    await close_async_database_connection()
+
+    connection = AsyncDatabaseConnection(create_backend(backend_name, **options))
+    if not await connection.connect():
+        raise Exception("데이터베이스 연결에 실패했습니다.")
+
+    _async_db_connection = connection
+    return connection
+
+
+def get_async_database_connection() -> AsyncDatabaseConnection:
+    """
+    전역 비동기 데이터베이스 연결 인스턴스 반환
+
+    Returns:
+        AsyncDatabaseConnection: 비동기 데이터베이스 연결 객체
+    """
+    if _async_db_connection is None:
+        raise Exception("비동기 데이터베이스 연결이 없습니다. (open_async_database_connection 먼저 호출)")
+    return _async_db_connection
+
+
+async def close_async_database_connection():
+    """전역 비동기 데이터베이스 연결 종료"""
+    global _async_db_connection
+    if _async_db_connection:
+        await _async_db_connection.disconnect()
+        _async_db_connection = None
@@ -0,0 +1,311 @@
+"""
+저장소 백엔드 모듈
+DB 종류별 연결, 세션 풀, SQL 방언 차이를 DatabaseConnection 뒤로 숨김
+- OracleBackend: python-oracledb (운영 환경)
+- SQLiteBackend: 내장 SQLite (Oracle 없이 개발/부하 테스트용, sqlite_backend 모듈)
+"""
+
+from typing import Optional, Dict, Any, List
+from .config import DATABASE_CONFIG, SQLITE_CONFIG, SQLQueries
+
+try:
+    import oracledb
+except ImportError:  # SQLite 백엔드만 사용하는 환경
+    oracledb = None
+
+
+class DatabaseBackend:
+    """저장소 백엔드 기본 클래스 (DB 종류별로 상속하여 구현)"""
+
+    name = "base"
+    DatabaseError = Exception       # 백엔드 드라이버의 DB 오류 타입
+    IntegrityError = ()             # 무결성 제약(UNIQUE 등) 위반 오류 타입 (없으면 빈 튜플)
+    ping_query = SQLQueries.PING    # 연결 상태 확인 쿼리
+    statement_cache_size = 0        # 세션별 드라이버 문장 캐시 크기 (파싱 횟수 추정용)
+
+    def connect(self):
+        """자동 커밋 모드의 새 연결 생성"""
+        raise NotImplementedError
+
+    def create_pool(self, pool_config: Dict[str, Any]):
+        """
+        세션 풀 생성
+
+        반환하는 풀은 acquire(), release(connection), close(force), busy, opened, min, max를
+        제공해야 함 (oracledb.ConnectionPool과 같은 인터페이스)
+        """
+        raise NotImplementedError
+
+    def prepare_connection(self, connection):
+        """풀에서 대여한 연결을 자동 커밋 모드로 초기화"""
+
+    def begin(self, connection):
+        """연결에서 명시적 트랜잭션 시작 (transaction() 블록용)"""
+        raise NotImplementedError
+
+    def begin_read_only(self, connection):
+        """블록 안의 조회가 같은 시점을 보는 읽기 전용 트랜잭션 시작 (read_snapshot() 블록용)"""
+        raise NotImplementedError
+
+    def wrap_cursor(self, cursor):
+        """드라이버 커서를 그대로 쓰거나 방언 변환용 커서로 감싸서 반환"""
+        return cursor
+
+    def translate(self, query: str) -> str:
+        """SQLQueries(Oracle 방언) 쿼리를 백엔드 방언으로 변환"""
+        return query
+
+    def configure_cursor(self, cursor, arraysize: int, prefetchrows: Optional[int] = None):
+        """대량 조회용 커서 설정"""
+        cursor.arraysize = arraysize
+
+    def set_rowfactory(self, cursor, rowfactory):
+        """컬럼 값들을 위치 인자로 받는 행 생성 함수 설정"""
+        raise NotImplementedError
+
+    def execute_returning(self, cursor, query: str, params: Dict[str, Any],
+                          returning: Dict[str, type]) -> List[tuple]:
+        """
+        RETURNING ... INTO 절이 있는 DML 실행
+
+        Args:
+            cursor: 커서
+            query: DML 쿼리 (Oracle 방언)
+            params: 입력 매개변수
+            returning: RETURNING INTO 출력 변수 이름과 타입 (쿼리의 RETURNING 컬럼 순서)
+
+        Returns:
+            List[tuple]: 변경된 행마다 RETURNING 컬럼 값 튜플
+        """
+        raise NotImplementedError
+
+    def next_sequence_values(self, cursor, sequence_name: str, count: int) -> List[int]:
+        """시퀀스 값 count개 예약"""
+        raise NotImplementedError
+
+    def connect_options(self) -> Dict[str, Any]:
+        """다른 프로세스에서 같은 DB에 연결할 때 create_backend에 넘길 설정"""
+        return {}
+
+    def session_key(self, connection) -> Any:
+        """문장 캐시를 공유하는 단위(세션)의 식별 값 (연결 객체가 세션과 같으면 객체 자체)"""
+        return id(connection)
+
+    def server_parse_stats(self, cursor, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        DB 서버가 집계한 문장별 파싱/실행 횟수
+
+        Args:
+            cursor: 커서
+            limit: 조회할 문장 수 (파싱 횟수가 많은 순)
+
+        Returns:
+            Optional[List[Dict]]: sql_id, sql_text, executions, parse_calls, loads (하드 파싱),
+                                  서버 통계가 없는 백엔드는 None
+        """
+        return None
+
+    def create_async_pool(self, pool_config: Dict[str, Any]):
+        """
+        비동기 세션 풀 생성 (AsyncDatabaseConnection용)
+
+        반환하는 풀은 await acquire(), await release(connection), await close(force), busy, opened, min, max를,
+        연결은 cursor(), await commit(), await rollback()을, 커서는 await execute()/executemany()/fetch*()를
+        제공해야 함 (oracledb.AsyncConnectionPool과 같은 인터페이스, 커서는 방언 변환까지 끝난 상태로 반환)
+        """
+        raise NotImplementedError(f"{self.name} 백엔드는 비동기 연결을 지원하지 않습니다.")
+
+    async def begin_async(self, connection):
+        """비동기 연결에서 명시적 트랜잭션 시작"""
+        raise NotImplementedError
+
+    async def execute_returning_async(self, cursor, query: str, params: Dict[str, Any],
+                                      returning: Dict[str, type]) -> List[tuple]:
+        """RETURNING ... INTO 절이 있는 DML 실행 (비동기 커서, execute_returning 참고)"""
+        raise NotImplementedError
+
+    async def next_sequence_values_async(self, cursor, sequence_name: str, count: int) -> List[int]:
+        """시퀀스 값 count개 예약 (비동기 커서)"""
+        raise NotImplementedError
+
+
+class OracleBackend(DatabaseBackend):
+    """python-oracledb 기반 Oracle 백엔드"""
+
+    name = "oracle"
+
+    # 시퀀스별 블록 예약 쿼리
+    SEQUENCE_BLOCK_QUERIES = {
+        'seq_account': SQLQueries.GET_ACCOUNT_SEQ_BLOCK,
+        'seq_transaction': SQLQueries.GET_TRANSACTION_SEQ_BLOCK,
+        'seq_payment': SQLQueries.GET_PAYMENT_SEQ_BLOCK
+    }
+
+    def __init__(self, host: str = "localhost", port: int = 1521,
+                 service_name: str = "orcl", username: str = "jhw1",
+                 password: str = "1234", stmtcachesize: int = 20):
+        """
+        Oracle 접속 정보 초기화
+
+        Args:
+            host: 데이터베이스 호스트
+            port: 데이터베이스 포트
+            service_name: 서비스 이름
+            username: 사용자명
+            password: 비밀번호
+            stmtcachesize: 세션별 문장 캐시 크기 (캐시에 있는 문장은 다시 파싱하지 않음)
+        """
+        if oracledb is None:
+            raise Exception("oracledb 패키지가 설치되어 있지 않습니다. (pip install oracledb)")
+
+        self.DatabaseError = oracledb.DatabaseError
+        self.IntegrityError = oracledb.IntegrityError
+        self.username = username
+        self.password = password
+        self.dsn = f"{host}:{port}/{service_name}"
+        self.statement_cache_size = stmtcachesize
+        self._options = {'host': host, 'port': port, 'service_name': service_name,
+                         'username': username, 'password': password, 'stmtcachesize': stmtcachesize}
+
+    def connect(self):
+        """자동 커밋 모드의 새 연결 생성"""
+        connection = oracledb.connect(user=self.username, password=self.password, dsn=self.dsn,
+                                      stmtcachesize=self.statement_cache_size)
+
+        # 자동 커밋 설정 (Java의 setAutoCommit(true)와 동일)
+        connection.autocommit = True
+        return connection
+
+    def create_pool(self, pool_config: Dict[str, Any]):
+        """oracledb 세션 풀 생성"""
+        return oracledb.create_pool(
+            user=self.username,
+            password=self.password,
+            dsn=self.dsn,
+            min=pool_config.get('min', 1),
+            max=pool_config.get('max', 10),
+            increment=pool_config.get('increment', 1),
+            timeout=pool_config.get('timeout', 0),
+            wait_timeout=pool_config.get('wait_timeout', 0),
+            getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+            stmtcachesize=self.statement_cache_size
+        )
+
+    def prepare_connection(self, connection):
+        """반납된 세션은 autocommit 설정이 초기화되므로 매번 설정"""
+        connection.autocommit = True
+
+    def begin(self, connection):
+        """자동 커밋을 끄면 다음 DML부터 트랜잭션이 시작됨"""
+        connection.autocommit = False
+
+    def begin_read_only(self, connection):
+        """읽기 전용 트랜잭션 (이후 모든 조회가 트랜잭션 시작 시점의 읽기 일관성을 가짐)"""
+        connection.autocommit = False
+        cursor = connection.cursor()
+        try:
+            cursor.execute(SQLQueries.SET_TRANSACTION_READ_ONLY)
+        finally:
+            cursor.close()
+
+    def configure_cursor(self, cursor, arraysize: int, prefetchrows: Optional[int] = None):
+        """대량 조회용 커서 설정 (첫 왕복에 미리 가져올 행 수 포함)"""
+        cursor.arraysize = arraysize
+        if prefetchrows is not None:
+            cursor.prefetchrows = prefetchrows
+
+    def set_rowfactory(self, cursor, rowfactory):
+        """oracledb 커서는 rowfactory를 직접 지원"""
+        cursor.rowfactory = rowfactory
+
+    def execute_returning(self, cursor, query: str, params: Dict[str, Any],
+                          returning: Dict[str, type]) -> List[tuple]:
+        """출력 변수를 바인딩해 실행하고 행별 값으로 묶어 반환"""
+        out_vars = {name: cursor.var(value_type) for name, value_type in returning.items()}
+        cursor.execute(query, {**params, **out_vars})
+        return list(zip(*(var.getvalue() for var in out_vars.values())))
+
+    def next_sequence_values(self, cursor, sequence_name: str, count: int) -> List[int]:
+        """CONNECT BY로 NEXTVAL을 count번 한 번에 조회"""
+        cursor.execute(self.SEQUENCE_BLOCK_QUERIES[sequence_name], {'count': count})
+        return [int(row[0]) for row in cursor.fetchall()]
+
+    def connect_options(self) -> Dict[str, Any]:
+        """다른 프로세스에서 같은 DB에 연결할 때 create_backend에 넘길 설정"""
+        return dict(self._options)
+
+    def session_key(self, connection) -> Any:
+        """풀에서 대여할 때마다 연결 객체가 달라질 수 있으므로 서버 세션 번호 사용"""
+        session_id = getattr(connection, 'session_id', None)
+        if session_id is None:
+            return id(connection)
+        return (session_id, getattr(connection, 'serial_num', None))
+
+    def server_parse_stats(self, cursor, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """V$SQL의 현재 스키마 문장별 파싱/실행 횟수 (AWR의 parse call과 같은 값)"""
+        cursor.execute(SQLQueries.SELECT_SQL_PARSE_STATS, {'limit': limit})
+        columns = [desc[0].lower() for desc in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def create_async_pool(self, pool_config: Dict[str, Any]):
+        """oracledb 비동기 세션 풀 생성 (thin 모드, 세션 대기와 SQL 실행이 이벤트 루프를 막지 않음)"""
+        return oracledb.create_pool_async(
+            user=self.username,
+            password=self.password,
+            dsn=self.dsn,
+            min=pool_config.get('min', 1),
+            max=pool_config.get('max', 10),
+            increment=pool_config.get('increment', 1),
+            timeout=pool_config.get('timeout', 0),
+            wait_timeout=pool_config.get('wait_timeout', 0),
+            getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+            stmtcachesize=self.statement_cache_size
+        )
+
+    async def begin_async(self, connection):
+        """자동 커밋을 끄면 다음 DML부터 트랜잭션이 시작됨 (왕복 없음)"""
+        connection.autocommit = False
+
+    async def execute_returning_async(self, cursor, query: str, params: Dict[str, Any],
+                                      returning: Dict[str, type]) -> List[tuple]:
+        """출력 변수를 바인딩해 실행하고 행별 값으로 묶어 반환"""
+        out_vars = {name: cursor.var(value_type) for name, value_type in returning.items()}
+        await cursor.execute(query, {**params, **out_vars})
+        return list(zip(*(var.getvalue() for var in out_vars.values())))
+
+    async def next_sequence_values_async(self, cursor, sequence_name: str, count: int) -> List[int]:
+        """CONNECT BY로 NEXTVAL을 count번 한 번에 조회"""
+        await cursor.execute(self.SEQUENCE_BLOCK_QUERIES[sequence_name], {'count': count})
+        return [int(row[0]) for row in await cursor.fetchall()]
+
+
+def create_backend(name: Optional[str] = None, **options) -> DatabaseBackend:
+    """
+    설정에 맞는 저장소 백엔드 생성
+
+    Args:
+        name: 백엔드 이름 ('oracle' 또는 'sqlite', 기본값: DATABASE_CONFIG['backend'])
+        **options: 백엔드 설정 덮어쓰기 (예: sqlite의 path)
+
+    Returns:
+        DatabaseBackend: 백엔드 객체
+    """
+    name = name or DATABASE_CONFIG.get('backend', 'oracle')
+
+    if name == 'oracle':
+        config = {
+            'host': DATABASE_CONFIG['host'],
+            'port': DATABASE_CONFIG['port'],
+            'service_name': DATABASE_CONFIG['service_name'],
+            'username': DATABASE_CONFIG['username'],
+            'password': DATABASE_CONFIG['password'],
+            'stmtcachesize': DATABASE_CONFIG.get('stmtcachesize', 20)
+        }
+        config.update(options)
+        return OracleBackend(**config)
+
+    if name == 'sqlite':
+        from .sqlite_backend import SQLiteBackend
+        return SQLiteBackend(**{**SQLITE_CONFIG, **options})
+
+    raise ValueError(f"지원하지 않는 백엔드입니다: {name}")
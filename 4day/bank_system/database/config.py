@@ -4,19 +4,121 @@
 
 # Oracle 데이터베이스 연결 설정
 DATABASE_CONFIG = {
+    'backend': 'oracle',  # 저장소 백엔드 ('oracle' 또는 'sqlite')
     'host': 'localhost',
     'port': 1521,
     'service_name': 'orcl',
     'username': 'jhw1',
     'password': '1234',
-    'encoding': 'UTF-8'
+    'encoding': 'UTF-8',
+    'stmtcachesize': 100  # 세션별 문장 캐시 크기 (SQLQueries 전체가 들어가게 잡아 같은 문장을 다시 파싱하지 않음)
+}
+
+# SQLite 백엔드 설정 (Oracle 없이 개발/부하 테스트용)
+SQLITE_CONFIG = {
+    'path': 'bank_system.db',
+    'busy_timeout': 5000,     # 쓰기 잠금 대기 제한 (밀리초)
+    'journal_mode': 'WAL',    # 읽기와 쓰기를 동시에 처리
+    'synchronous': 'NORMAL',
+    'cached_statements': 100  # 연결별 준비된 문장 캐시 크기 (DATABASE_CONFIG['stmtcachesize']와 같은 역할)
 }
 
 # 연결 풀 설정
 POOL_CONFIG = {
+    'enabled': True,    # True이면 세션 풀 사용 (단일 연결 대신)
     'min': 1,
     'max': 10,
-    'increment': 1
+    'increment': 1,
+    'timeout': 60,      # 유휴 세션 정리 시간 (초)
+    'wait_timeout': 5000  # 세션 대여 대기 제한 (밀리초)
+}
+
+# 대량 처리 설정
+BATCH_CONFIG = {
+    'interest_chunk_size': 1000,  # 이자 지급 시 한 번에 커밋하는 계좌 수
+    'fetch_arraysize': 1000,      # 대량 조회 시 한 번에 가져오는 행 수
+    'id_block_size': 100,         # ID 할당 시 한 번에 예약하는 시퀀스 값 개수
+    'interest_workers': 1,        # 이자 지급 작업 프로세스 수 (2 이상이면 계좌번호 구간별로 나눠 병렬 지급)
+    'interest_run_stale_seconds': 600  # 체크포인트가 이 시간(초) 이상 없는 실행 중 이자 지급은 중단된 것으로 보고 재개
+}
+
+# 캐시 설정
+CACHE_CONFIG = {
+    'account_max_size': 10000,  # 계좌 캐시 최대 보관 수
+    'account_ttl': 30,          # 계좌 캐시 유효 시간 (초)
+    'summary_max_size': 10000,  # 사용자 계좌 요약 캐시 최대 보관 수
+    'summary_ttl': 60,          # 사용자 계좌 요약 유효 시간 (초, 다른 프로세스의 거래 반영 주기)
+    'user_index': None,         # 가입 중복 확인 앞단 메모리 색인 ('bloom', 'set', None이면 사용 안 함)
+    'user_index_capacity': 100000,  # 블룸 필터 최소 예상 사용자 수 (적재 시 사용자 수의 2배와 비교해 큰 값)
+    'user_index_fp_rate': 0.01  # 블룸 필터 목표 오탐률 (오탐은 DB 조회로 확인)
+}
+
+# 페이지 조회 설정
+PAGE_CONFIG = {
+    'history_page_size': 20,  # 거래내역 한 페이지당 행 수
+    'max_page_size': 100,     # 서비스 요청으로 지정할 수 있는 최대 페이지 크기 (넘으면 이 값으로 줄임)
+    'stream_prefetchrows': 1000  # 스트리밍 조회 시 첫 왕복에 미리 가져오는 행 수
+}
+
+# 쿼리 통계 설정
+QUERY_STATS_CONFIG = {
+    'enabled': True,      # SQL 문장별 호출 수/시간/행 수/왕복 횟수 집계
+    'slow_query_ms': 200,  # 이 시간 이상 걸린 쿼리는 느린 쿼리 로그에 기록 (밀리초)
+    'slow_log_size': 100   # 보관할 느린 쿼리 로그 수
+}
+
+# 서비스 API 서버 설정
+SERVER_CONFIG = {
+    'host': '127.0.0.1',
+    'port': 8080,
+    'workers': 10,              # 동시에 처리하는 요청 수 (세션 풀 max와 맞춤)
+    'max_body_size': 1048576,   # 요청 본문 최대 크기 (바이트)
+    'async_db': False           # True이면 입출금/이체를 비동기 DB 연결로 이벤트 루프에서 처리
+}
+
+# 스케줄러 설정
+SCHEDULER_CONFIG = {
+    'interest_hour': 14,        # 월말 이자 지급 시각 (매월 마지막 날 14:00)
+    'interest_minute': 0,
+    'nightly_export': False,    # True면 매일 전날 거래내역을 EXPORT_CONFIG['output_dir']에 내보냄
+    'export_hour': 2,           # 야간 내보내기 시각 (02:00)
+    'export_minute': 0,
+    'export_format': 'csv',
+    'nightly_reconcile': False,  # True면 매일 원장-잔액 대사를 실행해 불일치 보고서를 EXPORT_CONFIG['output_dir']에 기록
+    'reconcile_hour': 3,        # 야간 대사 시각 (03:00, 내보내기 이후)
+    'reconcile_minute': 0,
+    'retry_delay': 300,         # 작업 오류 시 다시 시도하기까지 대기 시간 (초)
+    'max_wait': 3600            # 한 번에 대기하는 최대 시간 (초, 시스템 시각 변경 대비)
+}
+
+# 보고서 내보내기 설정
+EXPORT_CONFIG = {
+    'chunk_size': 10000,          # 한 번에 읽고 쓰는 행 수 (메모리 사용량 상한)
+    'output_dir': 'exports',      # 기본 출력 디렉터리
+    'csv_encoding': 'utf-8-sig'   # CSV 인코딩 (BOM 포함, 엑셀 호환)
+}
+
+# 사용자/계좌 대량 등록 설정
+IMPORT_CONFIG = {
+    'batch_size': 5000,           # 한 번에 검사하고 저장하는 행 수 (배치마다 한 트랜잭션)
+    'csv_encoding': 'utf-8-sig',  # CSV 기본 인코딩 (BOM이 없어도 읽힘, 제휴사 파일이 EUC-KR이면 'euc-kr')
+    'user_index': 'bloom'         # 전역 중복 확인 색인이 꺼져 있을 때 등록 중에만 쓰는 색인 방식 ('bloom' 또는 'set')
+}
+
+# 원장-잔액 대사 설정
+RECONCILE_CONFIG = {
+    'workers': 1,               # 작업 프로세스 수 (2 이상이면 계좌번호 구간별로 나눠 병렬 대사)
+    'fetch_arraysize': 10000,   # 스트리밍 조회 시 한 번에 가져오는 행 수 (원장 전체를 읽으므로 크게)
+    'tolerance': 0.005,         # 금액 비교 허용 오차 (실수 연산 반올림 차이)
+    'progress_every': 100000    # 작업 프로세스가 진행 상황을 보고하는 계좌 수 간격
+}
+
+# 거래 원장 그룹 커밋 설정
+LEDGER_CONFIG = {
+    'enabled': False,     # True면 입금/출금/이체를 원장 기록기에 모아 그룹 단위로 커밋
+    'max_batch': 256,     # 한 그룹에 모으는 최대 작업 수
+    'max_delay_ms': 0,    # 첫 작업 이후 그룹을 더 모으며 기다리는 최대 시간 (밀리초)
+    'ack_timeout': 30     # 호출자가 그룹 커밋을 기다리는 최대 시간 (초)
 }
 
 # SQL 쿼리 상수들
@@ -51,6 +153,33 @@ class SQLQueries:
         WHERE user_id = :user_id
     """
     
+    # 가입/수정 중복 확인: 아이디, 이메일, 전화번호 사용 여부를 한 번에 조회
+    # (확인하지 않을 항목은 NULL, 수정 시 current_user_id로 본인 제외, 각 컬럼의 고유 인덱스 사용)
+    SELECT_USER_KEY_CONFLICTS = """
+        SELECT NVL(SUM(CASE WHEN user_id = :user_id THEN 1 ELSE 0 END), 0) AS id_count,
+               NVL(SUM(CASE WHEN user_email = :user_email THEN 1 ELSE 0 END), 0) AS email_count,
+               NVL(SUM(CASE WHEN user_phone = :user_phone THEN 1 ELSE 0 END), 0) AS phone_count
+        FROM users
+        WHERE (user_id = :user_id OR user_email = :user_email OR user_phone = :user_phone)
+          AND (:current_user_id IS NULL OR user_id <> :current_user_id)
+    """
+    
+    # 중복 확인 색인 적재용
+    COUNT_USERS = "SELECT COUNT(*) AS count FROM users"
+    
+    SELECT_USER_KEYS = "SELECT user_id, user_email, user_phone FROM users"
+    
+    COUNT_USER_BY_ID = "SELECT COUNT(*) AS count FROM users WHERE user_id = :user_id"
+    
+    SELECT_USER_PASSWORD = "SELECT user_password FROM users WHERE user_id = :user_id"
+    
+    SELECT_ALL_USERS = """
+        SELECT user_id, user_name, user_password, user_email, user_phone, join_date
+        FROM users ORDER BY join_date DESC
+    """
+    
+    DELETE_USER = "DELETE FROM users WHERE user_id = :user_id"
+    
     # 계좌 관련
     INSERT_ACCOUNT = """
         INSERT INTO accounts (account_id, account_name, account_type, account_password, 
@@ -72,6 +201,15 @@ class SQLQueries:
         ORDER BY create_date DESC
     """
     
+    # 사용자 계좌 요약용: 사용자 계좌들의 마지막 거래일시
+    SELECT_USER_LAST_ACTIVITY = """
+        SELECT t.transaction_date
+        FROM transactions t JOIN accounts a ON t.account_id = a.account_id
+        WHERE a.user_id = :user_id
+        ORDER BY t.transaction_date DESC
+        FETCH FIRST 1 ROWS ONLY
+    """
+    
     SELECT_ALL_ACCOUNTS = """
         SELECT a.account_id, a.account_name, a.account_type, a.account_password, a.balance, 
                a.user_id, a.create_date, a.interest_rate, a.last_interest_date,
@@ -93,10 +231,51 @@ class SQLQueries:
         WHERE account_id = :account_id
     """
     
+    # 이체용: 두 계좌를 계좌번호 순서로 잠금 (교착 상태 방지)
+    SELECT_ACCOUNTS_FOR_TRANSFER = """
+        SELECT account_id, account_name, balance
+        FROM accounts
+        WHERE account_id IN (:from_account_id, :to_account_id)
+        ORDER BY account_id
+        FOR UPDATE
+    """
+    
+    # 입출금용: 계좌 잠금 및 현재 잔액 조회 (동시 요청 시 잔액 유실 방지)
+    SELECT_ACCOUNT_BALANCE_FOR_UPDATE = """
+        SELECT balance FROM accounts WHERE account_id = :account_id
+        FOR UPDATE
+    """
+    
+    # 이체용: 두 계좌 잔액을 한 번에 증감하고 갱신된 잔액 반환
+    # (입출금의 UPDATE_ACCOUNT_BALANCE와 같이 마지막 이자 지급일도 갱신)
+    UPDATE_TRANSFER_BALANCES = """
+        UPDATE accounts
+        SET balance = balance + CASE WHEN account_id = :from_account_id
+                                     THEN -:amount ELSE :amount END,
+            last_interest_date = :last_interest_date
+        WHERE account_id IN (:from_account_id, :to_account_id)
+        RETURNING account_id, balance INTO :out_account_id, :out_balance
+    """
+    
+    # 이자 지급용: 청크 저장점 (일괄 갱신에서 빠진 계좌가 있으면 되돌리고 계좌별로 다시 갱신)
+    SAVEPOINT_INTEREST_CHUNK = "SAVEPOINT interest_chunk"
+    
+    ROLLBACK_TO_INTEREST_CHUNK = "ROLLBACK TO SAVEPOINT interest_chunk"
+    
+    # 이자 지급용: 잔액에 이자를 더하고 마지막 이자 지급일 갱신
+    # (이미 기준 시각까지 지급했거나 그 뒤에 거래가 있었던 계좌는 갱신하지 않음 -> 같은 청크를 두 번 지급해도 한 번만 반영)
+    UPDATE_ACCOUNT_INTEREST = """
+        UPDATE accounts
+        SET balance = balance + :interest_amount, last_interest_date = :last_interest_date
+        WHERE account_id = :account_id AND last_interest_date < :last_interest_date
+    """
+    
     DELETE_ACCOUNT = """
         DELETE FROM accounts WHERE account_id = :account_id
     """
     
+    COUNT_ACCOUNTS_BY_USER = "SELECT COUNT(*) AS count FROM accounts WHERE user_id = :user_id"
+    
     # 거래 관련
     INSERT_TRANSACTION = """
         INSERT INTO transactions (transaction_id, transaction_date, account_id, transaction_type, 
@@ -107,13 +286,66 @@ class SQLQueries:
                 :depositor_name, :transaction_memo)
     """
     
+    # 스케줄러 관련 (작업별 마지막 실행 시각)
+    SELECT_SCHEDULER_RUN = """
+        SELECT last_run FROM scheduler_runs WHERE job_name = :job_name
+    """
+    
+    INSERT_SCHEDULER_RUN = """
+        INSERT INTO scheduler_runs (job_name, last_run) VALUES (:job_name, :last_run)
+    """
+    
+    # 마지막 실행 시각이 previous_run일 때만 갱신 (갱신한 프로세스만 작업 실행)
+    CLAIM_SCHEDULER_RUN = """
+        UPDATE scheduler_runs SET last_run = :last_run
+        WHERE job_name = :job_name AND last_run = :previous_run
+    """
+    
+    # 보고서 내보내기용: 기간별 거래내역 (start_date 이상, end_date 미만)
+    SELECT_TRANSACTIONS_BY_DATE_RANGE = """
+        SELECT transaction_id, transaction_date, account_id, transaction_type, 
+               amount, balance_after, counterpart_account, counterpart_name, 
+               depositor_name, transaction_memo
+        FROM transactions 
+        WHERE transaction_date >= :start_date AND transaction_date < :end_date
+        ORDER BY transaction_date, transaction_id
+    """
+    
+    # 원장 그룹 커밋용: 작업 단위 저장점 (실패한 작업만 되돌림)
+    SAVEPOINT_LEDGER_UNIT = "SAVEPOINT ledger_unit"
+    
+    ROLLBACK_TO_LEDGER_UNIT = "ROLLBACK TO SAVEPOINT ledger_unit"
+    
     SELECT_TRANSACTIONS_BY_ACCOUNT = """
         SELECT transaction_id, transaction_date, account_id, transaction_type, 
                amount, balance_after, counterpart_account, counterpart_name, 
                depositor_name, transaction_memo
         FROM transactions 
         WHERE account_id = :account_id
-        ORDER BY transaction_date DESC
+        ORDER BY transaction_date DESC, transaction_id DESC
+    """
+    
+    # 거래내역 키셋 페이지 조회 (transaction_date, transaction_id 기준 내림차순)
+    SELECT_TRANSACTIONS_FIRST_PAGE_BY_ACCOUNT = """
+        SELECT transaction_id, transaction_date, account_id, transaction_type, 
+               amount, balance_after, counterpart_account, counterpart_name, 
+               depositor_name, transaction_memo
+        FROM transactions 
+        WHERE account_id = :account_id
+        ORDER BY transaction_date DESC, transaction_id DESC
+        FETCH FIRST :page_size ROWS ONLY
+    """
+    
+    SELECT_TRANSACTIONS_NEXT_PAGE_BY_ACCOUNT = """
+        SELECT transaction_id, transaction_date, account_id, transaction_type, 
+               amount, balance_after, counterpart_account, counterpart_name, 
+               depositor_name, transaction_memo
+        FROM transactions 
+        WHERE account_id = :account_id
+          AND (transaction_date < :after_date
+               OR (transaction_date = :after_date AND transaction_id < :after_id))
+        ORDER BY transaction_date DESC, transaction_id DESC
+        FETCH FIRST :page_size ROWS ONLY
     """
     
     SELECT_TRANSACTIONS_BY_USER = """
@@ -123,7 +355,31 @@ class SQLQueries:
         FROM transactions t
         JOIN accounts a ON t.account_id = a.account_id
         WHERE a.user_id = :user_id
-        ORDER BY t.transaction_date DESC
+        ORDER BY t.transaction_date DESC, t.transaction_id DESC
+    """
+    
+    SELECT_TRANSACTIONS_FIRST_PAGE_BY_USER = """
+        SELECT t.transaction_id, t.transaction_date, t.account_id, t.transaction_type, 
+               t.amount, t.balance_after, t.counterpart_account, t.counterpart_name, 
+               t.depositor_name, t.transaction_memo, a.account_name
+        FROM transactions t
+        JOIN accounts a ON t.account_id = a.account_id
+        WHERE a.user_id = :user_id
+        ORDER BY t.transaction_date DESC, t.transaction_id DESC
+        FETCH FIRST :page_size ROWS ONLY
+    """
+    
+    SELECT_TRANSACTIONS_NEXT_PAGE_BY_USER = """
+        SELECT t.transaction_id, t.transaction_date, t.account_id, t.transaction_type, 
+               t.amount, t.balance_after, t.counterpart_account, t.counterpart_name, 
+               t.depositor_name, t.transaction_memo, a.account_name
+        FROM transactions t
+        JOIN accounts a ON t.account_id = a.account_id
+        WHERE a.user_id = :user_id
+          AND (t.transaction_date < :after_date
+               OR (t.transaction_date = :after_date AND t.transaction_id < :after_id))
+        ORDER BY t.transaction_date DESC, t.transaction_id DESC
+        FETCH FIRST :page_size ROWS ONLY
     """
     
     # 이자 관련
@@ -138,6 +394,112 @@ class SQLQueries:
         ORDER BY payment_date DESC
     """
     
+    SELECT_ACCOUNT_INTEREST_INFO = """
+        SELECT balance, interest_rate, last_interest_date, account_type
+        FROM accounts WHERE account_id = :account_id
+    """
+    
+    SELECT_INTEREST_ELIGIBLE_ACCOUNTS = """
+        SELECT account_id, balance, interest_rate, last_interest_date, account_type
+        FROM accounts
+        WHERE balance > 0 AND interest_rate > 0
+        ORDER BY account_id
+    """
+    
+    # 이자 지급 대상 중 계좌번호 구간 [start_id, end_id)에서 after_id(재개 지점) 이후 (NULL이면 해당 조건 없음)
+    SELECT_INTEREST_ELIGIBLE_ACCOUNTS_RANGE = """
+        SELECT account_id, balance, interest_rate, last_interest_date, account_type
+        FROM accounts
+        WHERE balance > 0 AND interest_rate > 0
+          AND (:start_id IS NULL OR account_id >= :start_id)
+          AND (:end_id IS NULL OR account_id < :end_id)
+          AND (:after_id IS NULL OR account_id > :after_id)
+        ORDER BY account_id
+    """
+    
+    # 이자 지급 대상을 계좌번호 순으로 :shards개 구간으로 나눈 각 구간의 첫 계좌번호와 계좌 수
+    SELECT_INTEREST_SHARD_BOUNDS = """
+        SELECT shard_no, MIN(account_id) AS start_id, COUNT(*) AS account_count
+        FROM (
+            SELECT account_id, NTILE(:shards) OVER (ORDER BY account_id) AS shard_no
+            FROM accounts
+            WHERE balance > 0 AND interest_rate > 0
+        ) shards
+        GROUP BY shard_no
+        ORDER BY shard_no
+    """
+    
+    # 이자 지급 실행 기록 (재개용 저널)
+    INSERT_INTEREST_RUN = """
+        INSERT INTO interest_runs (run_id, admin_id, calc_date, shard_count, status, started_at, updated_at)
+        VALUES (:run_id, :admin_id, :calc_date, :shard_count, :status, :started_at, :updated_at)
+    """
+    
+    INSERT_INTEREST_RUN_SHARD = """
+        INSERT INTO interest_run_shards (run_id, shard_no, start_id, end_id, account_count,
+                                         paid_count, paid_amount, status, updated_at)
+        VALUES (:run_id, :shard_no, :start_id, :end_id, :account_count, 0, 0, :status, :updated_at)
+    """
+    
+    # 가장 최근의 끝나지 않은 실행
+    SELECT_UNFINISHED_INTEREST_RUN = """
+        SELECT run_id, admin_id, calc_date, status, started_at, updated_at
+        FROM interest_runs
+        WHERE status <> 'COMPLETED'
+        ORDER BY started_at DESC
+        FETCH FIRST 1 ROWS ONLY
+    """
+    
+    SELECT_INTEREST_RUN_SHARDS = """
+        SELECT shard_no, start_id, end_id, account_count, last_account_id,
+               paid_count, paid_amount, status, updated_at
+        FROM interest_run_shards
+        WHERE run_id = :run_id
+        ORDER BY shard_no
+    """
+    
+    # 조회한 뒤 상태가 바뀌지 않았을 때만 실행을 넘겨받음 (넘겨받은 프로세스만 재개)
+    CLAIM_INTEREST_RUN = """
+        UPDATE interest_runs SET status = 'RUNNING', updated_at = :now
+        WHERE run_id = :run_id AND status = :status AND updated_at = :updated_at
+    """
+    
+    # 실행 종료 (claimed_at: 실행을 만들거나 넘겨받을 때 기록한 updated_at, 다른 프로세스가 넘겨받았으면 갱신 안 됨)
+    UPDATE_INTEREST_RUN_STATUS = """
+        UPDATE interest_runs SET status = :status, updated_at = :updated_at
+        WHERE run_id = :run_id AND updated_at = :claimed_at
+    """
+    
+    # 청크 지급과 같은 트랜잭션에서 실행 (last_account_id가 NULL이면 재개 지점은 그대로)
+    # 실행을 다른 프로세스가 넘겨받았으면 0행 갱신 -> 호출자가 청크를 롤백
+    UPDATE_INTEREST_RUN_CHECKPOINT = """
+        UPDATE interest_run_shards
+        SET last_account_id = NVL(:last_account_id, last_account_id),
+            paid_count = paid_count + :paid_count,
+            paid_amount = paid_amount + :paid_amount,
+            updated_at = :updated_at
+        WHERE run_id = :run_id AND shard_no = :shard_no
+          AND EXISTS (SELECT 1 FROM interest_runs
+                      WHERE run_id = :run_id AND status = 'RUNNING' AND updated_at = :claimed_at)
+    """
+    
+    UPDATE_INTEREST_RUN_SHARD_STATUS = """
+        UPDATE interest_run_shards SET status = :status, updated_at = :updated_at
+        WHERE run_id = :run_id AND shard_no = :shard_no
+          AND EXISTS (SELECT 1 FROM interest_runs
+                      WHERE run_id = :run_id AND status = 'RUNNING' AND updated_at = :claimed_at)
+    """
+    
+    # 실행을 아직 이 프로세스가 맡고 있는지 확인
+    COUNT_OWNED_INTEREST_RUN = """
+        SELECT COUNT(*) AS count FROM interest_runs
+        WHERE run_id = :run_id AND status = 'RUNNING' AND updated_at = :claimed_at
+    """
+    
+    COUNT_INTEREST_PAYMENTS_BY_ADMIN = """
+        SELECT COUNT(*) AS count FROM interest_payments WHERE admin_id = :admin_id
+    """
+    
     SELECT_INTEREST_PAYMENTS_BY_ACCOUNT = """
         SELECT payment_id, account_id, payment_date, interest_amount, admin_id
         FROM interest_payments
@@ -145,6 +507,77 @@ class SQLQueries:
         ORDER BY payment_date DESC
     """
     
+    # 원장 대사 관련 (계좌번호 구간 :start_id ~ :end_id, 양 끝 포함)
+    # 세 조회 모두 account_id 순으로 정렬해 한 번의 병합으로 비교 (거래/이자는 계좌 안에서 최신순)
+    # 구간 조건은 항상 값이 있는 BETWEEN이므로 색인 범위 검색 (NULL 허용 조건은 색인 전체를 읽음)
+    SELECT_RECONCILE_ACCOUNTS_RANGE = """
+        SELECT account_id, balance
+        FROM accounts
+        WHERE account_id BETWEEN :start_id AND :end_id
+        ORDER BY account_id
+    """
+    
+    # idx_transactions_account_date 순서와 같아 정렬 없이 색인 순서로 읽음
+    SELECT_RECONCILE_TRANSACTIONS_RANGE = """
+        SELECT account_id, transaction_id, transaction_date, transaction_type, amount, balance_after
+        FROM transactions
+        WHERE account_id BETWEEN :start_id AND :end_id
+        ORDER BY account_id, transaction_date DESC, transaction_id DESC
+    """
+    
+    # idx_interest_payments_account_date 순서와 같음
+    SELECT_RECONCILE_INTEREST_RANGE = """
+        SELECT account_id, payment_id, payment_date, interest_amount
+        FROM interest_payments
+        WHERE account_id BETWEEN :start_id AND :end_id
+        ORDER BY account_id, payment_date DESC, payment_id DESC
+    """
+    
+    # 세 테이블의 가장 작은/큰 계좌번호 (각각 색인 끝 한 번 조회, 계좌 없는 원장도 구간에 포함하기 위함)
+    SELECT_RECONCILE_KEY_BOUNDS = """
+        SELECT (SELECT MIN(account_id) FROM accounts) AS accounts_min,
+               (SELECT MAX(account_id) FROM accounts) AS accounts_max,
+               (SELECT MIN(account_id) FROM transactions) AS transactions_min,
+               (SELECT MAX(account_id) FROM transactions) AS transactions_max,
+               (SELECT MIN(account_id) FROM interest_payments) AS payments_min,
+               (SELECT MAX(account_id) FROM interest_payments) AS payments_max
+        FROM DUAL
+    """
+    
+    # 전체 계좌를 계좌번호 순으로 :shards개 구간으로 나눈 각 구간의 첫 계좌번호와 계좌 수
+    SELECT_RECONCILE_SHARD_BOUNDS = """
+        SELECT shard_no, MIN(account_id) AS start_id, COUNT(*) AS account_count
+        FROM (
+            SELECT account_id, NTILE(:shards) OVER (ORDER BY account_id) AS shard_no
+            FROM accounts
+        ) shards
+        GROUP BY shard_no
+        ORDER BY shard_no
+    """
+    
     # 시퀀스 관련
     GET_NEXT_ACCOUNT_SEQ = "SELECT seq_account.NEXTVAL FROM DUAL"
     GET_NEXT_TRANSACTION_SEQ = "SELECT seq_transaction.NEXTVAL FROM DUAL"
+    
+    # 시퀀스 블록 예약 (ID 할당기에서 :count개를 한 번에 조회)
+    GET_ACCOUNT_SEQ_BLOCK = "SELECT seq_account.NEXTVAL FROM DUAL CONNECT BY LEVEL <= :count"
+    GET_TRANSACTION_SEQ_BLOCK = "SELECT seq_transaction.NEXTVAL FROM DUAL CONNECT BY LEVEL <= :count"
+    GET_PAYMENT_SEQ_BLOCK = "SELECT seq_payment.NEXTVAL FROM DUAL CONNECT BY LEVEL <= :count"
+    
+    # SQLite 백엔드의 시퀀스 블록 예약 (sequences 테이블로 흉내, SQLite 전용)
+    UPDATE_SEQUENCE_BLOCK = "UPDATE sequences SET value = value + :count WHERE name = :name RETURNING value"
+    
+    # 접속 확인 (SQLite는 FROM DUAL을 제거해 실행)
+    PING = "SELECT 1 FROM DUAL"
+    
+    # 읽기 전용 트랜잭션 시작 (Oracle 전용, read_snapshot 블록의 조회가 같은 시점을 봄)
+    SET_TRANSACTION_READ_ONLY = "SET TRANSACTION READ ONLY"
+    
+    # 문장별 파싱/실행 횟수 (Oracle 전용, V$SQL 조회 권한 필요, loads는 하드 파싱 횟수)
+    SELECT_SQL_PARSE_STATS = """
+        SELECT sql_id, sql_text, executions, parse_calls, loads
+        FROM v$sql
+        WHERE parsing_schema_name = USER
+        ORDER BY parse_calls DESC
+        FETCH FIRST :limit ROWS ONLY
+    """
@@ -1,20 +1,134 @@
 """
 데이터베이스 연결 관리 클래스
 Java의 Oracle JDBC 연결을 Python으로 변환
+(DB 종류별 차이는 backend 모듈의 DatabaseBackend가 처리)
 """
 
-import oracledb
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from typing import Optional, Dict, Any, List, Callable, Iterator
 from contextlib import contextmanager
 import logging
+from .config import POOL_CONFIG, BATCH_CONFIG, PAGE_CONFIG, QUERY_STATS_CONFIG
+from .backend import DatabaseBackend, OracleBackend, create_backend
+from .query_stats import QueryStats, StatementCacheTracker, query_name, match_query_name
+
+
+class TrackedCursor:
+    """
+    실행 통계를 기록하는 커서 래퍼
+    
+    문장마다 실행+조회 시간, 반환(변경) 행 수, DB 왕복 횟수, 파싱 여부를 모아 다음 실행이나
+    커서 종료 시 QueryStats에 기록한다. 왕복 횟수는 실행 1회에 arraysize를 넘는
+    조회 행마다 1회를 더해 계산 (반복자로 읽는 시간은 호출 측 처리 시간과 섞이므로 제외)
+    파싱 여부는 세션의 문장 캐시(StatementCacheTracker)에 없던 문장인지로 판단
+    """
+    
+    __slots__ = ('_cursor', '_db', '_session', '_name', '_elapsed', '_rows', '_is_select', '_parsed')
+    
+    def __init__(self, cursor, db: 'DatabaseConnection', session_key=None):
+        object.__setattr__(self, '_cursor', cursor)
+        object.__setattr__(self, '_db', db)
+        object.__setattr__(self, '_session', session_key)
+        object.__setattr__(self, '_name', None)
+        object.__setattr__(self, '_elapsed', 0.0)
+        object.__setattr__(self, '_rows', 0)
+        object.__setattr__(self, '_is_select', False)
+        object.__setattr__(self, '_parsed', False)
+    
+    def execute(self, query: str, *args, **kwargs):
+        """쿼리 실행 (왕복 1회)"""
+        return self._run(query, self._cursor.execute, query, *args, **kwargs)
+    
+    def executemany(self, query: str, *args, **kwargs):
+        """일괄 실행 (행 수와 관계없이 왕복 1회)"""
+        return self._run(query, self._cursor.executemany, query, *args, **kwargs)
+    
+    def _run(self, query: str, method, *args, **kwargs):
+        """이전 문장 통계를 기록하고 새 문장 실행 시간 측정"""
+        self._finish()
+        self._db._count_round_trip()
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            if self._db.query_stats is not None:
+                object.__setattr__(self, '_name', query_name(query))
+                object.__setattr__(self, '_parsed', not self._db.statement_cache.lookup(self._session, query))
+            object.__setattr__(self, '_elapsed', time.perf_counter() - start)
+            # DML은 변경된 행 수 (SELECT는 조회하면서 더함)
+            is_select = self._cursor.description is not None
+            object.__setattr__(self, '_is_select', is_select)
+            object.__setattr__(self, '_rows', 0 if is_select else max(self._cursor.rowcount or 0, 0))
+    
+    def _fetched(self, start: float, count: int):
+        """조회 시간과 행 수 누적"""
+        object.__setattr__(self, '_elapsed', self._elapsed + time.perf_counter() - start)
+        object.__setattr__(self, '_rows', self._rows + count)
+    
+    def fetchone(self):
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(start, row is not None)
+        return row
+    
+    def fetchmany(self, *args, **kwargs):
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._fetched(start, len(rows))
+        return rows
+    
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(start, len(rows))
+        return rows
+    
+    def __iter__(self):
+        rows = 0
+        try:
+            for row in self._cursor:
+                rows += 1
+                yield row
+        finally:
+            object.__setattr__(self, '_rows', self._rows + rows)
+    
+    def _finish(self):
+        """현재 문장의 통계 기록"""
+        if self._name is None:
+            return
+        
+        fetch_trips = 0
+        if self._is_select:
+            fetch_trips = max(self._rows - 1, 0) // (self._cursor.arraysize or 1)
+        for _ in range(fetch_trips):
+            self._db._count_round_trip()
+        
+        self._db.query_stats.record(self._name, self._elapsed, self._rows, 1 + fetch_trips, self._parsed)
+        object.__setattr__(self, '_name', None)
+    
+    def close(self):
+        """마지막 문장 통계 기록 후 커서 종료"""
+        try:
+            self._finish()
+        finally:
+            self._cursor.close()
+    
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+    
+    def __setattr__(self, name: str, value):
+        setattr(self._cursor, name, value)
 
 
 class DatabaseConnection:
-    """Oracle 데이터베이스 연결을 관리하는 클래스"""
+    """데이터베이스 연결을 관리하는 클래스 (기본 백엔드: Oracle)"""
     
     def __init__(self, host: str = "localhost", port: int = 1521, 
                  service_name: str = "orcl", username: str = "jhw1", 
-                 password: str = "1234"):
+                 password: str = "1234", use_pool: bool = False,
+                 pool_config: Optional[Dict[str, Any]] = None,
+                 backend: Optional[DatabaseBackend] = None):
         """
         데이터베이스 연결 정보 초기화
         
@@ -24,13 +138,48 @@ class DatabaseConnection:
             service_name: 서비스 이름
             username: 사용자명
             password: 비밀번호
+            use_pool: 세션 풀 사용 여부 (False면 단일 연결)
+            pool_config: 세션 풀 설정 (기본값: POOL_CONFIG)
+            backend: 저장소 백엔드 (기본값: 위 접속 정보의 OracleBackend)
         """
         self.host = host
         self.port = port
         self.service_name = service_name
         self.username = username
         self.password = password
-        self.connection: Optional[oracledb.Connection] = None
+        self.backend = backend
+        self.connection = None
+        
+        # 세션 풀 (풀 모드에서만 사용)
+        self.use_pool = use_pool
+        self.pool_config = dict(POOL_CONFIG if pool_config is None else pool_config)
+        self.pool = None
+        
+        # 트랜잭션 중인 스레드가 고정(pin)한 연결
+        self._local = threading.local()
+        
+        # 단일 연결 모드에서 스레드별로 열어 두고 재사용하는 트랜잭션 전용 연결 (종료 시 일괄 종료)
+        self._dedicated: Dict[threading.Thread, Any] = {}
+        
+        # 세션 대여 통계 (대기 시간은 풀 API가 제공하지 않으므로 직접 측정)
+        self._stats_lock = threading.Lock()
+        self._acquire_count = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+        
+        # DB 왕복 횟수 (execute/executemany/commit/rollback 기준, 스레드별 + 전체)
+        self._round_trips = 0
+        
+        # SQL 문장별 실행 통계 및 느린 쿼리 로그 (비활성화 시 None)
+        self.query_stats: Optional[QueryStats] = None
+        if QUERY_STATS_CONFIG.get('enabled', False):
+            self.query_stats = QueryStats(
+                QUERY_STATS_CONFIG.get('slow_query_ms', 200),
+                QUERY_STATS_CONFIG.get('slow_log_size', 100)
+            )
+        
+        # 세션별 문장 캐시 추정 (파싱 횟수 집계용, 캐시 크기는 백엔드 생성 후 connect에서 설정)
+        self.statement_cache = StatementCacheTracker(0)
         
         # 로깅 설정
         logging.basicConfig(level=logging.INFO)
@@ -44,23 +193,24 @@ class DatabaseConnection:
             bool: 연결 성공 여부
         """
         try:
-            # Oracle 연결 문자열 생성
-            dsn = f"{self.host}:{self.port}/{self.service_name}"
+            if self.backend is None:
+                self.backend = OracleBackend(self.host, self.port, self.service_name,
+                                             self.username, self.password)
+            self.statement_cache = StatementCacheTracker(self.backend.statement_cache_size)
             
-            # 데이터베이스 연결
-            self.connection = oracledb.connect(
-                user=self.username,
-                password=self.password,
-                dsn=dsn
-            )
+            if self.use_pool:
+                # 세션 풀 생성 (요청마다 세션을 대여/반납)
+                self.pool = self.backend.create_pool(self.pool_config)
+                self.logger.info(f"은행 계좌 시스템 DB 세션 풀 생성 성공! ({self.backend.name})")
+                return True
             
-            # 자동 커밋 설정 (Java의 setAutoCommit(true)와 동일)
-            self.connection.autocommit = True
+            # 데이터베이스 연결 (자동 커밋 모드)
+            self.connection = self._open_connection()
             
-            self.logger.info("은행 계좌 시스템 DB 연결 성공!")
+            self.logger.info(f"은행 계좌 시스템 DB 연결 성공! ({self.backend.name})")
             return True
             
-        except oracledb.DatabaseError as e:
+        except self._database_error() as e:
             self.logger.error(f"데이터베이스 연결 실패: {e}")
             return False
         except Exception as e:
@@ -70,44 +220,333 @@ class DatabaseConnection:
     def disconnect(self):
         """데이터베이스 연결 종료"""
         try:
+            with self._stats_lock:
+                dedicated = list(self._dedicated.values())
+                self._dedicated.clear()
+            for connection in dedicated:
+                connection.close()
             if self.connection:
                 self.connection.close()
                 self.connection = None
                 self.logger.info("데이터베이스 연결이 정상적으로 종료되었습니다.")
-        except oracledb.DatabaseError as e:
+            if self.pool:
+                self.pool.close(force=True)
+                self.pool = None
+                self.logger.info("데이터베이스 세션 풀이 정상적으로 종료되었습니다.")
+        except self._database_error() as e:
             self.logger.error(f"DB 연결 종료 중 오류: {e}")
     
     def is_connected(self) -> bool:
         """연결 상태 확인"""
         try:
-            if self.connection:
+            if self.connection or self.pool:
                 # 간단한 쿼리로 연결 상태 확인
-                cursor = self.connection.cursor()
-                cursor.execute("SELECT 1 FROM DUAL")
-                cursor.close()
+                with self.get_cursor() as cursor:
+                    cursor.execute(self.backend.ping_query)
                 return True
         except:
             pass
         return False
     
     @contextmanager
-    def get_cursor(self):
+    def acquire_connection(self):
         """
-        컨텍스트 매니저를 사용한 커서 관리
+        작업에 사용할 연결 대여
+        
+        현재 스레드가 transaction() 안에 있으면 고정된 연결을 사용하고,
+        풀 모드에서는 세션 풀에서 세션을 빌려 작업 후 반납하고,
+        단일 연결 모드에서는 전역 연결을 그대로 사용
         
         Usage:
-            with db.get_cursor() as cursor:
-                cursor.execute("SELECT * FROM users")
-                result = cursor.fetchall()
+            with db.acquire_connection() as connection:
+                cursor = connection.cursor()
         """
+        pinned = getattr(self._local, 'connection', None)
+        if pinned is not None:
+            yield pinned
+            return
+        
+        if self.pool is None:
+            if not self.connection:
+                raise Exception("데이터베이스에 연결되지 않았습니다.")
+            yield self.connection
+            return
+        
+        start = time.perf_counter()
+        connection = self.pool.acquire()
+        self._record_acquire(time.perf_counter() - start)
+        
+        try:
+            self.backend.prepare_connection(connection)
+            yield connection
+        finally:
+            self.pool.release(connection)
+    
+    @contextmanager
+    def transaction(self):
+        """
+        하나의 작업 단위를 트랜잭션으로 실행
+        
+        블록 동안 하나의 연결(풀 모드에서는 풀 세션, 단일 연결 모드에서는 스레드별 전용 연결)을
+        현재 스레드에 고정하고, 블록이 끝나면 한 번 커밋하고 예외 발생 시 롤백한다.
+        공유 연결의 autocommit 설정은 변경하지 않으므로 다른 스레드와 동시에 사용 가능.
+        이미 트랜잭션 안에서 호출되면 바깥 트랜잭션에 합류한다.
+        
+        Usage:
+            with db.transaction():
+                db.execute_update(SQLQueries.INSERT_TRANSACTION, params)
+                db.execute_update(SQLQueries.UPDATE_ACCOUNT_BALANCE, params)
+        """
+        if getattr(self._local, 'connection', None) is not None:
+            yield self._local.connection
+            return
+        
+        connection = self._acquire_transaction_connection()
+        try:
+            self.backend.begin(connection)
+        except BaseException:
+            self._release_transaction_connection(connection, discard=True)
+            raise
+        
+        self._local.connection = connection
+        finished = False
+        try:
+            yield connection
+            self._count_round_trip()
+            connection.commit()
+            finished = True
+        except BaseException:
+            self._count_round_trip()
+            connection.rollback()
+            finished = True
+            raise
+        finally:
+            self._local.connection = None
+            # 롤백까지 실패한 연결은 상태를 알 수 없으므로 재사용하지 않음
+            self._release_transaction_connection(connection, discard=not finished)
+    
+    @contextmanager
+    def read_snapshot(self):
+        """
+        여러 SELECT를 같은 시점의 데이터로 읽는 읽기 전용 작업 단위 (원장 대사 등 장시간 일괄 조회용)
+        
+        transaction()처럼 하나의 연결을 현재 스레드에 고정하지만 쓰기 잠금을 잡지 않고,
+        블록 안의 모든 조회(동시에 열린 커서 포함)가 블록 시작 시점의 데이터를 본다.
+        블록이 끝나면 롤백으로 스냅샷을 해제한다. 이미 트랜잭션 안이면 그 트랜잭션에 합류한다.
+        (Oracle은 UNDO_RETENTION이 블록 실행 시간보다 짧으면 ORA-01555가 발생할 수 있음)
+        
+        Usage:
+            with db.read_snapshot():
+                accounts = db.iter_query(SQLQueries.SELECT_RECONCILE_ACCOUNTS_RANGE, params)
+                transactions = db.iter_query(SQLQueries.SELECT_RECONCILE_TRANSACTIONS_RANGE, params)
+        """
+        if getattr(self._local, 'connection', None) is not None:
+            yield self._local.connection
+            return
+        
+        connection = self._acquire_transaction_connection()
+        try:
+            self.backend.begin_read_only(connection)
+        except BaseException:
+            self._release_transaction_connection(connection, discard=True)
+            raise
+        
+        self._local.connection = connection
+        finished = False
+        try:
+            yield connection
+        finally:
+            self._local.connection = None
+            try:
+                self._count_round_trip()
+                connection.rollback()
+                finished = True
+            finally:
+                self._release_transaction_connection(connection, discard=not finished)
+    
+    def _acquire_transaction_connection(self):
+        """transaction()/read_snapshot() 블록에 고정할 연결 대여"""
+        if self.pool is not None:
+            start = time.perf_counter()
+            connection = self.pool.acquire()
+            self._record_acquire(time.perf_counter() - start)
+            return connection
         if not self.connection:
             raise Exception("데이터베이스에 연결되지 않았습니다.")
         
-        cursor = self.connection.cursor()
+        # 공유 연결의 autocommit을 바꾸지 않도록 스레드별 전용 연결 사용 (트랜잭션마다 새로 연결하지 않음)
+        thread = threading.current_thread()
+        with self._stats_lock:
+            connection = self._dedicated.get(thread)
+            if connection is not None:
+                return connection
+            # 종료된 스레드의 전용 연결 정리
+            finished = [t for t in self._dedicated if not t.is_alive()]
+            stale = [self._dedicated.pop(t) for t in finished]
+        for old in stale:
+            self._close_quietly(old)
+        
+        connection = self._open_connection()
+        with self._stats_lock:
+            self._dedicated[thread] = connection
+        return connection
+    
+    def _release_transaction_connection(self, connection, discard: bool = False):
+        """
+        트랜잭션에 사용한 연결 반납
+        
+        풀 모드에서는 세션 풀에 반납하고, 단일 연결 모드의 전용 연결은 다음 트랜잭션을 위해 유지한다.
+        discard가 True(시작/롤백 실패로 상태를 알 수 없음)이면 전용 연결을 닫고 다음에 새로 연결한다.
+        """
+        if self.pool is not None:
+            self.pool.release(connection)
+            return
+        if not discard:
+            return
+        thread = threading.current_thread()
+        with self._stats_lock:
+            if self._dedicated.get(thread) is connection:
+                del self._dedicated[thread]
+        self._close_quietly(connection)
+    
+    def _close_quietly(self, connection):
+        """정리 중인 연결 종료 (이미 끊긴 연결의 오류는 무시)"""
         try:
-            yield cursor
-        finally:
-            cursor.close()
+            connection.close()
+        except self._database_error() as e:
+            self.logger.warning(f"트랜잭션 전용 연결 종료 중 오류: {e}")
+    
+    def in_transaction(self) -> bool:
+        """현재 스레드가 transaction() 블록 안에 있는지 확인"""
+        return getattr(self._local, 'connection', None) is not None
+    
+    def _open_connection(self):
+        """새 단독 연결 생성 (자동 커밋 모드)"""
+        return self.backend.connect()
+    
+    def _database_error(self):
+        """현재 백엔드 드라이버의 DB 오류 타입 (백엔드 생성 전에는 모든 예외)"""
+        return self.backend.DatabaseError if self.backend is not None else Exception
+    
+    def is_duplicate_error(self, error: BaseException) -> bool:
+        """UNIQUE/기본키 제약 위반(이미 있는 값 저장)으로 실패한 오류인지 확인"""
+        return self.backend is not None and isinstance(error, self.backend.IntegrityError)
+    
+    def _record_acquire(self, wait_time: float):
+        """세션 대여 대기 시간 기록"""
+        with self._stats_lock:
+            self._acquire_count += 1
+            self._total_wait_time += wait_time
+            if wait_time > self._max_wait_time:
+                self._max_wait_time = wait_time
+    
+    def _count_round_trip(self):
+        """DB 왕복 1회 기록"""
+        self._local.round_trips = getattr(self._local, 'round_trips', 0) + 1
+        with self._stats_lock:
+            self._round_trips += 1
+    
+    def get_round_trip_count(self, current_thread_only: bool = True) -> int:
+        """
+        DB 왕복 횟수 조회 (작업 전후 값의 차이로 작업당 왕복 횟수 측정)
+        
+        Args:
+            current_thread_only: True면 현재 스레드의 횟수, False면 전체 횟수
+            
+        Returns:
+            int: 누적 왕복 횟수
+        """
+        if current_thread_only:
+            return getattr(self._local, 'round_trips', 0)
+        with self._stats_lock:
+            return self._round_trips
+    
+    def get_query_stats(self, sort_by: str = 'total_time') -> List[Dict[str, Any]]:
+        """
+        SQL 문장별 실행 통계 조회 (SQLQueries 상수 이름 기준)
+        
+        Args:
+            sort_by: 정렬 기준 ('total_time', 'calls', 'max_time', 'rows', 'round_trips')
+            
+        Returns:
+            List[Dict]: 문장별 통계, 통계가 비활성화되어 있으면 빈 리스트
+        """
+        return self.query_stats.get_report(sort_by) if self.query_stats else []
+    
+    def get_query_report(self, limit: Optional[int] = None, sort_by: str = 'total_time') -> str:
+        """SQL 문장별 통계와 느린 쿼리 로그를 표 형식 문자열로 반환"""
+        if self.query_stats is None:
+            return "쿼리 통계가 비활성화되어 있습니다. (QUERY_STATS_CONFIG['enabled'])"
+        return self.query_stats.format_report(limit, sort_by)
+    
+    def reset_query_stats(self):
+        """SQL 문장별 통계 초기화"""
+        if self.query_stats:
+            self.query_stats.reset()
+    
+    def get_server_parse_stats(self, limit: int = 20) -> Optional[List[Dict[str, Any]]]:
+        """
+        DB 서버가 집계한 문장별 파싱/실행 횟수 조회 (Oracle V$SQL, AWR 보고서와 같은 기준)
+        
+        Args:
+            limit: 조회할 문장 수 (파싱 횟수가 많은 순)
+            
+        Returns:
+            Optional[List[Dict]]: name (SQLQueries 상수 이름, 없으면 None), sql_id, sql_text,
+                                  executions, parse_calls, loads (하드 파싱),
+                                  서버 통계가 없는 백엔드이면 None
+        """
+        with self.get_cursor() as cursor:
+            stats = self.backend.server_parse_stats(cursor, limit)
+        
+        if stats is not None:
+            for item in stats:
+                item['name'] = match_query_name(item['sql_text'] or '')
+        return stats
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        세션 풀 통계 조회
+        
+        Returns:
+            Dict: 풀 사용 현황 (busy, open, 대기 시간 등), 풀 모드가 아니면 빈 딕셔너리
+        """
+        if self.pool is None:
+            return {}
+        
+        with self._stats_lock:
+            acquire_count = self._acquire_count
+            total_wait_time = self._total_wait_time
+            max_wait_time = self._max_wait_time
+        
+        return {
+            'busy': self.pool.busy,
+            'open': self.pool.opened,
+            'min': self.pool.min,
+            'max': self.pool.max,
+            'acquire_count': acquire_count,
+            'total_wait_time': total_wait_time,
+            'avg_wait_time': total_wait_time / acquire_count if acquire_count else 0.0,
+            'max_wait_time': max_wait_time
+        }
+    
+    @contextmanager
+    def get_cursor(self):
+        """
+        컨텍스트 매니저를 사용한 커서 관리
+        
+        Usage:
+            with db.get_cursor() as cursor:
+                cursor.execute(SQLQueries.SELECT_ALL_USERS)
+                result = cursor.fetchall()
+        """
+        with self.acquire_connection() as connection:
+            cursor = TrackedCursor(self.backend.wrap_cursor(connection.cursor()), self,
+                                   self.backend.session_key(connection))
+            try:
+                yield cursor
+            finally:
+                cursor.close()
     
     def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -127,8 +566,8 @@ class DatabaseConnection:
                 else:
                     cursor.execute(query)
                 
-                # 컬럼명 가져오기
-                columns = [desc[0] for desc in cursor.description]
+                # 컬럼명 가져오기 (Oracle은 대문자로 반환하므로 소문자로 통일)
+                columns = [desc[0].lower() for desc in cursor.description]
                 
                 # 결과를 딕셔너리 리스트로 변환
                 results = []
@@ -137,7 +576,44 @@ class DatabaseConnection:
                 
                 return results
                 
-        except oracledb.DatabaseError as e:
+        except self._database_error() as e:
+            self.logger.error(f"쿼리 실행 실패: {e}")
+            raise
+    
+    def iter_query(self, query: str, params: Optional[Dict[str, Any]] = None,
+                   arraysize: Optional[int] = None,
+                   rowfactory: Optional[Callable[..., Any]] = None) -> Iterator[Any]:
+        """
+        SELECT 쿼리 결과를 한 행씩 스트리밍 (전체 결과를 메모리에 올리지 않음)
+        
+        Args:
+            query: SQL 쿼리
+            params: 쿼리 매개변수
+            arraysize: 한 번에 가져오는 행 수 (기본값: BATCH_CONFIG)
+            rowfactory: 컬럼 값들을 위치 인자로 받아 행 객체를 만드는 함수
+                        (예: Account.from_row, 없으면 소문자 컬럼명 딕셔너리)
+            
+        Yields:
+            행 객체 (rowfactory 결과 또는 딕셔너리)
+        """
+        try:
+            with self.get_cursor() as cursor:
+                self.backend.configure_cursor(cursor, arraysize or BATCH_CONFIG['fetch_arraysize'],
+                                              PAGE_CONFIG['stream_prefetchrows'])
+                
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                if rowfactory is None:
+                    columns = [desc[0].lower() for desc in cursor.description]
+                    rowfactory = lambda *row: dict(zip(columns, row))
+                self.backend.set_rowfactory(cursor, rowfactory)
+                
+                yield from cursor
+                
+        except self._database_error() as e:
             self.logger.error(f"쿼리 실행 실패: {e}")
             raise
     
@@ -161,7 +637,7 @@ class DatabaseConnection:
                 
                 return cursor.rowcount
                 
-        except oracledb.DatabaseError as e:
+        except self._database_error() as e:
             self.logger.error(f"업데이트 실행 실패: {e}")
             raise
     
@@ -181,19 +657,56 @@ class DatabaseConnection:
                 cursor.executemany(query, params_list)
                 return cursor.rowcount
                 
-        except oracledb.DatabaseError as e:
+        except self._database_error() as e:
             self.logger.error(f"배치 실행 실패: {e}")
             raise
     
+    def execute_returning(self, cursor, query: str, params: Dict[str, Any],
+                          returning: Dict[str, type]) -> List[tuple]:
+        """
+        RETURNING ... INTO 절이 있는 DML 실행 (백엔드별 방식으로 결과 행 조회)
+        
+        Args:
+            cursor: get_cursor()로 얻은 커서
+            query: DML 쿼리
+            params: 입력 매개변수
+            returning: RETURNING INTO 출력 변수 이름과 타입 (예: {'out_balance': float})
+            
+        Returns:
+            List[tuple]: 변경된 행마다 RETURNING 컬럼 값 튜플
+        """
+        return self.backend.execute_returning(cursor, query, params, returning)
+    
+    def next_sequence_values(self, sequence_name: str, count: int) -> List[int]:
+        """
+        시퀀스 값 count개를 한 번의 왕복으로 예약
+        
+        Args:
+            sequence_name: 시퀀스 이름 (예: 'seq_transaction')
+            count: 예약할 값 개수
+            
+        Returns:
+            List[int]: 예약된 시퀀스 값 (오름차순)
+        """
+        try:
+            with self.get_cursor() as cursor:
+                return sorted(self.backend.next_sequence_values(cursor, sequence_name, count))
+                
+        except self._database_error() as e:
+            self.logger.error(f"시퀀스 조회 실패: {e}")
+            raise
+    
     def commit(self):
-        """트랜잭션 커밋"""
-        if self.connection:
-            self.connection.commit()
+        """트랜잭션 커밋 (transaction() 안에서는 고정된 연결을 커밋)"""
+        connection = getattr(self._local, 'connection', None) or self.connection
+        if connection:
+            connection.commit()
     
     def rollback(self):
-        """트랜잭션 롤백"""
-        if self.connection:
-            self.connection.rollback()
+        """트랜잭션 롤백 (transaction() 안에서는 고정된 연결을 롤백)"""
+        connection = getattr(self._local, 'connection', None) or self.connection
+        if connection:
+            connection.rollback()
     
     def __enter__(self):
         """컨텍스트 매니저 진입"""
@@ -215,19 +728,42 @@ _db_connection: Optional[DatabaseConnection] = None
 
 def get_database_connection() -> DatabaseConnection:
     """
-    전역 데이터베이스 연결 인스턴스 반환
+    전역 데이터베이스 연결 인스턴스 반환 (백엔드는 DATABASE_CONFIG['backend'])
     
     Returns:
         DatabaseConnection: 데이터베이스 연결 객체
     """
     global _db_connection
     if _db_connection is None:
-        _db_connection = DatabaseConnection()
+        _db_connection = DatabaseConnection(use_pool=POOL_CONFIG.get('enabled', False),
+                                            backend=create_backend())
         if not _db_connection.connect():
             raise Exception("데이터베이스 연결에 실패했습니다.")
     return _db_connection
 
 
+def configure_database_connection(backend_name: Optional[str] = None, **options) -> DatabaseConnection:
+    """
+    전역 데이터베이스 연결을 지정한 백엔드로 다시 생성
+    (매니저 생성 전에 호출해야 함, 예: 부하 테스트에서 SQLite 사용)
+    
+    Args:
+        backend_name: 백엔드 이름 ('oracle' 또는 'sqlite')
+        **options: 백엔드 설정 덮어쓰기 (예: path='bench.db')
+        
+    Returns:
+        DatabaseConnection: 데이터베이스 연결 객체
+    """
+    global _db_connection
+    close_database_connection()
+    _db_connection = DatabaseConnection(use_pool=POOL_CONFIG.get('enabled', False),
+                                        backend=create_backend(backend_name, **options))
+    if not _db_connection.connect():
+        _db_connection = None
+        raise Exception("데이터베이스 연결에 실패했습니다.")
+    return _db_connection
+
+
 def close_database_connection():
     """전역 데이터베이스 연결 종료"""
     global _db_connection
@@ -0,0 +1,25 @@
+-- seq_payment 시작 값 보정 (Oracle)
+-- schema.sql의 이전 버전은 seq_payment를 START WITH 1로 만들었으므로, 기존 COUNT(*) + 1 방식으로
+-- 발급된 이자 지급 ID(PAY00000001 ...)가 있는 DB에서는 새 ID가 기존 기본 키와 겹침
+-- 시퀀스를 MAX(payment_id) + 1부터 다시 만든다 (이미 그보다 앞서 있으면 그대로 둠)
+-- 이자 지급이 실행되지 않는 시간에 실행하고, 시퀀스에 준 권한/동의어가 있으면 다시 부여할 것
+
+DECLARE
+    v_start  NUMBER;
+    v_next   NUMBER;
+BEGIN
+    SELECT NVL(MAX(TO_NUMBER(SUBSTR(payment_id, 4))), 0) + 1
+      INTO v_start
+      FROM interest_payments
+     WHERE REGEXP_LIKE(payment_id, '^PAY[0-9]+$');
+
+    -- 캐시된 값 때문에 LAST_NUMBER는 실제 다음 값보다 클 수 있으므로 NEXTVAL로 확인
+    EXECUTE IMMEDIATE 'SELECT seq_payment.NEXTVAL FROM DUAL' INTO v_next;
+
+    IF v_next < v_start THEN
+        EXECUTE IMMEDIATE 'DROP SEQUENCE seq_payment';
+        EXECUTE IMMEDIATE 'CREATE SEQUENCE seq_payment START WITH ' || v_start
+                          || ' INCREMENT BY 1 CACHE 1000';
+    END IF;
+END;
+/
@@ -0,0 +1,237 @@
+"""
+쿼리 통계 모듈
+SQL 문장별(SQLQueries 상수 이름 기준) 호출 수, 총/최대 실행 시간, 반환 행 수, DB 왕복 횟수, 파싱 횟수를 집계하고
+기준 시간보다 오래 걸린 쿼리를 느린 쿼리 로그로 남김
+(같은 쿼리가 작업 하나에서 여러 번 실행되는 N+1 지점과 문장 캐시에서 밀려 다시 파싱되는 문장을 찾는 용도)
+"""
+
+import logging
+import threading
+from collections import deque, OrderedDict
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from .config import SQLQueries
+
+
+# 쿼리 문자열 -> SQLQueries 상수 이름
+_QUERY_NAMES: Dict[str, str] = {
+    value: name for name, value in vars(SQLQueries).items()
+    if name.isupper() and isinstance(value, str)
+}
+
+
+# 공백을 정리한 쿼리 앞부분 -> SQLQueries 상수 이름 (V$SQL의 sql_text 대조용)
+_QUERY_PREFIX_LENGTH = 80
+_QUERY_PREFIXES: Dict[str, str] = {
+    " ".join(value.split())[:_QUERY_PREFIX_LENGTH]: name for value, name in _QUERY_NAMES.items()
+}
+
+
+def query_name(query: str) -> str:
+    """
+    쿼리의 통계 키 반환 (SQLQueries에 없는 쿼리는 처음 실행될 때 경고 로그)
+
+    Args:
+        query: SQL 쿼리
+
+    Returns:
+        str: SQLQueries 상수 이름, 상수가 아닌 쿼리는 "SQL: "과 정규화한 쿼리 앞부분
+    """
+    name = _QUERY_NAMES.get(query)
+    if name is None:
+        name = "SQL: " + " ".join(query.split())[:60]
+        _QUERY_NAMES[query] = name
+        logging.getLogger(__name__).warning(f"SQLQueries에 없는 쿼리 실행 (문장 캐시 재사용이 어려움): {name}")
+    return name
+
+
+def match_query_name(sql_text: str) -> Optional[str]:
+    """
+    DB가 보고한 SQL 문장(V$SQL의 sql_text 등)에 해당하는 SQLQueries 상수 이름 조회
+
+    Args:
+        sql_text: SQL 문장 (앞부분만 있어도 됨)
+
+    Returns:
+        Optional[str]: 상수 이름, SQLQueries에 없는 문장이면 None
+    """
+    return _QUERY_PREFIXES.get(" ".join(sql_text.split())[:_QUERY_PREFIX_LENGTH])
+
+
+class StatementCacheTracker:
+    """
+    세션별 문장 캐시 동작을 흉내 내 파싱 횟수를 추정하는 클래스 (스레드 안전)
+
+    드라이버 문장 캐시(oracledb stmtcachesize, sqlite3 cached_statements)처럼 세션마다
+    최근 실행한 문장을 size개까지 LRU로 보관하고, 캐시에 없는 문장 실행을 파싱으로 집계한다.
+    (Oracle은 캐시에 있는 문장을 다시 파싱 요청하지 않으므로 서버의 parse call 횟수와 같은 추이)
+    """
+
+    def __init__(self, size: int, max_sessions: int = 256):
+        """
+        StatementCacheTracker 초기화
+
+        Args:
+            size: 세션별 문장 캐시 크기 (0이면 매번 파싱)
+            max_sessions: 추적할 최대 세션 수 (오래 쓰지 않은 세션부터 제외)
+        """
+        self.size = size
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict = OrderedDict()  # 세션 -> 문장 LRU
+        self._lock = threading.Lock()
+
+    def lookup(self, session_key: Any, query: str) -> bool:
+        """
+        세션의 문장 캐시에서 문장 조회 후 최근 사용으로 기록
+
+        Args:
+            session_key: 세션 식별 값 (DatabaseBackend.session_key)
+            query: SQL 쿼리
+
+        Returns:
+            bool: 캐시 적중 여부 (False면 파싱)
+        """
+        if self.size <= 0:
+            return False
+
+        with self._lock:
+            cache = self._sessions.get(session_key)
+            if cache is None:
+                cache = self._sessions[session_key] = OrderedDict()
+                if len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(session_key)
+
+            if query in cache:
+                cache.move_to_end(query)
+                return True
+
+            cache[query] = None
+            if len(cache) > self.size:
+                cache.popitem(last=False)
+            return False
+
+
+class QueryStats:
+    """SQL 문장별 실행 통계와 느린 쿼리 로그 (스레드 안전)"""
+
+    def __init__(self, slow_query_ms: float = 200, slow_log_size: int = 100):
+        """
+        QueryStats 초기화
+
+        Args:
+            slow_query_ms: 느린 쿼리 기준 시간 (밀리초)
+            slow_log_size: 보관할 느린 쿼리 로그 수
+        """
+        self.slow_query_ms = slow_query_ms
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._slow_log = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def record(self, name: str, elapsed: float, rows: int, round_trips: int, parsed: bool = False):
+        """
+        쿼리 한 번의 실행 결과 기록
+
+        Args:
+            name: 통계 키 (query_name 결과)
+            elapsed: 실행 및 조회 시간 (초)
+            rows: 반환(또는 변경)된 행 수
+            round_trips: DB 왕복 횟수
+            parsed: 문장 캐시에 없어 파싱한 실행인지 여부
+        """
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                stat = self._stats[name] = {
+                    'calls': 0, 'total_time': 0.0, 'max_time': 0.0, 'rows': 0, 'round_trips': 0, 'parses': 0
+                }
+            stat['calls'] += 1
+            stat['total_time'] += elapsed
+            stat['rows'] += rows
+            stat['round_trips'] += round_trips
+            stat['parses'] += parsed
+            if elapsed > stat['max_time']:
+                stat['max_time'] = elapsed
+
+            is_slow = elapsed * 1000 >= self.slow_query_ms
+            if is_slow:
+                self._slow_log.append({
+                    'time': datetime.now(),
+                    'name': name,
+                    'elapsed_ms': elapsed * 1000,
+                    'rows': rows
+                })
+
+        if is_slow:
+            self.logger.warning(f"느린 쿼리 ({elapsed * 1000:.1f}ms, {rows}행): {name}")
+
+    def get_report(self, sort_by: str = 'total_time') -> List[Dict[str, Any]]:
+        """
+        문장별 통계 조회
+
+        Args:
+            sort_by: 정렬 기준 ('total_time', 'calls', 'max_time', 'rows', 'round_trips', 'parses')
+
+        Returns:
+            List[Dict]: 문장별 통계 (name, calls, total_time, avg_time, max_time, rows, round_trips, parses)
+        """
+        with self._lock:
+            report = [
+                {'name': name, **stat, 'avg_time': stat['total_time'] / stat['calls']}
+                for name, stat in self._stats.items()
+            ]
+        report.sort(key=lambda item: item[sort_by], reverse=True)
+        return report
+
+    def get_slow_queries(self) -> List[Dict[str, Any]]:
+        """느린 쿼리 로그 조회 (오래된 순)"""
+        with self._lock:
+            return list(self._slow_log)
+
+    def reset(self):
+        """통계와 느린 쿼리 로그 초기화"""
+        with self._lock:
+            self._stats.clear()
+            self._slow_log.clear()
+
+    def format_report(self, limit: Optional[int] = None, sort_by: str = 'total_time') -> str:
+        """
+        문장별 통계와 느린 쿼리 로그를 표 형식 문자열로 변환
+
+        Args:
+            limit: 출력할 문장 수 (None이면 전체)
+            sort_by: 정렬 기준
+
+        Returns:
+            str: 보고서 문자열
+        """
+        full_report = self.get_report(sort_by)
+        report = full_report[:limit]
+        lines = [
+            f"{'쿼리':<45} {'호출':>8} {'총(ms)':>10} {'평균(ms)':>9} {'최대(ms)':>9} {'행':>9} {'왕복':>8} {'파싱':>7}",
+            "-" * 112
+        ]
+        for item in report:
+            lines.append(
+                f"{item['name'][:45]:<45} {item['calls']:>8,} {item['total_time'] * 1000:>10.1f} "
+                f"{item['avg_time'] * 1000:>9.2f} {item['max_time'] * 1000:>9.1f} "
+                f"{item['rows']:>9,} {item['round_trips']:>8,} {item['parses']:>7,}"
+            )
+        if not report:
+            lines.append("기록된 쿼리가 없습니다.")
+        else:
+            calls = sum(item['calls'] for item in full_report)
+            parses = sum(item['parses'] for item in full_report)
+            unnamed = sum(1 for item in full_report if item['name'].startswith("SQL: "))
+            lines.append(f"실행 {calls:,}회, 파싱 {parses:,}회 (문장 캐시 적중률 {1 - parses / calls:.1%}), "
+                         f"SQLQueries에 없는 문장 {unnamed}개")
+
+        slow_queries = self.get_slow_queries()
+        lines.append("")
+        lines.append(f"[느린 쿼리 로그] 기준 {self.slow_query_ms:g}ms, 최근 {len(slow_queries)}건")
+        for entry in slow_queries[-10:]:
+            lines.append(f"{entry['time']:%Y-%m-%d %H:%M:%S} {entry['elapsed_ms']:>9.1f}ms "
+                         f"{entry['rows']:>8,}행  {entry['name']}")
+        return "\n".join(lines)
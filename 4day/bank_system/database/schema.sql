@@ -0,0 +1,75 @@
+-- 은행 시스템 추가 스키마 (Oracle)
+-- 기존 users / accounts / transactions / interest_payments 테이블과
+-- seq_account / seq_transaction 시퀀스는 이미 생성되어 있다고 가정
+
+-- 이자 지급 ID 시퀀스 (기존 COUNT(*) + 1 방식 대체)
+-- 기존 interest_payments의 최대 번호(PAY00000123 -> 123) + 1부터 시작해야 기존 ID와 겹치지 않음
+-- (이미 START WITH 1로 만든 DB는 migrate_seq_payment.sql 실행)
+DECLARE
+    v_start NUMBER;
+BEGIN
+    SELECT NVL(MAX(TO_NUMBER(SUBSTR(payment_id, 4))), 0) + 1
+      INTO v_start
+      FROM interest_payments
+     WHERE REGEXP_LIKE(payment_id, '^PAY[0-9]+$');
+
+    EXECUTE IMMEDIATE 'CREATE SEQUENCE seq_payment START WITH ' || v_start
+                      || ' INCREMENT BY 1 CACHE 1000';
+END;
+/
+
+-- 이메일/전화번호 중복 방지 (가입 중복 확인은 프로세스별 색인을 거치므로
+-- 다른 프로세스에서 동시에 가입한 값은 이 제약이 최종적으로 막음, 기존 중복 행은 먼저 정리해야 함)
+ALTER TABLE users ADD CONSTRAINT uq_users_email UNIQUE (user_email);
+ALTER TABLE users ADD CONSTRAINT uq_users_phone UNIQUE (user_phone);
+
+-- ID 할당기가 블록 단위(BATCH_CONFIG['id_block_size'])로 값을 예약하므로
+-- 시퀀스 캐시도 크게 잡아 데이터 딕셔너리 갱신을 줄임
+ALTER SEQUENCE seq_account CACHE 1000;
+ALTER SEQUENCE seq_transaction CACHE 1000;
+
+-- 거래내역 키셋 페이지 조회용 인덱스 (account_id별 최신순)
+CREATE INDEX idx_transactions_account_date
+    ON transactions (account_id, transaction_date DESC, transaction_id DESC);
+
+-- 보고서 내보내기(기간별 거래내역) 조회용 인덱스
+CREATE INDEX idx_transactions_date
+    ON transactions (transaction_date, transaction_id);
+
+-- 원장 대사용 인덱스 (계좌별 이자 지급을 최신순으로 스트리밍)
+CREATE INDEX idx_interest_payments_account_date
+    ON interest_payments (account_id, payment_date DESC, payment_id DESC);
+
+-- 스케줄러 작업별 마지막 실행 시각 (놓친 실행을 한 번만 실행하기 위한 기록)
+CREATE TABLE scheduler_runs (
+    job_name  VARCHAR2(50) PRIMARY KEY,
+    last_run  TIMESTAMP NOT NULL
+);
+
+-- 이자 지급 실행 기록 (중단된 실행을 마지막으로 커밋한 청크부터 재개)
+CREATE TABLE interest_runs (
+    run_id       VARCHAR2(30) PRIMARY KEY,
+    admin_id     VARCHAR2(50) NOT NULL,
+    calc_date    TIMESTAMP NOT NULL,
+    shard_count  NUMBER(5) NOT NULL,
+    status       VARCHAR2(20) NOT NULL,
+    started_at   TIMESTAMP NOT NULL,
+    updated_at   TIMESTAMP NOT NULL
+);
+
+CREATE INDEX idx_interest_runs_status ON interest_runs (status, started_at);
+
+-- 이자 지급 구간별 체크포인트 (last_account_id: 마지막으로 커밋한 청크의 마지막 계좌번호)
+CREATE TABLE interest_run_shards (
+    run_id           VARCHAR2(30) NOT NULL REFERENCES interest_runs (run_id),
+    shard_no         NUMBER(5) NOT NULL,
+    start_id         VARCHAR2(20),
+    end_id           VARCHAR2(20),
+    account_count    NUMBER(12) DEFAULT 0 NOT NULL,
+    last_account_id  VARCHAR2(20),
+    paid_count       NUMBER(12) DEFAULT 0 NOT NULL,
+    paid_amount      NUMBER(18, 2) DEFAULT 0 NOT NULL,
+    status           VARCHAR2(20) NOT NULL,
+    updated_at       TIMESTAMP NOT NULL,
+    PRIMARY KEY (run_id, shard_no)
+);
@@ -0,0 +1,103 @@
+-- 은행 시스템 SQLite 스키마 (SQLiteBackend가 연결 시 자동 적용)
+-- Oracle 스키마와 같은 테이블/컬럼 구성, 시퀀스는 sequences 테이블로 흉내냄
+
+CREATE TABLE IF NOT EXISTS users (
+    user_id        TEXT PRIMARY KEY,
+    user_name      TEXT NOT NULL,
+    user_password  TEXT NOT NULL,
+    user_email     TEXT UNIQUE,
+    user_phone     TEXT UNIQUE,
+    join_date      TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS accounts (
+    account_id          TEXT PRIMARY KEY,
+    account_name        TEXT NOT NULL,
+    account_type        TEXT NOT NULL,
+    account_password    TEXT NOT NULL,
+    balance             REAL NOT NULL DEFAULT 0,
+    user_id             TEXT NOT NULL REFERENCES users (user_id),
+    create_date         TIMESTAMP,
+    interest_rate       REAL DEFAULT 0,
+    last_interest_date  TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_accounts_user ON accounts (user_id);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    transaction_id       TEXT PRIMARY KEY,
+    transaction_date     TIMESTAMP,
+    account_id           TEXT NOT NULL,
+    transaction_type     TEXT NOT NULL,
+    amount               REAL NOT NULL,
+    balance_after        REAL NOT NULL,
+    counterpart_account  TEXT,
+    counterpart_name     TEXT,
+    depositor_name       TEXT,
+    transaction_memo     TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_transactions_account_date
+    ON transactions (account_id, transaction_date DESC, transaction_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_transactions_date
+    ON transactions (transaction_date, transaction_id);
+
+CREATE TABLE IF NOT EXISTS interest_payments (
+    payment_id       TEXT PRIMARY KEY,
+    account_id       TEXT NOT NULL,
+    payment_date     TIMESTAMP,
+    interest_amount  REAL NOT NULL,
+    admin_id         TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_interest_payments_account_date
+    ON interest_payments (account_id, payment_date DESC, payment_id DESC);
+
+-- 스케줄러 작업별 마지막 실행 시각
+CREATE TABLE IF NOT EXISTS scheduler_runs (
+    job_name  TEXT PRIMARY KEY,
+    last_run  TIMESTAMP NOT NULL
+);
+
+-- 이자 지급 실행 기록 (중단된 실행 재개용)
+CREATE TABLE IF NOT EXISTS interest_runs (
+    run_id       TEXT PRIMARY KEY,
+    admin_id     TEXT NOT NULL,
+    calc_date    TIMESTAMP NOT NULL,
+    shard_count  INTEGER NOT NULL,
+    status       TEXT NOT NULL,
+    started_at   TIMESTAMP NOT NULL,
+    updated_at   TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_interest_runs_status ON interest_runs (status, started_at);
+
+-- 이자 지급 구간별 체크포인트
+CREATE TABLE IF NOT EXISTS interest_run_shards (
+    run_id           TEXT NOT NULL REFERENCES interest_runs (run_id),
+    shard_no         INTEGER NOT NULL,
+    start_id         TEXT,
+    end_id           TEXT,
+    account_count    INTEGER NOT NULL DEFAULT 0,
+    last_account_id  TEXT,
+    paid_count       INTEGER NOT NULL DEFAULT 0,
+    paid_amount      REAL NOT NULL DEFAULT 0,
+    status           TEXT NOT NULL,
+    updated_at       TIMESTAMP NOT NULL,
+    PRIMARY KEY (run_id, shard_no)
+);
+
+-- Oracle 시퀀스 대체 (name: 시퀀스 이름, value: 마지막으로 발급한 값)
+CREATE TABLE IF NOT EXISTS sequences (
+    name   TEXT PRIMARY KEY,
+    value  INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO sequences (name, value) VALUES ('seq_account', 0);
+INSERT OR IGNORE INTO sequences (name, value) VALUES ('seq_transaction', 0);
+-- 이자 지급 번호는 기존 최대 번호(PAY00000123 -> 123)부터 이어서 발급
+INSERT OR IGNORE INTO sequences (name, value)
+    SELECT 'seq_payment', COALESCE(MAX(CAST(SUBSTR(payment_id, 4) AS INTEGER)), 0)
+    FROM interest_payments
+    WHERE payment_id GLOB 'PAY[0-9]*';
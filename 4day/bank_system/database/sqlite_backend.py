@@ -0,0 +1,433 @@
+"""
+SQLite 저장소 백엔드
+Oracle 없이 노트북이나 CI에서 BankSystem 전체를 실행하고 부하 테스트하기 위한 내장 DB 백엔드
+- WAL 모드로 읽기와 쓰기를 동시에 처리
+- SQLQueries(Oracle 방언)를 실행 시점에 SQLite 방언으로 변환
+- 시퀀스는 sequences 테이블로 흉내냄
+- 비동기 풀(AsyncSQLitePool)은 연결 작업을 전용 스레드에서 실행해 AsyncDatabaseConnection에 같은 인터페이스 제공
+"""
+
+import asyncio
+import functools
+import os
+import queue
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
+from typing import Optional, Dict, Any, List
+from .backend import DatabaseBackend
+from .config import SQLQueries
+
+
+# 날짜 저장/조회 형식 (ISO 문자열이므로 문자열 비교와 날짜 순서가 같음)
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.fromisoformat(value.decode()))
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "schema_sqlite.sql")
+
+
+class SQLitePool:
+    """SQLite 연결 풀 (oracledb.ConnectionPool과 같은 인터페이스, 스레드 안전)"""
+
+    def __init__(self, connect, min: int = 1, max: int = 10, wait_timeout: int = 0):
+        """
+        SQLitePool 초기화
+
+        Args:
+            connect: 새 연결을 만드는 함수
+            min: 미리 만들어 둘 연결 수
+            max: 동시에 대여할 수 있는 최대 연결 수
+            wait_timeout: 대여 대기 제한 (밀리초, 0이면 무제한 대기)
+        """
+        self._connect = connect
+        self.min = min
+        self.max = max
+        self.wait_timeout = wait_timeout
+        self.opened = 0
+        self.busy = 0
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max)
+        self._lock = threading.Lock()
+
+        for _ in range(min):
+            self._idle.put(self._new_connection())
+
+    def _new_connection(self):
+        """새 연결 생성 및 개수 기록"""
+        connection = self._connect()
+        with self._lock:
+            self.opened += 1
+        return connection
+
+    def acquire(self):
+        """연결 대여 (max개가 모두 사용 중이면 wait_timeout까지 대기)"""
+        timeout = self.wait_timeout / 1000 if self.wait_timeout else None
+        if not self._slots.acquire(timeout=timeout):
+            raise sqlite3.OperationalError("연결 풀 대기 시간이 초과되었습니다.")
+
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            try:
+                connection = self._new_connection()
+            except Exception:
+                self._slots.release()
+                raise
+
+        with self._lock:
+            self.busy += 1
+        return connection
+
+    def release(self, connection):
+        """연결 반납 (끝나지 않은 트랜잭션은 롤백)"""
+        if connection.in_transaction:
+            connection.rollback()
+
+        self._idle.put(connection)
+        with self._lock:
+            self.busy -= 1
+        self._slots.release()
+
+    def close(self, force: bool = False):
+        """대기 중인 연결 모두 종료"""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            connection.close()
+            with self._lock:
+                self.opened -= 1
+
+
+class SQLiteCursor:
+    """SQLQueries를 SQLite 방언으로 변환해 실행하는 커서 래퍼"""
+
+    __slots__ = ('_cursor', '_backend')
+
+    def __init__(self, cursor: sqlite3.Cursor, backend: 'SQLiteBackend'):
+        object.__setattr__(self, '_cursor', cursor)
+        object.__setattr__(self, '_backend', backend)
+
+    def execute(self, query: str, params: Optional[Dict[str, Any]] = None):
+        """쿼리 변환 후 실행"""
+        self._cursor.execute(self._backend.translate(query), params or {})
+        return self
+
+    def executemany(self, query: str, params_list: List[Dict[str, Any]]):
+        """쿼리 변환 후 일괄 실행"""
+        self._cursor.executemany(self._backend.translate(query), params_list)
+        return self
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name: str, value):
+        if name == 'prefetchrows':
+            return  # SQLite는 별도 프리페치 설정이 없음
+        if name == 'rowfactory':
+            self._backend.set_rowfactory(self._cursor, value)
+            return
+        setattr(self._cursor, name, value)
+
+
+class AsyncSQLiteCursor:
+    """방언 변환 커서의 실행/조회를 스레드에서 처리하는 비동기 커서 (oracledb.AsyncCursor와 같은 인터페이스)"""
+
+    __slots__ = ('_cursor', '_run')
+
+    def __init__(self, cursor: SQLiteCursor, run):
+        object.__setattr__(self, '_cursor', cursor)
+        object.__setattr__(self, '_run', run)
+
+    async def execute(self, query: str, params: Optional[Dict[str, Any]] = None):
+        """쿼리 변환 후 실행"""
+        await self._run(self._cursor.execute, query, params)
+
+    async def executemany(self, query: str, params_list: List[Dict[str, Any]]):
+        """쿼리 변환 후 일괄 실행"""
+        await self._run(self._cursor.executemany, query, params_list)
+
+    async def fetchone(self):
+        return await self._run(self._cursor.fetchone)
+
+    async def fetchmany(self, size: Optional[int] = None):
+        return await self._run(self._cursor.fetchmany, size or self._cursor.arraysize)
+
+    async def fetchall(self):
+        return await self._run(self._cursor.fetchall)
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self._cursor, name, value)
+
+
+class AsyncSQLiteConnection:
+    """SQLite 연결의 비동기 래퍼 (한 번에 한 태스크만 사용하므로 작업 스레드가 바뀌어도 안전)"""
+
+    __slots__ = ('_connection', '_backend', '_run')
+
+    def __init__(self, connection: sqlite3.Connection, backend: 'SQLiteBackend', run):
+        self._connection = connection
+        self._backend = backend
+        self._run = run
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._connection.in_transaction
+
+    def cursor(self) -> AsyncSQLiteCursor:
+        """방언 변환 비동기 커서 생성"""
+        return AsyncSQLiteCursor(self._backend.wrap_cursor(self._connection.cursor()), self._run)
+
+    async def execute(self, query: str):
+        """매개변수 없는 문장 실행 (BEGIN 등)"""
+        await self._run(self._connection.execute, query)
+
+    async def commit(self):
+        await self._run(self._connection.commit)
+
+    async def rollback(self):
+        await self._run(self._connection.rollback)
+
+    def close(self):
+        self._connection.close()
+
+
+class AsyncSQLitePool:
+    """
+    SQLite 비동기 연결 풀 (oracledb.AsyncConnectionPool과 같은 인터페이스)
+
+    sqlite3는 비동기 API가 없으므로 연결 작업을 풀 전용 스레드에서 실행한다.
+    스레드 수를 max와 같게 두어, 쓰기 잠금을 기다리는 연결들이 스레드를 모두 차지해
+    잠금을 가진 연결의 커밋이 실행되지 못하는 일이 없게 함
+    """
+
+    def __init__(self, connect, backend: 'SQLiteBackend', min: int = 1, max: int = 10, wait_timeout: int = 0):
+        """
+        AsyncSQLitePool 초기화
+
+        Args:
+            connect: 새 연결을 만드는 함수
+            backend: 커서 방언 변환용 백엔드
+            min: 미리 만들어 둘 연결 수
+            max: 동시에 대여할 수 있는 최대 연결 수
+            wait_timeout: 대여 대기 제한 (밀리초, 0이면 무제한 대기)
+        """
+        self._connect = connect
+        self._backend = backend
+        self.min = min
+        self.max = max
+        self.wait_timeout = wait_timeout
+        self.opened = 0
+        self.busy = 0
+        self._idle: List[AsyncSQLiteConnection] = []
+        self._slots = asyncio.Semaphore(max)
+        self._executor = ThreadPoolExecutor(max_workers=max, thread_name_prefix='sqlite-async')
+
+        for _ in range(min):
+            self._idle.append(self._wrap(connect()))
+
+    async def _run(self, func, *args):
+        """연결 작업을 풀 전용 스레드에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    def _wrap(self, connection: sqlite3.Connection) -> AsyncSQLiteConnection:
+        """비동기 래퍼 생성 및 개수 기록"""
+        self.opened += 1
+        return AsyncSQLiteConnection(connection, self._backend, self._run)
+
+    async def acquire(self) -> AsyncSQLiteConnection:
+        """연결 대여 (max개가 모두 사용 중이면 wait_timeout까지 대기)"""
+        timeout = self.wait_timeout / 1000 if self.wait_timeout else None
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise sqlite3.OperationalError("연결 풀 대기 시간이 초과되었습니다.")
+
+        if self._idle:
+            connection = self._idle.pop()
+        else:
+            try:
+                connection = self._wrap(await self._run(self._connect))
+            except BaseException:
+                self._slots.release()
+                raise
+
+        self.busy += 1
+        return connection
+
+    async def release(self, connection: AsyncSQLiteConnection):
+        """연결 반납 (끝나지 않은 트랜잭션은 롤백)"""
+        try:
+            if connection.in_transaction:
+                await connection.rollback()
+        finally:
+            self._idle.append(connection)
+            self.busy -= 1
+            self._slots.release()
+
+    async def close(self, force: bool = False):
+        """대기 중인 연결 모두 종료 및 작업 스레드 정리"""
+        while self._idle:
+            self._idle.pop().close()
+            self.opened -= 1
+        self._executor.shutdown(wait=False)
+
+
+class SQLiteBackend(DatabaseBackend):
+    """내장 SQLite 백엔드 (WAL 모드)"""
+
+    name = "sqlite"
+    DatabaseError = sqlite3.DatabaseError
+    IntegrityError = sqlite3.IntegrityError
+
+    # Oracle 방언 -> SQLite 방언 변환 규칙 (정규식, 치환 문자열)
+    DIALECT_RULES = [
+        (re.compile(r"\s+FOR\s+UPDATE\b", re.IGNORECASE), ""),
+        (re.compile(r"FETCH\s+FIRST\s+(:\w+|\d+)\s+ROWS\s+ONLY", re.IGNORECASE), r"LIMIT \1"),
+        (re.compile(r"(RETURNING\s+.+?)\s+INTO\s+:\w+(\s*,\s*:\w+)*", re.IGNORECASE | re.DOTALL), r"\1"),
+        (re.compile(r"\s+FROM\s+DUAL\b", re.IGNORECASE), ""),
+        (re.compile(r"\bSYSDATE\b", re.IGNORECASE), "CURRENT_TIMESTAMP"),
+        (re.compile(r"\bNVL\(", re.IGNORECASE), "IFNULL("),
+    ]
+
+    SEQUENCE_BLOCK_QUERY = SQLQueries.UPDATE_SEQUENCE_BLOCK
+
+    def __init__(self, path: str = "bank_system.db", busy_timeout: int = 5000,
+                 journal_mode: str = "WAL", synchronous: str = "NORMAL", cached_statements: int = 128):
+        """
+        SQLite 접속 정보 초기화 (스키마가 없으면 생성)
+
+        Args:
+            path: DB 파일 경로
+            busy_timeout: 잠금 대기 제한 (밀리초)
+            journal_mode: 저널 모드 (WAL 권장)
+            synchronous: 동기화 수준 (WAL에서는 NORMAL로도 커밋 내구성 유지)
+            cached_statements: 연결별 준비된 문장 캐시 크기
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.statement_cache_size = cached_statements
+        self._translated: Dict[str, str] = {}
+        self._translate_lock = threading.Lock()
+
+        connection = self.connect()
+        try:
+            with open(SCHEMA_PATH, encoding='utf-8') as schema:
+                connection.executescript(schema.read())
+        finally:
+            connection.close()
+
+    def connect(self):
+        """자동 커밋 모드의 새 연결 생성 (여러 스레드에서 순차 사용 가능)"""
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=self.statement_cache_size
+        )
+        connection.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        connection.execute(f"PRAGMA synchronous = {self.synchronous}")
+        connection.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+        return connection
+
+    def create_pool(self, pool_config: Dict[str, Any]):
+        """SQLite 연결 풀 생성"""
+        return SQLitePool(
+            self.connect,
+            min=pool_config.get('min', 1),
+            max=pool_config.get('max', 10),
+            wait_timeout=pool_config.get('wait_timeout', 0)
+        )
+
+    def create_async_pool(self, pool_config: Dict[str, Any]):
+        """SQLite 비동기 연결 풀 생성 (개발/테스트용)"""
+        return AsyncSQLitePool(
+            self.connect,
+            self,
+            min=pool_config.get('min', 1),
+            max=pool_config.get('max', 10),
+            wait_timeout=pool_config.get('wait_timeout', 0)
+        )
+
+    def begin(self, connection):
+        """쓰기 잠금을 바로 잡는 트랜잭션 시작 (FOR UPDATE 대체, 잠금 승격 교착 방지)"""
+        connection.execute("BEGIN IMMEDIATE")
+
+    def begin_read_only(self, connection):
+        """지연 트랜잭션 시작 (WAL에서는 첫 조회 시점의 스냅샷을 끝까지 읽고 쓰기를 막지 않음)"""
+        connection.execute("BEGIN")
+
+    def wrap_cursor(self, cursor):
+        """방언 변환 커서로 감싸서 반환 (arraysize는 oracledb 기본값과 맞춤)"""
+        cursor.arraysize = 100
+        return SQLiteCursor(cursor, self)
+
+    def translate(self, query: str) -> str:
+        """Oracle 방언 쿼리를 SQLite 방언으로 변환 (쿼리별로 한 번만 변환)"""
+        translated = self._translated.get(query)
+        if translated is None:
+            translated = query
+            for pattern, replacement in self.DIALECT_RULES:
+                translated = pattern.sub(replacement, translated)
+            with self._translate_lock:
+                self._translated[query] = translated
+        return translated
+
+    def set_rowfactory(self, cursor, rowfactory):
+        """sqlite3의 row_factory는 (cursor, row)를 받으므로 위치 인자로 풀어서 전달"""
+        cursor.row_factory = lambda _cursor, row: rowfactory(*row)
+
+    def execute_returning(self, cursor, query: str, params: Dict[str, Any],
+                          returning: Dict[str, type]) -> List[tuple]:
+        """RETURNING 절의 결과 행을 그대로 조회"""
+        cursor.execute(query, params)
+        return [tuple(row) for row in cursor.fetchall()]
+
+    def next_sequence_values(self, cursor, sequence_name: str, count: int) -> List[int]:
+        """sequences 테이블 값을 count만큼 증가시키고 그 구간을 반환"""
+        cursor.execute(self.SEQUENCE_BLOCK_QUERY, {'count': count, 'name': sequence_name})
+        row = cursor.fetchone()
+        if row is None:
+            raise sqlite3.OperationalError(f"시퀀스가 없습니다: {sequence_name}")
+        last_value = row[0]
+        return list(range(last_value - count + 1, last_value + 1))
+
+    async def begin_async(self, connection):
+        """쓰기 잠금을 바로 잡는 트랜잭션 시작 (잠금 대기는 풀 스레드에서)"""
+        await connection.execute("BEGIN IMMEDIATE")
+
+    async def execute_returning_async(self, cursor, query: str, params: Dict[str, Any],
+                                      returning: Dict[str, type]) -> List[tuple]:
+        """RETURNING 절의 결과 행을 그대로 조회"""
+        await cursor.execute(query, params)
+        return [tuple(row) for row in await cursor.fetchall()]
+
+    async def next_sequence_values_async(self, cursor, sequence_name: str, count: int) -> List[int]:
+        """sequences 테이블 값을 count만큼 증가시키고 그 구간을 반환"""
+        await cursor.execute(self.SEQUENCE_BLOCK_QUERY, {'count': count, 'name': sequence_name})
+        row = await cursor.fetchone()
+        if row is None:
+            raise sqlite3.OperationalError(f"시퀀스가 없습니다: {sequence_name}")
+        last_value = row[0]
+        return list(range(last_value - count + 1, last_value + 1))
+
+    def connect_options(self) -> Dict[str, Any]:
+        """다른 프로세스에서 같은 DB에 연결할 때 create_backend에 넘길 설정"""
+        return {'path': self.path, 'busy_timeout': self.busy_timeout,
+                'journal_mode': self.journal_mode, 'synchronous': self.synchronous,
+                'cached_statements': self.statement_cache_size}
@@ -5,11 +5,20 @@
 - Transaction: 거래 내역
 - InterestInfo: 이자 정보
 - InterestPayment: 이자 지급 내역
+- InterestShard, InterestRun: 이자 지급 실행 기록 (구간별 체크포인트)
+- UserSummary: 사용자 계좌 요약
+- ReconcileShard, Discrepancy: 원장 대사 구간과 불일치 기록
+
+대량으로 만들어지는 엔티티는 @dataclass(slots=True)로 선언해 인스턴스당 메모리를 줄인다.
+from_row는 조회 행의 값을 그대로 넣으므로 __post_init__(현재 시각 설정)을 거치지 않는다.
 """
 
 from .user import User
 from .account import Account
 from .transaction import Transaction
-from .interest import InterestInfo, InterestPayment
+from .interest import InterestInfo, InterestPayment, InterestShard, InterestRun
+from .user_summary import UserSummary
+from .reconciliation import ReconcileShard, Discrepancy
 
-__all__ = ['User', 'Account', 'Transaction', 'InterestInfo', 'InterestPayment']
+__all__ = ['User', 'Account', 'Transaction', 'InterestInfo', 'InterestPayment', 'InterestShard', 'InterestRun',
+           'UserSummary', 'ReconcileShard', 'Discrepancy']
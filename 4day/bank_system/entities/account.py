@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """계좌 정보를 담는 클래스"""
     
@@ -50,18 +50,37 @@ class Account:
     @classmethod
     def from_dict(cls, data: dict) -> 'Account':
         """딕셔너리에서 Account 객체 생성 (DB 조회용)"""
-        return cls(
-            account_id=data.get('ACCOUNT_ID', data.get('account_id', '')),
-            account_name=data.get('ACCOUNT_NAME', data.get('account_name', '')),
-            account_type=data.get('ACCOUNT_TYPE', data.get('account_type', '')),
-            account_password=data.get('ACCOUNT_PASSWORD', data.get('account_password', '')),
-            balance=data.get('BALANCE', data.get('balance', 0.0)),
-            user_id=data.get('USER_ID', data.get('user_id', '')),
-            create_date=data.get('CREATE_DATE', data.get('create_date', None)),
-            interest_rate=data.get('INTEREST_RATE', data.get('interest_rate', 0.0)),
-            last_interest_date=data.get('LAST_INTEREST_DATE', data.get('last_interest_date', None))
+        return cls.from_row(
+            data.get('account_id', ''),
+            data.get('account_name', ''),
+            data.get('account_type', ''),
+            data.get('account_password', ''),
+            data.get('balance', 0.0),
+            data.get('user_id', ''),
+            data.get('create_date', None),
+            data.get('interest_rate', 0.0),
+            data.get('last_interest_date', None)
         )
     
+    @classmethod
+    def from_row(cls, account_id, account_name, account_type, account_password, balance,
+                 user_id, create_date, interest_rate, last_interest_date, *extra) -> 'Account':
+        """
+        조회 행(튜플)에서 Account 객체 생성 (커서 rowfactory용)
+        SQLQueries의 계좌 조회 컬럼 순서와 같아야 하며, 뒤에 붙은 컬럼은 무시
+        """
+        account = object.__new__(cls)
+        account.account_id = account_id
+        account.account_name = account_name
+        account.account_type = account_type
+        account.account_password = account_password
+        account.balance = balance
+        account.user_id = user_id
+        account.create_date = create_date
+        account.interest_rate = interest_rate
+        account.last_interest_date = last_interest_date
+        return account
+    
     @classmethod
     def create_basic_account(cls, account_id: str, account_name: str, 
                            account_type: str, account_password: str, 
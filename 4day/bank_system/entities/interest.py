@@ -3,12 +3,12 @@
 Java의 InterestInfo와 InterestPayment 클래스를 Python으로 변환
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class InterestInfo:
     """이자 계산 정보를 담는 클래스"""
     
@@ -47,7 +47,7 @@ class InterestInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class InterestPayment:
     """이자 지급 내역을 담는 클래스"""
     
@@ -79,14 +79,29 @@ class InterestPayment:
     @classmethod
     def from_dict(cls, data: dict) -> 'InterestPayment':
         """딕셔너리에서 InterestPayment 객체 생성 (DB 조회용)"""
-        return cls(
-            payment_id=data.get('PAYMENT_ID', data.get('payment_id', '')),
-            account_id=data.get('ACCOUNT_ID', data.get('account_id', '')),
-            payment_date=data.get('PAYMENT_DATE', data.get('payment_date', None)),
-            interest_amount=data.get('INTEREST_AMOUNT', data.get('interest_amount', 0.0)),
-            admin_id=data.get('ADMIN_ID', data.get('admin_id', ''))
+        return cls.from_row(
+            data.get('payment_id', ''),
+            data.get('account_id', ''),
+            data.get('payment_date', None),
+            data.get('interest_amount', 0.0),
+            data.get('admin_id', '')
         )
     
+    @classmethod
+    def from_row(cls, payment_id, account_id, payment_date, interest_amount,
+                 admin_id, *extra) -> 'InterestPayment':
+        """
+        조회 행(튜플)에서 InterestPayment 객체 생성 (커서 rowfactory용)
+        SQLQueries의 이자 지급 조회 컬럼 순서와 같아야 하며, 뒤에 붙은 컬럼은 무시
+        """
+        payment = object.__new__(cls)
+        payment.payment_id = payment_id
+        payment.account_id = account_id
+        payment.payment_date = payment_date
+        payment.interest_amount = interest_amount
+        payment.admin_id = admin_id
+        return payment
+    
     @classmethod
     def create_payment(cls, payment_id: str, account_id: str, 
                       interest_amount: float, admin_id: str) -> 'InterestPayment':
@@ -97,3 +112,57 @@ class InterestPayment:
             interest_amount=interest_amount,
             admin_id=admin_id
         )
+
+
+@dataclass(slots=True)
+class InterestShard:
+    """이자 지급 구간(계좌번호 범위)과 진행 상황을 담는 클래스"""
+    
+    shard_no: int                   # 구간 번호 (1부터)
+    start_id: Optional[str]         # 첫 계좌번호 (포함, None이면 처음부터)
+    end_id: Optional[str]           # 다음 구간의 첫 계좌번호 (미포함, None이면 끝까지)
+    account_count: int = 0          # 계획 시점의 대상 계좌 수
+    last_account_id: Optional[str] = None   # 마지막으로 커밋한 청크의 마지막 계좌번호 (재개 지점)
+    paid_count: int = 0             # 지급한 계좌 수
+    paid_amount: float = 0.0        # 지급한 이자 합계
+    status: str = "PENDING"         # PENDING / DONE / FAILED
+    updated_at: Optional[datetime] = None   # 마지막 체크포인트 시각
+    
+    def __str__(self) -> str:
+        """구간 정보를 문자열로 반환"""
+        text = f"샤드 {self.shard_no} [{self.start_id or '처음'} ~ {self.end_id or '끝'}) {self.account_count:,}개 계좌"
+        if self.last_account_id:
+            text += f", {self.last_account_id}까지 지급됨"
+        return text
+
+
+@dataclass(slots=True)
+class InterestRun:
+    """이자 지급 실행 기록(저널)을 담는 클래스"""
+    
+    run_id: str                     # 실행 ID
+    admin_id: str                   # 실행을 시작한 관리자
+    calc_date: datetime             # 이자 계산 기준 시각 (재개해도 같은 시각 사용)
+    status: str = "RUNNING"         # RUNNING / COMPLETED / FAILED
+    started_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    shards: List[InterestShard] = field(default_factory=list)
+    
+    def __str__(self) -> str:
+        """실행 정보를 문자열로 반환"""
+        return (f"InterestRun(id={self.run_id}, status={self.status}, "
+                f"shards={len(self.shards)}, pending={len(self.pending_shards())})")
+    
+    def pending_shards(self) -> List[InterestShard]:
+        """아직 끝나지 않은 구간 목록"""
+        return [shard for shard in self.shards if shard.status != "DONE"]
+    
+    @property
+    def paid_count(self) -> int:
+        """지금까지 지급한 계좌 수"""
+        return sum(shard.paid_count for shard in self.shards)
+    
+    @property
+    def paid_amount(self) -> float:
+        """지금까지 지급한 이자 합계"""
+        return sum(shard.paid_amount for shard in self.shards)
@@ -0,0 +1,76 @@
+"""
+원장 대사 관련 엔티티 클래스들
+- ReconcileShard: 대사 구간 (계좌번호 범위)
+- Discrepancy: 원장과 계좌 잔액의 불일치 한 건
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class ReconcileShard:
+    """원장 대사 구간(계좌번호 범위)을 담는 클래스"""
+    
+    shard_no: int                   # 구간 번호 (1부터)
+    start_id: Optional[str]         # 첫 계좌번호 (포함, None이면 처음부터)
+    end_id: Optional[str]           # 다음 구간의 첫 계좌번호 (미포함, None이면 끝까지)
+    account_count: int = 0          # 계획 시점의 계좌 수
+    
+    def __str__(self) -> str:
+        """구간 정보를 문자열로 반환"""
+        return f"샤드 {self.shard_no} [{self.start_id or '처음'} ~ {self.end_id or '끝'}) {self.account_count:,}개 계좌"
+
+
+@dataclass(slots=True)
+class Discrepancy:
+    """원장(거래/이자 기록)과 계좌 잔액의 불일치 한 건을 담는 클래스"""
+    
+    # 불일치 종류
+    BALANCE_MISMATCH = "BALANCE_MISMATCH"   # 계좌 잔액 != 마지막 거래 후 잔액 + 그 이후 지급 이자
+    LEDGER_BREAK = "LEDGER_BREAK"           # 거래 후 잔액 != 직전 거래 후 잔액 + 사이 지급 이자 +/- 거래액
+    OPENING_BALANCE = "OPENING_BALANCE"     # 첫 거래 이전 잔액이 0이 아님 (원장에 없는 입금)
+    ORPHAN_LEDGER = "ORPHAN_LEDGER"         # 계좌가 없는 거래/이자 기록
+    
+    KIND_NAMES = {
+        BALANCE_MISMATCH: "잔액 불일치",
+        LEDGER_BREAK: "원장 불연속",
+        OPENING_BALANCE: "개설 잔액 불일치",
+        ORPHAN_LEDGER: "계좌 없는 원장"
+    }
+    
+    account_id: str                 # 계좌번호
+    kind: str                       # 불일치 종류
+    expected: Optional[float]       # 원장으로 계산한 금액
+    actual: Optional[float]         # 기록된 금액 (계좌 잔액 또는 거래 후 잔액)
+    transaction_id: Optional[str] = None    # 관련 거래번호
+    detail: str = ""                # 설명
+    
+    @property
+    def difference(self) -> float:
+        """기록된 금액 - 원장으로 계산한 금액"""
+        if self.expected is None or self.actual is None:
+            return 0.0
+        return self.actual - self.expected
+    
+    @property
+    def kind_name(self) -> str:
+        """불일치 종류 표시 이름"""
+        return self.KIND_NAMES.get(self.kind, self.kind)
+    
+    def __str__(self) -> str:
+        """불일치 정보를 문자열로 반환"""
+        return f"Discrepancy(account={self.account_id}, kind={self.kind}, difference={self.difference:,.2f})"
+    
+    def to_dict(self) -> dict:
+        """불일치 정보를 딕셔너리로 변환 (보고서 기록용)"""
+        return {
+            'account_id': self.account_id,
+            'kind': self.kind,
+            'kind_name': self.kind_name,
+            'expected': self.expected,
+            'actual': self.actual,
+            'difference': self.difference if self.expected is not None and self.actual is not None else None,
+            'transaction_id': self.transaction_id,
+            'detail': self.detail
+        }
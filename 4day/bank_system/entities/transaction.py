@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """거래 내역을 담는 클래스"""
     
@@ -50,19 +50,40 @@ class Transaction:
     @classmethod
     def from_dict(cls, data: dict) -> 'Transaction':
         """딕셔너리에서 Transaction 객체 생성 (DB 조회용)"""
-        return cls(
-            transaction_id=data.get('TRANSACTION_ID', data.get('transaction_id', '')),
-            account_id=data.get('ACCOUNT_ID', data.get('account_id', '')),
-            transaction_type=data.get('TRANSACTION_TYPE', data.get('transaction_type', '')),
-            amount=data.get('AMOUNT', data.get('amount', 0.0)),
-            balance_after=data.get('BALANCE_AFTER', data.get('balance_after', 0.0)),
-            counterpart_account=data.get('COUNTERPART_ACCOUNT', data.get('counterpart_account')),
-            counterpart_name=data.get('COUNTERPART_NAME', data.get('counterpart_name')),
-            depositor_name=data.get('DEPOSITOR_NAME', data.get('depositor_name')),
-            transaction_memo=data.get('TRANSACTION_MEMO', data.get('transaction_memo')),
-            transaction_date=data.get('TRANSACTION_DATE', data.get('transaction_date', None))
+        return cls.from_row(
+            data.get('transaction_id', ''),
+            data.get('transaction_date', None),
+            data.get('account_id', ''),
+            data.get('transaction_type', ''),
+            data.get('amount', 0.0),
+            data.get('balance_after', 0.0),
+            data.get('counterpart_account'),
+            data.get('counterpart_name'),
+            data.get('depositor_name'),
+            data.get('transaction_memo')
         )
     
+    @classmethod
+    def from_row(cls, transaction_id, transaction_date, account_id, transaction_type, amount,
+                 balance_after, counterpart_account, counterpart_name, depositor_name,
+                 transaction_memo, *extra) -> 'Transaction':
+        """
+        조회 행(튜플)에서 Transaction 객체 생성 (커서 rowfactory용)
+        SQLQueries의 거래 조회 컬럼 순서와 같아야 하며, 뒤에 붙은 컬럼은 무시
+        """
+        transaction = object.__new__(cls)
+        transaction.transaction_id = transaction_id
+        transaction.account_id = account_id
+        transaction.transaction_type = transaction_type
+        transaction.amount = amount
+        transaction.balance_after = balance_after
+        transaction.counterpart_account = counterpart_account
+        transaction.counterpart_name = counterpart_name
+        transaction.depositor_name = depositor_name
+        transaction.transaction_memo = transaction_memo
+        transaction.transaction_date = transaction_date
+        return transaction
+    
     @classmethod
     def create_deposit_withdrawal(cls, transaction_id: str, account_id: str,
                                 transaction_type: str, amount: float, 
@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """사용자 정보를 담는 클래스"""
     
@@ -42,11 +42,27 @@ class User:
     @classmethod
     def from_dict(cls, data: dict) -> 'User':
         """딕셔너리에서 User 객체 생성 (DB 조회용)"""
-        return cls(
-            user_id=data.get('USER_ID', data.get('user_id', '')),
-            user_name=data.get('USER_NAME', data.get('user_name', '')),
-            user_password=data.get('USER_PASSWORD', data.get('user_password', '')),
-            user_email=data.get('USER_EMAIL', data.get('user_email', '')),
-            user_phone=data.get('USER_PHONE', data.get('user_phone', '')),
-            join_date=data.get('JOIN_DATE', data.get('join_date', None))
+        return cls.from_row(
+            data.get('user_id', ''),
+            data.get('user_name', ''),
+            data.get('user_password', ''),
+            data.get('user_email', ''),
+            data.get('user_phone', ''),
+            data.get('join_date', None)
         )
+    
+    @classmethod
+    def from_row(cls, user_id, user_name, user_password, user_email, user_phone,
+                 join_date, *extra) -> 'User':
+        """
+        조회 행(튜플)에서 User 객체 생성 (커서 rowfactory용)
+        SQLQueries의 사용자 조회 컬럼 순서와 같아야 하며, 뒤에 붙은 컬럼은 무시
+        """
+        user = object.__new__(cls)
+        user.user_id = user_id
+        user.user_name = user_name
+        user.user_password = user_password
+        user.user_email = user_email
+        user.user_phone = user_phone
+        user.join_date = join_date
+        return user
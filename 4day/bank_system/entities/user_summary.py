@@ -0,0 +1,136 @@
+"""
+사용자 계좌 요약 엔티티 클래스
+사용자별 계좌 목록, 총 잔액, 계좌 종류별 계좌 수/잔액, 마지막 거래일시를 미리 집계해 보관
+(입금/출금/이체/이자 지급 시 변동분만 반영하므로 목록 화면에서 accounts를 다시 조회하지 않음)
+"""
+
+import dataclasses
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, List
+from .account import Account
+
+
+@dataclass(slots=True)
+class UserSummary:
+    """사용자별 계좌 요약 정보를 담는 클래스"""
+
+    user_id: str                                                    # 사용자 ID
+    accounts: Dict[str, Account] = field(default_factory=dict)      # 계좌번호 -> 계좌 (개설일 최신순)
+    total_balance: float = 0.0                                      # 총 잔액
+    count_by_type: Dict[str, int] = field(default_factory=dict)     # 계좌 종류별 계좌 수
+    balance_by_type: Dict[str, float] = field(default_factory=dict)  # 계좌 종류별 잔액
+    last_activity: Optional[datetime] = None                        # 마지막 거래(이자 지급 포함) 일시
+
+    def __str__(self) -> str:
+        """요약 정보를 문자열로 반환"""
+        return (f"UserSummary(user={self.user_id}, accounts={self.account_count}, "
+                f"balance={self.total_balance:,.0f}원)")
+
+    @property
+    def account_count(self) -> int:
+        """계좌 수"""
+        return len(self.accounts)
+
+    def get_accounts(self) -> List[Account]:
+        """계좌 목록 반환 (개설일 최신순)"""
+        return list(self.accounts.values())
+
+    def copy(self) -> 'UserSummary':
+        """
+        요약 정보 복사본 반환
+        계좌 객체는 변경하지 않고 교체하므로 딕셔너리만 복사
+        """
+        return UserSummary(
+            user_id=self.user_id,
+            accounts=dict(self.accounts),
+            total_balance=self.total_balance,
+            count_by_type=dict(self.count_by_type),
+            balance_by_type=dict(self.balance_by_type),
+            last_activity=self.last_activity
+        )
+
+    def add_account(self, account: Account, activity_date: Optional[datetime] = None):
+        """
+        새 계좌 반영 (최신 계좌가 맨 앞)
+
+        Args:
+            account: 개설한 계좌
+            activity_date: 거래 일시 (초기 입금이 있으면 개설일시)
+        """
+        if account.account_id in self.accounts:
+            return
+
+        self.accounts = {account.account_id: account, **self.accounts}
+        self.total_balance += account.balance
+        self.count_by_type[account.account_type] = self.count_by_type.get(account.account_type, 0) + 1
+        self.balance_by_type[account.account_type] = (
+            self.balance_by_type.get(account.account_type, 0.0) + account.balance
+        )
+        self._touch(activity_date)
+
+    def remove_account(self, account_id: str):
+        """
+        해지한 계좌 제외
+
+        Args:
+            account_id: 해지한 계좌번호
+        """
+        account = self.accounts.pop(account_id, None)
+        if account is None:
+            return
+
+        self.total_balance -= account.balance
+        self.balance_by_type[account.account_type] -= account.balance
+        self.count_by_type[account.account_type] -= 1
+        if self.count_by_type[account.account_type] == 0:
+            del self.count_by_type[account.account_type]
+            del self.balance_by_type[account.account_type]
+
+    def apply_delta(self, account_id: str, delta: float, activity_date: Optional[datetime] = None):
+        """
+        계좌 잔액 변동분 반영
+
+        Args:
+            account_id: 계좌번호
+            delta: 잔액 변동분 (입금 +, 출금 -)
+            activity_date: 거래 일시
+        """
+        account = self.accounts.get(account_id)
+        if account is None:
+            return
+
+        # 다른 스레드에 넘겨준 복사본이 같은 계좌 객체를 참조하므로 새 객체로 교체
+        self.accounts[account_id] = dataclasses.replace(account, balance=account.balance + delta)
+        self.total_balance += delta
+        self.balance_by_type[account.account_type] += delta
+        self._touch(activity_date)
+
+    def _touch(self, activity_date: Optional[datetime]):
+        """마지막 거래 일시 갱신"""
+        if activity_date and (self.last_activity is None or activity_date > self.last_activity):
+            self.last_activity = activity_date
+
+    @classmethod
+    def from_accounts(cls, user_id: str, accounts: List[Account],
+                      last_activity: Optional[datetime] = None) -> 'UserSummary':
+        """
+        계좌 목록으로 요약 정보 생성 (DB 조회 시)
+
+        Args:
+            user_id: 사용자 ID
+            accounts: 사용자의 계좌 목록 (개설일 최신순)
+            last_activity: 마지막 거래 일시
+
+        Returns:
+            UserSummary: 요약 정보
+        """
+        summary = cls(user_id=user_id, last_activity=last_activity)
+        for account in accounts:
+            summary.accounts[account.account_id] = account
+            summary.total_balance += account.balance
+            summary.count_by_type[account.account_type] = summary.count_by_type.get(account.account_type, 0) + 1
+            summary.balance_by_type[account.account_type] = (
+                summary.balance_by_type.get(account.account_type, 0.0) + account.balance
+            )
+        return summary
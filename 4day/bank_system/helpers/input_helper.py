@@ -3,6 +3,7 @@
 Java의 InputHelper 클래스를 Python으로 변환
 """
 
+from datetime import datetime
 from typing import Optional
 from .validation_helper import ValidationHelper
 
@@ -154,6 +155,22 @@ class InputHelper:
             except ValueError:
                 print("올바른 숫자를 입력해주세요.")
     
+    def input_date(self, prompt: str) -> datetime:
+        """
+        날짜 입력 및 검증
+        
+        Args:
+            prompt: 입력 프롬프트
+            
+        Returns:
+            datetime: 입력한 날짜 (0시 0분)
+        """
+        while True:
+            try:
+                return datetime.strptime(self.input(prompt), '%Y-%m-%d')
+            except ValueError:
+                print("YYYY-MM-DD 형식으로 입력해주세요.")
+    
     def input_account_id(self, prompt: str, own_only: bool = False, login_id: Optional[str] = None) -> str:
         """
         계좌번호 입력 및 검증
@@ -215,7 +232,7 @@ class InputHelper:
     
     def input_new_user_email(self, login_id: str) -> Optional[str]:
         """
-        새 이메일 입력 (유효성 검사 포함)
+        새 이메일 입력 (형식 검사 포함, 중복 확인은 modify_user_info에서 전화번호와 함께 한 번에)
         
         Args:
             login_id: 로그인한 사용자 ID
@@ -230,8 +247,7 @@ class InputHelper:
                 if not user_input:  # 빈 입력이면 기존 유지
                     return None
                 
-                if (self.validator.validate_email(user_input) and 
-                    self.validator.check_email_duplicate(user_input, login_id)):
+                if self.validator.validate_email(user_input):
                     return user_input
                     
             except KeyboardInterrupt:
@@ -243,7 +259,7 @@ class InputHelper:
     
     def input_new_user_phone(self, login_id: str) -> Optional[str]:
         """
-        새 전화번호 입력 (유효성 검사 포함)
+        새 전화번호 입력 (형식 검사 포함, 중복 확인은 modify_user_info에서 이메일과 함께 한 번에)
         
         Args:
             login_id: 로그인한 사용자 ID
@@ -258,8 +274,7 @@ class InputHelper:
                 if not user_input:  # 빈 입력이면 기존 유지
                     return None
                 
-                if (self.validator.validate_phone(user_input) and 
-                    self.validator.check_phone_duplicate(user_input, login_id)):
+                if self.validator.validate_phone(user_input):
                     return user_input
                     
             except KeyboardInterrupt:
@@ -305,3 +320,19 @@ class InputHelper:
                 return False
             else:
                 print("y 또는 n을 입력해주세요.")
+    
+    def input_next_page(self) -> bool:
+        """
+        다음 페이지를 볼지 입력 (빈 값 허용)
+        
+        Returns:
+            bool: 엔터면 True, q면 False
+        """
+        try:
+            return input("다음 페이지는 엔터, 그만 보려면 q: ").strip().lower() != 'q'
+        except KeyboardInterrupt:
+            print("\n프로그램을 종료합니다.")
+            exit(0)
+        except EOFError:
+            print("\n입력이 종료되었습니다.")
+            exit(0)
@@ -3,17 +3,27 @@
 Java의 ValidationHelper 클래스를 Python으로 변환
 """
 
+import math
 import re
-from typing import Optional
-from ..database import get_database_connection
+from typing import Optional, List
+from ..database import get_database_connection, SQLQueries
+from ..utils.user_key_index import get_user_key_index
 
 
 class ValidationHelper:
     """입력 데이터의 유효성을 검사하는 클래스"""
     
+    # 중복 확인 항목 -> (SELECT_USER_KEY_CONFLICTS 결과 컬럼, 중복 시 메시지)
+    DUPLICATE_FIELDS = {
+        'user_id': ('id_count', "이미 존재하는 아이디입니다."),
+        'user_email': ('email_count', "이미 사용 중인 이메일입니다."),
+        'user_phone': ('phone_count', "이미 사용 중인 전화번호입니다.")
+    }
+    
     def __init__(self):
         """ValidationHelper 초기화"""
         self.db = get_database_connection()
+        self.user_index = get_user_key_index()
     
     def validate_user_id(self, user_id: str) -> bool:
         """
@@ -25,16 +35,32 @@ class ValidationHelper:
         Returns:
             bool: 유효한 ID인지 여부
         """
-        if len(user_id) < 4 or len(user_id) > 8:
-            print("아이디는 4~8자리여야 합니다.")
+        error = self.get_user_id_error(user_id)
+        if error:
+            print(error)
             return False
         
+        return True
+    
+    @staticmethod
+    def get_user_id_error(user_id: str) -> Optional[str]:
+        """
+        사용자 ID 규칙 위반 내용 조회 (출력하지 않음, 대량 등록 등에서 사용)
+        
+        Args:
+            user_id: 검사할 사용자 ID
+            
+        Returns:
+            Optional[str]: 오류 메시지 (유효하면 None)
+        """
+        if len(user_id) < 4 or len(user_id) > 8:
+            return "아이디는 4~8자리여야 합니다."
+        
         # 영문자(대소문자)와 숫자가 모두 포함되어야 함
         if not re.match(r'^(?=.*[a-zA-Z])(?=.*[0-9])[a-zA-Z0-9]+$', user_id):
-            print("아이디는 영문과 숫자가 모두 포함되어야 합니다.")
-            return False
+            return "아이디는 영문과 숫자가 모두 포함되어야 합니다."
         
-        return True
+        return None
     
     def validate_user_name(self, user_name: str) -> bool:
         """
@@ -46,12 +72,29 @@ class ValidationHelper:
         Returns:
             bool: 유효한 이름인지 여부
         """
-        if len(user_name) > 20:
-            print("이름은 20자리까지만 가능합니다.")
+        error = self.get_user_name_error(user_name)
+        if error:
+            print(error)
             return False
         
         return True
     
+    @staticmethod
+    def get_user_name_error(user_name: str) -> Optional[str]:
+        """
+        사용자 이름 규칙 위반 내용 조회 (출력하지 않음)
+        
+        Args:
+            user_name: 검사할 사용자 이름
+            
+        Returns:
+            Optional[str]: 오류 메시지 (유효하면 None)
+        """
+        if len(user_name) > 20:
+            return "이름은 20자리까지만 가능합니다."
+        
+        return None
+    
     def validate_user_password(self, password: str, user_id: str) -> bool:
         """
         사용자 비밀번호 유효성 검사
@@ -63,20 +106,36 @@ class ValidationHelper:
         Returns:
             bool: 유효한 비밀번호인지 여부
         """
-        if len(password) < 7 or len(password) > 12:
-            print("비밀번호는 7~12자리여야 합니다.")
+        error = self.get_user_password_error(password, user_id)
+        if error:
+            print(error)
             return False
         
+        return True
+    
+    @staticmethod
+    def get_user_password_error(password: str, user_id: str) -> Optional[str]:
+        """
+        사용자 비밀번호 규칙 위반 내용 조회 (출력하지 않음)
+        
+        Args:
+            password: 검사할 비밀번호
+            user_id: 사용자 ID (비밀번호와 같으면 안됨)
+            
+        Returns:
+            Optional[str]: 오류 메시지 (유효하면 None)
+        """
+        if len(password) < 7 or len(password) > 12:
+            return "비밀번호는 7~12자리여야 합니다."
+        
         # 영문자(대소문자)와 숫자가 모두 포함되어야 함
         if not re.match(r'^(?=.*[a-zA-Z])(?=.*[0-9])[a-zA-Z0-9]+$', password):
-            print("비밀번호는 영문과 숫자가 모두 포함되어야 합니다.")
-            return False
+            return "비밀번호는 영문과 숫자가 모두 포함되어야 합니다."
         
         if password == user_id:
-            print("비밀번호는 아이디와 같을 수 없습니다.")
-            return False
+            return "비밀번호는 아이디와 같을 수 없습니다."
         
-        return True
+        return None
     
     def validate_email(self, email: str) -> bool:
         """
@@ -88,23 +147,38 @@ class ValidationHelper:
         Returns:
             bool: 유효한 이메일인지 여부
         """
-        if len(email) > 100:
-            print("이메일은 100자리까지만 가능합니다.")
+        error = self.get_email_error(email)
+        if error:
+            print(error)
             return False
         
+        return True
+    
+    @staticmethod
+    def get_email_error(email: str) -> Optional[str]:
+        """
+        이메일 규칙 위반 내용 조회 (출력하지 않음)
+        
+        Args:
+            email: 검사할 이메일
+            
+        Returns:
+            Optional[str]: 오류 메시지 (유효하면 None)
+        """
+        if len(email) > 100:
+            return "이메일은 100자리까지만 가능합니다."
+        
         # 기본적인 이메일 형식 검증
         if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
-            print("올바른 이메일 형식이 아닙니다. (예: test@example.com)")
-            return False
+            return "올바른 이메일 형식이 아닙니다. (예: test@example.com)"
         
         # 일반적인 도메인 검증
         common_domains = ['.com', '.net', '.org', '.edu', '.gov', '.co.kr', '.kr']
         email_lower = email.lower()
         if not any(email_lower.endswith(domain) for domain in common_domains):
-            print("일반적인 도메인을 사용해주세요. (.com, .net, .org, .kr 등)")
-            return False
+            return "일반적인 도메인을 사용해주세요. (.com, .net, .org, .kr 등)"
         
-        return True
+        return None
     
     def validate_phone(self, phone: str) -> bool:
         """
@@ -116,22 +190,37 @@ class ValidationHelper:
         Returns:
             bool: 유효한 전화번호인지 여부
         """
+        error = self.get_phone_error(phone)
+        if error:
+            print(error)
+            return False
+        
+        return True
+    
+    @staticmethod
+    def get_phone_error(phone: str) -> Optional[str]:
+        """
+        전화번호 규칙 위반 내용 조회 (출력하지 않음)
+        
+        Args:
+            phone: 검사할 전화번호
+            
+        Returns:
+            Optional[str]: 오류 메시지 (유효하면 None)
+        """
         # 010-0000-0000 형식 검증
         if not re.match(r'^010-\d{4}-\d{4}$', phone):
-            print("전화번호는 010-0000-0000 형식으로 입력해주세요.")
-            return False
+            return "전화번호는 010-0000-0000 형식으로 입력해주세요."
         
         # 중간 4자리가 1000 이상인지 확인
         middle_part = phone[4:8]
         try:
             if int(middle_part) < 1000:
-                print("유효하지 않은 전화번호입니다. (010-1000-0000 이상이어야 합니다)")
-                return False
+                return "유효하지 않은 전화번호입니다. (010-1000-0000 이상이어야 합니다)"
         except ValueError:
-            print("유효하지 않은 전화번호입니다.")
-            return False
+            return "유효하지 않은 전화번호입니다."
         
-        return True
+        return None
     
     def validate_account_password(self, password: str) -> bool:
         """
@@ -143,42 +232,105 @@ class ValidationHelper:
         Returns:
             bool: 유효한 계좌 비밀번호인지 여부
         """
-        if len(password) != 4:
-            print("계좌 비밀번호는 4자리여야 합니다.")
+        error = self.get_account_password_error(password)
+        if error:
+            print(error)
             return False
         
+        return True
+    
+    @staticmethod
+    def get_account_password_error(password: str) -> Optional[str]:
+        """
+        계좌 비밀번호 규칙 위반 내용 조회 (출력하지 않음)
+        
+        Args:
+            password: 검사할 계좌 비밀번호
+            
+        Returns:
+            Optional[str]: 오류 메시지 (유효하면 None)
+        """
+        if len(password) != 4:
+            return "계좌 비밀번호는 4자리여야 합니다."
+        
         if not re.match(r'^[0-9]+$', password):
-            print("계좌 비밀번호는 숫자만 입력 가능합니다.")
-            return False
+            return "계좌 비밀번호는 숫자만 입력 가능합니다."
         
-        return True
+        return None
     
-    def check_user_id_duplicate(self, user_id: str) -> bool:
+    def find_user_conflicts(self, user_id: Optional[str] = None, email: Optional[str] = None,
+                            phone: Optional[str] = None, current_user_id: Optional[str] = None) -> List[str]:
         """
-        사용자 ID 중복 확인
+        아이디/이메일/전화번호 중 이미 사용 중인 항목 조회 (DB 왕복 최대 1회)
+        
+        중복 확인 색인이 있으면 색인에 없는 값(확실히 미사용)은 DB에서 확인하지 않고,
+        확인할 값이 남지 않으면 DB를 조회하지 않음
         
         Args:
-            user_id: 확인할 사용자 ID
+            user_id: 확인할 사용자 ID (None이면 확인하지 않음)
+            email: 확인할 이메일
+            phone: 확인할 전화번호
+            current_user_id: 현재 사용자 ID (수정 시 본인 제외용)
             
         Returns:
-            bool: 중복되지 않으면 True, 중복되면 False
+            List[str]: 사용 중인 항목 ('user_id', 'user_email', 'user_phone')
+        """
+        values = {'user_id': user_id, 'user_email': email, 'user_phone': phone}
+        values = {field: value for field, value in values.items() if value}
+        if self.user_index is not None:
+            values = {field: value for field, value in values.items()
+                      if self.user_index.might_exist(field, value)}
+        if not values:
+            return []
+        
+        results = self.db.execute_query(SQLQueries.SELECT_USER_KEY_CONFLICTS, {
+            'user_id': values.get('user_id'),
+            'user_email': values.get('user_email'),
+            'user_phone': values.get('user_phone'),
+            'current_user_id': current_user_id
+        })
+        
+        row = results[0]
+        return [field for field in values if row[self.DUPLICATE_FIELDS[field][0]] > 0]
+    
+    def check_user_duplicates(self, user_id: Optional[str] = None, email: Optional[str] = None,
+                              phone: Optional[str] = None, current_user_id: Optional[str] = None) -> bool:
+        """
+        아이디/이메일/전화번호 중복을 한 번에 확인 (중복된 항목마다 메시지 출력)
+        
+        Args:
+            user_id: 확인할 사용자 ID (None이면 확인하지 않음)
+            email: 확인할 이메일
+            phone: 확인할 전화번호
+            current_user_id: 현재 사용자 ID (수정 시 본인 제외용)
+            
+        Returns:
+            bool: 모두 중복되지 않으면 True, 하나라도 중복되면 False
         """
         try:
-            query = "SELECT COUNT(*) as count FROM users WHERE user_id = :user_id"
-            results = self.db.execute_query(query, {'user_id': user_id})
+            conflicts = self.find_user_conflicts(user_id, email, phone, current_user_id)
             
-            if results and len(results) > 0:
-                count = results[0].get('COUNT', results[0].get('count', 0))
-                if count > 0:
-                    print("이미 존재하는 아이디입니다.")
-                    return False
+            for field in conflicts:
+                print(self.DUPLICATE_FIELDS[field][1])
             
-            return True
+            return not conflicts
             
         except Exception as e:
-            print(f"아이디 중복 확인 오류: {e}")
+            print(f"중복 확인 오류: {e}")
             return False
     
+    def check_user_id_duplicate(self, user_id: str) -> bool:
+        """
+        사용자 ID 중복 확인
+        
+        Args:
+            user_id: 확인할 사용자 ID
+            
+        Returns:
+            bool: 중복되지 않으면 True, 중복되면 False
+        """
+        return self.check_user_duplicates(user_id=user_id)
+    
     def check_email_duplicate(self, email: str, current_user_id: Optional[str] = None) -> bool:
         """
         이메일 중복 확인 (수정 시 본인 제외)
@@ -190,27 +342,7 @@ class ValidationHelper:
         Returns:
             bool: 중복되지 않으면 True, 중복되면 False
         """
-        try:
-            if current_user_id:
-                query = "SELECT COUNT(*) FROM users WHERE user_email = :email AND user_id != :current_user_id"
-                params = {'email': email, 'current_user_id': current_user_id}
-            else:
-                query = "SELECT COUNT(*) FROM users WHERE user_email = :email"
-                params = {'email': email}
-            
-            results = self.db.execute_query(query, params)
-            
-            if results and len(results) > 0:
-                count = results[0].get('COUNT', results[0].get('count', 0))
-                if count > 0:
-                    print("이미 사용 중인 이메일입니다.")
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            print(f"이메일 중복 확인 오류: {e}")
-            return False
+        return self.check_user_duplicates(email=email, current_user_id=current_user_id)
     
     def check_phone_duplicate(self, phone: str, current_user_id: Optional[str] = None) -> bool:
         """
@@ -223,27 +355,7 @@ class ValidationHelper:
         Returns:
             bool: 중복되지 않으면 True, 중복되면 False
         """
-        try:
-            if current_user_id:
-                query = "SELECT COUNT(*) FROM users WHERE user_phone = :phone AND user_id != :current_user_id"
-                params = {'phone': phone, 'current_user_id': current_user_id}
-            else:
-                query = "SELECT COUNT(*) FROM users WHERE user_phone = :phone"
-                params = {'phone': phone}
-            
-            results = self.db.execute_query(query, params)
-            
-            if results and len(results) > 0:
-                count = results[0].get('COUNT', results[0].get('count', 0))
-                if count > 0:
-                    print("이미 사용 중인 전화번호입니다.")
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            print(f"전화번호 중복 확인 오류: {e}")
-            return False
+        return self.check_user_duplicates(phone=phone, current_user_id=current_user_id)
     
     def validate_amount(self, amount: float) -> bool:
         """
@@ -255,12 +367,31 @@ class ValidationHelper:
         Returns:
             bool: 유효한 금액인지 여부
         """
-        if amount < 1000:
-            print("금액은 1,000원 이상이어야 합니다.")
+        error = self.get_amount_error(amount)
+        if error:
+            print(error)
             return False
         
         return True
     
+    @staticmethod
+    def get_amount_error(amount: float) -> Optional[str]:
+        """
+        금액 규칙 위반 내용 조회 (출력하지 않음)
+        
+        Args:
+            amount: 검사할 금액
+            
+        Returns:
+            Optional[str]: 오류 메시지 (유효하면 None)
+        """
+        if not math.isfinite(amount):
+            return "금액은 숫자여야 합니다."
+        if amount < 1000:
+            return "금액은 1,000원 이상이어야 합니다."
+        
+        return None
+    
     def validate_account_number(self, account_number: str) -> bool:
         """
         계좌번호 유효성 검사
@@ -4,13 +4,24 @@
 - AccountManager: 계좌 관리
 - TransactionManager: 거래 관리
 - AdminManager: 관리자 기능
+- InterestShardManager: 이자 병렬 지급
 - SchedulerManager: 스케줄러 관리
+- ImportManager: 사용자/계좌 대량 등록 (CSV/엑셀)
+- ReconciliationManager: 원장-잔액 대사
+- AsyncAccountManager, AsyncTransactionManager: 비동기 계좌 조회 및 입출금/이체 (asyncio)
 """
 
 from .user_manager import UserManager
 from .account_manager import AccountManager
 from .transaction_manager import TransactionManager
 from .admin_manager import AdminManager
+from .interest_shard_manager import InterestShardManager
 from .scheduler_manager import SchedulerManager
+from .import_manager import ImportManager
+from .reconciliation_manager import ReconciliationManager
+from .async_account_manager import AsyncAccountManager
+from .async_transaction_manager import AsyncTransactionManager
 
-__all__ = ['UserManager', 'AccountManager', 'TransactionManager', 'AdminManager', 'SchedulerManager']
+__all__ = ['UserManager', 'AccountManager', 'TransactionManager', 'AdminManager', 'InterestShardManager',
+           'SchedulerManager', 'ImportManager', 'ReconciliationManager', 'AsyncAccountManager',
+           'AsyncTransactionManager']
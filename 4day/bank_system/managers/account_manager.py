@@ -8,10 +8,13 @@ from typing import Optional, List
 from ..database import get_database_connection, SQLQueries
 from ..entities.account import Account
 from ..entities.transaction import Transaction
+from ..entities.user_summary import UserSummary
 from ..helpers.input_helper import InputHelper
 from ..helpers.validation_helper import ValidationHelper
 from ..utils.bank_utils import BankUtils
 from ..utils.interest_calculator import InterestCalculator
+from ..utils.account_cache import get_account_cache
+from ..utils.summary_cache import get_summary_cache
 
 
 class AccountManager:
@@ -24,6 +27,8 @@ class AccountManager:
         self.input_helper = InputHelper()
         self.user_manager = user_manager
         self.transaction_manager = transaction_manager
+        self.account_cache = get_account_cache()
+        self.summary_cache = get_summary_cache()
         
         # InputHelper에 AccountManager 설정
         self.input_helper.set_account_manager(self)
@@ -43,15 +48,8 @@ class AccountManager:
             bool: 계좌 존재 여부
         """
         try:
-            results = self.db.execute_query(
-                "SELECT COUNT(*) as count FROM accounts WHERE account_id = :account_id",
-                {'account_id': account_id}
-            )
-            
-            if results and len(results) > 0:
-                count = results[0].get('COUNT', results[0].get('count', 0))
-                return count > 0
-            return False
+            # 캐시를 통해 조회 (같은 메뉴 흐름에서 반복 조회 방지)
+            return self.get_account_by_id(account_id) is not None
             
         except Exception as e:
             print(f"계좌 존재 확인 오류: {e}")
@@ -69,15 +67,8 @@ class AccountManager:
             bool: 본인 계좌 여부
         """
         try:
-            results = self.db.execute_query(
-                "SELECT COUNT(*) as count FROM accounts WHERE account_id = :account_id AND user_id = :user_id",
-                {'account_id': account_id, 'user_id': user_id}
-            )
-            
-            if results and len(results) > 0:
-                count = results[0].get('COUNT', results[0].get('count', 0))
-                return count > 0
-            return False
+            account = self.get_account_by_id(account_id)
+            return account is not None and account.user_id == user_id
             
         except Exception as e:
             print(f"계좌 소유권 확인 오류: {e}")
@@ -111,11 +102,48 @@ class AccountManager:
             account_password = self.input_helper.input_account_password()
             initial_balance = self.input_helper.input_amount("초기 입금액: ")
             
+            # 계좌 생성 처리
+            account = self.process_create_account(
+                user_id, account_name, account_type, account_password, initial_balance
+            )
+            
+            if account:
+                print(f"✅ 계좌가 생성되었습니다!")
+                print(f"계좌번호: {account.account_id}")
+                print(f"계좌명: {account_name}")
+                print(f"계좌종류: {account_type}")
+                print(f"이자율: {InterestCalculator.format_interest_rate(account.interest_rate)}")
+                print(f"초기잔액: {BankUtils.format_currency(initial_balance)}")
+                return True
+            else:
+                print("❌ 계좌 생성에 실패했습니다.")
+                return False
+                
+        except Exception as e:
+            print(f"계좌 생성 오류: {e}")
+            return False
+    
+    def process_create_account(self, user_id: str, account_name: str, account_type: str,
+                               account_password: str, initial_balance: float) -> Optional[Account]:
+        """
+        계좌 생성 처리 (내부 메서드)
+        
+        Args:
+            user_id: 계좌 소유자 ID
+            account_name: 계좌명
+            account_type: 계좌 종류 (보통예금, 정기예금, 적금)
+            account_password: 계좌 비밀번호
+            initial_balance: 초기 입금액
+            
+        Returns:
+            Optional[Account]: 생성된 계좌 객체 (실패 시 None)
+        """
+        try:
             # 계좌번호 생성
             account_id = BankUtils.generate_account_number()
             if not account_id:
                 print("계좌번호 생성에 실패했습니다.")
-                return False
+                return None
             
             # 이자율 설정
             interest_rate = InterestCalculator.get_interest_rate_by_type(account_type)
@@ -131,29 +159,27 @@ class AccountManager:
                 interest_rate=interest_rate
             )
             
-            # DB에 저장
-            if self.save_account(account):
-                print(f"✅ 계좌가 생성되었습니다!")
-                print(f"계좌번호: {account_id}")
-                print(f"계좌명: {account_name}")
-                print(f"계좌종류: {account_type}")
-                print(f"이자율: {InterestCalculator.format_interest_rate(interest_rate)}")
-                print(f"초기잔액: {BankUtils.format_currency(initial_balance)}")
+            # 개설 중에는 소유자의 요약을 DB에서 다시 읽어 캐시하지 않음
+            with self.summary_cache.tracking([user_id]):
+                # DB에 저장
+                if not self.save_account(account):
+                    return None
                 
                 # 초기 입금 거래 기록
+                deposit = None
                 if initial_balance > 0 and self.transaction_manager:
-                    self.transaction_manager.record_deposit(
+                    deposit = self.transaction_manager.record_deposit(
                         account_id, initial_balance, "계좌 개설", user_id
                     )
                 
-                return True
-            else:
-                print("❌ 계좌 생성에 실패했습니다.")
-                return False
-                
+                # 캐시된 요약에 새 계좌 추가
+                self.summary_cache.add_account(account, deposit.transaction_date if deposit else None)
+            
+            return account
+            
         except Exception as e:
             print(f"계좌 생성 오류: {e}")
-            return False
+            return None
     
     def save_account(self, account: Account) -> bool:
         """
@@ -187,30 +213,79 @@ class AccountManager:
             print(f"\n[{self.user_manager.get_user_name(user_id)}님의 계좌 목록]")
             print("=" * 80)
             
-            results = self.db.execute_query(
-                SQLQueries.SELECT_ACCOUNTS_BY_USER,
-                {'user_id': user_id}
-            )
-            
-            if not results:
+            # 미리 집계한 요약에서 조회 (캐시에 없을 때만 DB 조회)
+            summary = self.get_user_summary(user_id)
+            if summary is None or summary.account_count == 0:
                 print("등록된 계좌가 없습니다.")
                 return
             
             print(f"{'계좌번호':<15} {'계좌명':<15} {'계좌종류':<10} {'잔액':<15} {'이자율':<10} {'개설일':<12}")
             print("-" * 80)
             
-            for data in results:
-                account = Account.from_dict(data)
+            for account in summary.get_accounts():
                 print(f"{account.account_id:<15} {account.account_name:<15} "
                       f"{account.account_type:<10} {BankUtils.format_currency(account.balance):<15} "
                       f"{InterestCalculator.format_interest_rate(account.interest_rate):<10} "
                       f"{account.create_date.strftime('%Y-%m-%d'):<12}")
             
+            print("-" * 80)
+            self.print_user_summary(summary)
             print("=" * 80)
             
         except Exception as e:
             print(f"계좌 목록 조회 오류: {e}")
     
+    def get_user_summary(self, user_id: str) -> Optional[UserSummary]:
+        """
+        사용자 계좌 요약 조회 (요약 캐시를 먼저 확인)
+        
+        Args:
+            user_id: 사용자 ID
+            
+        Returns:
+            Optional[UserSummary]: 계좌 목록, 총 잔액, 종류별 집계, 마지막 거래일시 (오류 시 None)
+        """
+        try:
+            summary = self.summary_cache.get(user_id)
+            if summary is not None:
+                return summary
+            
+            # 조회 중에 커밋된 거래가 있으면 캐시에 넣지 않도록 조회 전에 토큰을 받음
+            token = self.summary_cache.load_token()
+            
+            results = self.db.execute_query(
+                SQLQueries.SELECT_ACCOUNTS_BY_USER,
+                {'user_id': user_id}
+            )
+            accounts = [Account.from_dict(data) for data in results]
+            
+            last_activity = None
+            if accounts:
+                results = self.db.execute_query(SQLQueries.SELECT_USER_LAST_ACTIVITY, {'user_id': user_id})
+                if results:
+                    last_activity = results[0]['transaction_date']
+            
+            summary = UserSummary.from_accounts(user_id, accounts, last_activity)
+            self.summary_cache.put(summary, token)
+            return summary
+            
+        except Exception as e:
+            print(f"계좌 요약 조회 오류: {e}")
+            return None
+    
+    def print_user_summary(self, summary: UserSummary):
+        """
+        사용자 계좌 요약 출력 (총 잔액, 계좌 종류별 집계, 마지막 거래일시)
+        
+        Args:
+            summary: 사용자 계좌 요약
+        """
+        print(f"총 {summary.account_count}개 계좌, 총 잔액 {BankUtils.format_currency(summary.total_balance)}")
+        for account_type, count in summary.count_by_type.items():
+            print(f"  {account_type}: {count}개, {BankUtils.format_currency(summary.balance_by_type[account_type])}")
+        if summary.last_activity:
+            print(f"마지막 거래: {summary.last_activity.strftime('%Y-%m-%d %H:%M:%S')}")
+    
     def read_account(self, user_id: str):
         """
         계좌 상세 조회
@@ -242,24 +317,34 @@ class AccountManager:
         except Exception as e:
             print(f"계좌 조회 오류: {e}")
     
-    def get_account_by_id(self, account_id: str) -> Optional[Account]:
+    def get_account_by_id(self, account_id: str, use_cache: bool = True) -> Optional[Account]:
         """
-        계좌번호로 계좌 정보 조회
+        계좌번호로 계좌 정보 조회 (계좌 캐시를 먼저 확인)
         
         Args:
             account_id: 계좌번호
+            use_cache: 캐시 사용 여부 (False면 DB에서 최신 정보를 조회해 캐시 갱신)
             
         Returns:
             Optional[Account]: 계좌 객체 또는 None
         """
         try:
+            if use_cache:
+                account = self.account_cache.get(account_id)
+                if account is not None:
+                    return account
+            
+            # 조회 중에 커밋된 거래가 무효화한 계좌는 캐시에 넣지 않음
+            token = self.account_cache.load_token()
             results = self.db.execute_query(
                 SQLQueries.SELECT_ACCOUNT_BY_ID,
                 {'account_id': account_id}
             )
             
             if results:
-                return Account.from_dict(results[0])
+                account = Account.from_dict(results[0])
+                self.account_cache.put(account, token)
+                return account
             
             return None
             
@@ -328,10 +413,13 @@ class AccountManager:
             bool: 삭제 성공 여부
         """
         try:
-            result = self.db.execute_update(
-                SQLQueries.DELETE_ACCOUNT,
-                {'account_id': account_id}
-            )
+            with self.summary_cache.tracking([account_id]):
+                result = self.db.execute_update(
+                    SQLQueries.DELETE_ACCOUNT,
+                    {'account_id': account_id}
+                )
+                self.account_cache.invalidate(account_id)
+                self.summary_cache.remove_account(account_id)
             return result > 0
             
         except Exception as e:
@@ -398,6 +486,7 @@ class AccountManager:
                 SQLQueries.UPDATE_ACCOUNT_PASSWORD,
                 {'account_id': account_id, 'account_password': new_password}
             )
+            self.account_cache.invalidate(account_id)
             return result > 0
             
         except Exception as e:
@@ -428,8 +517,18 @@ class AccountManager:
                 SQLQueries.UPDATE_ACCOUNT_BALANCE,
                 update_data
             )
+            self.account_cache.invalidate(account_id)
             return result > 0
             
         except Exception as e:
             print(f"계좌 잔액 업데이트 오류: {e}")
             return False
+    
+    def invalidate_account(self, account_id: str):
+        """
+        계좌 캐시 무효화 (다른 경로에서 계좌가 변경된 경우 호출)
+        
+        Args:
+            account_id: 계좌번호
+        """
+        self.account_cache.invalidate(account_id)
@@ -3,15 +3,24 @@
 Java의 AdminManager 클래스를 Python으로 변환 (간단 버전)
 """
 
-from datetime import datetime
-from typing import Optional, List
+import os
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any
 from ..database import get_database_connection, SQLQueries
 from ..entities.account import Account
-from ..entities.interest import InterestPayment
+from ..entities.interest import InterestPayment, InterestShard, InterestRun
 from ..helpers.input_helper import InputHelper
 from ..helpers.validation_helper import ValidationHelper
 from ..utils.bank_utils import BankUtils
 from ..utils.interest_calculator import InterestCalculator
+from ..utils.account_cache import get_account_cache
+from ..utils.summary_cache import get_summary_cache
+from ..utils.report_exporter import ReportExporter
+from ..utils.interest_run_journal import InterestRunJournal
+from .account_manager import AccountManager
+from .import_manager import ImportManager
+from .interest_shard_manager import InterestShardManager
+from .reconciliation_manager import ReconciliationManager
 
 
 class AdminManager:
@@ -22,6 +31,11 @@ class AdminManager:
         self.db = get_database_connection()
         self.validator = ValidationHelper()
         self.input_helper = InputHelper()
+        self.account_cache = get_account_cache()
+        self.summary_cache = get_summary_cache()
+        self.account_manager = AccountManager()
+        self.interest_journal = InterestRunJournal()
+        self.last_interest_results: List[Dict[str, Any]] = []  # 마지막 execute_interest_payment의 구간 지급 결과들
     
     def admin_login(self) -> Optional[str]:
         """
@@ -37,8 +51,7 @@ class AdminManager:
             admin_id = self.input_helper.input("관리자 ID: ")
             password = self.input_helper.input("비밀번호: ")
             
-            # 간단한 관리자 인증 (실제로는 DB에서 관리자 테이블 조회)
-            if admin_id == "admin" and password == "admin123":
+            if self.verify_admin(admin_id, password):
                 print("✅ 관리자 로그인 성공!")
                 return admin_id
             else:
@@ -49,6 +62,20 @@ class AdminManager:
             print(f"관리자 로그인 오류: {e}")
             return None
     
+    def verify_admin(self, admin_id: str, password: str) -> bool:
+        """
+        관리자 인증 정보 검증
+        
+        Args:
+            admin_id: 관리자 ID
+            password: 비밀번호
+            
+        Returns:
+            bool: 인증 성공 여부
+        """
+        # 간단한 관리자 인증 (실제로는 DB에서 관리자 테이블 조회)
+        return admin_id == "admin" and password == "admin123"
+    
     def get_admin_name(self, admin_id: str) -> str:
         """
         관리자 이름 조회
@@ -67,22 +94,28 @@ class AdminManager:
             print("\n[전체 계좌 조회]")
             print("=" * 120)
             
-            results = self.db.execute_query(SQLQueries.SELECT_ALL_ACCOUNTS)
-            
-            if not results:
-                print("등록된 계좌가 없습니다.")
-                return
-            
-            print(f"{'계좌번호':<15} {'계좌명':<15} {'계좌종류':<10} {'잔액':<15} {'이자율':<10} {'소유자':<15} {'개설일':<12}")
-            print("-" * 120)
+            # 전체 결과를 리스트로 만들지 않고 행에서 바로 (Account, 소유자명) 생성
+            rows = self.db.iter_query(
+                SQLQueries.SELECT_ALL_ACCOUNTS,
+                rowfactory=lambda *row: (Account.from_row(*row), row[9])
+            )
             
-            for data in results:
-                account = Account.from_dict(data)
+            count = 0
+            for account, user_name in rows:
+                if count == 0:
+                    print(f"{'계좌번호':<15} {'계좌명':<15} {'계좌종류':<10} {'잔액':<15} {'이자율':<10} {'소유자':<15} {'개설일':<12}")
+                    print("-" * 120)
+                
                 print(f"{account.account_id:<15} {account.account_name:<15} "
                       f"{account.account_type:<10} {BankUtils.format_currency(account.balance):<15} "
                       f"{InterestCalculator.format_interest_rate(account.interest_rate):<10} "
-                      f"{data.get('user_name', '-'):<15} "
+                      f"{user_name or '-':<15} "
                       f"{account.create_date.strftime('%Y-%m-%d'):<12}")
+                count += 1
+            
+            if count == 0:
+                print("등록된 계좌가 없습니다.")
+                return
             
             print("=" * 120)
             
@@ -97,12 +130,9 @@ class AdminManager:
             
             user_id = self.input_helper.input("조회할 사용자 ID: ")
             
-            results = self.db.execute_query(
-                SQLQueries.SELECT_ACCOUNTS_BY_USER,
-                {'user_id': user_id}
-            )
-            
-            if not results:
+            # 미리 집계한 요약에서 조회 (캐시에 없을 때만 DB 조회)
+            summary = self.account_manager.get_user_summary(user_id)
+            if summary is None or summary.account_count == 0:
                 print("해당 사용자의 계좌가 없습니다.")
                 return
             
@@ -111,13 +141,14 @@ class AdminManager:
             print(f"{'계좌번호':<15} {'계좌명':<15} {'계좌종류':<10} {'잔액':<15} {'이자율':<10} {'개설일':<12}")
             print("-" * 80)
             
-            for data in results:
-                account = Account.from_dict(data)
+            for account in summary.get_accounts():
                 print(f"{account.account_id:<15} {account.account_name:<15} "
                       f"{account.account_type:<10} {BankUtils.format_currency(account.balance):<15} "
                       f"{InterestCalculator.format_interest_rate(account.interest_rate):<10} "
                       f"{account.create_date.strftime('%Y-%m-%d'):<12}")
             
+            print("-" * 80)
+            self.account_manager.print_user_summary(summary)
             print("=" * 80)
             
         except Exception as e:
@@ -129,145 +160,327 @@ class AdminManager:
             print("\n[이자 지급 내역 조회]")
             print("=" * 100)
             
-            results = self.db.execute_query(SQLQueries.SELECT_INTEREST_PAYMENTS)
-            
-            if not results:
-                print("이자 지급 내역이 없습니다.")
-                return
-            
-            print(f"{'지급ID':<12} {'계좌번호':<15} {'지급일':<20} {'지급금액':<15} {'관리자':<15}")
-            print("-" * 100)
+            payments = self.db.iter_query(
+                SQLQueries.SELECT_INTEREST_PAYMENTS,
+                rowfactory=InterestPayment.from_row
+            )
             
-            for data in results:
-                payment = InterestPayment.from_dict(data)
+            count = 0
+            for payment in payments:
+                if count == 0:
+                    print(f"{'지급ID':<12} {'계좌번호':<15} {'지급일':<20} {'지급금액':<15} {'관리자':<15}")
+                    print("-" * 100)
+                
+                count += 1
                 print(f"{payment.payment_id:<12} {payment.account_id:<15} "
                       f"{payment.payment_date.strftime('%Y-%m-%d %H:%M:%S'):<20} "
                       f"{BankUtils.format_currency(payment.interest_amount):<15} "
                       f"{payment.admin_id:<15}")
             
+            if count == 0:
+                print("이자 지급 내역이 없습니다.")
+                return
+            
             print("=" * 100)
             
         except Exception as e:
             print(f"이자 지급 내역 조회 오류: {e}")
     
-    def execute_interest_payment(self, admin_id: str) -> bool:
+    def export_reports(self):
+        """보고서 내보내기 (전체 계좌, 이자 지급 내역, 기간별 거래내역을 파일로 스트리밍)"""
+        try:
+            print("\n[보고서 내보내기]")
+            print("=" * 50)
+            print("1. 전체 계좌\t2. 이자 지급 내역\t3. 기간별 거래내역\t4. 취소")
+            choice = self.input_helper.input_menu_choice("보고서 선택: ", ["1", "2", "3", "4"])
+            if choice == "4":
+                print("보고서 내보내기가 취소되었습니다.")
+                return
+            report = {"1": "accounts", "2": "interest", "3": "transactions"}[choice]
+            
+            formats = [name for name in ReportExporter.FORMATS if ReportExporter.is_format_available(name)]
+            file_format = formats[0]
+            if len(formats) > 1:
+                file_format = self.input_helper.input_menu_choice(f"파일 형식 ({'/'.join(formats)}): ", formats)
+            
+            start_date = end_date = None
+            if report == "transactions":
+                start_date = self.input_helper.input_date("시작일 (YYYY-MM-DD): ")
+                end_date = self.input_helper.input_date("종료일 (YYYY-MM-DD, 해당 일 포함): ") + timedelta(days=1)
+                if end_date <= start_date:
+                    print("종료일은 시작일 이후여야 합니다.")
+                    return
+            
+            exporter = ReportExporter()
+            result = exporter.export(report, file_format=file_format, start_date=start_date, end_date=end_date)
+            
+            print(f"\n✅ 보고서 내보내기 완료!")
+            print(f"파일: {result['path']}")
+            print(f"{result['rows']:,}행 ({result['chunks']:,}개 청크), {result['elapsed']:.2f}초")
+            
+        except Exception as e:
+            print(f"보고서 내보내기 오류: {e}")
+    
+    def import_customers(self):
+        """사용자/계좌 대량 등록 (CSV 또는 엑셀 파일, 거부된 행은 거부 파일에 기록)"""
+        try:
+            print("\n[대량 등록]")
+            print("=" * 50)
+            print("헤더: " + ", ".join(ImportManager.USER_COLUMNS + ImportManager.ACCOUNT_COLUMNS))
+            
+            formats = [name for name in ImportManager.FORMATS if ImportManager.is_format_available(name)]
+            path = self.input_helper.input(f"파일 경로 ({'/'.join(formats)}): ")
+            if not os.path.isfile(path):
+                print("파일을 찾을 수 없습니다.")
+                return
+            
+            def progress(state):
+                print(f"{state['rows']:,}행 처리 (거부 {state['rejected']:,}행)")
+            
+            result = ImportManager().import_file(path, progress=progress)
+            
+            print(f"\n✅ 대량 등록 완료!")
+            print(f"사용자 {result['users']:,}명, 계좌 {result['accounts']:,}개 등록, {result['elapsed']:.2f}초")
+            if result['rejects_path']:
+                print(f"거부 {result['rejected']:,}행: {result['rejects_path']}")
+            
+        except Exception as e:
+            print(f"대량 등록 오류: {e}")
+    
+    def reconcile_ledger(self, workers: Optional[int] = None, path: Optional[str] = None) -> bool:
+        """
+        원장 대사 실행 (계좌 잔액을 거래 원장과 이자 지급 기록으로 확인하고 불일치 보고서 기록)
+        
+        Args:
+            workers: 작업 프로세스 수 (기본값: RECONCILE_CONFIG['workers'])
+            path: 불일치 보고서 경로 (기본값: EXPORT_CONFIG['output_dir'])
+            
+        Returns:
+            bool: 모든 구간을 대사했고 불일치가 없으면 True
+        """
+        try:
+            print("\n[원장 대사]")
+            print("=" * 50)
+            
+            result = ReconciliationManager(workers).run(path)
+            ReconciliationManager.print_result(result)
+            return not (result['discrepancies'] or result['failed_shards'])
+            
+        except Exception as e:
+            print(f"원장 대사 오류: {e}")
+            return False
+    
+    def execute_interest_payment(self, admin_id: str, confirm: bool = True,
+                                 chunk_size: Optional[int] = None, workers: Optional[int] = None) -> bool:
         """
         이자 지급 실행
         
+        대상 계좌를 하나의 커서로 스트리밍하며 chunk_size개씩 일괄 지급하고
+        청크마다 커밋한다. workers가 2 이상이면 계좌번호 구간별로 여러 프로세스에서 지급한다.
+        confirm이 False이면 미리보기 없이 지급하며 대상 계좌를 한 번만 읽고, 합계는 지급 결과로 집계한다.
+        
+        실행과 구간별 체크포인트를 저널에 기록하므로, 이전 실행이 중간에 중단되었으면
+        먼저 그 실행을 같은 기준 시각으로 마지막으로 커밋한 청크 다음부터 이어서 지급한 뒤
+        현재 시각 기준의 새 실행을 시작한다.
+        
         Args:
             admin_id: 관리자 ID
+            confirm: 지급 전에 관리자 확인을 받을지 여부 (스케줄러는 False)
+            chunk_size: 한 번에 커밋하는 계좌 수 (기본값: BATCH_CONFIG)
+            workers: 작업 프로세스 수 (기본값: BATCH_CONFIG['interest_workers'])
             
         Returns:
-            bool: 이자 지급 성공 여부
+            bool: 이자 지급을 끝까지 마쳤는지 여부 (지급 대상이 없어도 True, 실패/취소/다른 실행 진행 중이면 False)
         """
+        shard_manager = InterestShardManager(workers, chunk_size)
+        self.last_interest_results = []
+        
         try:
             print("\n[이자 지급 실행]")
             print("=" * 50)
             
-            # 이자 지급 대상 계좌 조회
-            eligible_accounts = InterestCalculator.get_all_interest_eligible_accounts()
-            
-            if not eligible_accounts:
-                print("이자 지급 대상 계좌가 없습니다.")
+            # 중단된 실행이 있으면 먼저 이어서 지급
+            run = self.interest_journal.find_unfinished_run()
+            if run and not self.interest_journal.is_stale(run):
+                print(f"이자 지급이 이미 실행 중입니다. (실행 {run.run_id}, "
+                      f"{run.paid_count:,}개 계좌 지급, 마지막 기록 {run.updated_at:%Y-%m-%d %H:%M:%S})")
                 return False
             
-            # 이자 지급 요약 정보
-            summary = InterestCalculator.get_interest_summary(eligible_accounts)
-            print(f"이자 지급 대상: {summary['total_accounts']}개 계좌")
-            print(f"총 지급 금액: {BankUtils.format_currency(summary['total_amount'])}")
-            
-            # 계좌 종류별 집계
-            for account_type, info in summary['by_type'].items():
-                print(f"  {account_type}: {info['count']}개 계좌, {BankUtils.format_currency(info['amount'])}")
+            if run:
+                print(f"중단된 이자 지급을 이어서 실행합니다. (실행 {run.run_id}, "
+                      f"기준 시각 {run.calc_date:%Y-%m-%d %H:%M:%S})")
+                print(f"이미 지급: {run.paid_count:,}개 계좌, {BankUtils.format_currency(run.paid_amount)}, "
+                      f"남은 구간 {len(run.pending_shards())}/{len(run.shards)}개")
+                
+                if confirm and not self._confirm_interest_payment(run.calc_date, run.pending_shards(),
+                                                                  chunk_size, resume=True):
+                    return False
+                
+                if not self.interest_journal.claim(run):
+                    print("다른 프로세스가 먼저 이자 지급을 이어서 실행했습니다.")
+                    return False
+                
+                result = shard_manager.run(run, admin_id)
+                self.last_interest_results.append(result)
+                self._print_interest_result(result, run)
+                if result['failed_chunks'] or result['failed_shards']:
+                    # 이전 실행을 끝내지 못했으면 새 실행은 시작하지 않음 (다음 실행 때 다시 이어서 지급)
+                    return False
+                
+                print("\n현재 시각 기준으로 이번 이자 지급을 시작합니다.")
             
-            print("\n이자 지급을 실행하시겠습니까?")
-            if not self.input_helper.confirm_action():
-                print("이자 지급이 취소되었습니다.")
+            current_date = datetime.now()
+            if confirm and not self._confirm_interest_payment(current_date, [InterestShard(1, None, None)],
+                                                              chunk_size):
                 return False
             
-            # 이자 지급 처리
-            success_count = 0
-            total_amount = 0
-            
-            for interest_info in eligible_accounts:
-                if self.process_interest_payment(interest_info, admin_id):
-                    success_count += 1
-                    total_amount += interest_info.interest_amount
+            # 작업 프로세스가 1개이면 구간을 나누지 않음 (구간 계획 조회 없이 대상 계좌를 지급하며 한 번만 읽음)
+            if shard_manager.workers > 1:
+                shards = shard_manager.plan_shards()
+                if not shards:
+                    print("이자 지급 대상 계좌가 없습니다.")
+                    return True
+            else:
+                shards = [InterestShard(1, None, None)]
+            run = self.interest_journal.create_run(admin_id, current_date, shards)
             
-            print(f"\n✅ 이자 지급 완료!")
-            print(f"성공: {success_count}개 계좌")
-            print(f"총 지급 금액: {BankUtils.format_currency(total_amount)}")
+            # 이자 지급 처리 (구간별 청크 단위 일괄 지급, 합계는 지급하며 집계)
+            result = shard_manager.run(run, admin_id)
+            self.last_interest_results.append(result)
+            if result['total_accounts'] == 0 and not (result['failed_chunks'] or result['failed_shards']):
+                print("이자 지급 대상 계좌가 없습니다.")
+            else:
+                self._print_interest_result(result, run)
             
-            return success_count > 0
+            return not (result['failed_chunks'] or result['failed_shards'])
             
         except Exception as e:
             print(f"이자 지급 실행 오류: {e}")
             return False
     
-    def process_interest_payment(self, interest_info, admin_id: str) -> bool:
+    def _confirm_interest_payment(self, current_date: datetime, shards: List[InterestShard],
+                                  chunk_size: Optional[int], resume: bool = False) -> bool:
+        """지급 대상 요약을 보여주고 관리자 확인 (청크별로 합산하여 전체 목록을 메모리에 올리지 않음)"""
+        summary = InterestCalculator.get_interest_summary([])
+        for shard in shards:
+            for chunk in InterestCalculator.iter_interest_eligible_chunks(
+                    chunk_size, current_date, shard.start_id, shard.end_id, shard.last_account_id):
+                InterestCalculator.merge_interest_summary(
+                    summary, InterestCalculator.get_interest_summary(chunk)
+                )
+        
+        if summary['total_accounts'] == 0 and not resume:
+            print("이자 지급 대상 계좌가 없습니다.")
+            return False
+        
+        print(f"이자 지급 대상: {summary['total_accounts']}개 계좌")
+        print(f"총 지급 금액: {BankUtils.format_currency(summary['total_amount'])}")
+        
+        # 계좌 종류별 집계
+        for account_type, info in summary['by_type'].items():
+            print(f"  {account_type}: {info['count']}개 계좌, {BankUtils.format_currency(info['amount'])}")
+        
+        print("\n이자 지급을 실행하시겠습니까?")
+        if not self.input_helper.confirm_action():
+            print("이자 지급이 취소되었습니다.")
+            return False
+        return True
+    
+    @staticmethod
+    def _print_interest_result(result: Dict[str, Any], run: InterestRun):
+        """이자 지급 결과 출력 (InterestShardManager.run 결과)"""
+        print(f"\n✅ 이자 지급 완료! ({result['elapsed']:.2f}초)")
+        print(f"성공: {result['total_accounts']}개 계좌")
+        print(f"총 지급 금액: {BankUtils.format_currency(result['total_amount'])}")
+        for account_type, info in result['by_type'].items():
+            print(f"  {account_type}: {info['count']}개 계좌, {BankUtils.format_currency(info['amount'])}")
+        
+        if result['failed_chunks'] or result['failed_shards']:
+            print(f"❌ 실패: 청크 {result['failed_chunks']}개, 구간 {result['failed_shards']}개 "
+                  f"(다시 실행하면 실행 {run.run_id}을 이어서 지급)")
+    
+    def process_interest_payment_batch(self, interest_list: List, admin_id: str,
+                                       checkpoint: Optional[Dict[str, Any]] = None) -> Optional[List]:
         """
-        개별 계좌 이자 지급 처리
+        여러 계좌 이자를 하나의 트랜잭션으로 일괄 지급 처리
+        
+        잔액 갱신과 이자 지급 기록을 각각 executemany 한 번으로 처리한다.
+        잔액 갱신은 마지막 이자 지급일이 기준 시각보다 앞선 계좌에만 반영되므로, 같은 청크를 두 프로세스가
+        지급해도 한 번만 반영된다. 이미 지급했거나 조회 후 거래가 있었던 계좌가 섞여 있으면 저장점으로
+        되돌린 뒤 계좌별로 다시 갱신하고, 반영된 계좌에만 지급 기록을 남긴다.
+        지급일은 잔액 갱신으로 계좌를 잠근 뒤에 기록하므로, 그보다 먼저 커밋된 거래보다 항상 늦다.
+        (원장 대사가 지급일 순서로 잔액을 되짚을 때 실제 반영 순서와 같아지도록)
         
         Args:
-            interest_info: 이자 정보 객체
+            interest_list: 이자 정보 객체 리스트
             admin_id: 관리자 ID
+            checkpoint: 같은 트랜잭션에서 갱신할 실행 저널 체크포인트 (InterestRunJournal.checkpoint_params)
+                        (실행을 다른 프로세스가 넘겨받아 갱신되지 않으면 청크 전체 롤백)
             
         Returns:
-            bool: 이자 지급 성공 여부
+            Optional[List]: 실제로 지급한 이자 정보 리스트 (실패 시 None, 청크 전체 롤백)
         """
         try:
-            # 이자 지급 ID 생성
-            payment_id = BankUtils.generate_payment_id()
-            
-            # 이자 지급 기록 생성
-            payment = InterestPayment.create_payment(
-                payment_id=payment_id,
-                account_id=interest_info.account_id,
-                interest_amount=interest_info.interest_amount,
-                admin_id=admin_id
-            )
-            
-            # 새 잔액 계산
-            new_balance = interest_info.principal + interest_info.interest_amount
-            
-            # DB 트랜잭션 시작
-            self.db.connection.autocommit = False
-            
-            try:
-                # 이자 지급 기록 저장
-                result = self.db.execute_update(
-                    SQLQueries.INSERT_INTEREST_PAYMENT,
-                    payment.to_dict()
-                )
-                
-                if result <= 0:
-                    raise Exception("이자 지급 기록 저장 실패")
+            # 이자 지급 ID 생성 (예약된 시퀀스 블록에서 할당, 트랜잭션 밖에서)
+            payment_ids = BankUtils.generate_payment_ids(len(interest_list))
+            if len(payment_ids) != len(interest_list):
+                raise Exception("이자 지급 ID 생성 실패")
+            
+            balance_updates = [
+                {
+                    'account_id': interest_info.account_id,
+                    'interest_amount': interest_info.interest_amount,
+                    'last_interest_date': interest_info.current_date
+                }
+                for interest_info in interest_list
+            ]
+            
+            account_ids = [info.account_id for info in interest_list]
+            with self.summary_cache.tracking(account_ids):
+                # DB 트랜잭션 (블록 종료 시 커밋, 예외 시 롤백)
+                with self.db.transaction():
+                    self.db.execute_update(SQLQueries.SAVEPOINT_INTEREST_CHUNK)
+                    updated = self.db.execute_many(SQLQueries.UPDATE_ACCOUNT_INTEREST, balance_updates)
+                    
+                    if updated == len(interest_list):
+                        paid = interest_list
+                    else:
+                        # 갱신되지 않은 계좌가 있음: 일괄 갱신을 되돌리고 계좌별로 갱신
+                        self.db.execute_update(SQLQueries.ROLLBACK_TO_INTEREST_CHUNK)
+                        paid = [
+                            interest_info
+                            for interest_info, update in zip(interest_list, balance_updates)
+                            if self.db.execute_update(SQLQueries.UPDATE_ACCOUNT_INTEREST, update) == 1
+                        ]
+                    
+                    # 계좌를 잠근 뒤의 시각을 지급일로 기록
+                    payment_date = datetime.now()
+                    payments = []
+                    for payment_id, interest_info in zip(payment_ids, paid):
+                        payment = InterestPayment.create_payment(
+                            payment_id=payment_id,
+                            account_id=interest_info.account_id,
+                            interest_amount=interest_info.interest_amount,
+                            admin_id=admin_id
+                        )
+                        payment.payment_date = payment_date
+                        payments.append(payment.to_dict())
+                    
+                    if payments:
+                        self.db.execute_many(SQLQueries.INSERT_INTEREST_PAYMENT, payments)
+                    if checkpoint:
+                        checkpoint = dict(checkpoint, paid_count=len(paid),
+                                          paid_amount=sum(info.interest_amount for info in paid))
+                        if self.db.execute_update(SQLQueries.UPDATE_INTEREST_RUN_CHECKPOINT, checkpoint) != 1:
+                            raise Exception("다른 프로세스가 이자 지급 실행을 넘겨받았습니다.")
                 
-                # 계좌 잔액 업데이트
-                result = self.db.execute_update(
-                    SQLQueries.UPDATE_ACCOUNT_BALANCE,
-                    {
-                        'account_id': interest_info.account_id,
-                        'balance': new_balance,
-                        'last_interest_date': interest_info.current_date
-                    }
+                # 잔액이 바뀐 계좌 캐시 무효화, 요약에는 이자만큼 반영
+                self.account_cache.invalidate_many(account_ids)
+                self.summary_cache.apply_deltas(
+                    (info.account_id, info.interest_amount) for info in paid
                 )
-                
-                if result <= 0:
-                    raise Exception("계좌 잔액 업데이트 실패")
-                
-                # 트랜잭션 커밋
-                self.db.commit()
-                return True
-                
-            except Exception as e:
-                # 트랜잭션 롤백
-                self.db.rollback()
-                raise e
-            finally:
-                # 자동 커밋 복원
-                self.db.connection.autocommit = True
-                
+            return paid
+            
         except Exception as e:
-            print(f"계좌 {interest_info.account_id} 이자 지급 오류: {e}")
-            return False
+            print(f"이자 일괄 지급 오류 ({len(interest_list)}개 계좌): {e}")
+            return None
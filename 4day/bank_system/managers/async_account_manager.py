@@ -0,0 +1,116 @@
+"""
+비동기 계좌 관리 매니저 클래스
+AccountManager의 계좌 조회와 잔액 갱신을 비동기 DB 연결(AsyncDatabaseConnection)로 처리
+(계좌 캐시는 AccountManager와 같은 전역 캐시를 공유)
+"""
+
+from datetime import datetime
+from typing import Optional
+from ..database import get_async_database_connection, SQLQueries
+from ..entities.account import Account
+from ..utils.account_cache import get_account_cache
+
+
+class AsyncAccountManager:
+    """계좌 조회/잔액 갱신을 비동기로 처리하는 클래스"""
+
+    def __init__(self):
+        """AsyncAccountManager 초기화 (open_async_database_connection 이후에 생성)"""
+        self.db = get_async_database_connection()
+        self.account_cache = get_account_cache()
+
+    async def get_account_by_id(self, account_id: str, use_cache: bool = True) -> Optional[Account]:
+        """
+        계좌번호로 계좌 정보 조회 (계좌 캐시를 먼저 확인)
+
+        Args:
+            account_id: 계좌번호
+            use_cache: 캐시 사용 여부 (False면 DB에서 최신 정보를 조회해 캐시 갱신)
+
+        Returns:
+            Optional[Account]: 계좌 객체 또는 None
+        """
+        try:
+            if use_cache:
+                account = self.account_cache.get(account_id)
+                if account is not None:
+                    return account
+
+            # 조회 중에 커밋된 거래가 무효화한 계좌는 캐시에 넣지 않음
+            token = self.account_cache.load_token()
+            results = await self.db.execute_query(
+                SQLQueries.SELECT_ACCOUNT_BY_ID,
+                {'account_id': account_id}
+            )
+
+            if results:
+                account = Account.from_dict(results[0])
+                self.account_cache.put(account, token)
+                return account
+
+            return None
+
+        except Exception as e:
+            print(f"계좌 조회 오류: {e}")
+            return None
+
+    async def account_exists(self, account_id: str) -> bool:
+        """
+        계좌 존재 여부 확인
+
+        Args:
+            account_id: 확인할 계좌번호
+
+        Returns:
+            bool: 계좌 존재 여부
+        """
+        return await self.get_account_by_id(account_id) is not None
+
+    async def is_my_account(self, account_id: str, user_id: str) -> bool:
+        """
+        본인 계좌 여부 확인
+
+        Args:
+            account_id: 확인할 계좌번호
+            user_id: 사용자 ID
+
+        Returns:
+            bool: 본인 계좌 여부
+        """
+        account = await self.get_account_by_id(account_id)
+        return account is not None and account.user_id == user_id
+
+    async def update_account_balance(self, account_id: str, new_balance: float,
+                                     last_interest_date: Optional[datetime] = None) -> bool:
+        """
+        계좌 잔액 업데이트
+
+        Args:
+            account_id: 계좌번호
+            new_balance: 새 잔액
+            last_interest_date: 마지막 이자 지급일
+
+        Returns:
+            bool: 업데이트 성공 여부
+        """
+        try:
+            result = await self.db.execute_update(SQLQueries.UPDATE_ACCOUNT_BALANCE, {
+                'account_id': account_id,
+                'balance': new_balance,
+                'last_interest_date': last_interest_date or datetime.now()
+            })
+            self.account_cache.invalidate(account_id)
+            return result > 0
+
+        except Exception as e:
+            print(f"계좌 잔액 업데이트 오류: {e}")
+            return False
+
+    def invalidate_account(self, account_id: str):
+        """
+        계좌 캐시 무효화 (다른 경로에서 계좌가 변경된 경우 호출)
+
+        Args:
+            account_id: 계좌번호
+        """
+        self.account_cache.invalidate(account_id)
@@ -0,0 +1,265 @@
+"""
+비동기 거래 관리 매니저 클래스
+TransactionManager의 process_deposit/process_withdraw/process_transfer를 코루틴으로 제공
+(이벤트 루프 하나에서 수백 건의 입출금/이체를 요청마다 스레드 없이 동시에 진행, HTTP 서버 등 네트워크 프런트엔드용)
+
+- 잠금, 잔액 갱신, 거래 기록 저장, 커밋 순서와 요약 캐시 반영은 TransactionManager와 동일
+- 원장 기록기(그룹 커밋)는 스레드 기반이므로 사용하지 않고 작업마다 트랜잭션 하나로 커밋
+"""
+
+from datetime import datetime
+from typing import Optional, List, Callable, Awaitable
+from ..database import get_async_database_connection, SQLQueries
+from ..entities.transaction import Transaction
+from ..utils.bank_utils import BankUtils
+from ..utils.summary_cache import get_summary_cache
+from .async_account_manager import AsyncAccountManager
+from .transaction_manager import TransactionManager
+
+
+class AsyncTransactionManager:
+    """입금/출금/이체를 비동기로 처리하는 클래스"""
+
+    CREDIT_TYPES = TransactionManager.CREDIT_TYPES
+
+    def __init__(self, account_manager: Optional[AsyncAccountManager] = None):
+        """
+        AsyncTransactionManager 초기화 (open_async_database_connection 이후에 생성)
+
+        Args:
+            account_manager: 비동기 계좌 매니저 (없으면 새로 생성)
+        """
+        self.db = get_async_database_connection()
+        self.account_manager = account_manager or AsyncAccountManager()
+        self.summary_cache = get_summary_cache()
+
+    async def process_deposit(self, account_id: str, amount: float, depositor_name: str) -> bool:
+        """
+        입금 처리
+
+        Args:
+            account_id: 계좌번호
+            amount: 입금액
+            depositor_name: 입금자명
+
+        Returns:
+            bool: 입금 성공 여부
+        """
+        try:
+            # 거래번호 생성 (시퀀스 예약은 트랜잭션 밖에서)
+            transaction_ids = await BankUtils.generate_transaction_ids_async(1)
+            if not transaction_ids:
+                return False
+
+            async def unit() -> List[Transaction]:
+                # 계좌를 잠근 뒤의 잔액으로 새 잔액 계산 (동시 입출금 시 잔액 유실 방지)
+                balance = await self._lock_account_balance(account_id)
+                if balance is None:
+                    raise Exception("계좌 정보를 찾을 수 없습니다.")
+                new_balance = balance + amount
+
+                if not await self.account_manager.update_account_balance(account_id, new_balance):
+                    raise Exception("계좌 잔액 업데이트 실패")
+
+                transaction = Transaction.create_deposit_withdrawal(
+                    transaction_id=transaction_ids[0],
+                    account_id=account_id,
+                    transaction_type="입금",
+                    amount=amount,
+                    balance_after=new_balance
+                )
+                transaction.depositor_name = depositor_name
+                transaction.transaction_memo = f"입금 - {depositor_name}"
+                return [transaction]
+
+            await self._commit_unit(unit, [account_id])
+
+            # 커밋 전에 다른 요청이 이전 잔액을 캐시했을 수 있으므로 커밋 후 다시 무효화
+            self.account_manager.invalidate_account(account_id)
+            return True
+
+        except Exception as e:
+            print(f"입금 처리 오류: {e}")
+            return False
+
+    async def process_withdraw(self, account_id: str, amount: float) -> bool:
+        """
+        출금 처리
+
+        Args:
+            account_id: 계좌번호
+            amount: 출금액
+
+        Returns:
+            bool: 출금 성공 여부
+        """
+        try:
+            transaction_ids = await BankUtils.generate_transaction_ids_async(1)
+            if not transaction_ids:
+                return False
+
+            async def unit() -> List[Transaction]:
+                # 계좌를 잠근 뒤의 잔액으로 확인 및 새 잔액 계산
+                balance = await self._lock_account_balance(account_id)
+                if balance is None:
+                    raise Exception("계좌 정보를 찾을 수 없습니다.")
+                if balance < amount:
+                    raise Exception("잔액이 부족합니다.")
+                new_balance = balance - amount
+
+                if not await self.account_manager.update_account_balance(account_id, new_balance):
+                    raise Exception("계좌 잔액 업데이트 실패")
+
+                transaction = Transaction.create_deposit_withdrawal(
+                    transaction_id=transaction_ids[0],
+                    account_id=account_id,
+                    transaction_type="출금",
+                    amount=amount,
+                    balance_after=new_balance
+                )
+                transaction.transaction_memo = "출금"
+                return [transaction]
+
+            await self._commit_unit(unit, [account_id])
+
+            self.account_manager.invalidate_account(account_id)
+            return True
+
+        except Exception as e:
+            print(f"출금 처리 오류: {e}")
+            return False
+
+    async def process_transfer(self, from_account_id: str, to_account_id: str, amount: float) -> bool:
+        """
+        이체 처리
+
+        두 계좌를 계좌번호 순서로 잠근 뒤(SELECT ... FOR UPDATE) DB에서 잔액을 증감하므로
+        동시 이체 시에도 잔액 유실이 없고, 교착 상태가 발생하지 않는다.
+
+        Args:
+            from_account_id: 보내는 계좌번호
+            to_account_id: 받는 계좌번호
+            amount: 이체액
+
+        Returns:
+            bool: 이체 성공 여부
+        """
+        try:
+            if from_account_id == to_account_id:
+                return False
+
+            # 거래번호 생성 (두 건을 한 번에)
+            transaction_ids = await BankUtils.generate_transaction_ids_async(2)
+            if len(transaction_ids) != 2:
+                return False
+            from_transaction_id, to_transaction_id = transaction_ids
+
+            account_params = {
+                'from_account_id': from_account_id,
+                'to_account_id': to_account_id
+            }
+
+            async def unit() -> List[Transaction]:
+                # 두 계좌 잠금 및 계좌명/잔액 조회
+                rows = await self.db.execute_query(SQLQueries.SELECT_ACCOUNTS_FOR_TRANSFER, account_params)
+                locked = {row['account_id']: row for row in rows}
+
+                if from_account_id not in locked or to_account_id not in locked:
+                    raise Exception("계좌 정보를 찾을 수 없습니다.")
+
+                from_account_name = locked[from_account_id]['account_name']
+                to_account_name = locked[to_account_id]['account_name']
+
+                # 잠금 이후의 잔액으로 확인
+                if locked[from_account_id]['balance'] < amount:
+                    raise Exception("잔액이 부족합니다.")
+
+                # 두 계좌 잔액 갱신 (갱신된 잔액을 RETURNING으로 받음)
+                async with self.db.get_cursor() as cursor:
+                    updated = await self.db.execute_returning(
+                        cursor,
+                        SQLQueries.UPDATE_TRANSFER_BALANCES,
+                        {**account_params, 'amount': amount, 'last_interest_date': datetime.now()},
+                        {'out_account_id': str, 'out_balance': float}
+                    )
+
+                if len(updated) != 2:
+                    raise Exception("계좌 잔액 업데이트 실패")
+
+                balances = dict(updated)
+
+                from_transaction = Transaction.create_full_transaction(
+                    transaction_id=from_transaction_id,
+                    account_id=from_account_id,
+                    transaction_type="이체출금",
+                    amount=amount,
+                    balance_after=balances[from_account_id],
+                    counterpart_account=to_account_id,
+                    counterpart_name=to_account_name,
+                    depositor_name=None,
+                    transaction_memo=f"이체출금 - {to_account_name}"
+                )
+
+                to_transaction = Transaction.create_full_transaction(
+                    transaction_id=to_transaction_id,
+                    account_id=to_account_id,
+                    transaction_type="이체입금",
+                    amount=amount,
+                    balance_after=balances[to_account_id],
+                    counterpart_account=from_account_id,
+                    counterpart_name=from_account_name,
+                    depositor_name=None,
+                    transaction_memo=f"이체입금 - {from_account_name}"
+                )
+
+                return [from_transaction, to_transaction]
+
+            await self._commit_unit(unit, [from_account_id, to_account_id])
+
+            self.account_manager.invalidate_account(from_account_id)
+            self.account_manager.invalidate_account(to_account_id)
+            return True
+
+        except Exception as e:
+            print(f"이체 처리 오류: {e}")
+            return False
+
+    async def _commit_unit(self, unit: Callable[[], Awaitable[List[Transaction]]],
+                           account_ids: List[str]) -> List[Transaction]:
+        """
+        거래 작업을 실행하고 반환된 거래 기록과 함께 한 트랜잭션으로 커밋
+        (커밋 후 거래 기록의 금액을 사용자 계좌 요약 캐시에 변동분으로 반영)
+
+        Args:
+            unit: 잔액을 갱신하고 저장할 거래 기록을 반환하는 코루틴 함수
+            account_ids: 작업이 잔액을 변경하는 계좌번호
+
+        Returns:
+            List[Transaction]: 저장된 거래 기록 (작업 실패 시 예외)
+        """
+        with self.summary_cache.tracking(account_ids):
+            async with self.db.transaction():
+                records = await unit()
+                await self.db.execute_many(SQLQueries.INSERT_TRANSACTION, [record.to_dict() for record in records])
+
+            for record in records:
+                delta = record.amount if record.transaction_type in self.CREDIT_TYPES else -record.amount
+                self.summary_cache.apply_delta(record.account_id, delta, record.transaction_date)
+
+        return records
+
+    async def _lock_account_balance(self, account_id: str) -> Optional[float]:
+        """
+        트랜잭션 안에서 계좌를 잠그고 현재 잔액 조회
+
+        Args:
+            account_id: 계좌번호
+
+        Returns:
+            Optional[float]: 잔액 (계좌가 없으면 None)
+        """
+        results = await self.db.execute_query(
+            SQLQueries.SELECT_ACCOUNT_BALANCE_FOR_UPDATE,
+            {'account_id': account_id}
+        )
+        return results[0]['balance'] if results else None
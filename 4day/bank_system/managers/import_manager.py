@@ -0,0 +1,445 @@
+"""
+대량 등록 매니저 클래스
+제휴사 고객 이전 등을 위해 CSV 또는 엑셀(.xlsx) 파일의 사용자와 계좌를 스트리밍으로 읽어 한꺼번에 등록
+(회원가입/계좌 개설 화면은 한 건씩 입력받고 건마다 확인 쿼리와 INSERT를 실행하므로 수십만 명 이전에는 맞지 않음)
+
+- 파일을 batch_size행씩 읽어 형식 검사와 중복 확인을 메모리에서 처리
+  (중복 확인 색인에 없는 값은 DB를 조회하지 않고, 있을 수 있는 값만 ValidationHelper.find_user_conflicts로 확인)
+- 계좌번호/거래번호를 배치마다 블록으로 예약하고, 사용자/계좌/초기 입금 거래를 executemany로 한 트랜잭션에 저장
+- 저장에 실패한 배치는 행 단위로 다시 저장해 실패한 행만 거부
+- 거부된 행은 원래 값에 행 번호와 사유를 붙여 거부 파일(CSV)에 기록
+
+파일 형식 (첫 행은 헤더, 컬럼 순서는 자유):
+    user_id, user_name, user_password, user_email, user_phone, account_name, account_type, account_password, balance
+    - 사용자 항목이 있는 행은 신규 가입, 계좌 항목도 있으면 계좌를 함께 개설
+    - user_id와 계좌 항목만 있는 행은 기존 사용자(또는 파일 앞쪽에서 등록한 사용자)의 계좌 개설
+    - account_type: 보통예금/정기예금/적금 또는 1/2/3, balance: 초기 입금액 (0 또는 1,000원 이상)
+
+실행: python -m bank_system.batch.import_customers customers.csv --rejects customers_rejects.csv
+"""
+
+import csv
+import math
+import os
+import time
+from itertools import islice
+from typing import Optional, Dict, Any, List, Iterator, Tuple, Callable
+from ..database import get_database_connection, SQLQueries, CACHE_CONFIG, IMPORT_CONFIG
+from ..entities.user import User
+from ..entities.account import Account
+from ..entities.transaction import Transaction
+from ..helpers.validation_helper import ValidationHelper
+from ..utils.bank_utils import BankUtils
+from ..utils.interest_calculator import InterestCalculator
+from ..utils.summary_cache import get_summary_cache
+from ..utils.user_key_index import UserKeyIndex
+
+try:
+    import openpyxl
+except ImportError:  # CSV 등록은 openpyxl 없이도 사용 가능
+    openpyxl = None
+
+
+class ImportManager:
+    """CSV/엑셀 파일의 사용자와 계좌를 대량 등록하는 클래스"""
+
+    USER_COLUMNS = ('user_id', 'user_name', 'user_password', 'user_email', 'user_phone')
+    ACCOUNT_COLUMNS = ('account_name', 'account_type', 'account_password', 'balance')
+
+    # 계좌 종류 코드 (계좌 개설 화면의 선택 번호와 같음)
+    ACCOUNT_TYPES = {'1': '보통예금', '2': '정기예금', '3': '적금'}
+
+    FORMATS = ('csv', 'xlsx')
+
+    def __init__(self, batch_size: Optional[int] = None):
+        """
+        ImportManager 초기화
+
+        Args:
+            batch_size: 한 번에 검사하고 저장하는 행 수 (기본값: IMPORT_CONFIG)
+        """
+        self.db = get_database_connection()
+        self.validator = ValidationHelper()
+        self.summary_cache = get_summary_cache()
+        self.batch_size = batch_size or IMPORT_CONFIG['batch_size']
+
+    @staticmethod
+    def is_format_available(file_format: str) -> bool:
+        """파일 형식 사용 가능 여부 (xlsx는 openpyxl 필요)"""
+        return file_format == 'csv' or (file_format in ImportManager.FORMATS and openpyxl is not None)
+
+    @staticmethod
+    def default_rejects_path(path: str) -> str:
+        """기본 거부 파일 경로 (입력 파일 옆의 이름_rejects.csv)"""
+        return os.path.splitext(path)[0] + '_rejects.csv'
+
+    def import_file(self, path: str, rejects_path: Optional[str] = None, sheet: Optional[str] = None,
+                    encoding: Optional[str] = None,
+                    progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        파일의 사용자/계좌 등록
+
+        Args:
+            path: 입력 파일 경로 (.csv 또는 .xlsx)
+            rejects_path: 거부 파일 경로 (없으면 default_rejects_path, 거부된 행이 없으면 만들지 않음)
+            sheet: 엑셀 시트 이름 (없으면 첫 번째 시트)
+            encoding: CSV 인코딩 (기본값: IMPORT_CONFIG)
+            progress: 배치마다 진행 상황(결과와 같은 형식)을 받는 함수
+
+        Returns:
+            Dict: rows (읽은 행 수), users, accounts (등록 수), rejected (거부 행 수), batches,
+                  rejects_path (거부 파일, 없으면 None), elapsed (초)
+        """
+        file_format = os.path.splitext(path)[1].lower().lstrip('.')
+        if file_format not in self.FORMATS:
+            raise ValueError(f"알 수 없는 파일 형식: {path} (가능: {', '.join(self.FORMATS)})")
+        if not self.is_format_available(file_format):
+            raise ValueError(f"{file_format} 형식은 openpyxl이 필요합니다. (pip install openpyxl)")
+
+        encoding = encoding or IMPORT_CONFIG['csv_encoding']
+        rejects_path = rejects_path or self.default_rejects_path(path)
+        start = time.perf_counter()
+
+        # 전역 중복 확인 색인이 꺼져 있으면 이번 등록에만 쓰는 색인을 만듦 (파일 행 수만큼 여유를 둠)
+        if self.validator.user_index is None:
+            index = UserKeyIndex(
+                mode=IMPORT_CONFIG['user_index'],
+                capacity=CACHE_CONFIG['user_index_capacity'] + self._count_rows(path, file_format, sheet),
+                fp_rate=CACHE_CONFIG['user_index_fp_rate']
+            )
+            index.load()
+            self.validator.user_index = index
+
+        if file_format == 'csv':
+            header, rows = self._read_csv(path, encoding)
+        else:
+            header, rows = self._read_xlsx(path, sheet)
+
+        result = {'rows': 0, 'users': 0, 'accounts': 0, 'rejected': 0, 'batches': 0}
+
+        # 거부 파일은 임시 파일에 쓰고, 거부된 행이 있을 때만 남김
+        temp_path = rejects_path + '.part'
+        try:
+            with open(temp_path, 'w', newline='', encoding=IMPORT_CONFIG['csv_encoding']) as fp:
+                writer = csv.writer(fp, delimiter=",", quotechar='"')
+                writer.writerow(['line', 'reason'] + header)
+
+                while True:
+                    batch = list(islice(rows, self.batch_size))
+                    if not batch:
+                        break
+
+                    records, rejects = self._validate_batch(batch)
+                    saved, failed = self._save_batch(records)
+                    rejects.extend(failed)
+
+                    writer.writerows([line, reason] + [row.get(column, '') for column in header]
+                                     for line, row, reason in sorted(rejects, key=lambda item: item[0]))
+
+                    result['rows'] += len(batch)
+                    result['users'] += sum(1 for record in saved if record['user'])
+                    result['accounts'] += sum(1 for record in saved if record['account'])
+                    result['rejected'] += len(rejects)
+                    result['batches'] += 1
+                    if progress:
+                        progress(dict(result, elapsed=time.perf_counter() - start))
+
+            if result['rejected']:
+                os.replace(temp_path, rejects_path)
+            else:
+                os.remove(temp_path)
+                rejects_path = None
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        finally:
+            rows.close()
+
+        result['rejects_path'] = rejects_path
+        result['elapsed'] = time.perf_counter() - start
+        return result
+
+    def _read_csv(self, path: str, encoding: str) -> Tuple[List[str], Iterator[Tuple[int, Dict[str, str]]]]:
+        """CSV 파일의 헤더와 (행 번호, 행) 반복자"""
+        fp = open(path, 'r', newline='', encoding=encoding)
+        try:
+            reader = csv.reader(fp, delimiter=",")
+            header = self._header(next(reader, []))
+        except Exception:
+            fp.close()
+            raise
+
+        def iter_rows():
+            try:
+                for values in reader:
+                    if any(value.strip() for value in values):
+                        yield reader.line_num, self._row(header, values)
+            finally:
+                fp.close()
+
+        return header, iter_rows()
+
+    def _read_xlsx(self, path: str, sheet: Optional[str]) -> Tuple[List[str], Iterator[Tuple[int, Dict[str, str]]]]:
+        """엑셀 파일(읽기 전용 모드, 행 단위 스트리밍)의 헤더와 (행 번호, 행) 반복자"""
+        book = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            worksheet = book[sheet] if sheet else book.worksheets[0]
+            values_iter = worksheet.iter_rows(values_only=True)
+            header = self._header(next(values_iter, ()))
+        except Exception:
+            book.close()
+            raise
+
+        def iter_rows():
+            try:
+                for line, values in enumerate(values_iter, start=2):
+                    if any(value is not None and str(value).strip() for value in values):
+                        yield line, self._row(header, values)
+            finally:
+                book.close()
+
+        return header, iter_rows()
+
+    def _header(self, values) -> List[str]:
+        """헤더 행 정리 및 필수 컬럼 확인"""
+        header = [self._text(value).lower() for value in values]
+        if 'user_id' not in header:
+            raise ValueError("헤더에 user_id 컬럼이 필요합니다.")
+        if not (set(self.USER_COLUMNS) <= set(header) or set(self.ACCOUNT_COLUMNS) <= set(header)):
+            raise ValueError(f"헤더에 사용자 컬럼({', '.join(self.USER_COLUMNS)}) 또는 "
+                             f"계좌 컬럼({', '.join(self.ACCOUNT_COLUMNS)})이 모두 있어야 합니다.")
+        return header
+
+    def _row(self, header: List[str], values) -> Dict[str, str]:
+        """값 목록을 컬럼 이름 -> 문자열 딕셔너리로 변환 (없는 값은 빈 문자열)"""
+        values = list(values)
+        return {column: self._text(values[i]) if i < len(values) else '' for i, column in enumerate(header)}
+
+    @staticmethod
+    def _text(value) -> str:
+        """셀 값을 문자열로 변환 (엑셀 숫자 셀의 1234.0은 1234)"""
+        if value is None:
+            return ''
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value).strip()
+
+    def _validate_batch(self, batch: List[Tuple[int, Dict[str, str]]]) -> Tuple[List[Dict[str, Any]], List[tuple]]:
+        """
+        배치의 각 행 검사 (형식 -> 같은 배치 안의 중복 -> 색인/DB 중복)
+
+        Args:
+            batch: (행 번호, 행) 리스트
+
+        Returns:
+            Tuple: 저장할 레코드 리스트, 거부 (행 번호, 행, 사유) 리스트
+        """
+        records = []
+        rejects = []
+        pending = set()  # 이 배치에서 등록할 (항목, 값), 앞선 배치는 이미 저장되어 DB 확인에 걸림
+
+        for line, row in batch:
+            record, reason = self._check_row(row, pending)
+            if reason:
+                rejects.append((line, row, reason))
+            else:
+                record['line'] = line
+                record['row'] = row
+                records.append(record)
+
+        return records, rejects
+
+    def _check_row(self, row: Dict[str, str], pending: set) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        한 행 검사
+
+        Args:
+            row: 행
+            pending: 이 배치에서 등록할 (항목, 값) 집합 (통과하면 이 행의 값을 추가)
+
+        Returns:
+            Tuple: 레코드 ({'user': User 또는 None, 'account': 계좌 항목 또는 None}), 거부 사유 (통과하면 None)
+        """
+        user_id = row.get('user_id', '')
+        if not user_id:
+            return None, "user_id가 없습니다."
+
+        has_user = any(row.get(column) for column in self.USER_COLUMNS[1:])
+        has_account = any(row.get(column) for column in self.ACCOUNT_COLUMNS)
+        if not (has_user or has_account):
+            return None, "등록할 사용자나 계좌 정보가 없습니다."
+
+        user = account = None
+        if has_user:
+            missing = [column for column in self.USER_COLUMNS if not row.get(column)]
+            if missing:
+                return None, f"필수 항목 누락: {', '.join(missing)}"
+
+            error = (ValidationHelper.get_user_id_error(user_id)
+                     or ValidationHelper.get_user_name_error(row['user_name'])
+                     or ValidationHelper.get_user_password_error(row['user_password'], user_id)
+                     or ValidationHelper.get_email_error(row['user_email'])
+                     or ValidationHelper.get_phone_error(row['user_phone']))
+            if error:
+                return None, error
+
+            user = User(user_id=user_id, user_name=row['user_name'], user_password=row['user_password'],
+                        user_email=row['user_email'], user_phone=row['user_phone'])
+
+        if has_account:
+            missing = [column for column in self.ACCOUNT_COLUMNS if not row.get(column)]
+            if missing:
+                return None, f"필수 항목 누락: {', '.join(missing)}"
+
+            account_type = self.ACCOUNT_TYPES.get(row['account_type'], row['account_type'])
+            if account_type not in self.ACCOUNT_TYPES.values():
+                return None, f"알 수 없는 계좌 종류입니다: {row['account_type']}"
+
+            try:
+                balance = float(row['balance'].replace(',', ''))
+            except ValueError:
+                return None, "초기 입금액은 숫자여야 합니다."
+            if not math.isfinite(balance):
+                return None, "초기 입금액은 숫자여야 합니다."
+
+            error = (ValidationHelper.get_account_password_error(row['account_password'])
+                     or (ValidationHelper.get_amount_error(balance) if balance else None))
+            if error:
+                return None, error
+
+            account = {'account_name': row['account_name'], 'account_type': account_type,
+                       'account_password': row['account_password'], 'balance': balance}
+
+        if user:
+            keys = [('user_id', user_id), ('user_email', user.user_email), ('user_phone', user.user_phone)]
+            conflicts = [field for field, value in keys if (field, value) in pending]
+            if not conflicts:
+                conflicts = self.validator.find_user_conflicts(user_id, user.user_email, user.user_phone)
+            if conflicts:
+                return None, " ".join(ValidationHelper.DUPLICATE_FIELDS[field][1] for field in conflicts)
+            pending.update(keys)
+        elif ('user_id', user_id) not in pending and not self.validator.find_user_conflicts(user_id=user_id):
+            # 계좌만 있는 행은 기존 사용자이거나 같은 배치에서 등록할 사용자여야 함
+            return None, "존재하지 않는 사용자입니다."
+
+        return {'user': user, 'account': account}, None
+
+    def _save_batch(self, records: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[tuple]]:
+        """
+        배치 저장 (한 트랜잭션, 실패하면 행 단위로 다시 저장)
+
+        Args:
+            records: 검사를 통과한 레코드 리스트
+
+        Returns:
+            Tuple: 저장한 레코드 리스트, 거부 (행 번호, 행, 사유) 리스트
+        """
+        if not records:
+            return [], []
+
+        self._prepare(records)
+
+        try:
+            with self.db.transaction():
+                self._insert(records)
+            saved, rejects = records, []
+        except Exception as e:
+            if len(records) == 1:
+                return [], [(records[0]['line'], records[0]['row'], f"저장 오류: {e}")]
+
+            # 다른 프로세스와 겹친 가입 등으로 배치가 실패하면 실패한 행만 거부
+            saved, rejects = [], []
+            failed_users = set()
+            for record in records:
+                if record['user'] is None and record['row']['user_id'] in failed_users:
+                    rejects.append((record['line'], record['row'], "사용자 등록에 실패해 계좌를 개설하지 않았습니다."))
+                    continue
+                try:
+                    with self.db.transaction():
+                        self._insert([record])
+                    saved.append(record)
+                except Exception as row_error:
+                    if record['user']:
+                        failed_users.add(record['user'].user_id)
+                    if self.db.is_duplicate_error(row_error):
+                        reason = "이미 사용 중인 아이디, 이메일 또는 전화번호입니다."
+                    else:
+                        reason = f"저장 오류: {row_error}"
+                    rejects.append((record['line'], record['row'], reason))
+
+        for record in saved:
+            user = record['user']
+            if user:
+                self.validator.user_index.add_user(user.user_id, user.user_email, user.user_phone)
+            if record['account']:
+                deposit = record['deposit']
+                self.summary_cache.add_account(record['account'], deposit.transaction_date if deposit else None)
+
+        return saved, rejects
+
+    def _prepare(self, records: List[Dict[str, Any]]):
+        """배치의 계좌번호/거래번호를 블록으로 예약해 계좌 객체와 초기 입금 거래 생성"""
+        accounts = [record for record in records if record['account']]
+        deposits = [record for record in accounts if record['account']['balance'] > 0]
+
+        account_ids = BankUtils.generate_account_numbers(len(accounts)) if accounts else []
+        transaction_ids = BankUtils.generate_transaction_ids(len(deposits)) if deposits else []
+        if len(account_ids) != len(accounts) or len(transaction_ids) != len(deposits):
+            raise Exception("계좌번호/거래번호 생성에 실패했습니다.")
+
+        for record, account_id in zip(accounts, account_ids):
+            fields = record['account']
+            record['account'] = Account.create_account_with_interest(
+                account_id=account_id,
+                account_name=fields['account_name'],
+                account_type=fields['account_type'],
+                account_password=fields['account_password'],
+                balance=fields['balance'],
+                user_id=record['row']['user_id'],
+                interest_rate=InterestCalculator.get_interest_rate_by_type(fields['account_type'])
+            )
+            record['deposit'] = None
+
+        for record, transaction_id in zip(deposits, transaction_ids):
+            account = record['account']
+            deposit = Transaction.create_deposit_withdrawal(
+                transaction_id=transaction_id,
+                account_id=account.account_id,
+                transaction_type="입금",
+                amount=account.balance,
+                balance_after=account.balance
+            )
+            deposit.transaction_memo = "계좌 개설"
+            record['deposit'] = deposit
+
+    def _insert(self, records: List[Dict[str, Any]]):
+        """사용자, 계좌, 초기 입금 거래를 executemany로 저장 (트랜잭션 안에서 호출)"""
+        users = [record['user'].to_dict() for record in records if record['user']]
+        accounts = [record['account'].to_dict() for record in records if record['account']]
+        deposits = [record['deposit'].to_dict() for record in records if record.get('deposit')]
+
+        if users:
+            self.db.execute_many(SQLQueries.INSERT_USER, users)
+        if accounts:
+            self.db.execute_many(SQLQueries.INSERT_ACCOUNT, accounts)
+        if deposits:
+            self.db.execute_many(SQLQueries.INSERT_TRANSACTION, deposits)
+
+    @staticmethod
+    def _count_rows(path: str, file_format: str, sheet: Optional[str]) -> int:
+        """중복 확인 색인 크기를 정하기 위한 파일 행 수 (CSV는 줄 수, 엑셀은 시트 크기 정보)"""
+        if file_format == 'csv':
+            count = 0
+            with open(path, 'rb') as fp:
+                for block in iter(lambda: fp.read(1 << 20), b''):
+                    count += block.count(b'\n')
+            return count
+
+        book = openpyxl.load_workbook(path, read_only=True)
+        try:
+            worksheet = book[sheet] if sheet else book.worksheets[0]
+            return worksheet.max_row or 0
+        finally:
+            book.close()
+
@@ -0,0 +1,278 @@
+"""
+이자 병렬 지급 매니저 클래스
+이자 지급 대상 계좌를 계좌번호 구간(샤드)으로 나눠 여러 프로세스에서 동시에 지급하고,
+각 프로세스의 지급 결과(get_interest_summary 형식)를 합산 (작업 프로세스가 1개이면 현재 프로세스에서 차례로 지급)
+
+- 구간은 NTILE로 대상 계좌 수가 같도록 나누며, 각 구간은 다음 구간의 첫 계좌번호 전까지 (빈틈 없음)
+- 작업 프로세스마다 자체 DB 세션으로 구간을 스트리밍하며 청크 단위 일괄 지급 (AdminManager와 같은 방식)
+- 진행 상황은 큐로 받아 일정 간격으로 샤드별로 출력
+- 실행과 구간별 체크포인트는 InterestRunJournal에 기록되어, 중단되면 마지막으로 커밋한 청크부터 재개
+
+실행: python -m bank_system.batch.pay_interest --workers 8   (중단된 실행이 있으면 이어서 지급)
+"""
+
+import multiprocessing
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+from ..database import (get_database_connection, configure_database_connection, close_database_connection,
+                        SQLQueries, BATCH_CONFIG)
+from ..entities.interest import InterestShard, InterestRun
+from ..utils.bank_utils import BankUtils
+from ..utils.interest_calculator import InterestCalculator
+from ..utils.account_cache import get_account_cache
+from ..utils.summary_cache import get_summary_cache
+from ..utils.interest_run_journal import InterestRunJournal
+
+
+class InterestShardManager:
+    """이자 지급을 계좌번호 구간별로 여러 프로세스에 나눠 실행하는 클래스"""
+
+    # 진행 상황 출력 간격 (초)
+    PROGRESS_INTERVAL = 2.0
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        """
+        InterestShardManager 초기화
+
+        Args:
+            workers: 작업 프로세스 수 (기본값: BATCH_CONFIG['interest_workers'])
+            chunk_size: 한 번에 커밋하는 계좌 수 (기본값: BATCH_CONFIG)
+        """
+        self.db = get_database_connection()
+        self.workers = max(1, workers or BATCH_CONFIG['interest_workers'])
+        self.chunk_size = chunk_size or BATCH_CONFIG['interest_chunk_size']
+
+    def plan_shards(self, shard_count: Optional[int] = None) -> List[InterestShard]:
+        """
+        이자 지급 대상 계좌를 계좌 수가 비슷한 구간으로 나눔
+
+        Args:
+            shard_count: 구간 수 (기본값: 작업 프로세스 수)
+
+        Returns:
+            List[InterestShard]: 구간 목록 (대상 계좌가 없으면 빈 리스트)
+        """
+        results = self.db.execute_query(SQLQueries.SELECT_INTEREST_SHARD_BOUNDS,
+                                        {'shards': shard_count or self.workers})
+
+        shards = []
+        for i, row in enumerate(results):
+            shards.append(InterestShard(
+                shard_no=i + 1,
+                start_id=row['start_id'] if i > 0 else None,
+                end_id=results[i + 1]['start_id'] if i + 1 < len(results) else None,
+                account_count=row['account_count']
+            ))
+        return shards
+
+    def run(self, run: InterestRun, admin_id: str) -> Dict[str, Any]:
+        """
+        실행 기록의 끝나지 않은 구간을 지급 (작업 프로세스가 1개이면 현재 프로세스에서 차례로 실행)
+
+        Args:
+            run: 지급할 실행 기록 (InterestRunJournal.create_run 또는 재개할 기록)
+            admin_id: 관리자 ID
+
+        Returns:
+            Dict: 이번에 지급한 get_interest_summary 형식의 합계와 failed_chunks, failed_shards,
+                  elapsed, shards (구간별 결과), worker_round_trips (작업 프로세스의 DB 왕복 횟수,
+                  현재 프로세스에서 지급하면 0이고 왕복은 현재 프로세스의 통계에 잡힘)
+        """
+        shards = run.pending_shards()
+        workers = min(self.workers, len(shards))
+        journal = InterestRunJournal()
+
+        total = InterestCalculator.get_interest_summary([])
+        total.update({'failed_chunks': 0, 'failed_shards': 0, 'elapsed': 0.0, 'shards': [], 'worker_round_trips': 0})
+        start = time.perf_counter()
+
+        try:
+            if workers <= 1:
+                for shard in shards:
+                    self._merge_shard_result(total, pay_interest_shard(run.run_id, run.updated_at, run.calc_date,
+                                                                       shard, admin_id, self.chunk_size))
+            else:
+                self._run_parallel(run, shards, workers, admin_id, total)
+        except BaseException:
+            # 취소(Ctrl+C) 또는 예상하지 못한 오류: 커밋된 청크까지는 체크포인트에 남아 있음
+            journal.finish_run(run, InterestRunJournal.FAILED)
+            raise
+
+        total['elapsed'] = time.perf_counter() - start
+        total['shards'].sort(key=lambda result: result['shard_no'])
+
+        failed = total['failed_shards'] or any(result['failed_chunks'] for result in total['shards'])
+        journal.finish_run(run, InterestRunJournal.FAILED if failed else InterestRunJournal.COMPLETED)
+        return total
+
+    def _run_parallel(self, run: InterestRun, shards: List[InterestShard], workers: int,
+                      admin_id: str, total: Dict[str, Any]):
+        """구간을 작업 프로세스에 나눠 실행하고 결과를 total에 합산"""
+        print(f"이자 병렬 지급: {len(shards)}개 구간, 작업 프로세스 {workers}개")
+        for shard in shards:
+            print(f"  {shard}")
+
+        backend_name = self.db.backend.name
+        options = self.db.backend.connect_options()
+
+        # 작업 프로세스는 부모의 DB 연결/스레드를 물려받지 않도록 spawn으로 시작
+        context = multiprocessing.get_context('spawn')
+        try:
+            with context.Manager() as sync_manager:
+                progress = sync_manager.Queue()
+                processed = {shard.shard_no: 0 for shard in shards}
+
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                    pending = {
+                        executor.submit(run_interest_shard, backend_name, options, run.run_id, run.updated_at,
+                                        run.calc_date, shard, admin_id, self.chunk_size, progress): shard
+                        for shard in shards
+                    }
+
+                    next_report = time.perf_counter() + self.PROGRESS_INTERVAL
+                    while pending:
+                        done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                        self._drain_progress(progress, processed)
+
+                        for future in done:
+                            shard = pending.pop(future)
+                            try:
+                                result = future.result()
+                            except Exception as e:
+                                # 작업 프로세스 오류: 커밋된 청크까지는 체크포인트에 남아 있으므로 재개 가능
+                                print(f"  샤드 {shard.shard_no} 오류: {e}")
+                                total['failed_shards'] += 1
+                                continue
+
+                            processed[result['shard_no']] = result['processed']
+                            self._merge_shard_result(total, result)
+                            print(f"  샤드 {result['shard_no']} 완료: {result['total_accounts']:,}개 계좌, "
+                                  f"{BankUtils.format_currency(result['total_amount'])}, {result['elapsed']:.2f}초"
+                                  + (f", 실패 청크 {result['failed_chunks']}개" if result['failed_chunks'] else ""))
+
+                        if pending and time.perf_counter() >= next_report:
+                            self._print_progress(shards, processed)
+                            next_report = time.perf_counter() + self.PROGRESS_INTERVAL
+        finally:
+            # 다른 프로세스에서 잔액이 바뀌었으므로 이 프로세스의 캐시는 비움
+            get_account_cache().clear()
+            get_summary_cache().clear()
+
+    @staticmethod
+    def _merge_shard_result(total: Dict[str, Any], result: Dict[str, Any]):
+        """구간 결과를 전체 합계에 더함"""
+        InterestCalculator.merge_interest_summary(total, result)
+        total['failed_chunks'] += result['failed_chunks']
+        total['worker_round_trips'] += result.get('round_trips', 0)
+        total['shards'].append(result)
+
+    @staticmethod
+    def _drain_progress(progress, processed: Dict[int, int]):
+        """진행 상황 큐에 쌓인 (구간 번호, 처리한 계좌 수)를 반영"""
+        while True:
+            try:
+                shard_no, count = progress.get_nowait()
+            except queue.Empty:
+                break
+            processed[shard_no] = count
+
+    @staticmethod
+    def _print_progress(shards: List[InterestShard], processed: Dict[int, int]):
+        """구간별 진행률 출력"""
+        parts = [
+            f"{shard.shard_no}: {processed[shard.shard_no] * 100 // max(shard.account_count, 1)}%"
+            for shard in shards
+        ]
+        done = sum(processed.values())
+        planned = sum(shard.account_count for shard in shards)
+        print(f"  진행 {done:,}/{planned:,} 계좌 ({' | '.join(parts)})")
+
+
+def pay_interest_shard(run_id: str, claimed_at: datetime, calc_date: datetime, shard: InterestShard,
+                       admin_id: str, chunk_size: int, progress=None) -> Dict[str, Any]:
+    """
+    한 구간의 이자를 체크포인트 이후부터 청크 단위로 지급 (현재 프로세스의 DB 연결 사용)
+
+    청크마다 지급과 체크포인트 갱신을 한 트랜잭션으로 커밋한다.
+    실패한 청크가 있으면 그 뒤 청크는 지급하되 재개 지점은 옮기지 않아,
+    재개 시 실패한 청크부터 다시 조회한다. (이미 지급한 계좌는 기준 시각까지 이자가 0이라 제외됨)
+    실행을 다른 프로세스가 넘겨받았으면 청크가 롤백되므로 그 자리에서 멈춘다.
+
+    Args:
+        run_id: 실행 ID
+        claimed_at: 실행을 만들거나 넘겨받을 때의 updated_at (소유 확인용)
+        calc_date: 이자 계산 기준 시각
+        shard: 지급할 구간 (last_account_id가 있으면 그 다음 계좌부터)
+        admin_id: 관리자 ID
+        chunk_size: 한 번에 커밋하는 계좌 수
+        progress: 진행 상황 큐 ((구간 번호, 처리한 계좌 수)를 넣음, 없으면 생략)
+
+    Returns:
+        Dict: 구간의 지급 합계 (get_interest_summary 형식)와 shard_no, processed, failed_chunks, elapsed
+    """
+    from .admin_manager import AdminManager
+
+    start = time.perf_counter()
+    admin_manager = AdminManager()
+    journal = InterestRunJournal()
+    result = InterestCalculator.get_interest_summary([])
+    processed = failed_chunks = 0
+
+    for chunk in InterestCalculator.iter_interest_eligible_chunks(chunk_size, calc_date, shard.start_id,
+                                                                  shard.end_id, shard.last_account_id):
+        checkpoint = journal.checkpoint_params(run_id, claimed_at, shard.shard_no, chunk,
+                                               advance=not failed_chunks)
+        paid = admin_manager.process_interest_payment_batch(chunk, admin_id, checkpoint)
+        processed += len(chunk)
+        if progress is not None:
+            progress.put((shard.shard_no, processed))
+
+        if paid is not None:
+            InterestCalculator.merge_interest_summary(result, InterestCalculator.get_interest_summary(paid))
+            continue
+
+        failed_chunks += 1
+        if not journal.is_owner(run_id, claimed_at):
+            print(f"  샤드 {shard.shard_no}: 다른 프로세스가 실행 {run_id}을 넘겨받아 지급을 멈춥니다.")
+            break
+
+    journal.finish_shard(run_id, claimed_at, shard.shard_no,
+                         InterestRunJournal.FAILED if failed_chunks else InterestRunJournal.DONE)
+
+    result.update({'shard_no': shard.shard_no, 'processed': processed,
+                   'failed_chunks': failed_chunks, 'elapsed': time.perf_counter() - start})
+    return result
+
+
+def run_interest_shard(backend_name: str, options: Dict[str, Any], run_id: str, claimed_at: datetime,
+                       calc_date: datetime, shard: InterestShard, admin_id: str, chunk_size: int,
+                       progress) -> Dict[str, Any]:
+    """
+    작업 프로세스에서 한 구간의 이자 지급 실행 (자체 DB 연결 사용)
+
+    Args:
+        backend_name: 백엔드 이름
+        options: 백엔드 설정 (connect_options)
+        run_id: 실행 ID
+        claimed_at: 실행을 만들거나 넘겨받을 때의 updated_at
+        calc_date: 이자 계산 기준 시각
+        shard: 지급할 구간
+        admin_id: 관리자 ID
+        chunk_size: 한 번에 커밋하는 계좌 수
+        progress: 진행 상황 큐
+
+    Returns:
+        Dict: pay_interest_shard 결과와 round_trips (이 구간을 지급하며 작업 프로세스가 DB를 왕복한 횟수)
+    """
+    db = configure_database_connection(backend_name, **options)
+    try:
+        before = db.get_round_trip_count(current_thread_only=False)
+        result = pay_interest_shard(run_id, claimed_at, calc_date, shard, admin_id, chunk_size, progress)
+        result['round_trips'] = db.get_round_trip_count(current_thread_only=False) - before
+        return result
+    finally:
+        close_database_connection()
+
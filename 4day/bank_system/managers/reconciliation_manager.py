@@ -0,0 +1,455 @@
+"""
+원장 대사 매니저 클래스
+계좌 잔액(accounts.balance)이 거래 원장(transactions의 거래 후 잔액)과 이자 지급 기록(interest_payments)으로
+설명되는지 확인하고 불일치를 CSV 보고서로 기록 (야간 배치용)
+
+- 계좌, 거래, 이자 지급을 각각 계좌번호 순 커서 하나로 스트리밍하며 한 번의 병합으로 비교
+  (테이블을 메모리에 올리지 않으므로 원장이 수억 행이어도 메모리는 일정, 거래/이자는 계좌 안에서 최신순)
+- 계좌마다 현재 잔액에서 시작해 최신 기록부터 과거로 되돌리며 확인
+  잔액 불일치: 계좌 잔액 != 마지막 거래 후 잔액 + 그 이후 지급 이자
+  원장 불연속: 거래 후 잔액 != 직전 거래 후 잔액 + 사이 지급 이자 +/- 거래액
+  개설 잔액 불일치: 첫 거래 이전 잔액이 0이 아님 / 계좌 없는 원장: 계좌가 삭제된 거래/이자 기록
+- 세 조회는 read_snapshot 블록 안에서 같은 시점의 데이터를 읽으므로 대사 중의 거래로 인한 오탐이 없음
+- workers가 2 이상이면 계좌번호 구간(샤드)별로 여러 프로세스에서 동시에 대사하고 구간별 보고서를 합침
+
+실행: python -m bank_system.batch.reconcile --workers 8   (불일치가 있거나 실패한 구간이 있으면 종료 코드 1)
+"""
+
+import csv
+import multiprocessing
+import os
+import queue
+import time
+from itertools import takewhile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterator, Callable, Tuple
+from ..database import (get_database_connection, configure_database_connection, close_database_connection,
+                        SQLQueries, RECONCILE_CONFIG, EXPORT_CONFIG)
+from ..entities.reconciliation import ReconcileShard, Discrepancy
+from ..utils.bank_utils import BankUtils
+from .transaction_manager import TransactionManager
+
+
+class ReconciliationManager:
+    """원장과 계좌 잔액을 대사하는 클래스 (계좌번호 구간별 병렬 실행 가능)"""
+
+    # 보고서 컬럼 (Discrepancy.to_dict 키)
+    REPORT_COLUMNS = ['account_id', 'kind', 'kind_name', 'expected', 'actual', 'difference',
+                      'transaction_id', 'detail']
+
+    # 진행 상황 출력 간격 (초)
+    PROGRESS_INTERVAL = 2.0
+
+    def __init__(self, workers: Optional[int] = None, tolerance: Optional[float] = None):
+        """
+        ReconciliationManager 초기화
+
+        Args:
+            workers: 작업 프로세스 수 (기본값: RECONCILE_CONFIG['workers'])
+            tolerance: 금액 비교 허용 오차 (기본값: RECONCILE_CONFIG['tolerance'])
+        """
+        self.db = get_database_connection()
+        self.workers = max(1, workers or RECONCILE_CONFIG['workers'])
+        self.tolerance = RECONCILE_CONFIG['tolerance'] if tolerance is None else tolerance
+
+    def plan_shards(self, shard_count: Optional[int] = None) -> List[ReconcileShard]:
+        """
+        전체 계좌를 계좌 수가 비슷한 구간으로 나눔
+        (첫 구간은 처음부터, 마지막 구간은 끝까지이고 구간 사이에 빈틈이 없으므로 계좌 없는 원장도 어느 한 구간에 포함)
+
+        Args:
+            shard_count: 구간 수 (기본값: 작업 프로세스 수)
+
+        Returns:
+            List[ReconcileShard]: 구간 목록 (계좌가 없으면 전체 범위 구간 하나)
+        """
+        results = self.db.execute_query(SQLQueries.SELECT_RECONCILE_SHARD_BOUNDS,
+                                        {'shards': shard_count or self.workers})
+        if not results:
+            return [ReconcileShard(shard_no=1, start_id=None, end_id=None)]
+
+        return [
+            ReconcileShard(
+                shard_no=i + 1,
+                start_id=row['start_id'] if i > 0 else None,
+                end_id=results[i + 1]['start_id'] if i + 1 < len(results) else None,
+                account_count=row['account_count']
+            )
+            for i, row in enumerate(results)
+        ]
+
+    def key_bounds(self) -> Optional[Tuple[str, str]]:
+        """
+        대사할 계좌번호의 전체 범위 (계좌, 거래, 이자 지급 중 가장 작은/큰 계좌번호)
+
+        Returns:
+            Optional[Tuple[str, str]]: (첫 계좌번호, 마지막 계좌번호), 세 테이블 모두 비어 있으면 None
+        """
+        row = self.db.execute_query(SQLQueries.SELECT_RECONCILE_KEY_BOUNDS)[0]
+        lows = [row[name] for name in ('accounts_min', 'transactions_min', 'payments_min') if row[name]]
+        highs = [row[name] for name in ('accounts_max', 'transactions_max', 'payments_max') if row[name]]
+        return (min(lows), max(highs)) if lows else None
+
+    @staticmethod
+    def default_path() -> str:
+        """기본 보고서 경로 (EXPORT_CONFIG['output_dir']/reconcile_실행시각.csv)"""
+        return os.path.join(EXPORT_CONFIG['output_dir'], f"reconcile_{datetime.now():%Y%m%d_%H%M%S}.csv")
+
+    def run(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        원장 대사 실행 (작업 프로세스가 1개이면 현재 프로세스에서 전체 범위를 한 번에 대사)
+
+        Args:
+            path: 불일치 보고서 경로 (없으면 default_path, 불일치가 없어도 헤더만 있는 파일을 기록)
+
+        Returns:
+            Dict: path, accounts, transactions, payments (읽은 행 수), discrepancies, by_kind (종류별 건수),
+                  balance_difference (잔액 불일치 금액 합계), failed_shards, elapsed, shards (구간별 결과)
+        """
+        path = path or self.default_path()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        bounds = self.key_bounds()
+        if bounds is None or self.workers <= 1:
+            shards = [ReconcileShard(shard_no=1, start_id=None, end_id=None)]
+        else:
+            shards = self.plan_shards()
+
+        total = {'path': path, 'accounts': 0, 'transactions': 0, 'payments': 0, 'discrepancies': 0,
+                 'by_kind': {}, 'balance_difference': 0.0, 'failed_shards': 0, 'elapsed': 0.0, 'shards': []}
+        part_paths = {shard.shard_no: f"{path}.{shard.shard_no}.part" for shard in shards}
+        start = time.perf_counter()
+
+        try:
+            if bounds is None:
+                pass  # 대사할 기록 없음 (헤더만 기록)
+            elif len(shards) == 1:
+                shard = shards[0]
+                self._merge_shard_result(total, reconcile_shard(shard, bounds, self.tolerance,
+                                                                part_paths[shard.shard_no]))
+            else:
+                self._run_parallel(shards, bounds, part_paths, total)
+
+            total['shards'].sort(key=lambda result: result['shard_no'])
+            self._write_report(path, [part_paths[result['shard_no']] for result in total['shards']])
+        finally:
+            for part_path in part_paths.values():
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+
+        total['elapsed'] = time.perf_counter() - start
+        return total
+
+    def _run_parallel(self, shards: List[ReconcileShard], bounds: Tuple[str, str], part_paths: Dict[int, str],
+                      total: Dict[str, Any]):
+        """구간을 작업 프로세스에 나눠 대사하고 결과를 total에 합산"""
+        workers = min(self.workers, len(shards))
+        print(f"원장 병렬 대사: {len(shards)}개 구간, 작업 프로세스 {workers}개")
+        for shard in shards:
+            print(f"  {shard}")
+
+        backend_name = self.db.backend.name
+        options = self.db.backend.connect_options()
+
+        # 작업 프로세스는 부모의 DB 연결/스레드를 물려받지 않도록 spawn으로 시작
+        context = multiprocessing.get_context('spawn')
+        with context.Manager() as sync_manager:
+            progress = sync_manager.Queue()
+            processed = {shard.shard_no: 0 for shard in shards}
+
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                pending = {
+                    executor.submit(run_reconcile_shard, backend_name, options, shard, bounds, self.tolerance,
+                                    part_paths[shard.shard_no], progress): shard
+                    for shard in shards
+                }
+
+                next_report = time.perf_counter() + self.PROGRESS_INTERVAL
+                while pending:
+                    done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                    self._drain_progress(progress, processed)
+
+                    for future in done:
+                        shard = pending.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            # 실패한 구간은 보고서에서 빠지므로 결과를 불완전한 대사로 표시
+                            print(f"  샤드 {shard.shard_no} 오류: {e}")
+                            total['failed_shards'] += 1
+                            continue
+
+                        processed[result['shard_no']] = result['accounts']
+                        self._merge_shard_result(total, result)
+                        print(f"  샤드 {result['shard_no']} 완료: 계좌 {result['accounts']:,}개, "
+                              f"거래 {result['transactions']:,}건, 불일치 {result['discrepancies']:,}건, "
+                              f"{result['elapsed']:.2f}초")
+
+                    if pending and time.perf_counter() >= next_report:
+                        self._print_progress(shards, processed)
+                        next_report = time.perf_counter() + self.PROGRESS_INTERVAL
+
+    def _write_report(self, path: str, part_paths: List[str]):
+        """헤더 아래에 구간별 보고서를 주어진 순서대로 이어 붙여 최종 보고서 기록"""
+        temp_path = path + '.part'
+        try:
+            with open(temp_path, 'w', encoding=EXPORT_CONFIG['csv_encoding'], newline='') as file:
+                csv.writer(file).writerow(self.REPORT_COLUMNS)
+                for part_path in part_paths:
+                    with open(part_path, encoding='utf-8', newline='') as part:
+                        while True:
+                            block = part.read(1 << 20)
+                            if not block:
+                                break
+                            file.write(block)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _merge_shard_result(total: Dict[str, Any], result: Dict[str, Any]):
+        """구간 결과를 전체 합계에 더함"""
+        for key in ('accounts', 'transactions', 'payments', 'discrepancies', 'balance_difference'):
+            total[key] += result[key]
+        for kind, count in result['by_kind'].items():
+            total['by_kind'][kind] = total['by_kind'].get(kind, 0) + count
+        total['shards'].append(result)
+
+    @staticmethod
+    def _drain_progress(progress, processed: Dict[int, int]):
+        """진행 상황 큐에 쌓인 (구간 번호, 처리한 계좌 수)를 반영"""
+        while True:
+            try:
+                shard_no, count = progress.get_nowait()
+            except queue.Empty:
+                break
+            processed[shard_no] = count
+
+    @staticmethod
+    def _print_progress(shards: List[ReconcileShard], processed: Dict[int, int]):
+        """구간별 진행률 출력"""
+        parts = [
+            f"{shard.shard_no}: {processed[shard.shard_no] * 100 // max(shard.account_count, 1)}%"
+            for shard in shards
+        ]
+        done = sum(processed.values())
+        planned = sum(shard.account_count for shard in shards)
+        print(f"  진행 {done:,}/{planned:,} 계좌 ({' | '.join(parts)})")
+
+    @staticmethod
+    def print_result(result: Dict[str, Any]):
+        """
+        대사 결과 요약 출력
+
+        Args:
+            result: run 결과
+        """
+        print(f"계좌 {result['accounts']:,}개, 거래 {result['transactions']:,}건, "
+              f"이자 지급 {result['payments']:,}건 대사, {result['elapsed']:.2f}초 "
+              f"({result['transactions'] / max(result['elapsed'], 1e-9):,.0f} 거래/초)")
+
+        if result['discrepancies']:
+            print(f"❌ 불일치 {result['discrepancies']:,}건 "
+                  f"(잔액 차이 합계 {BankUtils.format_currency(result['balance_difference'])})")
+            for kind, count in sorted(result['by_kind'].items()):
+                print(f"  {Discrepancy.KIND_NAMES.get(kind, kind)}: {count:,}건")
+        else:
+            print("✅ 불일치가 없습니다.")
+
+        if result['failed_shards']:
+            print(f"❌ 실패한 구간 {result['failed_shards']}개 (해당 구간은 대사되지 않음)")
+        print(f"보고서: {result['path']}")
+
+
+def _as_tuple(*row) -> tuple:
+    """조회 행을 튜플 그대로 사용 (행마다 딕셔너리를 만들지 않음)"""
+    return row
+
+
+def _is_later(first: Optional[datetime], second: Optional[datetime]) -> bool:
+    """first가 second와 같거나 이후인지 (일시가 없는 기록은 가장 오래된 것으로 봄)"""
+    if first is None:
+        return False
+    return second is None or first >= second
+
+
+def reconcile_streams(accounts: Iterator[tuple], transactions: Iterator[tuple], payments: Iterator[tuple],
+                      tolerance: float, counts: Dict[str, int],
+                      progress: Optional[Callable[[int], None]] = None,
+                      progress_every: int = 0) -> Iterator[Discrepancy]:
+    """
+    계좌번호 순으로 정렬된 세 스트림을 한 번에 병합하며 불일치를 생성 (계좌 하나의 기록만큼도 모아 두지 않음)
+
+    계좌마다 현재 잔액에서 시작해 최신 기록부터 과거로 되돌린다. 이자 지급은 잔액에서 빼고,
+    거래는 되돌린 잔액과 거래 후 잔액을 비교한 뒤 거래 전 잔액으로 이동한다.
+    불일치가 있으면 기록된 거래 후 잔액에서 다시 이어가므로 불일치 한 곳은 한 번만 보고된다.
+    (이자 지급일과 거래일이 같으면 이자를 거래 이후로 봄)
+
+    Args:
+        accounts: (account_id, balance) 스트림, 계좌번호 순
+        transactions: (account_id, transaction_id, transaction_date, transaction_type, amount, balance_after)
+                      스트림, 계좌번호 순 + 계좌 안에서 최신순
+        payments: (account_id, payment_id, payment_date, interest_amount) 스트림, 계좌번호 순 + 최신순
+        tolerance: 금액 비교 허용 오차
+        counts: 읽은 행 수를 더할 딕셔너리 (accounts, transactions, payments)
+        progress: 처리한 계좌 수를 받는 함수 (progress_every개마다 호출)
+        progress_every: progress 호출 간격 (계좌 수)
+
+    Yields:
+        Discrepancy: 불일치 기록
+    """
+    credit_types = TransactionManager.CREDIT_TYPES
+    account = next(accounts, None)
+    transaction = next(transactions, None)
+    payment = next(payments, None)
+
+    while account is not None or transaction is not None or payment is not None:
+        account_id = min(row[0] for row in (account, transaction, payment) if row is not None)
+
+        balance = None
+        if account is not None and account[0] == account_id:
+            balance = account[1]
+            account = next(accounts, None)
+            counts['accounts'] += 1
+            if progress and progress_every and counts['accounts'] % progress_every == 0:
+                progress(counts['accounts'])
+
+        # running: 지금 보고 있는 기록 직후의 잔액 (계좌가 없으면 비교하지 않음)
+        running = balance
+        newer_id = None  # 방금 지나온(더 최근) 거래번호
+        ledger_rows = 0
+
+        while True:
+            has_transaction = transaction is not None and transaction[0] == account_id
+            has_payment = payment is not None and payment[0] == account_id
+            if not (has_transaction or has_payment):
+                break
+            ledger_rows += 1
+
+            if has_payment and (not has_transaction or _is_later(payment[2], transaction[2])):
+                if running is not None:
+                    running -= payment[3]
+                payment = next(payments, None)
+                counts['payments'] += 1
+                continue
+
+            _, transaction_id, _, transaction_type, amount, balance_after = transaction
+            if running is not None and abs(running - balance_after) > tolerance:
+                if newer_id is None:
+                    yield Discrepancy(account_id, Discrepancy.BALANCE_MISMATCH,
+                                      expected=balance_after + (balance - running), actual=balance,
+                                      transaction_id=transaction_id,
+                                      detail="마지막 거래 후 잔액과 이후 지급 이자의 합이 계좌 잔액과 다름")
+                else:
+                    yield Discrepancy(account_id, Discrepancy.LEDGER_BREAK,
+                                      expected=running, actual=balance_after, transaction_id=transaction_id,
+                                      detail=f"다음 거래 {newer_id}의 거래 전 잔액과 다름")
+
+            running = balance_after - amount if transaction_type in credit_types else balance_after + amount
+            newer_id = transaction_id
+            transaction = next(transactions, None)
+            counts['transactions'] += 1
+
+        if balance is None:
+            yield Discrepancy(account_id, Discrepancy.ORPHAN_LEDGER, expected=None, actual=None,
+                              transaction_id=newer_id, detail=f"계좌가 없는 거래/이자 기록 {ledger_rows:,}건")
+        elif abs(running) > tolerance:
+            yield Discrepancy(account_id, Discrepancy.OPENING_BALANCE, expected=0.0, actual=running,
+                              transaction_id=newer_id,
+                              detail="첫 거래 이전 잔액이 0이 아님" if newer_id else "거래 기록 없이 잔액이 있음")
+
+
+def reconcile_shard(shard: ReconcileShard, bounds: Tuple[str, str], tolerance: float, part_path: str,
+                    progress=None) -> Dict[str, Any]:
+    """
+    한 구간을 대사하고 불일치를 구간 보고서(헤더 없는 CSV)에 기록 (현재 프로세스의 DB 연결 사용)
+
+    구간의 열린 끝은 전체 범위(bounds)로 채워 색인 범위로 조회하고, 다음 구간의 첫 계좌번호에
+    이르면 읽기를 멈춘다. (조회 상한은 다음 구간의 첫 계좌번호를 포함하지만 그 행은 대사하지 않음)
+
+    Args:
+        shard: 대사할 구간
+        bounds: 대사할 전체 계좌번호 범위 (key_bounds 결과)
+        tolerance: 금액 비교 허용 오차
+        part_path: 구간 보고서 경로
+        progress: 진행 상황 큐 ((구간 번호, 처리한 계좌 수)를 넣음, 없으면 생략)
+
+    Returns:
+        Dict: shard_no, accounts, transactions, payments, discrepancies, by_kind, balance_difference, elapsed
+    """
+    db = get_database_connection()
+    start = time.perf_counter()
+    params = {'start_id': shard.start_id or bounds[0], 'end_id': shard.end_id or bounds[1]}
+    arraysize = RECONCILE_CONFIG['fetch_arraysize']
+
+    counts = {'accounts': 0, 'transactions': 0, 'payments': 0}
+    by_kind: Dict[str, int] = {}
+    discrepancies = 0
+    balance_difference = 0.0
+
+    report_progress = None
+    if progress is not None:
+        report_progress = lambda count: progress.put((shard.shard_no, count))
+
+    with open(part_path, 'w', encoding='utf-8', newline='') as file, db.read_snapshot():
+        writer = csv.writer(file)
+        streams = [
+            db.iter_query(query, params, arraysize, _as_tuple)
+            for query in (SQLQueries.SELECT_RECONCILE_ACCOUNTS_RANGE,
+                          SQLQueries.SELECT_RECONCILE_TRANSACTIONS_RANGE,
+                          SQLQueries.SELECT_RECONCILE_INTEREST_RANGE)
+        ]
+        try:
+            rows = streams
+            if shard.end_id is not None:
+                rows = [takewhile(lambda row: row[0] < shard.end_id, stream) for stream in streams]
+
+            for discrepancy in reconcile_streams(*rows, tolerance, counts, report_progress,
+                                                 RECONCILE_CONFIG['progress_every']):
+                record = discrepancy.to_dict()
+                writer.writerow([record[column] for column in ReconciliationManager.REPORT_COLUMNS])
+                by_kind[discrepancy.kind] = by_kind.get(discrepancy.kind, 0) + 1
+                discrepancies += 1
+                if discrepancy.kind == Discrepancy.BALANCE_MISMATCH:
+                    balance_difference += discrepancy.difference
+        finally:
+            for stream in streams:
+                stream.close()
+
+    if progress is not None:
+        progress.put((shard.shard_no, counts['accounts']))
+
+    result = dict(counts)
+    result.update({'shard_no': shard.shard_no, 'discrepancies': discrepancies, 'by_kind': by_kind,
+                   'balance_difference': balance_difference, 'elapsed': time.perf_counter() - start})
+    return result
+
+
+def run_reconcile_shard(backend_name: str, options: Dict[str, Any], shard: ReconcileShard,
+                        bounds: Tuple[str, str], tolerance: float, part_path: str, progress) -> Dict[str, Any]:
+    """
+    작업 프로세스에서 한 구간의 대사 실행 (자체 DB 연결 사용)
+
+    Args:
+        backend_name: 백엔드 이름
+        options: 백엔드 설정 (connect_options)
+        shard: 대사할 구간
+        bounds: 대사할 전체 계좌번호 범위
+        tolerance: 금액 비교 허용 오차
+        part_path: 구간 보고서 경로
+        progress: 진행 상황 큐
+
+    Returns:
+        Dict: reconcile_shard 결과
+    """
+    configure_database_connection(backend_name, **options)
+    try:
+        return reconcile_shard(shard, bounds, tolerance, part_path, progress)
+    finally:
+        close_database_connection()
+
@@ -1,121 +1,347 @@
 """
 스케줄러 관리 매니저 클래스
 Java의 SchedulerManager 클래스를 Python으로 변환 (간단 버전)
+
+작업마다 다음 실행 시각을 계산해 그때까지 stop_event를 기다리므로 주기적으로 깨어나 확인하지 않고,
+중지 요청 시 바로 종료한다.
+마지막 실행 시각은 scheduler_runs 테이블에 저장하여, 시스템이 꺼져 있던 동안 놓친 실행은
+다시 시작할 때 한 번만 실행한다. (여러 번 놓쳤어도 한 번, 여러 프로세스가 동시에 떠 있어도 한 번)
 """
 
+import calendar
 import threading
-import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Callable, Dict, Any, List
+from ..database import get_database_connection, SQLQueries, SCHEDULER_CONFIG
+from ..utils.report_exporter import ReportExporter
 from .admin_manager import AdminManager
 
 
+# 다음 실행 시각 계산 함수: 기준 시각 이후의 첫 실행 시각 반환
+Schedule = Callable[[datetime], datetime]
+
+
+@dataclass(slots=True)
+class ScheduledJob:
+    """예약 작업 정보를 담는 클래스"""
+
+    name: str                       # 작업 이름 (scheduler_runs의 job_name)
+    description: str                # 작업 설명 (상태 표시용)
+    func: Callable[[datetime], Any]  # 실행할 함수 (예정 시각을 받음, False 반환 시 실패로 보고 재시도)
+    schedule: Schedule              # 다음 실행 시각 계산 함수
+    catch_up: bool = True           # 놓친 실행을 시작 시 한 번 실행할지 여부
+    next_run: Optional[datetime] = None     # 다음 실행 예정 시각
+    last_run: Optional[datetime] = None     # 마지막으로 실행한 예정 시각
+    last_result: Optional[str] = None       # 마지막 실행 결과
+    retry_at: Optional[datetime] = None     # 오류 후 다시 시도할 시각
+
+    @property
+    def due_time(self) -> datetime:
+        """실제로 실행할 시각 (재시도 대기 중이면 재시도 시각)"""
+        return max(self.next_run, self.retry_at) if self.retry_at else self.next_run
+
+
 class SchedulerManager:
-    """이자 지급 스케줄러를 관리하는 클래스"""
-    
+    """이자 지급 등 예약 작업을 관리하는 스케줄러 클래스"""
+
     def __init__(self, admin_manager: AdminManager):
-        """SchedulerManager 초기화"""
+        """SchedulerManager 초기화 (월말 이자 지급, 설정 시 야간 거래내역 내보내기/원장 대사 등록)"""
+        self.db = get_database_connection()
         self.admin_manager = admin_manager
         self.scheduler_thread: Optional[threading.Thread] = None
         self.running = False
         self.stop_event = threading.Event()
-    
+        self._wakeup = threading.Event()  # 작업 추가 시 다음 실행 시각 재계산
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._lock = threading.Lock()
+
+        # 매월 마지막 날 오후 2시 이자 지급
+        self.add_job(
+            'interest_payment', "모든 계좌 이자 일괄 지급",
+            self._execute_scheduled_interest_payment,
+            self.monthly_last_day(SCHEDULER_CONFIG['interest_hour'], SCHEDULER_CONFIG['interest_minute'])
+        )
+
+        # 매일 전날 거래내역 내보내기
+        if SCHEDULER_CONFIG['nightly_export']:
+            self.add_job(
+                'nightly_export', "전날 거래내역 내보내기",
+                self._execute_nightly_export,
+                self.daily(SCHEDULER_CONFIG['export_hour'], SCHEDULER_CONFIG['export_minute'])
+            )
+
+        # 매일 원장 대사 (불일치가 있으면 실패로 보고 잠시 후 다시 대사)
+        if SCHEDULER_CONFIG['nightly_reconcile']:
+            self.add_job(
+                'nightly_reconcile', "원장-잔액 대사",
+                lambda scheduled: self.admin_manager.reconcile_ledger(),
+                self.daily(SCHEDULER_CONFIG['reconcile_hour'], SCHEDULER_CONFIG['reconcile_minute'])
+            )
+
+    @staticmethod
+    def monthly_last_day(hour: int, minute: int = 0) -> Schedule:
+        """
+        매월 마지막 날 지정 시각 일정
+
+        Args:
+            hour: 시
+            minute: 분
+
+        Returns:
+            Schedule: 다음 실행 시각 계산 함수
+        """
+        def next_time(after: datetime) -> datetime:
+            year, month = after.year, after.month
+            while True:
+                last_day = calendar.monthrange(year, month)[1]
+                candidate = datetime(year, month, last_day, hour, minute)
+                if candidate > after:
+                    return candidate
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return next_time
+
+    @staticmethod
+    def daily(hour: int, minute: int = 0) -> Schedule:
+        """
+        매일 지정 시각 일정
+
+        Args:
+            hour: 시
+            minute: 분
+
+        Returns:
+            Schedule: 다음 실행 시각 계산 함수
+        """
+        def next_time(after: datetime) -> datetime:
+            candidate = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            return candidate if candidate > after else candidate + timedelta(days=1)
+        return next_time
+
+    def add_job(self, name: str, description: str, func: Callable[[datetime], Any],
+                schedule: Schedule, catch_up: bool = True) -> ScheduledJob:
+        """
+        예약 작업 등록
+
+        저장된 마지막 실행 시각 이후의 첫 실행 시각을 다음 실행 시각으로 잡으므로,
+        이미 지난 시각이면 시작하자마자 한 번 실행된다. (catch_up=False면 다음 일정부터)
+
+        Args:
+            name: 작업 이름
+            description: 작업 설명
+            func: 실행할 함수 (이번 실행의 예정 시각을 인자로 받음)
+            schedule: 다음 실행 시각 계산 함수
+            catch_up: 놓친 실행을 한 번 실행할지 여부
+
+        Returns:
+            ScheduledJob: 등록한 작업
+        """
+        now = datetime.now()
+        last_run = self._load_last_run(name, now)
+
+        job = ScheduledJob(name=name, description=description, func=func,
+                           schedule=schedule, catch_up=catch_up, last_run=last_run)
+        job.next_run = schedule(last_run if catch_up else max(last_run, now))
+
+        with self._lock:
+            self._jobs[name] = job
+        self._wakeup.set()
+        return job
+
+    def get_jobs(self) -> List[ScheduledJob]:
+        """등록된 작업 목록 (다음 실행 시각 순)"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.due_time)
+
     def start(self):
         """스케줄러 시작"""
         if self.running:
             return
-        
+
         self.running = True
         self.stop_event.clear()
-        
+
         # 스케줄러 스레드 시작
         self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.scheduler_thread.start()
-        
+
         print("✅ 이자 지급 스케줄러가 시작되었습니다.")
-    
+
     def stop(self):
-        """스케줄러 중지"""
+        """스케줄러 중지 (대기 중이면 바로 종료, 작업 실행 중이면 작업이 끝날 때까지 대기)"""
         if not self.running:
             return
-        
+
         self.running = False
         self.stop_event.set()
-        
+        self._wakeup.set()
+
         if self.scheduler_thread and self.scheduler_thread.is_alive():
-            self.scheduler_thread.join(timeout=5)
-        
+            self.scheduler_thread.join()
+
         print("✅ 이자 지급 스케줄러가 중지되었습니다.")
-    
+
     def is_running(self) -> bool:
         """스케줄러 실행 상태 확인"""
         return self.running and not self.stop_event.is_set()
-    
+
     def get_next_execution_info(self) -> str:
         """다음 실행 정보 반환"""
         if not self.is_running():
             return "스케줄러가 중지됨"
-        
-        # 다음 실행 시간 계산 (매월 마지막 날 오후 2시)
-        now = datetime.now()
-        next_month = now.replace(day=1) + timedelta(days=32)
-        next_month = next_month.replace(day=1) - timedelta(days=1)  # 마지막 날
-        next_execution = next_month.replace(hour=14, minute=0, second=0, microsecond=0)
-        
-        if next_execution <= now:
-            next_execution = next_execution + timedelta(days=1)
-        
-        return f"다음 실행: {next_execution.strftime('%Y-%m-%d %H:%M:%S')}"
-    
+
+        job = self._jobs.get('interest_payment')
+        if job is None or job.next_run is None:
+            return "예약된 이자 지급 없음"
+
+        return f"다음 실행: {job.due_time.strftime('%Y-%m-%d %H:%M:%S')}"
+
     def _scheduler_loop(self):
-        """스케줄러 메인 루프"""
+        """스케줄러 메인 루프 (다음 실행 시각까지 대기)"""
         while self.running and not self.stop_event.is_set():
             try:
-                # 현재 시간 확인
+                self._wakeup.clear()
+
                 now = datetime.now()
-                
-                # 매월 마지막 날 오후 2시에 실행
-                if self._should_execute_interest_payment(now):
-                    self._execute_scheduled_interest_payment()
-                
-                # 1시간마다 체크
-                time.sleep(3600)
-                
+                for job in self.get_jobs():
+                    if job.due_time <= now and not self.stop_event.is_set():
+                        self._run_job(job, now)
+
+                # 가장 가까운 다음 실행 시각까지 대기 (시스템 시각 변경에 대비해 최대 max_wait)
+                jobs = self.get_jobs()
+                if not jobs:
+                    timeout = SCHEDULER_CONFIG['max_wait']
+                else:
+                    timeout = (jobs[0].due_time - datetime.now()).total_seconds()
+                    timeout = min(max(timeout, 0), SCHEDULER_CONFIG['max_wait'])
+
+                if timeout > 0:
+                    self._wakeup.wait(timeout)
+
             except Exception as e:
                 print(f"스케줄러 오류: {e}")
-                time.sleep(60)  # 오류 시 1분 후 재시도
-    
-    def _should_execute_interest_payment(self, now: datetime) -> bool:
-        """이자 지급 실행 조건 확인"""
-        # 매월 마지막 날 오후 2시
-        if now.hour != 14 or now.minute != 0:
-            return False
-        
-        # 마지막 날인지 확인
-        next_day = now + timedelta(days=1)
-        return next_day.month != now.month
-    
-    def _execute_scheduled_interest_payment(self):
-        """스케줄된 이자 지급 실행"""
+                self.stop_event.wait(60)  # 오류 시 1분 후 재시도
+
+    def _run_job(self, job: ScheduledJob, now: datetime):
+        """
+        예정 시각이 지난 작업 실행
+
+        놓친 실행이 여러 번이면 가장 최근 예정 시각 한 번으로 합치고,
+        DB의 마지막 실행 시각을 먼저 갱신(선점)한 프로세스만 실행한다.
+        작업이 예외를 내거나 False를 반환하면 선점을 되돌리고 retry_delay 후 다시 시도한다.
+        """
+        # now 이전의 가장 최근 예정 시각
+        scheduled = job.next_run
+        following = job.schedule(scheduled)
+        while following <= now:
+            scheduled, following = following, job.schedule(following)
+
+        previous = job.last_run
+        if not self._claim_run(job.name, previous, scheduled):
+            # 다른 프로세스가 이미 실행함
+            job.last_run = self._load_last_run(job.name, now)
+            job.next_run = job.schedule(max(job.last_run, scheduled))
+            job.last_result = "다른 프로세스에서 실행됨"
+            return
+
+        job.last_run = scheduled
+        job.next_run = following
+        job.retry_at = None
+
         try:
-            print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 이자 지급 실행")
-            
-            # 관리자 ID로 이자 지급 실행
-            admin_id = "AUTO_SCHEDULER"
-            success = self.admin_manager.execute_interest_payment(admin_id)
-            
-            if success:
-                print("✅ 자동 이자 지급이 완료되었습니다.")
-            else:
-                print("❌ 자동 이자 지급에 실패했습니다.")
-                
+            if job.func(scheduled) is not False:
+                job.last_result = "성공"
+                return
+            failure = "실패"
+
+        except Exception as e:
+            print(f"예약 작업 실행 오류 ({job.name}): {e}")
+            failure = f"오류: {e}"
+
+        # 선점을 되돌리고 잠시 후 다시 시도
+        self._release_run(job.name, previous, scheduled)
+        job.last_run = previous
+        job.next_run = scheduled
+        job.retry_at = datetime.now() + timedelta(seconds=SCHEDULER_CONFIG['retry_delay'])
+        job.last_result = failure
+
+    def _load_last_run(self, name: str, now: datetime) -> datetime:
+        """
+        작업의 마지막 실행 시각 조회 (처음 등록하는 작업이면 현재 시각으로 기록)
+
+        Returns:
+            datetime: 마지막 실행 시각
+        """
+        results = self.db.execute_query(SQLQueries.SELECT_SCHEDULER_RUN, {'job_name': name})
+        if results:
+            return results[0]['last_run']
+
+        now = now.replace(microsecond=0)
+        try:
+            self.db.execute_update(SQLQueries.INSERT_SCHEDULER_RUN, {'job_name': name, 'last_run': now})
+            return now
+        except Exception:
+            # 다른 프로세스가 먼저 등록함
+            return self.db.execute_query(SQLQueries.SELECT_SCHEDULER_RUN, {'job_name': name})[0]['last_run']
+
+    def _claim_run(self, name: str, previous: datetime, scheduled: datetime) -> bool:
+        """마지막 실행 시각을 previous에서 scheduled로 갱신 (성공한 프로세스만 실행)"""
+        return self.db.execute_update(
+            SQLQueries.CLAIM_SCHEDULER_RUN,
+            {'job_name': name, 'previous_run': previous, 'last_run': scheduled}
+        ) == 1
+
+    def _release_run(self, name: str, previous: datetime, scheduled: datetime):
+        """실패한 실행의 선점 취소 (마지막 실행 시각을 되돌림)"""
+        try:
+            self.db.execute_update(
+                SQLQueries.CLAIM_SCHEDULER_RUN,
+                {'job_name': name, 'previous_run': scheduled, 'last_run': previous}
+            )
         except Exception as e:
-            print(f"자동 이자 지급 실행 오류: {e}")
-    
+            print(f"예약 작업 선점 취소 오류 ({name}): {e}")
+
+    def _execute_scheduled_interest_payment(self, scheduled: datetime) -> bool:
+        """스케줄된 이자 지급 실행 (기준 시각은 실행 시점의 현재 시각)"""
+        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 이자 지급 실행")
+
+        # 관리자 ID로 이자 지급 실행
+        admin_id = "AUTO_SCHEDULER"
+        success = self.admin_manager.execute_interest_payment(admin_id, confirm=False)
+
+        if success:
+            print("✅ 자동 이자 지급이 완료되었습니다.")
+        else:
+            print("❌ 자동 이자 지급에 실패했습니다.")
+        return success
+
+    def _execute_nightly_export(self, scheduled: datetime) -> bool:
+        """예정 시각 기준 전날 거래내역 내보내기 (늦게 따라잡아 실행해도 예정된 날짜를 내보냄)"""
+        end_date = scheduled.replace(hour=0, minute=0, second=0, microsecond=0)
+        start_date = end_date - timedelta(days=1)
+
+        result = ReportExporter().export(
+            'transactions', file_format=SCHEDULER_CONFIG['export_format'],
+            start_date=start_date, end_date=end_date
+        )
+        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 거래내역 내보내기: "
+              f"{result['path']} ({result['rows']:,}행)")
+        return True
+
     def get_status_info(self) -> dict:
         """스케줄러 상태 정보 반환"""
         return {
             'running': self.is_running(),
             'next_execution': self.get_next_execution_info(),
-            'thread_alive': self.scheduler_thread.is_alive() if self.scheduler_thread else False
+            'thread_alive': self.scheduler_thread.is_alive() if self.scheduler_thread else False,
+            'jobs': [
+                {
+                    'name': job.name,
+                    'description': job.description,
+                    'next_run': job.due_time,
+                    'last_run': job.last_run,
+                    'last_result': job.last_result
+                }
+                for job in self.get_jobs()
+            ]
         }
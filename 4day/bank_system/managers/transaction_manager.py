@@ -4,21 +4,35 @@ Java의 TransactionManager 클래스를 Python으로 변환
 """
 
 from datetime import datetime
-from typing import Optional, List
-from ..database import get_database_connection, SQLQueries
+from typing import Optional, List, Tuple, Iterator, Dict, Any
+from ..database import get_database_connection, SQLQueries, PAGE_CONFIG, LEDGER_CONFIG
 from ..entities.transaction import Transaction
 from ..helpers.input_helper import InputHelper
 from ..utils.bank_utils import BankUtils
+from ..utils.ledger_writer import LedgerUnit, get_ledger_writer
+from ..utils.summary_cache import get_summary_cache
 
 
 class TransactionManager:
     """거래 관련 기능을 관리하는 클래스"""
     
-    def __init__(self, account_manager=None):
-        """TransactionManager 초기화"""
+    # 잔액이 늘어나는 거래 유형
+    CREDIT_TYPES = ("입금", "이체입금")
+    
+    def __init__(self, account_manager=None, use_ledger: Optional[bool] = None):
+        """
+        TransactionManager 초기화
+        
+        Args:
+            account_manager: 계좌 매니저
+            use_ledger: 입금/출금/이체를 원장 기록기로 그룹 커밋할지 여부
+                        (기본값: LEDGER_CONFIG['enabled'])
+        """
         self.db = get_database_connection()
         self.input_helper = InputHelper()
         self.account_manager = account_manager
+        self.use_ledger = LEDGER_CONFIG['enabled'] if use_ledger is None else use_ledger
+        self.summary_cache = get_summary_cache()
     
     def set_account_manager(self, account_manager):
         """AccountManager 설정"""
@@ -79,55 +93,42 @@ class TransactionManager:
             bool: 입금 성공 여부
         """
         try:
-            # 현재 잔액 조회
-            account = self.account_manager.get_account_by_id(account_id)
-            if not account:
-                return False
-            
-            # 새 잔액 계산
-            new_balance = account.balance + amount
-            
-            # 거래번호 생성
+            # 거래번호 생성 (시퀀스 예약은 트랜잭션 밖에서)
             transaction_id = BankUtils.generate_transaction_id()
             if not transaction_id:
                 return False
             
-            # 거래 기록 생성
-            transaction = Transaction.create_deposit_withdrawal(
-                transaction_id=transaction_id,
-                account_id=account_id,
-                transaction_type="입금",
-                amount=amount,
-                balance_after=new_balance
-            )
-            
-            # 거래 메모 설정
-            transaction.depositor_name = depositor_name
-            transaction.transaction_memo = f"입금 - {depositor_name}"
-            
-            # DB 트랜잭션 시작
-            self.db.connection.autocommit = False
-            
-            try:
-                # 거래 기록 저장
-                if not self.save_transaction(transaction):
-                    raise Exception("거래 기록 저장 실패")
+            def unit() -> List[Transaction]:
+                # 계좌를 잠근 뒤의 잔액으로 새 잔액 계산 (동시 입출금 시 잔액 유실 방지)
+                balance = self._lock_account_balance(account_id)
+                if balance is None:
+                    raise Exception("계좌 정보를 찾을 수 없습니다.")
+                new_balance = balance + amount
                 
                 # 계좌 잔액 업데이트
                 if not self.account_manager.update_account_balance(account_id, new_balance):
                     raise Exception("계좌 잔액 업데이트 실패")
                 
-                # 트랜잭션 커밋
-                self.db.commit()
-                return True
+                # 거래 기록 생성
+                transaction = Transaction.create_deposit_withdrawal(
+                    transaction_id=transaction_id,
+                    account_id=account_id,
+                    transaction_type="입금",
+                    amount=amount,
+                    balance_after=new_balance
+                )
                 
-            except Exception as e:
-                # 트랜잭션 롤백
-                self.db.rollback()
-                raise e
-            finally:
-                # 자동 커밋 복원
-                self.db.connection.autocommit = True
+                # 거래 메모 설정
+                transaction.depositor_name = depositor_name
+                transaction.transaction_memo = f"입금 - {depositor_name}"
+                return [transaction]
+            
+            # 잔액 갱신과 거래 기록 저장을 한 트랜잭션으로 커밋
+            self._commit_unit(unit, [account_id])
+            
+            # 커밋 전에 다른 스레드가 이전 잔액을 캐시했을 수 있으므로 커밋 후 다시 무효화
+            self.account_manager.invalidate_account(account_id)
+            return True
                 
         except Exception as e:
             print(f"입금 처리 오류: {e}")
@@ -189,59 +190,95 @@ class TransactionManager:
             bool: 출금 성공 여부
         """
         try:
-            # 현재 잔액 조회
-            account = self.account_manager.get_account_by_id(account_id)
-            if not account:
-                return False
-            
-            # 새 잔액 계산
-            new_balance = account.balance - amount
-            
-            # 거래번호 생성
+            # 거래번호 생성 (시퀀스 예약은 트랜잭션 밖에서)
             transaction_id = BankUtils.generate_transaction_id()
             if not transaction_id:
                 return False
             
-            # 거래 기록 생성
-            transaction = Transaction.create_deposit_withdrawal(
-                transaction_id=transaction_id,
-                account_id=account_id,
-                transaction_type="출금",
-                amount=amount,
-                balance_after=new_balance
-            )
-            
-            # 거래 메모 설정
-            transaction.transaction_memo = "출금"
-            
-            # DB 트랜잭션 시작
-            self.db.connection.autocommit = False
-            
-            try:
-                # 거래 기록 저장
-                if not self.save_transaction(transaction):
-                    raise Exception("거래 기록 저장 실패")
+            def unit() -> List[Transaction]:
+                # 계좌를 잠근 뒤의 잔액으로 확인 및 새 잔액 계산
+                balance = self._lock_account_balance(account_id)
+                if balance is None:
+                    raise Exception("계좌 정보를 찾을 수 없습니다.")
+                if balance < amount:
+                    raise Exception("잔액이 부족합니다.")
+                new_balance = balance - amount
                 
                 # 계좌 잔액 업데이트
                 if not self.account_manager.update_account_balance(account_id, new_balance):
                     raise Exception("계좌 잔액 업데이트 실패")
                 
-                # 트랜잭션 커밋
-                self.db.commit()
-                return True
+                # 거래 기록 생성
+                transaction = Transaction.create_deposit_withdrawal(
+                    transaction_id=transaction_id,
+                    account_id=account_id,
+                    transaction_type="출금",
+                    amount=amount,
+                    balance_after=new_balance
+                )
                 
-            except Exception as e:
-                # 트랜잭션 롤백
-                self.db.rollback()
-                raise e
-            finally:
-                # 자동 커밋 복원
-                self.db.connection.autocommit = True
+                # 거래 메모 설정
+                transaction.transaction_memo = "출금"
+                return [transaction]
+            
+            # 잔액 갱신과 거래 기록 저장을 한 트랜잭션으로 커밋
+            self._commit_unit(unit, [account_id])
+            
+            # 커밋 전에 다른 스레드가 이전 잔액을 캐시했을 수 있으므로 커밋 후 다시 무효화
+            self.account_manager.invalidate_account(account_id)
+            return True
                 
         except Exception as e:
             print(f"출금 처리 오류: {e}")
             return False
     
+    def _commit_unit(self, unit: LedgerUnit, account_ids: List[str]) -> List[Transaction]:
+        """
+        거래 작업을 실행하고 반환된 거래 기록과 함께 커밋
+        
+        원장 기록기를 사용하면 다른 스레드의 작업과 한 그룹으로 묶어
+        거래 기록은 executemany 한 번, 커밋은 그룹당 한 번으로 처리하고,
+        그룹이 커밋된 뒤에 반환한다.
+        커밋 후 거래 기록의 금액을 사용자 계좌 요약 캐시에 변동분으로 반영한다.
+        
+        Args:
+            unit: 잔액을 갱신하고 저장할 거래 기록을 반환하는 작업
+            account_ids: 작업이 잔액을 변경하는 계좌번호
+            
+        Returns:
+            List[Transaction]: 저장된 거래 기록 (작업 실패 시 예외)
+        """
+        with self.summary_cache.tracking(account_ids):
+            if self.use_ledger:
+                records = get_ledger_writer().execute(unit)
+            else:
+                # DB 트랜잭션 (블록 종료 시 커밋, 예외 시 롤백)
+                with self.db.transaction():
+                    records = unit()
+                    self.db.execute_many(SQLQueries.INSERT_TRANSACTION, [record.to_dict() for record in records])
+            
+            for record in records:
+                delta = record.amount if record.transaction_type in self.CREDIT_TYPES else -record.amount
+                self.summary_cache.apply_delta(record.account_id, delta, record.transaction_date)
+        
+        return records
+    
+    def _lock_account_balance(self, account_id: str) -> Optional[float]:
+        """
+        트랜잭션 안에서 계좌를 잠그고 현재 잔액 조회
+        
+        Args:
+            account_id: 계좌번호
+            
+        Returns:
+            Optional[float]: 잔액 (계좌가 없으면 None)
+        """
+        results = self.db.execute_query(
+            SQLQueries.SELECT_ACCOUNT_BALANCE_FOR_UPDATE,
+            {'account_id': account_id}
+        )
+        return results[0]['balance'] if results else None
+    
     def transfer(self, user_id: str):
         """
         이체 처리
@@ -316,6 +353,10 @@ class TransactionManager:
         """
         이체 처리 (내부 메서드)
         
+        두 계좌를 계좌번호 순서로 잠근 뒤(SELECT ... FOR UPDATE) DB에서 잔액을 증감하므로
+        동시 이체 시에도 잔액 유실이 없고, 교착 상태가 발생하지 않는다.
+        (계좌 잠금, 잔액 갱신, 거래 기록 일괄 저장, 커밋 순으로 처리, 원장 기록기 사용 시 그룹 커밋)
+        
         Args:
             from_account_id: 보내는 계좌번호
             to_account_id: 받는 계좌번호
@@ -325,79 +366,83 @@ class TransactionManager:
             bool: 이체 성공 여부
         """
         try:
-            # 계좌 정보 조회
-            from_account = self.account_manager.get_account_by_id(from_account_id)
-            to_account = self.account_manager.get_account_by_id(to_account_id)
-            
-            if not from_account or not to_account:
+            if from_account_id == to_account_id:
                 return False
             
-            # 새 잔액 계산
-            from_new_balance = from_account.balance - amount
-            to_new_balance = to_account.balance + amount
-            
-            # 거래번호 생성
-            from_transaction_id = BankUtils.generate_transaction_id()
-            to_transaction_id = BankUtils.generate_transaction_id()
-            
-            if not from_transaction_id or not to_transaction_id:
+            # 거래번호 생성 (두 건을 한 번에)
+            transaction_ids = BankUtils.generate_transaction_ids(2)
+            if len(transaction_ids) != 2:
                 return False
-            
-            # 거래 기록 생성
-            from_transaction = Transaction.create_transfer(
-                transaction_id=from_transaction_id,
-                account_id=from_account_id,
-                transaction_type="이체출금",
-                amount=amount,
-                balance_after=from_new_balance,
-                counterpart_account=to_account_id
-            )
-            
-            to_transaction = Transaction.create_transfer(
-                transaction_id=to_transaction_id,
-                account_id=to_account_id,
-                transaction_type="이체입금",
-                amount=amount,
-                balance_after=to_new_balance,
-                counterpart_account=from_account_id
-            )
-            
-            # 거래 메모 설정
-            from_transaction.counterpart_name = to_account.account_name
-            from_transaction.transaction_memo = f"이체출금 - {to_account.account_name}"
-            
-            to_transaction.counterpart_name = from_account.account_name
-            to_transaction.transaction_memo = f"이체입금 - {from_account.account_name}"
-            
-            # DB 트랜잭션 시작
-            self.db.connection.autocommit = False
-            
-            try:
-                # 거래 기록 저장
-                if not self.save_transaction(from_transaction):
-                    raise Exception("보내는 계좌 거래 기록 저장 실패")
+            from_transaction_id, to_transaction_id = transaction_ids
+            
+            account_params = {
+                'from_account_id': from_account_id,
+                'to_account_id': to_account_id
+            }
+            
+            def unit() -> List[Transaction]:
+                with self.db.get_cursor() as cursor:
+                    # 두 계좌 잠금 및 계좌명/잔액 조회
+                    cursor.execute(SQLQueries.SELECT_ACCOUNTS_FOR_TRANSFER, account_params)
+                    locked = {row[0]: row for row in cursor.fetchall()}
                 
-                if not self.save_transaction(to_transaction):
-                    raise Exception("받는 계좌 거래 기록 저장 실패")
+                    if from_account_id not in locked or to_account_id not in locked:
+                        raise Exception("계좌 정보를 찾을 수 없습니다.")
                 
-                # 계좌 잔액 업데이트
-                if not self.account_manager.update_account_balance(from_account_id, from_new_balance):
-                    raise Exception("보내는 계좌 잔액 업데이트 실패")
+                    from_account_name = locked[from_account_id][1]
+                    to_account_name = locked[to_account_id][1]
                 
-                if not self.account_manager.update_account_balance(to_account_id, to_new_balance):
-                    raise Exception("받는 계좌 잔액 업데이트 실패")
+                    # 잠금 이후의 잔액으로 확인
+                    if locked[from_account_id][2] < amount:
+                        raise Exception("잔액이 부족합니다.")
                 
-                # 트랜잭션 커밋
-                self.db.commit()
-                return True
+                    # 두 계좌 잔액 갱신 (갱신된 잔액을 RETURNING으로 받음)
+                    updated = self.db.execute_returning(
+                        cursor,
+                        SQLQueries.UPDATE_TRANSFER_BALANCES,
+                        {**account_params, 'amount': amount, 'last_interest_date': datetime.now()},
+                        {'out_account_id': str, 'out_balance': float}
+                    )
                 
-            except Exception as e:
-                # 트랜잭션 롤백
-                self.db.rollback()
-                raise e
-            finally:
-                # 자동 커밋 복원
-                self.db.connection.autocommit = True
+                    if len(updated) != 2:
+                        raise Exception("계좌 잔액 업데이트 실패")
+                
+                    balances = dict(updated)
+                
+                # 거래 기록 생성
+                from_transaction = Transaction.create_full_transaction(
+                    transaction_id=from_transaction_id,
+                    account_id=from_account_id,
+                    transaction_type="이체출금",
+                    amount=amount,
+                    balance_after=balances[from_account_id],
+                    counterpart_account=to_account_id,
+                    counterpart_name=to_account_name,
+                    depositor_name=None,
+                    transaction_memo=f"이체출금 - {to_account_name}"
+                )
+                
+                to_transaction = Transaction.create_full_transaction(
+                    transaction_id=to_transaction_id,
+                    account_id=to_account_id,
+                    transaction_type="이체입금",
+                    amount=amount,
+                    balance_after=balances[to_account_id],
+                    counterpart_account=from_account_id,
+                    counterpart_name=from_account_name,
+                    depositor_name=None,
+                    transaction_memo=f"이체입금 - {from_account_name}"
+                )
+                
+                return [from_transaction, to_transaction]
+            
+            # 잔액 갱신과 거래 기록 일괄 저장을 한 트랜잭션으로 커밋
+            self._commit_unit(unit, [from_account_id, to_account_id])
+            
+            # 잔액이 바뀐 계좌 캐시 무효화
+            self.account_manager.invalidate_account(from_account_id)
+            self.account_manager.invalidate_account(to_account_id)
+            return True
                 
         except Exception as e:
             print(f"이체 처리 오류: {e}")
@@ -429,18 +474,123 @@ class TransactionManager:
         except Exception as e:
             print(f"거래내역 조회 오류: {e}")
     
-    def show_account_transactions(self, account_id: str):
+    def get_account_transactions_page(self, account_id: str, page_size: Optional[int] = None,
+                                      after: Optional[Tuple[datetime, str]] = None
+                                      ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[datetime, str]]]:
         """
-        특정 계좌의 거래내역 조회
+        특정 계좌의 거래내역 한 페이지 조회 (키셋 페이지네이션, 최신순)
         
         Args:
             account_id: 계좌번호
+            page_size: 페이지당 행 수 (기본값: PAGE_CONFIG)
+            after: 이전 페이지가 반환한 다음 페이지 키 (None이면 첫 페이지)
+            
+        Returns:
+            Tuple: (거래내역 행 리스트, 다음 페이지 키 또는 None (마지막 페이지))
         """
-        try:
+        page_size = page_size or PAGE_CONFIG['history_page_size']
+        
+        if after is None:
             results = self.db.execute_query(
-                SQLQueries.SELECT_TRANSACTIONS_BY_ACCOUNT,
-                {'account_id': account_id}
+                SQLQueries.SELECT_TRANSACTIONS_FIRST_PAGE_BY_ACCOUNT,
+                {'account_id': account_id, 'page_size': page_size}
             )
+        else:
+            results = self.db.execute_query(
+                SQLQueries.SELECT_TRANSACTIONS_NEXT_PAGE_BY_ACCOUNT,
+                {'account_id': account_id, 'page_size': page_size,
+                 'after_date': after[0], 'after_id': after[1]}
+            )
+        
+        return results, self._next_page_key(results, page_size)
+    
+    def get_user_transactions_page(self, user_id: str, page_size: Optional[int] = None,
+                                   after: Optional[Tuple[datetime, str]] = None
+                                   ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[datetime, str]]]:
+        """
+        사용자 전체 계좌의 거래내역 한 페이지 조회 (키셋 페이지네이션, 최신순)
+        
+        Args:
+            user_id: 사용자 ID
+            page_size: 페이지당 행 수 (기본값: PAGE_CONFIG)
+            after: 이전 페이지가 반환한 다음 페이지 키 (None이면 첫 페이지)
+            
+        Returns:
+            Tuple: (거래내역 행 리스트, 다음 페이지 키 또는 None (마지막 페이지))
+        """
+        page_size = page_size or PAGE_CONFIG['history_page_size']
+        
+        if after is None:
+            results = self.db.execute_query(
+                SQLQueries.SELECT_TRANSACTIONS_FIRST_PAGE_BY_USER,
+                {'user_id': user_id, 'page_size': page_size}
+            )
+        else:
+            results = self.db.execute_query(
+                SQLQueries.SELECT_TRANSACTIONS_NEXT_PAGE_BY_USER,
+                {'user_id': user_id, 'page_size': page_size,
+                 'after_date': after[0], 'after_id': after[1]}
+            )
+        
+        return results, self._next_page_key(results, page_size)
+    
+    @staticmethod
+    def _next_page_key(results: List[Dict[str, Any]], page_size: int) -> Optional[Tuple[datetime, str]]:
+        """페이지의 마지막 행으로 다음 페이지 키 생성 (행 수가 page_size보다 적으면 None)"""
+        if len(results) < page_size:
+            return None
+        
+        last = Transaction.from_dict(results[-1])
+        return (last.transaction_date, last.transaction_id)
+    
+    def iter_account_transactions(self, account_id: str,
+                                  arraysize: Optional[int] = None) -> Iterator[Transaction]:
+        """
+        특정 계좌의 전체 거래내역을 스트리밍 조회 (내보내기용)
+        
+        결과 전체를 메모리에 올리지 않고 arraysize 단위로 가져오며 하나씩 반환한다.
+        
+        Args:
+            account_id: 계좌번호
+            arraysize: 한 번에 가져오는 행 수 (기본값: BATCH_CONFIG['fetch_arraysize'])
+            
+        Yields:
+            Transaction: 거래 객체 (최신순)
+        """
+        yield from self._iter_transactions(
+            SQLQueries.SELECT_TRANSACTIONS_BY_ACCOUNT, {'account_id': account_id}, arraysize
+        )
+    
+    def iter_user_transactions(self, user_id: str,
+                               arraysize: Optional[int] = None) -> Iterator[Transaction]:
+        """
+        사용자 전체 계좌의 거래내역을 스트리밍 조회 (내보내기용)
+        
+        Args:
+            user_id: 사용자 ID
+            arraysize: 한 번에 가져오는 행 수 (기본값: BATCH_CONFIG['fetch_arraysize'])
+            
+        Yields:
+            Transaction: 거래 객체 (최신순)
+        """
+        yield from self._iter_transactions(
+            SQLQueries.SELECT_TRANSACTIONS_BY_USER, {'user_id': user_id}, arraysize
+        )
+    
+    def _iter_transactions(self, query: str, params: Dict[str, Any],
+                           arraysize: Optional[int]) -> Iterator[Transaction]:
+        """거래내역 쿼리를 스트리밍하며 Transaction 객체 반환 (행에서 바로 생성)"""
+        yield from self.db.iter_query(query, params, arraysize, rowfactory=Transaction.from_row)
+    
+    def show_account_transactions(self, account_id: str):
+        """
+        특정 계좌의 거래내역 조회 (페이지 단위)
+        
+        Args:
+            account_id: 계좌번호
+        """
+        try:
+            results, next_key = self.get_account_transactions_page(account_id)
             
             if not results:
                 print("거래내역이 없습니다.")
@@ -451,21 +601,29 @@ class TransactionManager:
             print(f"{'거래일시':<20} {'거래유형':<10} {'거래금액':<15} {'거래후잔액':<15} {'상대방정보':<20} {'메모':<20}")
             print("-" * 100)
             
-            for data in results:
-                transaction = Transaction.from_dict(data)
-                counterpart_info = BankUtils.get_counterpart_display(
-                    transaction.transaction_type,
-                    transaction.counterpart_name,
-                    transaction.depositor_name,
-                    transaction.counterpart_account
-                )
+            while True:
+                for data in results:
+                    transaction = Transaction.from_dict(data)
+                    counterpart_info = BankUtils.get_counterpart_display(
+                        transaction.transaction_type,
+                        transaction.counterpart_name,
+                        transaction.depositor_name,
+                        transaction.counterpart_account
+                    )
+                    
+                    print(f"{transaction.transaction_date.strftime('%Y-%m-%d %H:%M:%S'):<20} "
+                          f"{transaction.transaction_type:<10} "
+                          f"{BankUtils.format_currency(transaction.amount):<15} "
+                          f"{BankUtils.format_currency(transaction.balance_after):<15} "
+                          f"{counterpart_info:<20} "
+                          f"{transaction.transaction_memo or '-':<20}")
+                
+                if next_key is None or not self.input_helper.input_next_page():
+                    break
                 
-                print(f"{transaction.transaction_date.strftime('%Y-%m-%d %H:%M:%S'):<20} "
-                      f"{transaction.transaction_type:<10} "
-                      f"{BankUtils.format_currency(transaction.amount):<15} "
-                      f"{BankUtils.format_currency(transaction.balance_after):<15} "
-                      f"{counterpart_info:<20} "
-                      f"{transaction.transaction_memo or '-':<20}")
+                results, next_key = self.get_account_transactions_page(account_id, after=next_key)
+                if not results:
+                    break
             
             print("=" * 100)
             
@@ -474,16 +632,13 @@ class TransactionManager:
     
     def show_user_transactions(self, user_id: str):
         """
-        사용자의 전체 거래내역 조회
+        사용자의 전체 거래내역 조회 (페이지 단위)
         
         Args:
             user_id: 사용자 ID
         """
         try:
-            results = self.db.execute_query(
-                SQLQueries.SELECT_TRANSACTIONS_BY_USER,
-                {'user_id': user_id}
-            )
+            results, next_key = self.get_user_transactions_page(user_id)
             
             if not results:
                 print("거래내역이 없습니다.")
@@ -494,23 +649,31 @@ class TransactionManager:
             print(f"{'거래일시':<20} {'계좌번호':<15} {'계좌명':<15} {'거래유형':<10} {'거래금액':<15} {'거래후잔액':<15} {'상대방정보':<20} {'메모':<20}")
             print("-" * 120)
             
-            for data in results:
-                transaction = Transaction.from_dict(data)
-                counterpart_info = BankUtils.get_counterpart_display(
-                    transaction.transaction_type,
-                    transaction.counterpart_name,
-                    transaction.depositor_name,
-                    transaction.counterpart_account
-                )
+            while True:
+                for data in results:
+                    transaction = Transaction.from_dict(data)
+                    counterpart_info = BankUtils.get_counterpart_display(
+                        transaction.transaction_type,
+                        transaction.counterpart_name,
+                        transaction.depositor_name,
+                        transaction.counterpart_account
+                    )
+                    
+                    print(f"{transaction.transaction_date.strftime('%Y-%m-%d %H:%M:%S'):<20} "
+                          f"{transaction.account_id:<15} "
+                          f"{data.get('account_name', '-'):<15} "
+                          f"{transaction.transaction_type:<10} "
+                          f"{BankUtils.format_currency(transaction.amount):<15} "
+                          f"{BankUtils.format_currency(transaction.balance_after):<15} "
+                          f"{counterpart_info:<20} "
+                          f"{transaction.transaction_memo or '-':<20}")
                 
-                print(f"{transaction.transaction_date.strftime('%Y-%m-%d %H:%M:%S'):<20} "
-                      f"{transaction.account_id:<15} "
-                      f"{data.get('account_name', '-'):<15} "
-                      f"{transaction.transaction_type:<10} "
-                      f"{BankUtils.format_currency(transaction.amount):<15} "
-                      f"{BankUtils.format_currency(transaction.balance_after):<15} "
-                      f"{counterpart_info:<20} "
-                      f"{transaction.transaction_memo or '-':<20}")
+                if next_key is None or not self.input_helper.input_next_page():
+                    break
+                
+                results, next_key = self.get_user_transactions_page(user_id, after=next_key)
+                if not results:
+                    break
             
             print("=" * 120)
             
@@ -538,7 +701,7 @@ class TransactionManager:
             print(f"거래 기록 저장 오류: {e}")
             return False
     
-    def record_deposit(self, account_id: str, amount: float, memo: str, user_id: str) -> bool:
+    def record_deposit(self, account_id: str, amount: float, memo: str, user_id: str) -> Optional[Transaction]:
         """
         입금 거래 기록 (내부용)
         
@@ -549,18 +712,18 @@ class TransactionManager:
             user_id: 사용자 ID
             
         Returns:
-            bool: 기록 성공 여부
+            Optional[Transaction]: 저장한 거래 기록 (실패 시 None)
         """
         try:
             # 현재 잔액 조회
             account = self.account_manager.get_account_by_id(account_id)
             if not account:
-                return False
+                return None
             
             # 거래번호 생성
             transaction_id = BankUtils.generate_transaction_id()
             if not transaction_id:
-                return False
+                return None
             
             # 거래 기록 생성
             transaction = Transaction.create_deposit_withdrawal(
@@ -573,8 +736,8 @@ class TransactionManager:
             
             transaction.transaction_memo = memo
             
-            return self.save_transaction(transaction)
+            return transaction if self.save_transaction(transaction) else None
             
         except Exception as e:
             print(f"입금 거래 기록 오류: {e}")
-            return False
+            return None
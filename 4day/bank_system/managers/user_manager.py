@@ -9,6 +9,7 @@ from ..database import get_database_connection, SQLQueries
 from ..entities.user import User
 from ..helpers.input_helper import InputHelper
 from ..helpers.validation_helper import ValidationHelper
+from ..utils.user_key_index import get_user_key_index
 
 
 class UserManager:
@@ -19,6 +20,7 @@ class UserManager:
         self.db = get_database_connection()
         self.validator = ValidationHelper()
         self.input_helper = InputHelper()
+        self.user_index = get_user_key_index()
     
     def get_user_name(self, user_id: str) -> str:
         """
@@ -37,7 +39,7 @@ class UserManager:
             )
             
             if results:
-                return results[0].get('USER_NAME', results[0].get('user_name', ''))
+                return results[0].get('user_name', '')
             
         except Exception as e:
             print(f"사용자 이름 조회 오류: {e}")
@@ -56,13 +58,12 @@ class UserManager:
         """
         try:
             results = self.db.execute_query(
-                "SELECT COUNT(*) as count FROM users WHERE user_id = :user_id",
+                SQLQueries.COUNT_USER_BY_ID,
                 {'user_id': user_id}
             )
             
             if results and len(results) > 0:
-                # Oracle에서는 COUNT(*)가 대문자로 반환됨
-                count = results[0].get('COUNT', results[0].get('count', 0))
+                count = results[0].get('count', 0)
                 return count > 0
             
             return False
@@ -89,6 +90,11 @@ class UserManager:
             user_email = self.input_helper.input_email()
             user_phone = self.input_helper.input_phone()
             
+            # 아이디/이메일/전화번호 중복을 한 번에 확인 (아이디 입력 이후 다른 사용자가 가입했을 수 있음)
+            if not self.validator.check_user_duplicates(user_id, user_email, user_phone):
+                print("❌ 회원가입에 실패했습니다.")
+                return False
+            
             # 사용자 객체 생성
             user = User(
                 user_id=user_id,
@@ -126,10 +132,20 @@ class UserManager:
                 SQLQueries.INSERT_USER,
                 user.to_dict()
             )
+            if result > 0 and self.user_index is not None:
+                self.user_index.add_user(user.user_id, user.user_email, user.user_phone)
             return result > 0
             
         except Exception as e:
-            print(f"사용자 저장 오류: {e}")
+            if not self.db.is_duplicate_error(e):
+                print(f"사용자 저장 오류: {e}")
+                return False
+            
+            # 중복 확인 이후 다른 프로세스가 같은 값으로 가입함 (users의 UNIQUE 제약이 막음)
+            # 색인에 넣어 두면 이후 중복 확인은 DB로 다시 확인함
+            print("이미 사용 중인 아이디, 이메일 또는 전화번호입니다.")
+            if self.user_index is not None:
+                self.user_index.add_user(user.user_id, user.user_email, user.user_phone)
             return False
     
     def login(self) -> Optional[str]:
@@ -178,21 +194,16 @@ class UserManager:
         """
         try:
             results = self.db.execute_query(
-                "SELECT user_password FROM users WHERE user_id = :user_id",
+                SQLQueries.SELECT_USER_PASSWORD,
                 {'user_id': user_id}
             )
             
             if results:
-                # Oracle에서는 컬럼명이 대문자로 반환될 수 있음
-                stored_password = results[0].get('USER_PASSWORD', results[0].get('user_password', ''))
-                print(f"DEBUG: 입력한 비밀번호: '{password}'")  # 디버깅용
-                print(f"DEBUG: 저장된 비밀번호: '{stored_password}'")  # 디버깅용
-                print(f"DEBUG: 비밀번호 길이 - 입력: {len(password)}, 저장: {len(stored_password)}")  # 디버깅용
+                stored_password = results[0].get('user_password', '')
                 
                 # 공백 제거 후 비교
                 password_trimmed = password.strip()
                 stored_trimmed = stored_password.strip()
-                print(f"DEBUG: 공백 제거 후 - 입력: '{password_trimmed}', 저장: '{stored_trimmed}'")  # 디버깅용
                 
                 return stored_trimmed == password_trimmed
             
@@ -236,6 +247,12 @@ class UserManager:
                 print("수정할 정보가 없습니다.")
                 return False
             
+            # 새 이메일/전화번호 중복을 한 번에 확인 (본인 제외)
+            if (new_email or new_phone) and not self.validator.check_user_duplicates(
+                    email=new_email, phone=new_phone, current_user_id=user_id):
+                print("❌ 회원 정보 수정에 실패했습니다.")
+                return False
+            
             # 수정된 정보로 업데이트
             update_data = {
                 'user_id': user_id,
@@ -296,10 +313,18 @@ class UserManager:
                 SQLQueries.UPDATE_USER,
                 user_data
             )
+            if result > 0 and self.user_index is not None:
+                self.user_index.add_user(user_email=user_data['user_email'], user_phone=user_data['user_phone'])
             return result > 0
             
         except Exception as e:
-            print(f"사용자 업데이트 오류: {e}")
+            if not self.db.is_duplicate_error(e):
+                print(f"사용자 업데이트 오류: {e}")
+                return False
+            
+            print("이미 사용 중인 이메일 또는 전화번호입니다.")
+            if self.user_index is not None:
+                self.user_index.add_user(user_email=user_data['user_email'], user_phone=user_data['user_phone'])
             return False
     
     def get_all_users(self) -> List[User]:
@@ -311,7 +336,7 @@ class UserManager:
         """
         try:
             results = self.db.execute_query(
-                "SELECT * FROM users ORDER BY join_date DESC"
+                SQLQueries.SELECT_ALL_USERS
             )
             
             return [User.from_dict(data) for data in results]
@@ -333,7 +358,7 @@ class UserManager:
         try:
             # 계좌가 있는지 확인
             account_count = self.db.execute_query(
-                "SELECT COUNT(*) as count FROM accounts WHERE user_id = :user_id",
+                SQLQueries.COUNT_ACCOUNTS_BY_USER,
                 {'user_id': user_id}
             )
             
@@ -343,7 +368,7 @@ class UserManager:
             
             # 사용자 삭제
             result = self.db.execute_update(
-                "DELETE FROM users WHERE user_id = :user_id",
+                SQLQueries.DELETE_USER,
                 {'user_id': user_id}
             )
             
@@ -0,0 +1,12 @@
+"""
+서비스 계층
+- BankService: 대화형 입력 없이 인자를 받아 처리하는 은행 업무 서비스
+- AsyncBankService: 계좌 조회/입출금/이체를 비동기 DB 연결로 처리하는 BankService
+- BankHTTPServer: BankService를 여러 클라이언트에 제공하는 asyncio HTTP/JSON 서버
+"""
+
+from .bank_service import BankService, ServiceError
+from .async_bank_service import AsyncBankService
+from .http_server import BankHTTPServer
+
+__all__ = ['BankService', 'ServiceError', 'AsyncBankService', 'BankHTTPServer']
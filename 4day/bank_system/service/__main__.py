@@ -0,0 +1,9 @@
+"""
+은행 서비스 서버 실행 진입점
+실행: python -m bank_system.service [--backend sqlite] [--port 8080]
+"""
+
+from .http_server import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+비동기 은행 서비스 클래스
+BankService의 계좌 조회/입금/출금/이체를 코루틴으로 제공 (AsyncTransactionManager 사용)
+HTTP 서버는 코루틴 메서드를 이벤트 루프에서 바로 실행하므로 요청이 많아도 작업 스레드를 차지하지 않음
+(회원가입, 계좌 개설, 거래내역, 요약, 이자 지급은 BankService의 동기 메서드를 그대로 사용)
+"""
+
+from typing import Dict, Any
+from ..database import get_async_database_connection, SQLQueries
+from ..entities.account import Account
+from ..managers.async_account_manager import AsyncAccountManager
+from ..managers.async_transaction_manager import AsyncTransactionManager
+from .bank_service import BankService, ServiceError
+
+
+class AsyncBankService(BankService):
+    """입출금/이체를 비동기로 처리하는 서비스 클래스 (open_async_database_connection 이후에 생성)"""
+
+    def __init__(self):
+        """AsyncBankService 초기화 (동기 매니저와 비동기 매니저를 함께 연결)"""
+        super().__init__()
+        self.async_db = get_async_database_connection()
+        self.async_account_manager = AsyncAccountManager()
+        self.async_transaction_manager = AsyncTransactionManager(self.async_account_manager)
+
+    async def get_account(self, user_id: str, user_password: str, account_id: str,
+                          account_password: str) -> Dict[str, Any]:
+        """
+        계좌 조회
+
+        Args:
+            user_id: 사용자 ID
+            user_password: 사용자 비밀번호
+            account_id: 계좌번호
+            account_password: 계좌 비밀번호
+
+        Returns:
+            Dict: 계좌 정보
+        """
+        await self._authenticate_async(user_id, user_password)
+        return self._account_result(await self._authorize_async(user_id, account_id, account_password))
+
+    async def deposit(self, user_id: str, user_password: str, account_id: str, account_password: str,
+                      amount: float, depositor_name: str) -> Dict[str, Any]:
+        """
+        입금
+
+        Args:
+            user_id: 사용자 ID
+            user_password: 사용자 비밀번호
+            account_id: 입금할 계좌번호
+            account_password: 계좌 비밀번호
+            amount: 입금액
+            depositor_name: 입금자명
+
+        Returns:
+            Dict: 계좌번호, 입금액, 입금 후 잔액
+        """
+        amount = self._to_amount(amount)
+        await self._authenticate_async(user_id, user_password)
+        await self._authorize_async(user_id, account_id, account_password)
+
+        if not await self.async_transaction_manager.process_deposit(account_id, amount, depositor_name):
+            raise ServiceError("입금 처리에 실패했습니다.", 500)
+
+        return await self._balance_result_async(account_id, amount)
+
+    async def withdraw(self, user_id: str, user_password: str, account_id: str, account_password: str,
+                       amount: float) -> Dict[str, Any]:
+        """
+        출금
+
+        Args:
+            user_id: 사용자 ID
+            user_password: 사용자 비밀번호
+            account_id: 출금할 계좌번호
+            account_password: 계좌 비밀번호
+            amount: 출금액
+
+        Returns:
+            Dict: 계좌번호, 출금액, 출금 후 잔액
+        """
+        amount = self._to_amount(amount)
+        await self._authenticate_async(user_id, user_password)
+        await self._authorize_async(user_id, account_id, account_password)
+
+        # 잔액은 process_withdraw가 계좌를 잠근 뒤 확인 (캐시된 잔액은 오래되었을 수 있음)
+        if not await self.async_transaction_manager.process_withdraw(account_id, amount):
+            raise ServiceError("출금 처리에 실패했습니다. (잔액 부족 등)", 409)
+
+        return await self._balance_result_async(account_id, amount)
+
+    async def transfer(self, user_id: str, user_password: str, from_account_id: str, account_password: str,
+                       to_account_id: str, amount: float) -> Dict[str, Any]:
+        """
+        이체
+
+        Args:
+            user_id: 사용자 ID
+            user_password: 사용자 비밀번호
+            from_account_id: 보내는 계좌번호
+            account_password: 보내는 계좌 비밀번호
+            to_account_id: 받는 계좌번호
+            amount: 이체액
+
+        Returns:
+            Dict: 보내는 계좌번호, 받는 계좌번호, 이체액, 이체 후 잔액
+        """
+        amount = self._to_amount(amount)
+        await self._authenticate_async(user_id, user_password)
+        await self._authorize_async(user_id, from_account_id, account_password)
+
+        if from_account_id == to_account_id:
+            raise ServiceError("같은 계좌로는 이체할 수 없습니다.")
+        if not await self.async_account_manager.account_exists(to_account_id):
+            raise ServiceError("받는 계좌를 찾을 수 없습니다.", 404)
+
+        # 잔액은 process_transfer가 두 계좌를 잠근 뒤 확인
+        if not await self.async_transaction_manager.process_transfer(from_account_id, to_account_id, amount):
+            raise ServiceError("이체 처리에 실패했습니다. (잔액 부족 등)", 409)
+
+        result = await self._balance_result_async(from_account_id, amount)
+        result['to_account_id'] = to_account_id
+        return result
+
+    def health(self) -> Dict[str, Any]:
+        """
+        서비스 상태 조회
+
+        Returns:
+            Dict: DB 연결 상태, 백엔드 이름, 동기/비동기 세션 풀 통계
+        """
+        result = super().health()
+        result['async_pool'] = self.async_db.get_pool_stats()
+        return result
+
+    async def _authenticate_async(self, user_id: str, user_password: str):
+        """사용자 ID와 비밀번호 확인 (UserManager.verify_login과 같은 비교를 비동기 연결로 수행)"""
+        results = await self.async_db.execute_query(SQLQueries.SELECT_USER_PASSWORD, {'user_id': str(user_id)})
+        if not results or results[0]['user_password'].strip() != str(user_password).strip():
+            raise ServiceError("아이디 또는 비밀번호가 일치하지 않습니다.", 401)
+
+    async def _authorize_async(self, user_id: str, account_id: str, account_password: str) -> Account:
+        """본인 계좌 여부와 계좌 비밀번호 확인 후 계좌 반환"""
+        account = await self.async_account_manager.get_account_by_id(account_id)
+        if account is None:
+            raise ServiceError("계좌를 찾을 수 없습니다.", 404)
+        if account.user_id != user_id:
+            raise ServiceError("본인 계좌만 이용할 수 있습니다.", 403)
+        if str(account_password) != account.account_password:
+            raise ServiceError("계좌 비밀번호가 일치하지 않습니다.", 403)
+        return account
+
+    async def _balance_result_async(self, account_id: str, amount: float) -> Dict[str, Any]:
+        """거래 후 잔액 응답 (거래 처리 시 캐시가 무효화되므로 DB의 최신 잔액)"""
+        account = await self.async_account_manager.get_account_by_id(account_id)
+        return {
+            'account_id': account_id,
+            'amount': amount,
+            'balance': account.balance if account else None
+        }
@@ -0,0 +1,398 @@
+"""
+은행 서비스 클래스
+대화형 메뉴(input) 없이 인자를 받아 처리하고 결과를 딕셔너리로 반환하는 서비스 계층
+(HTTP 서버 등 여러 클라이언트의 요청을 동시에 처리할 때 사용, 매니저의 process_* 메서드 재사용)
+"""
+
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
+from ..database import get_database_connection, PAGE_CONFIG
+from ..entities.account import Account
+from ..entities.user import User
+from ..helpers.validation_helper import ValidationHelper
+from ..managers.user_manager import UserManager
+from ..managers.account_manager import AccountManager
+from ..managers.transaction_manager import TransactionManager
+from ..managers.admin_manager import AdminManager
+
+
+class ServiceError(Exception):
+    """요청을 처리할 수 없을 때 발생하는 예외 (status는 HTTP 상태 코드)"""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+class BankService:
+    """대화형 입력 없이 은행 업무를 처리하는 서비스 클래스 (스레드 안전)"""
+
+    ACCOUNT_TYPES = ('보통예금', '정기예금', '적금')
+
+    def __init__(self):
+        """BankService 초기화 (BankSystem과 같은 방식으로 매니저 연결)"""
+        self.db = get_database_connection()
+        self.validator = ValidationHelper()
+        self.user_manager = UserManager()
+        self.transaction_manager = TransactionManager()
+        self.account_manager = AccountManager(
+            user_manager=self.user_manager,
+            transaction_manager=self.transaction_manager
+        )
+        self.transaction_manager.set_account_manager(self.account_manager)
+        self.admin_manager = AdminManager()
+
+        # 이자 지급은 동시에 하나만 실행
+        self._interest_lock = threading.Lock()
+
+    def register_user(self, user_id: str, user_name: str, user_password: str,
+                      user_email: str, user_phone: str) -> Dict[str, Any]:
+        """
+        회원가입
+
+        Args:
+            user_id: 사용자 ID
+            user_name: 이름
+            user_password: 비밀번호
+            user_email: 이메일
+            user_phone: 전화번호
+
+        Returns:
+            Dict: 가입한 사용자 정보
+        """
+        if not (self.validator.validate_user_id(user_id)
+                and self.validator.validate_user_name(user_name)
+                and self.validator.validate_user_password(user_password, user_id)
+                and self.validator.validate_email(user_email)
+                and self.validator.validate_phone(user_phone)):
+            raise ServiceError("회원 정보 형식이 올바르지 않습니다.")
+
+        # 아이디/이메일/전화번호 중복을 한 번에 확인 (사용 가능하면 True)
+        if not self.validator.check_user_duplicates(user_id, user_email, user_phone):
+            raise ServiceError("이미 사용 중인 아이디, 이메일 또는 전화번호입니다.", 409)
+
+        user = User(
+            user_id=user_id,
+            user_name=user_name,
+            user_password=user_password,
+            user_email=user_email,
+            user_phone=user_phone,
+            join_date=datetime.now()
+        )
+
+        if not self.user_manager.save_user(user):
+            # 확인 이후 다른 프로세스가 같은 값으로 가입했으면 UNIQUE 제약으로 실패함 (저장 실패 시 색인에 추가되어 DB로 다시 확인)
+            if not self.validator.check_user_duplicates(user_id, user_email, user_phone):
+                raise ServiceError("이미 사용 중인 아이디, 이메일 또는 전화번호입니다.", 409)
+            raise ServiceError("회원가입에 실패했습니다.", 500)
+
+        return {'user_id': user.user_id, 'user_name': user.user_name, 'join_date': user.join_date}
+
+    def open_account(self, user_id: str, user_password: str, account_name: str, account_type: str,
+                     account_password: str, initial_balance: float = 0) -> Dict[str, Any]:
+        """
+        계좌 개설
+
+        Args:
+            user_id: 계좌 소유자 ID
+            user_password: 사용자 비밀번호
+            account_name: 계좌명
+            account_type: 계좌 종류 (보통예금, 정기예금, 적금)
+            account_password: 계좌 비밀번호 (숫자 4자리)
+            initial_balance: 초기 입금액
+
+        Returns:
+            Dict: 개설한 계좌 정보
+        """
+        initial_balance = self._to_amount(initial_balance, allow_zero=True)
+        self._authenticate(user_id, user_password)
+
+        if account_type not in self.ACCOUNT_TYPES:
+            raise ServiceError(f"계좌 종류는 {', '.join(self.ACCOUNT_TYPES)} 중 하나여야 합니다.")
+        if not account_name:
+            raise ServiceError("계좌명을 입력해주세요.")
+        if not self.validator.validate_account_password(str(account_password)):
+            raise ServiceError("계좌 비밀번호는 숫자 4자리여야 합니다.")
+
+        account = self.account_manager.process_create_account(
+            user_id, account_name, account_type, str(account_password), initial_balance
+        )
+        if account is None:
+            raise ServiceError("계좌 생성에 실패했습니다.", 500)
+
+        return self._account_result(account)
+
+    def get_account(self, user_id: str, user_password: str, account_id: str,
+                    account_password: str) -> Dict[str, Any]:
+        """
+        계좌 조회
+
+        Args:
+            user_id: 사용자 ID
+            user_password: 사용자 비밀번호
+            account_id: 계좌번호
+            account_password: 계좌 비밀번호
+
+        Returns:
+            Dict: 계좌 정보
+        """
+        self._authenticate(user_id, user_password)
+        return self._account_result(self._authorize(user_id, account_id, account_password))
+
+    def deposit(self, user_id: str, user_password: str, account_id: str, account_password: str,
+                amount: float, depositor_name: str) -> Dict[str, Any]:
+        """
+        입금
+
+        Args:
+            user_id: 사용자 ID
+            user_password: 사용자 비밀번호
+            account_id: 입금할 계좌번호
+            account_password: 계좌 비밀번호
+            amount: 입금액
+            depositor_name: 입금자명
+
+        Returns:
+            Dict: 계좌번호, 입금액, 입금 후 잔액
+        """
+        amount = self._to_amount(amount)
+        self._authenticate(user_id, user_password)
+        self._authorize(user_id, account_id, account_password)
+
+        if not self.transaction_manager.process_deposit(account_id, amount, depositor_name):
+            raise ServiceError("입금 처리에 실패했습니다.", 500)
+
+        return self._balance_result(account_id, amount)
+
+    def withdraw(self, user_id: str, user_password: str, account_id: str, account_password: str,
+                 amount: float) -> Dict[str, Any]:
+        """
+        출금
+
+        Args:
+            user_id: 사용자 ID
+            user_password: 사용자 비밀번호
+            account_id: 출금할 계좌번호
+            account_password: 계좌 비밀번호
+            amount: 출금액
+
+        Returns:
+            Dict: 계좌번호, 출금액, 출금 후 잔액
+        """
+        amount = self._to_amount(amount)
+        self._authenticate(user_id, user_password)
+        self._authorize(user_id, account_id, account_password)
+
+        # 잔액은 process_withdraw가 계좌를 잠근 뒤 확인 (캐시된 잔액은 오래되었을 수 있음)
+        if not self.transaction_manager.process_withdraw(account_id, amount):
+            raise ServiceError("출금 처리에 실패했습니다. (잔액 부족 등)", 409)
+
+        return self._balance_result(account_id, amount)
+
+    def transfer(self, user_id: str, user_password: str, from_account_id: str, account_password: str,
+                 to_account_id: str, amount: float) -> Dict[str, Any]:
+        """
+        이체
+
+        Args:
+            user_id: 사용자 ID
+            user_password: 사용자 비밀번호
+            from_account_id: 보내는 계좌번호
+            account_password: 보내는 계좌 비밀번호
+            to_account_id: 받는 계좌번호
+            amount: 이체액
+
+        Returns:
+            Dict: 보내는 계좌번호, 받는 계좌번호, 이체액, 이체 후 잔액
+        """
+        amount = self._to_amount(amount)
+        self._authenticate(user_id, user_password)
+        self._authorize(user_id, from_account_id, account_password)
+
+        if from_account_id == to_account_id:
+            raise ServiceError("같은 계좌로는 이체할 수 없습니다.")
+        if not self.account_manager.account_exists(to_account_id):
+            raise ServiceError("받는 계좌를 찾을 수 없습니다.", 404)
+
+        # 잔액은 process_transfer가 두 계좌를 잠근 뒤 확인
+        if not self.transaction_manager.process_transfer(from_account_id, to_account_id, amount):
+            raise ServiceError("이체 처리에 실패했습니다. (잔액 부족 등)", 409)
+
+        result = self._balance_result(from_account_id, amount)
+        result['to_account_id'] = to_account_id
+        return result
+
+    def history(self, user_id: str, user_password: str, account_id: Optional[str] = None,
+                page_size: Optional[int] = None, after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        거래내역 한 페이지 조회 (최신순)
+
+        Args:
+            user_id: 사용자 ID
+            user_password: 사용자 비밀번호
+            account_id: 계좌번호 (없으면 사용자 전체 계좌)
+            page_size: 페이지당 행 수 (기본값: PAGE_CONFIG)
+            after: 이전 응답의 next 값 (없으면 첫 페이지)
+
+        Returns:
+            Dict: transactions (거래내역 리스트), next (다음 페이지 값, 마지막이면 None)
+        """
+        page_size = self._to_page_size(page_size) if page_size else None
+        after_key = self._decode_page_key(after) if after else None
+        self._authenticate(user_id, user_password)
+
+        if account_id:
+            if not self.account_manager.is_my_account(account_id, user_id):
+                raise ServiceError("본인 계좌만 조회할 수 있습니다.", 403)
+            rows, next_key = self.transaction_manager.get_account_transactions_page(
+                account_id, page_size, after_key
+            )
+        else:
+            rows, next_key = self.transaction_manager.get_user_transactions_page(
+                user_id, page_size, after_key
+            )
+
+        return {
+            'transactions': rows,
+            'next': self._encode_page_key(next_key) if next_key else None
+        }
+
+    def summary(self, user_id: str, user_password: str) -> Dict[str, Any]:
+        """
+        사용자 계좌 요약 조회 (미리 집계한 요약 캐시 사용)
+
+        Args:
+            user_id: 사용자 ID
+            user_password: 사용자 비밀번호
+
+        Returns:
+            Dict: 계좌 수, 총 잔액, 계좌 종류별 계좌 수/잔액, 마지막 거래일시, 계좌 목록
+        """
+        self._authenticate(user_id, user_password)
+        summary = self.account_manager.get_user_summary(user_id)
+        if summary is None:
+            raise ServiceError("계좌 요약을 조회할 수 없습니다.", 500)
+
+        return {
+            'user_id': summary.user_id,
+            'account_count': summary.account_count,
+            'total_balance': summary.total_balance,
+            'by_type': {
+                account_type: {'count': count, 'balance': summary.balance_by_type[account_type]}
+                for account_type, count in summary.count_by_type.items()
+            },
+            'last_activity': summary.last_activity,
+            'accounts': [self._account_result(account) for account in summary.get_accounts()]
+        }
+
+    def pay_interest(self, admin_id: str, admin_password: str) -> Dict[str, Any]:
+        """
+        이자 지급 실행 (확인 입력 없이 실행)
+
+        Args:
+            admin_id: 관리자 ID
+            admin_password: 관리자 비밀번호
+
+        Returns:
+            Dict: 지급 성공 여부
+        """
+        if not self.admin_manager.verify_admin(str(admin_id), str(admin_password)):
+            raise ServiceError("관리자 인증에 실패했습니다.", 401)
+
+        if not self._interest_lock.acquire(blocking=False):
+            raise ServiceError("이자 지급이 이미 진행 중입니다.", 409)
+
+        try:
+            paid = self.admin_manager.execute_interest_payment(admin_id, confirm=False)
+        finally:
+            self._interest_lock.release()
+
+        return {'paid': paid}
+
+    def health(self) -> Dict[str, Any]:
+        """
+        서비스 상태 조회
+
+        Returns:
+            Dict: DB 연결 상태, 백엔드 이름, 세션 풀 통계
+        """
+        return {
+            'connected': self.db.is_connected(),
+            'backend': self.db.backend.name,
+            'pool': self.db.get_pool_stats()
+        }
+
+    def _authenticate(self, user_id: str, user_password: str):
+        """사용자 ID와 비밀번호 확인 (로그인과 같은 UserManager.verify_login 사용)"""
+        if not self.user_manager.verify_login(str(user_id), str(user_password)):
+            raise ServiceError("아이디 또는 비밀번호가 일치하지 않습니다.", 401)
+
+    def _authorize(self, user_id: str, account_id: str, account_password: str) -> Account:
+        """본인 계좌 여부와 계좌 비밀번호 확인 후 계좌 반환"""
+        account = self.account_manager.get_account_by_id(account_id)
+        if account is None:
+            raise ServiceError("계좌를 찾을 수 없습니다.", 404)
+        if account.user_id != user_id:
+            raise ServiceError("본인 계좌만 이용할 수 있습니다.", 403)
+        if str(account_password) != account.account_password:
+            raise ServiceError("계좌 비밀번호가 일치하지 않습니다.", 403)
+        return account
+
+    def _to_amount(self, value: Any, allow_zero: bool = False) -> float:
+        """요청 값을 금액으로 변환 및 검증"""
+        try:
+            amount = float(value)
+        except (TypeError, ValueError):
+            raise ServiceError("금액은 숫자여야 합니다.")
+        if allow_zero and amount == 0:
+            return amount
+
+        # validate_amount는 오류를 화면에 출력하므로 메시지만 받아 응답에 담음
+        error = self.validator.get_amount_error(amount)
+        if error:
+            raise ServiceError(error)
+        return amount
+
+    @staticmethod
+    def _to_page_size(value: Any) -> int:
+        """요청 값을 페이지당 행 수로 변환 및 검증 (PAGE_CONFIG['max_page_size']를 넘으면 줄임)"""
+        try:
+            page_size = int(value)
+        except (TypeError, ValueError):
+            raise ServiceError("페이지 크기는 정수여야 합니다.")
+        if page_size < 1:
+            raise ServiceError("페이지 크기는 1 이상이어야 합니다.")
+        return min(page_size, PAGE_CONFIG['max_page_size'])
+
+    def _account_result(self, account: Account) -> Dict[str, Any]:
+        """계좌 정보 응답 (비밀번호 제외)"""
+        result = account.to_dict()
+        del result['account_password']
+        return result
+
+    def _balance_result(self, account_id: str, amount: float) -> Dict[str, Any]:
+        """거래 후 잔액 응답 (거래 처리 시 캐시가 무효화되므로 DB의 최신 잔액)"""
+        account = self.account_manager.get_account_by_id(account_id)
+        return {
+            'account_id': account_id,
+            'amount': amount,
+            'balance': account.balance if account else None
+        }
+
+    @staticmethod
+    def _encode_page_key(key: Tuple[datetime, str]) -> str:
+        """다음 페이지 키를 문자열로 변환 (거래일시|거래번호)"""
+        return f"{key[0].isoformat()}|{key[1]}"
+
+    @staticmethod
+    def _decode_page_key(value: Any) -> Tuple[datetime, str]:
+        """문자열을 다음 페이지 키로 변환"""
+        if not isinstance(value, str):
+            raise ServiceError("잘못된 페이지 값입니다.")
+        try:
+            date_text, transaction_id = value.split('|', 1)
+            return datetime.fromisoformat(date_text), transaction_id
+        except ValueError:
+            raise ServiceError("잘못된 페이지 값입니다.")
@@ -0,0 +1,269 @@
+"""
+은행 서비스 HTTP/JSON 서버
+asyncio로 여러 클라이언트 연결을 동시에 받고, DB 작업(BankService)은 작업 스레드에서 실행
+(작업 스레드 수는 세션 풀 크기에 맞춰 풀 세션을 기다리며 쌓이지 않게 함)
+--async-db로 실행하면 AsyncBankService의 코루틴 메서드(계좌 조회, 입출금, 이체)는 작업 스레드 없이
+이벤트 루프에서 비동기 세션 풀로 처리
+
+실행: python -m bank_system.service [--backend sqlite] [--port 8080] [--async-db]
+
+요청 예:
+    POST /deposit  {"user_id": "user01", "user_password": "pass1234", "account_id": "110-234-000001",
+                    "account_password": "1234", "amount": 10000, "depositor_name": "홍길동"}
+    POST /history  {"user_id": "user01", "user_password": "pass1234", "page_size": 20}
+    POST /interest {"admin_id": "admin", "admin_password": "..."}
+(회원가입과 상태 조회 외의 요청은 모두 사용자 또는 관리자 ID/비밀번호로 인증)
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
+from http import HTTPStatus
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlsplit, parse_qsl
+from ..database import (SERVER_CONFIG, configure_database_connection, close_database_connection,
+                        open_async_database_connection, close_async_database_connection)
+from ..utils.ledger_writer import close_ledger_writer
+from .bank_service import BankService, ServiceError
+from .async_bank_service import AsyncBankService
+
+
+class BankHTTPServer:
+    """BankService를 HTTP/JSON으로 제공하는 asyncio 서버"""
+
+    # (메서드, 경로) -> BankService 메서드 이름
+    ROUTES = {
+        ('GET', '/health'): 'health',
+        ('POST', '/users'): 'register_user',
+        ('POST', '/accounts'): 'open_account',
+        ('POST', '/accounts/query'): 'get_account',
+        ('POST', '/deposit'): 'deposit',
+        ('POST', '/withdraw'): 'withdraw',
+        ('POST', '/transfer'): 'transfer',
+        ('POST', '/history'): 'history',
+        ('POST', '/summary'): 'summary',
+        ('POST', '/interest'): 'pay_interest'
+    }
+
+    def __init__(self, service: BankService, host: Optional[str] = None,
+                 port: Optional[int] = None, workers: Optional[int] = None):
+        """
+        BankHTTPServer 초기화
+
+        Args:
+            service: 요청을 처리할 서비스 객체
+            host: 바인드 주소 (기본값: SERVER_CONFIG)
+            port: 포트 (기본값: SERVER_CONFIG)
+            workers: DB 작업 스레드 수 (기본값: SERVER_CONFIG)
+        """
+        self.service = service
+        self.host = host or SERVER_CONFIG['host']
+        self.port = port or SERVER_CONFIG['port']
+        self.max_body_size = SERVER_CONFIG['max_body_size']
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers or SERVER_CONFIG['workers'],
+            thread_name_prefix='bank-service'
+        )
+        self.server: Optional[asyncio.AbstractServer] = None
+
+        # 라우트별 서비스 메서드와 시그니처 (요청 인자 검사용)
+        self._handlers = {}
+        for route, name in self.ROUTES.items():
+            handler = getattr(service, name)
+            self._handlers[route] = (handler, inspect.signature(handler))
+
+    async def start(self):
+        """서버 시작"""
+        self.server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        print(f"은행 서비스 서버 시작: http://{self.host}:{self.port}")
+
+    async def serve_forever(self):
+        """서버 시작 후 종료될 때까지 요청 처리"""
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def stop(self):
+        """서버 종료 (처리 중인 작업은 끝날 때까지 대기)"""
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        self.executor.shutdown(wait=True)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """클라이언트 연결 하나를 처리 (keep-alive 연결은 여러 요청을 차례로 처리)"""
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+
+                method, path, params, keep_alive = request
+                status, body = await self._dispatch(method, path, params)
+                self._write_response(writer, status, body, keep_alive)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except ServiceError as e:
+            # 요청 형식 오류 (연결은 닫음)
+            self._write_response(writer, e.status, {'error': e.message}, False)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader
+                            ) -> Optional[Tuple[str, str, Dict[str, Any], bool]]:
+        """
+        HTTP 요청 하나 읽기
+
+        Returns:
+            Tuple: (메서드, 경로, 요청 인자(쿼리 문자열 + JSON 본문), keep-alive 여부),
+                   연결이 끝났으면 None
+        """
+        request_line = await self._read_line(reader)
+        if not request_line.strip():
+            return None
+
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+        except ValueError:
+            raise ServiceError("잘못된 요청입니다.")
+
+        headers = {}
+        while True:
+            line = await self._read_line(reader)
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        url = urlsplit(target)
+        params: Dict[str, Any] = dict(parse_qsl(url.query))
+
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            raise ServiceError("잘못된 Content-Length 값입니다.")
+        if length < 0:
+            raise ServiceError("잘못된 Content-Length 값입니다.")
+        if length > self.max_body_size:
+            raise ServiceError("요청 본문이 너무 큽니다.", 413)
+        if length:
+            body = await reader.readexactly(length)
+            try:
+                data = json.loads(body)
+            except ValueError:
+                raise ServiceError("요청 본문은 JSON이어야 합니다.")
+            if not isinstance(data, dict):
+                raise ServiceError("요청 본문은 JSON 객체여야 합니다.")
+            params.update(data)
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+        return method.upper(), url.path, params, keep_alive
+
+    @staticmethod
+    async def _read_line(reader: asyncio.StreamReader) -> bytes:
+        """요청 줄 또는 헤더 한 줄 읽기 (StreamReader 한도를 넘는 줄은 431로 응답)"""
+        try:
+            return await reader.readline()
+        except (ValueError, asyncio.LimitOverrunError):
+            raise ServiceError("요청 줄 또는 헤더가 너무 깁니다.", HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+
+    async def _dispatch(self, method: str, path: str, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """요청을 서비스 메서드로 전달하고 (상태 코드, 응답 본문) 반환"""
+        route = self._handlers.get((method, path))
+        if route is None:
+            return HTTPStatus.NOT_FOUND, {'error': f"{method} {path} 경로가 없습니다."}
+
+        handler, signature = route
+        try:
+            signature.bind(**params)
+        except TypeError as e:
+            return HTTPStatus.BAD_REQUEST, {'error': f"요청 인자 오류: {e}"}
+
+        loop = asyncio.get_running_loop()
+        try:
+            if inspect.iscoroutinefunction(handler):
+                # 비동기 서비스 메서드는 이벤트 루프에서 바로 실행
+                result = await handler(**params)
+            else:
+                result = await loop.run_in_executor(self.executor, lambda: handler(**params))
+            return HTTPStatus.OK, result
+        except ServiceError as e:
+            return e.status, {'error': e.message}
+        except Exception as e:
+            print(f"서비스 요청 처리 오류 ({method} {path}): {e}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': "요청 처리 중 오류가 발생했습니다."}
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, body: Dict[str, Any], keep_alive: bool):
+        """JSON 응답 쓰기"""
+        payload = json.dumps(body, ensure_ascii=False, default=_json_default).encode('utf-8')
+        header = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            f"\r\n"
+        )
+        writer.write(header.encode('latin-1') + payload)
+
+
+def _json_default(value: Any):
+    """JSON으로 바로 변환되지 않는 값 처리 (날짜는 ISO 형식 문자열)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"JSON으로 변환할 수 없는 값: {type(value).__name__}")
+
+
+def main():
+    """서버 실행"""
+    parser = argparse.ArgumentParser(description="은행 서비스 HTTP/JSON 서버")
+    parser.add_argument('--host', default=SERVER_CONFIG['host'])
+    parser.add_argument('--port', type=int, default=SERVER_CONFIG['port'])
+    parser.add_argument('--workers', type=int, default=SERVER_CONFIG['workers'])
+    parser.add_argument('--backend', choices=['oracle', 'sqlite'], default=None,
+                        help="저장소 백엔드 (기본값: DATABASE_CONFIG['backend'])")
+    parser.add_argument('--sqlite-path', default=None, help="SQLite DB 파일 경로")
+    parser.add_argument('--async-db', action='store_true', default=SERVER_CONFIG['async_db'],
+                        help="입출금/이체를 비동기 DB 연결로 처리")
+    args = parser.parse_args()
+
+    options = {'path': args.sqlite_path} if args.backend == 'sqlite' and args.sqlite_path else {}
+    configure_database_connection(args.backend, **options)
+
+    async def serve():
+        # 비동기 세션 풀은 이벤트 루프 안에서 생성/종료
+        if args.async_db:
+            await open_async_database_connection(args.backend, **options)
+        try:
+            service = AsyncBankService() if args.async_db else BankService()
+            server = BankHTTPServer(service, args.host, args.port, args.workers)
+            try:
+                await server.serve_forever()
+            finally:
+                server.executor.shutdown(wait=True)
+        finally:
+            if args.async_db:
+                await close_async_database_connection()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\n은행 서비스 서버가 종료됩니다...")
+    finally:
+        close_ledger_writer()
+        close_database_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,30 @@
-sㅓ 거ㄴ데 """
+"""
 유틸리티 클래스들
 - BankUtils: 은행 관련 유틸리티
 - InterestCalculator: 이자 계산기
+- VectorizedInterestCalculator: 배열 단위 이자 계산기
+- SequenceBlockAllocator: 시퀀스 블록 ID 할당기
+- AccountCache: 계좌 캐시
+- UserSummaryCache: 사용자 계좌 요약 캐시
+- LedgerWriter: 거래 원장 그룹 커밋 기록기
+- ReportExporter: 관리자 보고서 내보내기 (CSV, Parquet/Arrow)
+- InterestRunJournal: 이자 지급 실행 기록 (체크포인트, 재개)
+- UserKeyIndex: 가입 정보 중복 확인 색인 (블룸 필터/해시 집합)
 """
 
 from .bank_utils import BankUtils
 from .interest_calculator import InterestCalculator
+from .vectorized_interest import VectorizedInterestCalculator
+from .id_allocator import SequenceBlockAllocator, get_id_allocator
+from .account_cache import AccountCache, get_account_cache
+from .summary_cache import UserSummaryCache, get_summary_cache
+from .ledger_writer import LedgerWriter, get_ledger_writer, close_ledger_writer
+from .report_exporter import ReportExporter
+from .interest_run_journal import InterestRunJournal
+from .user_key_index import UserKeyIndex, get_user_key_index
 
-__all__ = ['BankUtils', 'InterestCalculator']
+__all__ = ['BankUtils', 'InterestCalculator', 'VectorizedInterestCalculator',
+           'SequenceBlockAllocator', 'get_id_allocator', 'AccountCache', 'get_account_cache',
+           'UserSummaryCache', 'get_summary_cache',
+           'LedgerWriter', 'get_ledger_writer', 'close_ledger_writer', 'ReportExporter',
+           'InterestRunJournal', 'UserKeyIndex', 'get_user_key_index']
@@ -0,0 +1,176 @@
+"""
+계좌 캐시 클래스
+계좌번호로 조회한 Account 객체를 프로세스 메모리에 보관 (LRU + TTL)
+
+거래는 커밋한 뒤 invalidate로 계좌를 지우므로, 커밋 전에 읽은 행을 지운 뒤에 저장하면
+오래된 잔액과 비밀번호가 TTL 동안 남는다. 조회 전에 load_token()을 받고 put에 넘기면
+그사이 같은 계좌가 무효화되었을 때 저장하지 않는다. (UserSummaryCache와 같은 구간별 변경 번호)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, Tuple
+from ..database import CACHE_CONFIG
+from ..entities.account import Account
+
+
+class AccountCache:
+    """크기 제한과 유효 시간이 있는 계좌 캐시 클래스 (스레드 안전)"""
+
+    # 무효화를 추적하는 구간 수 (계좌번호의 해시로 구분)
+    STRIPES = 64
+
+    def __init__(self, max_size: int = 10000, ttl: float = 30.0):
+        """
+        AccountCache 초기화
+
+        Args:
+            max_size: 최대 보관 계좌 수 (초과 시 가장 오래 사용하지 않은 계좌 제거)
+            ttl: 캐시 유효 시간 (초)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._versions = [0] * self.STRIPES
+        self._lock = threading.Lock()
+
+        # 캐시 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejected = 0
+
+    def get(self, account_id: str) -> Optional[Account]:
+        """
+        캐시에서 계좌 조회
+
+        Args:
+            account_id: 계좌번호
+
+        Returns:
+            Optional[Account]: 캐시된 계좌 객체 또는 None (없거나 만료된 경우)
+        """
+        with self._lock:
+            entry = self._entries.get(account_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            account, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[account_id]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(account_id)
+            self.hits += 1
+            return account
+
+    def load_token(self) -> Tuple[int, ...]:
+        """
+        DB에서 계좌를 읽기 전에 받는 토큰 (put에 전달)
+
+        Returns:
+            Tuple: 구간별 변경 번호
+        """
+        with self._lock:
+            return tuple(self._versions)
+
+    def put(self, account: Account, token: Tuple[int, ...]) -> bool:
+        """
+        DB에서 읽은 계좌를 캐시에 저장
+        읽는 동안(토큰 이후) 같은 계좌가 무효화되었으면 저장하지 않음
+
+        Args:
+            account: 저장할 계좌 객체
+            token: 조회 전에 받은 load_token() 결과
+
+        Returns:
+            bool: 저장 여부
+        """
+        stripe = self._stripe(account.account_id)
+        with self._lock:
+            if token[stripe] != self._versions[stripe]:
+                self.rejected += 1
+                return False
+
+            self._entries[account.account_id] = (account, time.monotonic() + self.ttl)
+            self._entries.move_to_end(account.account_id)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, account_id: str):
+        """
+        계좌를 캐시에서 제거
+
+        Args:
+            account_id: 제거할 계좌번호
+        """
+        with self._lock:
+            self._versions[self._stripe(account_id)] += 1
+            self._entries.pop(account_id, None)
+
+    def invalidate_many(self, account_ids: Iterable[str]):
+        """
+        여러 계좌를 캐시에서 제거
+
+        Args:
+            account_ids: 제거할 계좌번호 목록
+        """
+        with self._lock:
+            for account_id in account_ids:
+                self._versions[self._stripe(account_id)] += 1
+                self._entries.pop(account_id, None)
+
+    def clear(self):
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._versions = [version + 1 for version in self._versions]
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 조회
+
+        Returns:
+            Dict: 크기, 적중/실패 횟수, 적중률, 제거 횟수, 저장 거부 횟수
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'rejected': self.rejected
+            }
+
+    def _stripe(self, key: str) -> int:
+        """키가 속한 구간 번호"""
+        return hash(key) % self.STRIPES
+
+
+# 전역 계좌 캐시 인스턴스 (모든 매니저가 같은 캐시를 공유)
+_account_cache: Optional[AccountCache] = None
+
+
+def get_account_cache() -> AccountCache:
+    """
+    전역 계좌 캐시 인스턴스 반환
+
+    Returns:
+        AccountCache: 계좌 캐시 객체
+    """
+    global _account_cache
+    if _account_cache is None:
+        _account_cache = AccountCache(
+            max_size=CACHE_CONFIG['account_max_size'],
+            ttl=CACHE_CONFIG['account_ttl']
+        )
+    return _account_cache
@@ -4,8 +4,8 @@ Java의 BankUtils 클래스를 Python으로 변환
 """
 
 from datetime import datetime
-from typing import Optional
-from ..database import get_database_connection
+from typing import Optional, List
+from .id_allocator import get_id_allocator
 
 
 class BankUtils:
@@ -46,16 +46,28 @@ class BankUtils:
             str: 생성된 계좌번호 또는 None (오류 시)
         """
         try:
-            db = get_database_connection()
-            with db.get_cursor() as cursor:
-                cursor.execute("SELECT '110-234-' || LPAD(SEQ_ACCOUNT.NEXTVAL, 6, '0') FROM DUAL")
-                result = cursor.fetchone()
-                if result:
-                    return result[0]
+            return get_id_allocator('account').next_id()
         except Exception as e:
             print(f"계좌번호 생성 오류: {e}")
         return None
     
+    @staticmethod
+    def generate_account_numbers(count: int) -> List[str]:
+        """
+        여러 개의 계좌번호를 한 번에 생성
+        
+        Args:
+            count: 생성할 계좌번호 개수
+            
+        Returns:
+            List[str]: 생성된 계좌번호 리스트 (오류 시 빈 리스트)
+        """
+        try:
+            return get_id_allocator('account').next_ids(count)
+        except Exception as e:
+            print(f"계좌번호 생성 오류: {e}")
+        return []
+    
     @staticmethod
     def generate_transaction_id() -> Optional[str]:
         """
@@ -65,37 +77,75 @@ class BankUtils:
             str: 생성된 거래번호 또는 None (오류 시)
         """
         try:
-            db = get_database_connection()
-            with db.get_cursor() as cursor:
-                cursor.execute("SELECT 'T' || LPAD(SEQ_TRANSACTION.NEXTVAL, 8, '0') FROM DUAL")
-                result = cursor.fetchone()
-                if result:
-                    return result[0]
+            return get_id_allocator('transaction').next_id()
         except Exception as e:
             print(f"거래번호 생성 오류: {e}")
         return None
     
     @staticmethod
-    def generate_payment_id() -> str:
+    def generate_transaction_ids(count: int) -> List[str]:
+        """
+        여러 개의 거래번호를 한 번에 생성
+        
+        Args:
+            count: 생성할 거래번호 개수
+            
+        Returns:
+            List[str]: 생성된 거래번호 리스트 (오류 시 빈 리스트)
+        """
+        try:
+            return get_id_allocator('transaction').next_ids(count)
+        except Exception as e:
+            print(f"거래번호 생성 오류: {e}")
+        return []
+    
+    @staticmethod
+    async def generate_transaction_ids_async(count: int) -> List[str]:
+        """
+        여러 개의 거래번호를 한 번에 생성 (비동기 DB 연결 사용)
+        
+        Args:
+            count: 생성할 거래번호 개수
+            
+        Returns:
+            List[str]: 생성된 거래번호 리스트 (오류 시 빈 리스트)
+        """
+        try:
+            return await get_id_allocator('transaction').next_ids_async(count)
+        except Exception as e:
+            print(f"거래번호 생성 오류: {e}")
+        return []
+    
+    @staticmethod
+    def generate_payment_id() -> Optional[str]:
         """
         새로운 이자 지급 ID 생성 (기본 형식: PAY00000001)
         
         Returns:
-            str: 생성된 이자 지급 ID
+            str: 생성된 이자 지급 ID 또는 None (오류 시)
         """
         try:
-            db = get_database_connection()
-            with db.get_cursor() as cursor:
-                cursor.execute("SELECT COUNT(*) + 1 FROM interest_payments")
-                result = cursor.fetchone()
-                if result:
-                    next_number = result[0]
-                    return f"PAY{next_number:08d}"
+            return get_id_allocator('payment').next_id()
         except Exception as e:
             print(f"이자 지급 ID 생성 오류: {e}")
+        return None
+    
+    @staticmethod
+    def generate_payment_ids(count: int) -> List[str]:
+        """
+        여러 개의 이자 지급 ID를 한 번에 생성
         
-        # 오류 시 기본값
-        return "PAY00000001"
+        Args:
+            count: 생성할 이자 지급 ID 개수
+            
+        Returns:
+            List[str]: 생성된 이자 지급 ID 리스트 (오류 시 빈 리스트)
+        """
+        try:
+            return get_id_allocator('payment').next_ids(count)
+        except Exception as e:
+            print(f"이자 지급 ID 생성 오류: {e}")
+        return []
     
     @staticmethod
     def get_counterpart_display(transaction_type: str, counterpart_name: Optional[str] = None,
@@ -0,0 +1,159 @@
+"""
+ID 할당기 클래스
+시퀀스 값을 블록 단위로 미리 예약해 두고 메모리에서 하나씩 나눠주는 방식
+(ID마다 NEXTVAL 조회를 하지 않으므로 대량 처리 시 DB 왕복이 크게 줄어듦)
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from collections import deque
+from typing import Dict, List
+from ..database import get_database_connection, get_async_database_connection, BATCH_CONFIG
+
+
+class SequenceBlockAllocator:
+    """시퀀스 값을 블록 단위로 예약하여 ID를 생성하는 클래스 (스레드 안전)"""
+
+    def __init__(self, sequence_name: str, id_format: str, block_size: int = 100):
+        """
+        SequenceBlockAllocator 초기화
+
+        Args:
+            sequence_name: 값을 예약할 시퀀스 이름 (예: 'seq_transaction')
+            id_format: 시퀀스 값을 ID 문자열로 바꾸는 형식 (예: "T{:08d}")
+            block_size: 한 번에 예약할 시퀀스 값 개수
+        """
+        self.sequence_name = sequence_name
+        self.id_format = id_format
+        self.block_size = block_size
+        self._values = deque()
+        self._lock = threading.Lock()
+        # 비동기 예약 직렬화 잠금 (asyncio.Lock은 한 이벤트 루프에 묶이므로 루프별로 생성)
+        self._async_locks: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]' = \
+            weakref.WeakKeyDictionary()
+        self.block_fetch_count = 0  # DB에서 블록을 조회한 횟수
+
+    def next_id(self) -> str:
+        """
+        다음 ID 반환
+
+        Returns:
+            str: 생성된 ID
+        """
+        return self.next_ids(1)[0]
+
+    def next_ids(self, count: int) -> List[str]:
+        """
+        여러 개의 ID를 한 번에 반환
+
+        Args:
+            count: 생성할 ID 개수
+
+        Returns:
+            List[str]: 생성된 ID 리스트
+        """
+        with self._lock:
+            if len(self._values) < count:
+                # 부족한 만큼 포함해 블록 단위로 예약
+                self._reserve(max(self.block_size, count - len(self._values)))
+
+            return self._take(count)
+
+    async def next_ids_async(self, count: int) -> List[str]:
+        """
+        여러 개의 ID를 한 번에 반환 (비동기 DB 연결로 블록 예약)
+
+        남은 값이 충분하면 DB 왕복 없이 바로 반환하고, 부족하면 한 태스크만 블록을 예약하며
+        나머지 태스크는 이벤트 루프를 막지 않고 기다린다. (동기 next_ids와 같은 블록을 공유)
+
+        Args:
+            count: 생성할 ID 개수
+
+        Returns:
+            List[str]: 생성된 ID 리스트
+        """
+        with self._lock:
+            if len(self._values) >= count:
+                return self._take(count)
+
+        async with self._async_lock():
+            with self._lock:
+                if len(self._values) >= count:
+                    return self._take(count)
+
+            # 예약 중에 다른 스레드가 남은 값을 가져갈 수 있으므로 count개 이상 예약
+            db = get_async_database_connection()
+            values = await db.next_sequence_values(self.sequence_name, max(self.block_size, count))
+
+            with self._lock:
+                self._values.extend(values)
+                self.block_fetch_count += 1
+                return self._take(count)
+
+    def _async_lock(self) -> asyncio.Lock:
+        """현재 이벤트 루프의 예약 잠금 반환 (루프가 바뀌어도 다른 루프의 잠금을 쓰지 않음)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            lock = self._async_locks.get(loop)
+            if lock is None:
+                lock = self._async_locks[loop] = asyncio.Lock()
+            return lock
+
+    def _take(self, count: int) -> List[str]:
+        """남은 값에서 count개를 ID로 변환해 꺼냄 (호출 전에 잠금을 잡고 있어야 함)"""
+        return [self.id_format.format(self._values.popleft()) for _ in range(count)]
+
+    def _reserve(self, count: int):
+        """시퀀스 값 count개를 DB에서 예약 (호출 전에 잠금을 잡고 있어야 함)"""
+        db = get_database_connection()
+        self._values.extend(db.next_sequence_values(self.sequence_name, count))
+        self.block_fetch_count += 1
+
+    def discard(self):
+        """예약해 둔 값 폐기 (시퀀스에는 빈 번호로 남음)"""
+        with self._lock:
+            self._values.clear()
+
+
+# ID 종류별 (시퀀스 이름, ID 형식)
+ID_SEQUENCES = {
+    'account': ('seq_account', "110-234-{:06d}"),
+    'transaction': ('seq_transaction', "T{:08d}"),
+    'payment': ('seq_payment', "PAY{:08d}")
+}
+
+# 프로세스 전역 ID 할당기 인스턴스
+_allocators: Dict[str, SequenceBlockAllocator] = {}
+_allocators_lock = threading.Lock()
+
+
+def _reset_allocators_after_fork():
+    """fork된 자식 프로세스에서 부모가 예약한 값을 버림 (부모와 같은 ID를 나눠주지 않도록)"""
+    global _allocators_lock
+    _allocators.clear()
+    _allocators_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_allocators_after_fork)
+
+
+def get_id_allocator(name: str) -> SequenceBlockAllocator:
+    """
+    전역 ID 할당기 인스턴스 반환
+
+    Args:
+        name: ID 종류 ('account', 'transaction', 'payment')
+
+    Returns:
+        SequenceBlockAllocator: ID 할당기 객체
+    """
+    with _allocators_lock:
+        if name not in _allocators:
+            sequence_name, id_format = ID_SEQUENCES[name]
+            _allocators[name] = SequenceBlockAllocator(
+                sequence_name, id_format, BATCH_CONFIG['id_block_size']
+            )
+        return _allocators[name]
@@ -4,9 +4,10 @@ Java의 InterestCalculator 클래스를 Python으로 변환
 """
 
 from datetime import datetime, date
-from typing import Optional
-from ..database import get_database_connection
+from typing import Optional, Iterator, List
+from ..database import get_database_connection, SQLQueries, BATCH_CONFIG
 from ..entities.interest import InterestInfo
+from .vectorized_interest import VectorizedInterestCalculator
 
 
 class InterestCalculator:
@@ -76,6 +77,44 @@ class InterestCalculator:
         # 원 단위 이하 반올림
         return round(interest)
     
+    @staticmethod
+    def build_interest_info(account_id: str, balance: float, interest_rate: float,
+                            last_interest_date: datetime, account_type: str,
+                            current_date: datetime) -> Optional[InterestInfo]:
+        """
+        조회된 계좌 값으로 이자 정보 생성 (DB 조회 없음)
+        
+        Args:
+            account_id: 계좌번호
+            balance: 잔액
+            interest_rate: 연이자율
+            last_interest_date: 마지막 이자 지급일
+            account_type: 계좌 종류
+            current_date: 이자 계산 기준일
+            
+        Returns:
+            InterestInfo: 이자 정보 객체 또는 None (경과 일수가 1일 미만인 경우)
+        """
+        # 경과 일수 계산
+        days = InterestCalculator.calculate_days_between(last_interest_date, current_date)
+        
+        # 이자 계산 (최소 1일 이상일 때만)
+        if days < 1:
+            return None
+        
+        interest_amount = InterestCalculator.calculate_interest(balance, interest_rate, days)
+        
+        return InterestInfo(
+            account_id=account_id,
+            principal=balance,
+            interest_rate=interest_rate,
+            last_interest_date=last_interest_date,
+            current_date=current_date,
+            days=days,
+            interest_amount=interest_amount,
+            account_type=account_type
+        )
+    
     @staticmethod
     def calculate_account_interest(account_id: str) -> Optional[InterestInfo]:
         """
@@ -89,42 +128,18 @@ class InterestCalculator:
         """
         try:
             db = get_database_connection()
-            query = """
-                SELECT balance, interest_rate, last_interest_date, account_type 
-                FROM accounts WHERE account_id = :account_id
-            """
-            
-            results = db.execute_query(query, {'account_id': account_id})
+            results = db.execute_query(SQLQueries.SELECT_ACCOUNT_INTEREST_INFO, {'account_id': account_id})
             
             if results:
                 data = results[0]
-                balance = data['balance']
-                interest_rate = data['interest_rate']
-                last_interest_date = data['last_interest_date']
-                account_type = data['account_type']
-                
-                # 현재 날짜
-                current_date = datetime.now()
-                
-                # 경과 일수 계산
-                days = InterestCalculator.calculate_days_between(last_interest_date, current_date)
-                
-                # 이자 계산 (최소 1일 이상일 때만)
-                if days >= 1:
-                    interest_amount = InterestCalculator.calculate_interest(
-                        balance, interest_rate, days
-                    )
-                    
-                    return InterestInfo(
-                        account_id=account_id,
-                        principal=balance,
-                        interest_rate=interest_rate,
-                        last_interest_date=last_interest_date,
-                        current_date=current_date,
-                        days=days,
-                        interest_amount=interest_amount,
-                        account_type=account_type
-                    )
+                return InterestCalculator.build_interest_info(
+                    account_id,
+                    data['balance'],
+                    data['interest_rate'],
+                    data['last_interest_date'],
+                    data['account_type'],
+                    datetime.now()
+                )
             
         except Exception as e:
             print(f"이자 계산 오류: {e}")
@@ -157,6 +172,67 @@ class InterestCalculator:
         """
         return f"{amount:,.0f}원"
     
+    @classmethod
+    def iter_interest_eligible_chunks(cls, chunk_size: Optional[int] = None,
+                                      current_date: Optional[datetime] = None,
+                                      start_id: Optional[str] = None,
+                                      end_id: Optional[str] = None,
+                                      after_id: Optional[str] = None) -> Iterator[List[InterestInfo]]:
+        """
+        이자 지급 대상 계좌를 하나의 커서로 조회하면서 일정 개수씩 나눠 반환
+        
+        계좌별로 다시 조회하지 않고 조회한 행으로 바로 이자를 계산하며,
+        전체 결과를 메모리에 올리지 않는다.
+        
+        Args:
+            chunk_size: 한 번에 반환할 최대 계좌 수 (기본값: BATCH_CONFIG)
+            current_date: 이자 계산 기준 시각 (기본값: 현재 시각)
+            start_id: 조회할 첫 계좌번호 (포함, 병렬 지급 시 구간 지정)
+            end_id: 조회를 멈출 계좌번호 (미포함)
+            after_id: 이미 지급한 마지막 계좌번호 (재개 시, 이 계좌 다음부터 조회)
+            
+        Yields:
+            List[InterestInfo]: 이자 금액이 0보다 큰 계좌의 이자 정보 리스트
+        """
+        chunk_size = chunk_size or BATCH_CONFIG['interest_chunk_size']
+        current_date = current_date or datetime.now()
+        
+        db = get_database_connection()
+        with db.get_cursor() as cursor:
+            cursor.arraysize = BATCH_CONFIG['fetch_arraysize']
+            if start_id is None and end_id is None and after_id is None:
+                cursor.execute(SQLQueries.SELECT_INTEREST_ELIGIBLE_ACCOUNTS)
+            else:
+                cursor.execute(SQLQueries.SELECT_INTEREST_ELIGIBLE_ACCOUNTS_RANGE,
+                               {'start_id': start_id, 'end_id': end_id, 'after_id': after_id})
+            
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                
+                # 청크 단위로 경과 일수와 이자를 한 번에 계산
+                account_ids, balances, interest_rates, last_dates, account_types = zip(*rows)
+                days = VectorizedInterestCalculator.calculate_days(last_dates, current_date)
+                interest = VectorizedInterestCalculator.calculate_interest(balances, interest_rates, days)
+                
+                chunk = [
+                    InterestInfo(
+                        account_id=account_ids[i],
+                        principal=balances[i],
+                        interest_rate=interest_rates[i],
+                        last_interest_date=last_dates[i],
+                        current_date=current_date,
+                        days=int(days[i]),
+                        interest_amount=float(interest[i]),
+                        account_type=account_types[i]
+                    )
+                    for i in (interest > 0).nonzero()[0]
+                ]
+                
+                if chunk:
+                    yield chunk
+    
     @classmethod
     def get_all_interest_eligible_accounts(cls) -> list:
         """
@@ -166,23 +242,9 @@ class InterestCalculator:
             list: 이자 지급 대상 계좌 리스트
         """
         try:
-            db = get_database_connection()
-            query = """
-                SELECT account_id, balance, interest_rate, last_interest_date, account_type
-                FROM accounts 
-                WHERE balance > 0 AND interest_rate > 0
-                ORDER BY account_id
-            """
-            
-            results = db.execute_query(query)
             eligible_accounts = []
-            
-            for data in results:
-                account_id = data['account_id']
-                interest_info = cls.calculate_account_interest(account_id)
-                
-                if interest_info and interest_info.interest_amount > 0:
-                    eligible_accounts.append(interest_info)
+            for chunk in cls.iter_interest_eligible_chunks():
+                eligible_accounts.extend(chunk)
             
             return eligible_accounts
             
@@ -221,22 +283,34 @@ class InterestCalculator:
                 'by_type': {}
             }
         
-        summary = {
-            'total_accounts': len(interest_list),
-            'total_amount': InterestCalculator.calculate_total_interest_amount(interest_list),
-            'by_type': {}
-        }
+        return VectorizedInterestCalculator.summarize_by_type(
+            [interest.account_type for interest in interest_list],
+            [interest.interest_amount for interest in interest_list]
+        )
+    
+    @staticmethod
+    def merge_interest_summary(total: dict, summary: dict) -> dict:
+        """
+        이자 지급 요약 정보 합산 (청크별 요약을 하나로 합칠 때 사용)
+        
+        Args:
+            total: 누적 요약 정보 (get_interest_summary 형식)
+            summary: 더할 요약 정보
+            
+        Returns:
+            dict: 합산된 요약 정보
+        """
+        total['total_accounts'] += summary['total_accounts']
+        total['total_amount'] += summary['total_amount']
         
-        # 계좌 종류별 집계
-        for interest in interest_list:
-            account_type = interest.account_type
-            if account_type not in summary['by_type']:
-                summary['by_type'][account_type] = {
+        for account_type, info in summary['by_type'].items():
+            if account_type not in total['by_type']:
+                total['by_type'][account_type] = {
                     'count': 0,
                     'amount': 0
                 }
             
-            summary['by_type'][account_type]['count'] += 1
-            summary['by_type'][account_type]['amount'] += interest.interest_amount
+            total['by_type'][account_type]['count'] += info['count']
+            total['by_type'][account_type]['amount'] += info['amount']
         
-        return summary
+        return total
@@ -0,0 +1,267 @@
+"""
+이자 지급 실행 저널 클래스
+이자 지급 실행(기준 시각, 구간 목록, 상태)과 구간별 체크포인트를 interest_runs / interest_run_shards에 기록
+
+- 체크포인트는 청크 지급과 같은 트랜잭션에서 갱신되므로 커밋된 청크까지만 기록됨
+- 실행이 중간에 죽거나 취소되면 다음 실행 시 같은 기준 시각으로 체크포인트 이후만 다시 조회해 지급
+  (이미 지급한 계좌를 다시 읽거나 이자를 다시 계산하지 않으므로 복구 시간은 남은 작업량에 비례)
+- 실행 중인 다른 프로세스가 있으면 새 실행을 시작하지 않고, 재개는 상태 비교 갱신으로 한 프로세스만 넘겨받음
+- 실행을 만들거나 넘겨받을 때 기록한 updated_at(claimed_at)이 실행의 소유 표시이며,
+  체크포인트/종료 기록은 claimed_at이 그대로일 때만 갱신됨 (넘겨받힌 이전 프로세스의 청크는 롤백)
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any
+from ..database import get_database_connection, SQLQueries, BATCH_CONFIG
+from ..entities.interest import InterestInfo, InterestShard, InterestRun
+
+
+class InterestRunJournal:
+    """이자 지급 실행 기록과 체크포인트를 관리하는 클래스"""
+
+    # 실행 상태
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+    # 구간 상태
+    PENDING = "PENDING"
+    DONE = "DONE"
+
+    def __init__(self, stale_seconds: Optional[float] = None):
+        """
+        InterestRunJournal 초기화
+
+        Args:
+            stale_seconds: 체크포인트가 이 시간 이상 없으면 실행 중인 기록도 중단된 것으로 봄
+                           (기본값: BATCH_CONFIG['interest_run_stale_seconds'])
+        """
+        self.db = get_database_connection()
+        self.stale_seconds = stale_seconds or BATCH_CONFIG['interest_run_stale_seconds']
+
+    def create_run(self, admin_id: str, calc_date: datetime, shards: List[InterestShard]) -> InterestRun:
+        """
+        새 실행 기록 생성 (실행과 구간을 한 트랜잭션으로 저장)
+
+        Args:
+            admin_id: 관리자 ID
+            calc_date: 이자 계산 기준 시각
+            shards: 지급할 구간 목록
+
+        Returns:
+            InterestRun: 생성한 실행 기록
+        """
+        now = datetime.now()
+        run = InterestRun(
+            run_id=f"IR{now:%Y%m%d%H%M%S%f}",
+            admin_id=admin_id,
+            calc_date=calc_date,
+            status=self.RUNNING,
+            started_at=now,
+            updated_at=now,
+            shards=shards
+        )
+
+        with self.db.transaction():
+            self.db.execute_update(SQLQueries.INSERT_INTEREST_RUN, {
+                'run_id': run.run_id,
+                'admin_id': admin_id,
+                'calc_date': calc_date,
+                'shard_count': len(shards),
+                'status': run.status,
+                'started_at': now,
+                'updated_at': now
+            })
+            self.db.execute_many(SQLQueries.INSERT_INTEREST_RUN_SHARD, [
+                {
+                    'run_id': run.run_id,
+                    'shard_no': shard.shard_no,
+                    'start_id': shard.start_id,
+                    'end_id': shard.end_id,
+                    'account_count': shard.account_count,
+                    'status': self.PENDING,
+                    'updated_at': now
+                }
+                for shard in shards
+            ])
+
+        for shard in shards:
+            shard.status = self.PENDING
+            shard.updated_at = now
+        return run
+
+    def find_unfinished_run(self) -> Optional[InterestRun]:
+        """
+        가장 최근의 끝나지 않은 실행 조회
+        (모든 구간이 끝났는데 완료로 기록되지 못한 실행은 완료 처리하고 None 반환)
+
+        Returns:
+            Optional[InterestRun]: 실행 기록 (구간 포함) 또는 None
+        """
+        results = self.db.execute_query(SQLQueries.SELECT_UNFINISHED_INTEREST_RUN)
+        if not results:
+            return None
+
+        row = results[0]
+        run = InterestRun(
+            run_id=row['run_id'],
+            admin_id=row['admin_id'],
+            calc_date=row['calc_date'],
+            status=row['status'],
+            started_at=row['started_at'],
+            updated_at=row['updated_at'],
+            shards=self.load_shards(row['run_id'])
+        )
+
+        if not run.pending_shards():
+            self.finish_run(run, self.COMPLETED)
+            return None
+        return run
+
+    def load_shards(self, run_id: str) -> List[InterestShard]:
+        """
+        실행의 구간별 체크포인트 조회
+
+        Args:
+            run_id: 실행 ID
+
+        Returns:
+            List[InterestShard]: 구간 목록 (구간 번호 순)
+        """
+        results = self.db.execute_query(SQLQueries.SELECT_INTEREST_RUN_SHARDS, {'run_id': run_id})
+        return [
+            InterestShard(
+                shard_no=int(row['shard_no']),
+                start_id=row['start_id'],
+                end_id=row['end_id'],
+                account_count=int(row['account_count']),
+                last_account_id=row['last_account_id'],
+                paid_count=int(row['paid_count']),
+                paid_amount=float(row['paid_amount']),
+                status=row['status'],
+                updated_at=row['updated_at']
+            )
+            for row in results
+        ]
+
+    def is_stale(self, run: InterestRun) -> bool:
+        """
+        중단된 실행인지 확인 (실패로 기록되었거나, 실행 중인데 오랫동안 체크포인트가 없음)
+
+        Args:
+            run: 실행 기록
+
+        Returns:
+            bool: 재개 가능 여부
+        """
+        if run.status != self.RUNNING:
+            return True
+
+        last_update = max([run.updated_at] + [shard.updated_at for shard in run.shards if shard.updated_at])
+        return last_update < datetime.now() - timedelta(seconds=self.stale_seconds)
+
+    def claim(self, run: InterestRun) -> bool:
+        """
+        중단된 실행을 넘겨받음 (조회한 뒤 다른 프로세스가 먼저 넘겨받았으면 실패)
+
+        Args:
+            run: find_unfinished_run()으로 조회한 실행 기록
+
+        Returns:
+            bool: 넘겨받기 성공 여부
+        """
+        now = datetime.now()
+        claimed = self.db.execute_update(SQLQueries.CLAIM_INTEREST_RUN, {
+            'run_id': run.run_id,
+            'status': run.status,
+            'updated_at': run.updated_at,
+            'now': now
+        }) == 1
+
+        if claimed:
+            run.status = self.RUNNING
+            run.updated_at = now
+        return claimed
+
+    def is_owner(self, run_id: str, claimed_at: datetime) -> bool:
+        """
+        실행을 아직 맡고 있는지 확인 (다른 프로세스가 넘겨받았거나 종료되었으면 False)
+
+        Args:
+            run_id: 실행 ID
+            claimed_at: 실행을 만들거나 넘겨받을 때의 updated_at
+
+        Returns:
+            bool: 소유 여부
+        """
+        results = self.db.execute_query(SQLQueries.COUNT_OWNED_INTEREST_RUN,
+                                        {'run_id': run_id, 'claimed_at': claimed_at})
+        return bool(results) and results[0]['count'] > 0
+
+    def checkpoint_params(self, run_id: str, claimed_at: datetime, shard_no: int, chunk: List[InterestInfo],
+                          advance: bool = True) -> Dict[str, Any]:
+        """
+        청크 지급과 함께 실행할 체크포인트 갱신 매개변수 생성
+
+        Args:
+            run_id: 실행 ID
+            claimed_at: 실행을 만들거나 넘겨받을 때의 updated_at (소유 확인용)
+            shard_no: 구간 번호
+            chunk: 지급할 청크
+            advance: 재개 지점을 이 청크의 마지막 계좌로 옮길지 여부
+                     (앞선 청크가 실패했으면 False로 두어 재개 시 실패한 청크부터 다시 조회)
+
+        Returns:
+            Dict: UPDATE_INTEREST_RUN_CHECKPOINT 매개변수
+        """
+        return {
+            'run_id': run_id,
+            'claimed_at': claimed_at,
+            'shard_no': shard_no,
+            'last_account_id': chunk[-1].account_id if advance else None,
+            'paid_count': len(chunk),
+            'paid_amount': sum(info.interest_amount for info in chunk),
+            'updated_at': datetime.now()
+        }
+
+    def finish_shard(self, run_id: str, claimed_at: datetime, shard_no: int, status: str):
+        """
+        구간 종료 기록 (실행을 다른 프로세스가 넘겨받았으면 기록하지 않음)
+
+        Args:
+            run_id: 실행 ID
+            claimed_at: 실행을 만들거나 넘겨받을 때의 updated_at
+            shard_no: 구간 번호
+            status: DONE 또는 FAILED
+        """
+        self.db.execute_update(SQLQueries.UPDATE_INTEREST_RUN_SHARD_STATUS, {
+            'run_id': run_id,
+            'claimed_at': claimed_at,
+            'shard_no': shard_no,
+            'status': status,
+            'updated_at': datetime.now()
+        })
+
+    def finish_run(self, run: InterestRun, status: str) -> bool:
+        """
+        실행 종료 기록 (실행을 다른 프로세스가 넘겨받았으면 기록하지 않음)
+
+        Args:
+            run: 실행 기록 (updated_at은 만들거나 넘겨받을 때의 값)
+            status: COMPLETED 또는 FAILED
+
+        Returns:
+            bool: 기록 여부
+        """
+        now = datetime.now()
+        finished = self.db.execute_update(SQLQueries.UPDATE_INTEREST_RUN_STATUS, {
+            'run_id': run.run_id,
+            'status': status,
+            'updated_at': now,
+            'claimed_at': run.updated_at
+        }) == 1
+
+        if finished:
+            run.status = status
+            run.updated_at = now
+        return finished
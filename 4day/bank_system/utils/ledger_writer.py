@@ -0,0 +1,244 @@
+"""
+거래 원장 기록기 클래스 (그룹 커밋)
+여러 스레드의 거래 작업을 모아 하나의 DB 트랜잭션에서 실행하고,
+거래 기록은 executemany 한 번, 커밋은 그룹당 한 번으로 처리
+(작업마다 INSERT와 커밋을 따로 하지 않으므로 동시 거래가 많을 때 처리량이 크게 늘어남)
+
+- 작업(unit)은 잔액 갱신 등을 실행하고 저장할 Transaction 목록을 반환하는 함수
+- 작업마다 SAVEPOINT를 두어 실패한 작업만 되돌리고 나머지는 그대로 커밋
+- 호출자는 자신이 속한 그룹이 커밋된 뒤에 결과를 받음 (커밋 전에는 응답하지 않음)
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, List, Optional, Dict, Any
+from ..database import get_database_connection, SQLQueries, LEDGER_CONFIG
+from ..entities.transaction import Transaction
+
+
+# 작업 함수: 그룹 트랜잭션 안에서 실행되고 저장할 거래 기록을 반환
+LedgerUnit = Callable[[], List[Transaction]]
+
+
+class LedgerWriter:
+    """거래 작업을 그룹 단위로 모아 한 번에 커밋하는 기록기 (스레드 안전)"""
+
+    def __init__(self, max_batch: int = 256, max_delay_ms: float = 2):
+        """
+        LedgerWriter 초기화
+
+        Args:
+            max_batch: 한 그룹에 모으는 최대 작업 수
+            max_delay_ms: 첫 작업이 들어온 뒤 그룹을 더 모으며 기다리는 최대 시간 (밀리초)
+        """
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        # 그룹 커밋 통계
+        self.group_count = 0
+        self.unit_count = 0
+        self.failed_unit_count = 0
+        self.record_count = 0
+
+    def start(self):
+        """기록 스레드 시작"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='ledger-writer', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """대기 중인 작업을 모두 커밋한 뒤 기록 스레드 종료"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def submit(self, unit: LedgerUnit) -> Future:
+        """
+        작업 등록
+
+        Args:
+            unit: 그룹 트랜잭션 안에서 실행할 작업 (저장할 Transaction 목록 반환)
+
+        Returns:
+            Future: 그룹 커밋 후 작업이 반환한 거래 기록 (작업 실패 시 예외)
+        """
+        future = Future()
+        self.start()
+        self._queue.put((unit, future))
+        return future
+
+    def execute(self, unit: LedgerUnit, timeout: Optional[float] = None) -> List[Transaction]:
+        """
+        작업을 등록하고 그룹이 커밋될 때까지 대기
+
+        이미 transaction() 안에서 호출되면 바깥 트랜잭션이 커밋을 맡으므로
+        그룹에 넣지 않고 현재 트랜잭션에서 바로 실행한다.
+        대기 시간이 지나면 아직 그룹에 들어가지 않은 작업은 취소하고 TimeoutError를 발생시키며,
+        이미 그룹에서 실행 중인 작업은 그룹의 커밋/롤백 결과가 나올 때까지 기다린다.
+        (실패를 응답한 작업이 나중에 커밋되어 재시도 시 이중 기록되지 않도록)
+
+        Args:
+            unit: 작업 함수
+            timeout: 최대 대기 시간 (초, 기본값: LEDGER_CONFIG['ack_timeout'])
+
+        Returns:
+            List[Transaction]: 저장된 거래 기록
+        """
+        db = get_database_connection()
+        if db.in_transaction():
+            records = unit()
+            if records:
+                db.execute_many(SQLQueries.INSERT_TRANSACTION, [record.to_dict() for record in records])
+            return records
+
+        future = self.submit(unit)
+        try:
+            return future.result(timeout or LEDGER_CONFIG.get('ack_timeout'))
+        except FutureTimeoutError:
+            if future.cancel():
+                raise
+            return future.result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        그룹 커밋 통계 조회
+
+        Returns:
+            Dict: 그룹 수, 작업 수, 실패 작업 수, 기록 수, 평균 그룹 크기, 대기 작업 수
+        """
+        return {
+            'groups': self.group_count,
+            'units': self.unit_count,
+            'failed_units': self.failed_unit_count,
+            'records': self.record_count,
+            'avg_group_size': self.unit_count / self.group_count if self.group_count else 0.0,
+            'pending': self._queue.qsize()
+        }
+
+    def _run(self):
+        """기록 스레드: 작업을 그룹으로 모아 커밋"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            stopping = False
+            deadline = time.perf_counter() + self.max_delay
+
+            # 크기 또는 시간 제한까지 작업 수집
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._commit_group(batch)
+
+            if stopping:
+                break
+
+        # 종료 요청 이후 남은 작업 처리
+        leftovers = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                leftovers.append(item)
+        if leftovers:
+            self._commit_group(leftovers)
+
+    def _commit_group(self, batch: List[tuple]):
+        """작업 그룹을 하나의 트랜잭션으로 실행 (거래 기록은 executemany 한 번)"""
+        db = get_database_connection()
+        done = []       # (future, 거래 기록)
+        failed = []     # (future, 예외)
+        records: List[Transaction] = []
+
+        try:
+            with db.transaction():
+                for unit, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+
+                    db.execute_update(SQLQueries.SAVEPOINT_LEDGER_UNIT)
+                    try:
+                        unit_records = unit() or []
+                    except Exception as e:
+                        db.execute_update(SQLQueries.ROLLBACK_TO_LEDGER_UNIT)
+                        failed.append((future, e))
+                        continue
+
+                    records.extend(unit_records)
+                    done.append((future, unit_records))
+
+                if records:
+                    db.execute_many(SQLQueries.INSERT_TRANSACTION, [record.to_dict() for record in records])
+
+        except Exception as e:
+            # 기록 저장 또는 커밋 실패: 그룹 전체가 롤백됨
+            print(f"거래 원장 그룹 커밋 오류 ({len(batch)}건): {e}")
+            for future, _ in done:
+                future.set_exception(e)
+            for future, error in failed:
+                future.set_exception(error)
+            self.group_count += 1
+            self.failed_unit_count += len(done) + len(failed)
+            return
+
+        # 커밋 완료 후 응답
+        for future, unit_records in done:
+            future.set_result(unit_records)
+        for future, error in failed:
+            future.set_exception(error)
+
+        self.group_count += 1
+        self.unit_count += len(done)
+        self.failed_unit_count += len(failed)
+        self.record_count += len(records)
+
+
+# 프로세스 전역 원장 기록기 인스턴스
+_ledger_writer: Optional[LedgerWriter] = None
+_ledger_writer_lock = threading.Lock()
+
+
+def get_ledger_writer() -> LedgerWriter:
+    """
+    전역 원장 기록기 인스턴스 반환
+
+    Returns:
+        LedgerWriter: 원장 기록기 객체
+    """
+    global _ledger_writer
+    with _ledger_writer_lock:
+        if _ledger_writer is None:
+            _ledger_writer = LedgerWriter(
+                max_batch=LEDGER_CONFIG.get('max_batch', 256),
+                max_delay_ms=LEDGER_CONFIG.get('max_delay_ms', 2)
+            )
+        return _ledger_writer
+
+
+def close_ledger_writer():
+    """전역 원장 기록기 종료 (대기 중인 작업은 커밋 후 종료)"""
+    global _ledger_writer
+    with _ledger_writer_lock:
+        writer, _ledger_writer = _ledger_writer, None
+    if writer is not None:
+        writer.stop()
@@ -0,0 +1,211 @@
+"""
+관리자 보고서 내보내기 클래스
+전체 계좌, 이자 지급 내역, 기간별 거래내역을 하나의 커서로 chunk_size행씩 읽어
+CSV 또는 Parquet/Arrow 파일로 바로 기록 (전체 결과를 메모리에 올리지 않으므로 수천만 행도 일정한 메모리로 처리)
+
+- CSV: csv 모듈 사용 (기본 인코딩 utf-8-sig, 엑셀에서 한글이 깨지지 않음)
+- Parquet/Arrow: pyarrow가 설치되어 있을 때만 사용 가능 (청크마다 row group/record batch 하나)
+
+실행: python -m bank_system.batch.export_reports accounts --format csv --output accounts.csv
+      python -m bank_system.batch.export_reports transactions --start 2025-01-01 --end 2025-02-01 --format parquet
+"""
+
+import csv
+import os
+import time
+from datetime import datetime
+from operator import itemgetter
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+from ..database import get_database_connection, SQLQueries, EXPORT_CONFIG
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # CSV 내보내기는 pyarrow 없이도 사용 가능
+    pa = None
+    pq = None
+
+
+class ReportExporter:
+    """관리자 보고서를 스트리밍으로 파일에 내보내는 클래스"""
+
+    # 보고서 이름 -> (조회 쿼리, 내보낼 컬럼과 타입) (계좌 비밀번호는 내보내지 않음)
+    REPORTS = {
+        'accounts': (SQLQueries.SELECT_ALL_ACCOUNTS, {
+            'account_id': 'str', 'account_name': 'str', 'account_type': 'str', 'balance': 'float',
+            'user_id': 'str', 'user_name': 'str', 'create_date': 'datetime', 'interest_rate': 'float',
+            'last_interest_date': 'datetime'
+        }),
+        'interest': (SQLQueries.SELECT_INTEREST_PAYMENTS, {
+            'payment_id': 'str', 'account_id': 'str', 'payment_date': 'datetime',
+            'interest_amount': 'float', 'admin_id': 'str'
+        }),
+        'transactions': (SQLQueries.SELECT_TRANSACTIONS_BY_DATE_RANGE, {
+            'transaction_id': 'str', 'transaction_date': 'datetime', 'account_id': 'str',
+            'transaction_type': 'str', 'amount': 'float', 'balance_after': 'float',
+            'counterpart_account': 'str', 'counterpart_name': 'str', 'depositor_name': 'str',
+            'transaction_memo': 'str'
+        })
+    }
+
+    FORMATS = ('csv', 'parquet', 'arrow')
+
+    # 파일 형식별 확장자
+    EXTENSIONS = {'csv': 'csv', 'parquet': 'parquet', 'arrow': 'arrow'}
+
+    def __init__(self, chunk_size: Optional[int] = None):
+        """
+        ReportExporter 초기화
+
+        Args:
+            chunk_size: 한 번에 읽고 쓰는 행 수 (기본값: EXPORT_CONFIG)
+        """
+        self.db = get_database_connection()
+        self.chunk_size = chunk_size or EXPORT_CONFIG['chunk_size']
+
+    @staticmethod
+    def is_format_available(file_format: str) -> bool:
+        """파일 형식 사용 가능 여부 (Parquet/Arrow는 pyarrow 필요)"""
+        return file_format == 'csv' or (file_format in ReportExporter.FORMATS and pa is not None)
+
+    def default_path(self, report: str, file_format: str,
+                     start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> str:
+        """
+        기본 출력 파일 경로 (EXPORT_CONFIG['output_dir']/보고서_기간 또는 생성시각.확장자)
+
+        Args:
+            report: 보고서 이름
+            file_format: 파일 형식
+            start_date: 시작일 (거래내역)
+            end_date: 종료일 (거래내역, 해당 일 미포함)
+
+        Returns:
+            str: 파일 경로
+        """
+        if start_date and end_date:
+            suffix = f"{start_date:%Y%m%d}_{end_date:%Y%m%d}"
+        else:
+            suffix = f"{datetime.now():%Y%m%d_%H%M%S}"
+        filename = f"{report}_{suffix}.{self.EXTENSIONS[file_format]}"
+        return os.path.join(EXPORT_CONFIG['output_dir'], filename)
+
+    def export(self, report: str, path: Optional[str] = None, file_format: str = 'csv',
+               start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        보고서 내보내기
+
+        Args:
+            report: 보고서 이름 ('accounts', 'interest', 'transactions')
+            path: 출력 파일 경로 (없으면 default_path)
+            file_format: 파일 형식 ('csv', 'parquet', 'arrow')
+            start_date: 거래내역 시작일시 (포함)
+            end_date: 거래내역 종료일시 (미포함)
+
+        Returns:
+            Dict: path, rows (내보낸 행 수), chunks (청크 수), elapsed (초)
+        """
+        if report not in self.REPORTS:
+            raise ValueError(f"알 수 없는 보고서: {report} (가능: {', '.join(self.REPORTS)})")
+        if file_format not in self.FORMATS:
+            raise ValueError(f"알 수 없는 파일 형식: {file_format} (가능: {', '.join(self.FORMATS)})")
+        if not self.is_format_available(file_format):
+            raise ValueError(f"{file_format} 형식은 pyarrow가 필요합니다. (pip install pyarrow)")
+
+        params = None
+        if report == 'transactions':
+            if not (start_date and end_date):
+                raise ValueError("거래내역은 시작일과 종료일이 필요합니다.")
+            params = {'start_date': start_date, 'end_date': end_date}
+
+        path = path or self.default_path(report, file_format, start_date, end_date)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        query, columns = self.REPORTS[report]
+        start = time.perf_counter()
+
+        # 중간에 실패하면 불완전한 파일이 남지 않도록 임시 파일에 쓴 뒤 이름 변경
+        temp_path = path + '.part'
+        try:
+            chunk_iter = self._iter_chunks(query, params, list(columns))
+            if file_format == 'csv':
+                rows, chunks = self._write_csv(temp_path, columns, chunk_iter)
+            else:
+                rows, chunks = self._write_arrow(temp_path, columns, chunk_iter, file_format)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return {'path': path, 'rows': rows, 'chunks': chunks, 'elapsed': time.perf_counter() - start}
+
+    def _iter_chunks(self, query: str, params: Optional[Dict[str, Any]],
+                     columns: List[str]) -> Iterator[List[tuple]]:
+        """
+        조회 결과를 chunk_size행씩 읽어 내보낼 컬럼만 남긴 튜플 리스트로 반환
+
+        Yields:
+            List[tuple]: 청크 (columns 순서의 값)
+        """
+        with self.db.get_cursor() as cursor:
+            self.db.backend.configure_cursor(cursor, self.chunk_size, self.chunk_size)
+
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+
+            names = [desc[0].lower() for desc in cursor.description]
+            pick = itemgetter(*(names.index(column) for column in columns))
+
+            while True:
+                rows = cursor.fetchmany(self.chunk_size)
+                if not rows:
+                    break
+                yield [pick(row) for row in rows]
+
+    @staticmethod
+    def _write_csv(path: str, columns: Dict[str, str], chunks: Iterator[List[tuple]]) -> Tuple[int, int]:
+        """CSV 파일 쓰기 (헤더 + 청크별 writerows)"""
+        rows = count = 0
+        with open(path, 'w', newline='', encoding=EXPORT_CONFIG['csv_encoding']) as fp:
+            writer = csv.writer(fp, delimiter=",", quotechar='"')
+            writer.writerow(list(columns))
+
+            for chunk in chunks:
+                writer.writerows(chunk)
+                rows += len(chunk)
+                count += 1
+
+        return rows, count
+
+    @staticmethod
+    def _write_arrow(path: str, columns: Dict[str, str], chunks: Iterator[List[tuple]],
+                     file_format: str) -> Tuple[int, int]:
+        """Parquet 또는 Arrow IPC 파일 쓰기 (청크마다 열 단위로 변환해 기록)"""
+        types = {'str': pa.string(), 'float': pa.float64(), 'datetime': pa.timestamp('us')}
+        schema = pa.schema([(name, types[kind]) for name, kind in columns.items()])
+
+        if file_format == 'parquet':
+            writer = pq.ParquetWriter(path, schema, compression='snappy')
+        else:
+            writer = pa.ipc.new_file(path, schema)
+
+        rows = count = 0
+        try:
+            for chunk in chunks:
+                arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*chunk), schema)]
+                batch = pa.record_batch(arrays, schema=schema)
+                if file_format == 'parquet':
+                    writer.write_batch(batch)
+                else:
+                    writer.write(batch)
+                rows += len(chunk)
+                count += 1
+        finally:
+            writer.close()
+
+        return rows, count
+
@@ -0,0 +1,277 @@
+"""
+사용자 계좌 요약 캐시 클래스
+사용자별 UserSummary를 프로세스 메모리에 보관하고 (LRU + TTL)
+입금/출금/이체/이자 지급이 커밋되면 변동분만 반영 (목록 화면은 DB를 다시 조회하지 않음)
+
+DB에서 요약을 읽는 중에 같은 계좌의 거래가 커밋되면 변동분이 두 번 반영되거나 빠질 수 있으므로,
+거래는 tracking()으로 시작/종료를 알리고 그동안 겹치는 계좌의 요약은 캐시에 넣지 않는다.
+(다른 프로세스의 거래는 반영되지 않으므로 TTL이 지나면 DB에서 다시 읽음)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterable, Tuple
+from ..database import CACHE_CONFIG
+from ..entities.account import Account
+from ..entities.user_summary import UserSummary
+
+
+class UserSummaryCache:
+    """변동분을 반영하는 사용자 계좌 요약 캐시 클래스 (스레드 안전)"""
+
+    # 진행 중인 거래를 추적하는 구간 수 (계좌번호/사용자 ID의 해시로 구분)
+    STRIPES = 64
+
+    def __init__(self, max_size: int = 10000, ttl: float = 60.0):
+        """
+        UserSummaryCache 초기화
+
+        Args:
+            max_size: 최대 보관 사용자 수 (초과 시 가장 오래 사용하지 않은 사용자 제거)
+            ttl: 캐시 유효 시간 (초)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._owners: Dict[str, str] = {}  # 캐시된 계좌번호 -> 사용자 ID
+        self._versions = [0] * self.STRIPES
+        self._pending = [0] * self.STRIPES
+        self._lock = threading.Lock()
+
+        # 캐시 통계
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self.deltas = 0
+
+    def get(self, user_id: str) -> Optional[UserSummary]:
+        """
+        캐시에서 요약 조회
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            Optional[UserSummary]: 요약 복사본 또는 None (없거나 만료된 경우)
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            summary, expires_at = entry
+            if expires_at < time.monotonic():
+                self._remove(user_id)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return summary.copy()
+
+    def load_token(self) -> Tuple[tuple, tuple]:
+        """
+        DB에서 요약을 읽기 전에 받는 토큰 (put에 전달)
+
+        Returns:
+            Tuple: 구간별 변경 번호와 진행 중인 거래 수
+        """
+        with self._lock:
+            return tuple(self._versions), tuple(self._pending)
+
+    def put(self, summary: UserSummary, token: Tuple[tuple, tuple]) -> bool:
+        """
+        DB에서 읽은 요약을 캐시에 저장
+        읽는 동안(토큰 이후) 같은 사용자나 계좌의 거래가 진행되었으면 저장하지 않음
+
+        Args:
+            summary: 저장할 요약
+            token: 조회 전에 받은 load_token() 결과
+
+        Returns:
+            bool: 저장 여부
+        """
+        versions, pending = token
+        stripes = {self._stripe(key) for key in (summary.user_id, *summary.accounts)}
+
+        with self._lock:
+            if any(pending[s] or versions[s] != self._versions[s] for s in stripes):
+                self.rejected += 1
+                return False
+
+            self._remove(summary.user_id)
+            self._entries[summary.user_id] = (summary.copy(), time.monotonic() + self.ttl)
+            for account_id in summary.accounts:
+                self._owners[account_id] = summary.user_id
+
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+            return True
+
+    @contextmanager
+    def tracking(self, keys: Iterable[str]):
+        """
+        거래 진행 구간 표시 (블록 동안 겹치는 사용자/계좌의 요약은 캐시에 저장하지 않음)
+
+        Usage:
+            with cache.tracking([account_id]):
+                with db.transaction():
+                    ...
+                cache.apply_delta(account_id, amount)
+
+        Args:
+            keys: 거래가 변경하는 계좌번호 또는 사용자 ID
+        """
+        stripes = [self._stripe(key) for key in keys]
+        with self._lock:
+            for s in stripes:
+                self._versions[s] += 1
+                self._pending[s] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                for s in stripes:
+                    self._versions[s] += 1
+                    self._pending[s] -= 1
+
+    def apply_delta(self, account_id: str, delta: float, activity_date: Optional[datetime] = None):
+        """
+        커밋된 잔액 변동분을 캐시된 요약에 반영 (캐시에 없으면 무시)
+
+        Args:
+            account_id: 계좌번호
+            delta: 잔액 변동분
+            activity_date: 거래 일시
+        """
+        with self._lock:
+            self._apply(account_id, delta, activity_date)
+
+    def apply_deltas(self, deltas: Iterable[Tuple[str, float]], activity_date: Optional[datetime] = None):
+        """
+        여러 계좌의 잔액 변동분 반영 (이자 일괄 지급 등)
+
+        Args:
+            deltas: (계좌번호, 변동분) 목록
+            activity_date: 거래 일시
+        """
+        with self._lock:
+            for account_id, delta in deltas:
+                self._apply(account_id, delta, activity_date)
+
+    def add_account(self, account: Account, activity_date: Optional[datetime] = None):
+        """
+        개설한 계좌를 소유자의 캐시된 요약에 추가
+
+        Args:
+            account: 개설한 계좌
+            activity_date: 초기 입금 일시
+        """
+        with self._lock:
+            entry = self._entries.get(account.user_id)
+            if entry is not None:
+                entry[0].add_account(account, activity_date)
+                self._owners[account.account_id] = account.user_id
+
+    def remove_account(self, account_id: str):
+        """
+        해지한 계좌를 소유자의 캐시된 요약에서 제외
+
+        Args:
+            account_id: 해지한 계좌번호
+        """
+        with self._lock:
+            user_id = self._owners.pop(account_id, None)
+            entry = self._entries.get(user_id) if user_id else None
+            if entry is not None:
+                entry[0].remove_account(account_id)
+
+    def invalidate_account(self, account_id: str):
+        """
+        계좌 소유자의 요약을 캐시에서 제거 (변동분을 알 수 없을 때)
+
+        Args:
+            account_id: 계좌번호
+        """
+        with self._lock:
+            user_id = self._owners.get(account_id)
+            if user_id:
+                self._remove(user_id)
+
+    def invalidate(self, user_id: str):
+        """
+        사용자의 요약을 캐시에서 제거
+
+        Args:
+            user_id: 사용자 ID
+        """
+        with self._lock:
+            self._remove(user_id)
+
+    def clear(self):
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._owners.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 조회
+
+        Returns:
+            Dict: 크기, 적중/실패 횟수, 적중률, 저장 거부 횟수, 반영한 변동분 수
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'rejected': self.rejected,
+                'deltas': self.deltas
+            }
+
+    def _apply(self, account_id: str, delta: float, activity_date: Optional[datetime]):
+        """변동분 반영 (잠금을 잡은 상태에서 호출)"""
+        user_id = self._owners.get(account_id)
+        entry = self._entries.get(user_id) if user_id else None
+        if entry is not None:
+            entry[0].apply_delta(account_id, delta, activity_date)
+            self.deltas += 1
+
+    def _remove(self, user_id: str):
+        """사용자 요약과 계좌 소유자 색인 제거 (잠금을 잡은 상태에서 호출)"""
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            for account_id in entry[0].accounts:
+                self._owners.pop(account_id, None)
+
+    def _stripe(self, key: str) -> int:
+        """키가 속한 구간 번호"""
+        return hash(key) % self.STRIPES
+
+
+# 전역 요약 캐시 인스턴스 (모든 매니저가 같은 캐시를 공유)
+_summary_cache: Optional[UserSummaryCache] = None
+
+
+def get_summary_cache() -> UserSummaryCache:
+    """
+    전역 사용자 계좌 요약 캐시 인스턴스 반환
+
+    Returns:
+        UserSummaryCache: 요약 캐시 객체
+    """
+    global _summary_cache
+    if _summary_cache is None:
+        _summary_cache = UserSummaryCache(
+            max_size=CACHE_CONFIG['summary_max_size'],
+            ttl=CACHE_CONFIG['summary_ttl']
+        )
+    return _summary_cache
@@ -0,0 +1,240 @@
+"""
+가입 정보 중복 확인 색인 클래스
+가입된 아이디/이메일/전화번호를 프로세스 메모리에 보관해 중복 확인 앞단에서 걸러냄
+(색인에 없는 값은 확실히 사용 중이 아니므로 DB를 조회하지 않음, 대량 가입 시 대부분의 확인이 DB에 가지 않음)
+
+- bloom: 블룸 필터 (사용자 수와 관계없이 작은 메모리, 오탐은 DB 조회로 확인)
+- set: 해시 집합 (오탐 없음, 값 개수만큼 메모리 사용)
+
+색인에 있다는 결과는 DB로 다시 확인하므로 삭제나 수정 전 값이 남아 있어도 결과는 정확하다.
+다른 프로세스에서 가입한 값은 색인에 없으므로, 여러 프로세스가 가입을 처리하면
+users 테이블의 기본키와 UNIQUE 제약(schema.sql의 uq_users_email/uq_users_phone)이 최종 확인을 맡고,
+저장이 제약에 걸리면 UserManager.save_user가 중복으로 알리고 값을 색인에 추가한다.
+"""
+
+import hashlib
+import math
+import threading
+from typing import Optional, Dict, Any
+from ..database import get_database_connection, SQLQueries, CACHE_CONFIG
+
+
+class UserKeyIndex:
+    """아이디/이메일/전화번호 존재 여부를 미리 거르는 메모리 색인 클래스 (스레드 안전)"""
+
+    # 색인하는 항목 (users 컬럼명)
+    FIELDS = ('user_id', 'user_email', 'user_phone')
+
+    MODES = ('bloom', 'set')
+
+    def __init__(self, mode: str = 'bloom', capacity: int = 100000, fp_rate: float = 0.01):
+        """
+        UserKeyIndex 초기화 (load()로 DB에서 적재)
+
+        Args:
+            mode: 색인 방식 ('bloom' 또는 'set')
+            capacity: 블룸 필터 최소 예상 사용자 수
+            fp_rate: 블룸 필터 목표 오탐률
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"알 수 없는 색인 방식: {mode} (가능: {', '.join(self.MODES)})")
+
+        self.mode = mode
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self._lock = threading.Lock()
+        self._keys = set()
+        self._bits = bytearray()
+        self._bit_count = 0
+        self._hash_count = 0
+        self._key_count = 0
+        self._key_capacity = 0
+        self._loaded = False
+        self._loading_keys = None  # 적재 중에 추가된 키 (적재가 끝나면 새 색인에 반영)
+
+        # 색인 통계
+        self.lookups = 0
+        self.negatives = 0  # 색인에 없어 DB 조회를 건너뛴 횟수
+
+    def load(self) -> int:
+        """
+        DB의 가입 정보로 색인을 다시 만듦 (블룸 필터는 현재 사용자 수에 맞춰 크기 결정)
+
+        Returns:
+            int: 적재한 사용자 수
+        """
+        db = get_database_connection()
+        with self._lock:
+            self._loading_keys = []
+
+        try:
+            users = db.execute_query(SQLQueries.COUNT_USERS)[0]['count']
+
+            keys = set()
+            bits = bytearray()
+            bit_count = hash_count = 0
+            key_capacity = max(self.capacity, users * 2) * len(self.FIELDS)
+
+            if self.mode == 'bloom':
+                bit_count = max(8, math.ceil(-key_capacity * math.log(self.fp_rate) / math.log(2) ** 2))
+                hash_count = max(1, round(bit_count / key_capacity * math.log(2)))
+                bits = bytearray((bit_count + 7) // 8)
+
+            count = 0
+            for row in db.iter_query(SQLQueries.SELECT_USER_KEYS):
+                for field in self.FIELDS:
+                    value = row[field]
+                    if not value:
+                        continue
+                    key = self._key(field, value)
+                    if self.mode == 'set':
+                        keys.add(key)
+                    else:
+                        for position in self._positions(key, bit_count, hash_count):
+                            bits[position >> 3] |= 1 << (position & 7)
+                count += 1
+        except Exception:
+            with self._lock:
+                self._loading_keys = None
+            raise
+
+        with self._lock:
+            self._keys = keys
+            self._bits = bits
+            self._bit_count = bit_count
+            self._hash_count = hash_count
+            self._key_count = count * len(self.FIELDS)
+            self._key_capacity = key_capacity
+            self._loaded = True
+
+            for key in self._loading_keys:
+                self._insert(key)
+            self._loading_keys = None
+        return count
+
+    def might_exist(self, field: str, value: str) -> bool:
+        """
+        값이 사용 중일 수 있는지 확인
+
+        Args:
+            field: 항목 ('user_id', 'user_email', 'user_phone')
+            value: 확인할 값
+
+        Returns:
+            bool: False면 확실히 사용 중이 아님, True면 DB로 확인 필요
+        """
+        if not self._loaded:
+            return True
+
+        key = self._key(field, value)
+        if self.mode == 'set':
+            found = key in self._keys
+        else:
+            bits = self._bits
+            found = all(bits[position >> 3] & (1 << (position & 7))
+                        for position in self._positions(key, self._bit_count, self._hash_count))
+
+        with self._lock:
+            self.lookups += 1
+            if not found:
+                self.negatives += 1
+        return found
+
+    def add_user(self, user_id: Optional[str] = None, user_email: Optional[str] = None,
+                 user_phone: Optional[str] = None):
+        """
+        가입하거나 수정한 사용자의 값을 색인에 추가 (수정 전 값은 남겨 두고 DB 확인에 맡김)
+
+        Args:
+            user_id: 사용자 ID
+            user_email: 이메일
+            user_phone: 전화번호
+        """
+        values = zip(self.FIELDS, (user_id, user_email, user_phone))
+        keys = [self._key(field, value) for field, value in values if value]
+
+        with self._lock:
+            if self._loading_keys is not None:
+                self._loading_keys.extend(keys)
+            if self._loaded:
+                for key in keys:
+                    self._insert(key)
+
+    def _insert(self, key: str):
+        """키를 현재 색인에 추가 (잠금을 잡은 상태에서 호출)"""
+        if self.mode == 'set':
+            self._keys.add(key)
+        else:
+            for position in self._positions(key, self._bit_count, self._hash_count):
+                self._bits[position >> 3] |= 1 << (position & 7)
+        self._key_count += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        색인 통계 조회
+
+        Returns:
+            Dict: 방식, 색인한 값 수, 메모리 크기(바이트, 블룸 필터), 조회 수, DB 조회를 건너뛴 비율,
+                  예상 오탐률 (블룸 필터, 색인한 값이 늘수록 증가)
+        """
+        with self._lock:
+            stats = {
+                'mode': self.mode,
+                'keys': self._key_count,
+                'lookups': self.lookups,
+                'negatives': self.negatives,
+                'negative_rate': self.negatives / self.lookups if self.lookups else 0.0
+            }
+            if self.mode == 'bloom' and self._bit_count:
+                stats['bytes'] = len(self._bits)
+                stats['capacity'] = self._key_capacity
+                stats['expected_fp_rate'] = (
+                    1 - math.exp(-self._hash_count * self._key_count / self._bit_count)
+                ) ** self._hash_count
+        return stats
+
+    @staticmethod
+    def _key(field: str, value: str) -> str:
+        """항목별로 구분한 색인 키"""
+        return f"{field}:{value}"
+
+    @staticmethod
+    def _positions(key: str, bit_count: int, hash_count: int):
+        """블룸 필터 비트 위치 (해시 두 개를 조합하는 이중 해싱)"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % bit_count for i in range(hash_count)]
+
+
+# 전역 중복 확인 색인 인스턴스 (CACHE_CONFIG['user_index']가 None이면 사용하지 않음)
+_user_key_index: Optional[UserKeyIndex] = None
+_user_key_index_lock = threading.Lock()
+
+
+def get_user_key_index() -> Optional[UserKeyIndex]:
+    """
+    전역 중복 확인 색인 인스턴스 반환 (처음 호출할 때 DB에서 적재)
+
+    Returns:
+        Optional[UserKeyIndex]: 색인 객체, 사용하지 않도록 설정되어 있으면 None
+    """
+    global _user_key_index
+    mode = CACHE_CONFIG.get('user_index')
+    if not mode:
+        return None
+
+    with _user_key_index_lock:
+        if _user_key_index is None:
+            index = UserKeyIndex(
+                mode=mode,
+                capacity=CACHE_CONFIG['user_index_capacity'],
+                fp_rate=CACHE_CONFIG['user_index_fp_rate']
+            )
+            try:
+                index.load()
+            except Exception as e:
+                # 적재하지 못한 색인은 모든 값을 DB로 확인
+                print(f"중복 확인 색인 적재 오류: {e}")
+            _user_key_index = index
+        return _user_key_index
@@ -0,0 +1,146 @@
+"""
+벡터화 이자 계산기 클래스
+NumPy 배열로 여러 계좌의 이자를 한 번에 계산 (월말 일괄 지급, 이자율 변경 시뮬레이션용)
+"""
+
+from datetime import datetime
+from typing import Optional, Sequence, Dict
+import numpy as np
+
+
+class VectorizedInterestCalculator:
+    """계좌 배열 단위로 이자를 계산하는 클래스 (InterestCalculator의 배열 버전)"""
+
+    @staticmethod
+    def calculate_days(last_interest_dates: Sequence[datetime],
+                       current_date: Optional[datetime] = None) -> np.ndarray:
+        """
+        마지막 이자 지급일부터 기준일까지의 경과 일수 계산
+
+        Args:
+            last_interest_dates: 마지막 이자 지급일 배열
+            current_date: 기준일 (기본값: 현재 시각)
+
+        Returns:
+            np.ndarray: 경과 일수 배열 (int64)
+        """
+        current_date = current_date or datetime.now()
+
+        # 시각은 버리고 날짜 단위로 계산 (InterestCalculator.calculate_days_between과 동일)
+        last_days = np.asarray(last_interest_dates, dtype='datetime64[us]').astype('datetime64[D]')
+        current_day = np.datetime64(current_date, 'us').astype('datetime64[D]')
+
+        return (current_day - last_days).astype(np.int64)
+
+    @staticmethod
+    def calculate_interest(principals: Sequence[float], annual_rates: Sequence[float],
+                           days: Sequence[int]) -> np.ndarray:
+        """
+        이자 일괄 계산
+        공식: (원금 × 연이자율 × 경과일수) ÷ 365
+
+        Args:
+            principals: 원금 배열
+            annual_rates: 연이자율 배열
+            days: 경과 일수 배열
+
+        Returns:
+            np.ndarray: 이자 금액 배열 (원 단위 이하 반올림, 대상이 아니면 0)
+        """
+        principals = np.asarray(principals, dtype=np.float64)
+        annual_rates = np.asarray(annual_rates, dtype=np.float64)
+        days = np.asarray(days, dtype=np.int64)
+
+        eligible = (principals > 0) & (annual_rates > 0) & (days > 0)
+        interest = (principals * annual_rates * days) / 365.0
+
+        # np.rint는 round()와 같이 0.5를 짝수 쪽으로 반올림
+        return np.where(eligible, np.rint(interest), 0.0)
+
+    @staticmethod
+    def summarize_by_type(account_types: Sequence[str], interest_amounts: Sequence[float]) -> dict:
+        """
+        계좌 종류별 이자 집계 (InterestCalculator.get_interest_summary와 같은 형식)
+
+        Args:
+            account_types: 계좌 종류 배열
+            interest_amounts: 이자 금액 배열
+
+        Returns:
+            dict: 이자 지급 요약 정보
+        """
+        interest_amounts = np.asarray(interest_amounts, dtype=np.float64)
+
+        if interest_amounts.size == 0:
+            return {
+                'total_accounts': 0,
+                'total_amount': 0,
+                'by_type': {}
+            }
+
+        types, inverse = np.unique(np.asarray(account_types, dtype=object), return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(types))
+        amounts = np.bincount(inverse, weights=interest_amounts, minlength=len(types))
+
+        return {
+            'total_accounts': int(interest_amounts.size),
+            'total_amount': float(interest_amounts.sum()),
+            'by_type': {
+                account_type: {'count': int(count), 'amount': float(amount)}
+                for account_type, count, amount in zip(types, counts, amounts)
+            }
+        }
+
+    @classmethod
+    def calculate(cls, balances: Sequence[float], annual_rates: Sequence[float],
+                  last_interest_dates: Sequence[datetime], account_types: Sequence[str],
+                  current_date: Optional[datetime] = None) -> Dict[str, object]:
+        """
+        계좌 배열의 이자 계산 및 계좌 종류별 집계
+
+        Args:
+            balances: 잔액 배열
+            annual_rates: 연이자율 배열
+            last_interest_dates: 마지막 이자 지급일 배열
+            account_types: 계좌 종류 배열
+            current_date: 기준일 (기본값: 현재 시각)
+
+        Returns:
+            dict: days(경과 일수 배열), interest(이자 배열), summary(이자가 있는 계좌 기준 요약)
+        """
+        days = cls.calculate_days(last_interest_dates, current_date)
+        interest = cls.calculate_interest(balances, annual_rates, days)
+
+        paid = interest > 0
+        account_types = np.asarray(account_types, dtype=object)
+
+        return {
+            'days': days,
+            'interest': interest,
+            'summary': cls.summarize_by_type(account_types[paid], interest[paid])
+        }
+
+    @classmethod
+    def simulate_rate_change(cls, balances: Sequence[float], account_types: Sequence[str],
+                             days: Sequence[int], rate_by_type: Dict[str, float]) -> dict:
+        """
+        계좌 종류별 이자율을 바꿨을 때의 지급 예상액 계산 (DB 변경 없음)
+
+        Args:
+            balances: 잔액 배열
+            account_types: 계좌 종류 배열
+            days: 경과 일수 배열
+            rate_by_type: 계좌 종류별 새 연이자율 (예: {"적금": 0.025})
+
+        Returns:
+            dict: 새 이자율 기준 이자 지급 요약 정보
+        """
+        account_types = np.asarray(account_types, dtype=object)
+        rates = np.zeros(account_types.size, dtype=np.float64)
+        for account_type, rate in rate_by_type.items():
+            rates[account_types == account_type] = rate
+
+        interest = cls.calculate_interest(balances, rates, days)
+        paid = interest > 0
+
+        return cls.summarize_by_type(account_types[paid], interest[paid])
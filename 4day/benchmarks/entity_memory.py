@@ -0,0 +1,94 @@
+"""
+엔티티 메모리 벤치마크
+Transaction 객체 N개(기본 100만 개)를 만들 때의 메모리 사용량을
+__dict__ 기반 dataclass(변경 전)와 __slots__ dataclass(현재)로 비교
+
+실행: python benchmarks/entity_memory.py [개수]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+sys.path.insert(0, __file__.rsplit('benchmarks', 1)[0])
+
+from bank_system.entities.transaction import Transaction
+
+
+@dataclass
+class LegacyTransaction:
+    """변경 전 Transaction과 같은 구조 (__dict__ 사용, 생성 시 __post_init__ 호출)"""
+
+    transaction_id: str
+    account_id: str
+    transaction_type: str
+    amount: float
+    balance_after: float
+    counterpart_account: Optional[str] = None
+    counterpart_name: Optional[str] = None
+    depositor_name: Optional[str] = None
+    transaction_memo: Optional[str] = None
+    transaction_date: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.transaction_date is None:
+            self.transaction_date = datetime.now()
+
+
+def make_rows(count: int) -> list:
+    """DB 조회 결과와 같은 컬럼 순서의 튜플 생성 (문자열/날짜는 공유해 객체 자체 크기만 측정)"""
+    date = datetime(2024, 1, 1, 12, 0, 0)
+    return [
+        ("T00000001", date, "110-234-000001", "입금", 1000.0, 5000.0,
+         None, None, "홍길동", "입금 - 홍길동")
+        for _ in range(count)
+    ]
+
+
+def measure(label: str, rows: list, build) -> float:
+    """rows로 객체 리스트를 만들 때 늘어난 메모리와 시간 측정"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    objects = [build(row) for row in rows]
+
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_object = current / len(objects)
+    print(f"{label:<28} {current / 1024 / 1024:>10.1f} MB {per_object:>10.1f} B/객체 {elapsed:>8.2f} 초")
+
+    del objects
+    return per_object
+
+
+def legacy_from_row(row: tuple) -> LegacyTransaction:
+    """변경 전 방식: 생성자를 거쳐 객체 생성"""
+    (transaction_id, transaction_date, account_id, transaction_type, amount,
+     balance_after, counterpart_account, counterpart_name, depositor_name, transaction_memo) = row
+    return LegacyTransaction(transaction_id, account_id, transaction_type, amount, balance_after,
+                             counterpart_account, counterpart_name, depositor_name,
+                             transaction_memo, transaction_date)
+
+
+def main():
+    """벤치마크 실행"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = make_rows(count)
+
+    print(f"\n[Transaction 객체 {count:,}개 메모리 비교]")
+    print("=" * 80)
+    before = measure("변경 전 (__dict__)", rows, legacy_from_row)
+    after = measure("현재 (__slots__, from_row)", rows, lambda row: Transaction.from_row(*row))
+    print("=" * 80)
+    print(f"객체당 메모리: {before:.1f} B -> {after:.1f} B ({(1 - after / before) * 100:.0f}% 감소)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+"""
+은행 핵심 기능 부하 벤치마크
+사용자/계좌 N개를 만든 뒤 M개의 작업 스레드(또는 프로세스)로 입금/출금/이체를
+지정한 비율로 실행하고, 작업별 지연 시간(p50/p95/p99), TPS, 작업당 DB 왕복 횟수를 출력
+마지막으로 전체 계좌 이자 지급 처리량과 원장 대사 처리량(불일치 0건이어야 함)도 측정
+
+기본값은 임시 SQLite DB(WAL)를 사용하므로 Oracle 없이 CI에서도 실행 가능
+(faker가 설치되어 있으면 한국어 이름으로 사용자 생성)
+
+실행: python benchmarks/load_benchmark.py --users 1000 --workers 8 --ops 500
+      python benchmarks/load_benchmark.py --mode process --mix deposit=40,withdraw=20,transfer=40
+      python benchmarks/load_benchmark.py --mode async --workers 200  (이벤트 루프 하나에서 200개 태스크)
+      python benchmarks/load_benchmark.py --backend oracle   (DATABASE_CONFIG의 Oracle에 실행)
+      python benchmarks/load_benchmark.py --ledger           (거래 원장 그룹 커밋 사용)
+      python benchmarks/load_benchmark.py --interest-workers 4  (이자 병렬 지급)
+      python benchmarks/load_benchmark.py --reconcile-workers 4 (원장 병렬 대사)
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple, Optional
+
+sys.path.insert(0, __file__.rsplit('benchmarks', 1)[0])
+
+from bank_system.database import (configure_database_connection, close_database_connection, SQLQueries,
+                                  open_async_database_connection, close_async_database_connection)
+from bank_system.entities.account import Account
+from bank_system.entities.transaction import Transaction
+from bank_system.entities.user import User
+from bank_system.managers.account_manager import AccountManager
+from bank_system.managers.admin_manager import AdminManager
+from bank_system.managers.async_transaction_manager import AsyncTransactionManager
+from bank_system.managers.reconciliation_manager import ReconciliationManager
+from bank_system.managers.transaction_manager import TransactionManager
+from bank_system.utils.bank_utils import BankUtils
+from bank_system.utils.interest_calculator import InterestCalculator
+from bank_system.utils.ledger_writer import get_ledger_writer, close_ledger_writer
+
+try:
+    from faker import Faker
+except ImportError:  # faker 없이도 실행 가능
+    Faker = None
+
+
+OPERATIONS = ('deposit', 'withdraw', 'transfer')
+ACCOUNT_TYPES = ('보통예금', '정기예금', '적금')
+INITIAL_BALANCE = 10_000_000
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    """'deposit=50,withdraw=20,transfer=30' 형식의 작업 비율 파싱"""
+    mix = {}
+    for item in text.split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 작업: {name} (가능: {', '.join(OPERATIONS)})")
+        mix[name] = int(weight)
+    return mix
+
+
+def connect(backend: str, db_path: str):
+    """벤치마크용 전역 DB 연결 설정"""
+    options = {'path': db_path} if backend == 'sqlite' else {}
+    return configure_database_connection(backend, **options)
+
+
+def seed(db, users: int, accounts_per_user: int) -> List[str]:
+    """
+    사용자와 계좌를 일괄 생성 (executemany, 계좌 개설 입금 거래도 함께 기록)
+
+    Returns:
+        List[str]: 생성한 계좌번호 리스트
+    """
+    fake = Faker('ko_KR') if Faker else None
+    now = datetime.now()
+    last_interest_date = now - timedelta(days=31)  # 이자 지급 대상이 되도록 한 달 전
+    run_id = now.strftime('%H%M%S')  # 같은 DB에 반복 실행해도 ID가 겹치지 않도록
+    phone_base = int(now.timestamp()) * 1000
+
+    user_rows = []
+    for i in range(users):
+        user = User(
+            user_id=f"b{run_id}{i:06d}",
+            user_name=fake.name() if fake else f"사용자{i}",
+            user_password="bench1234",
+            user_email=f"b{run_id}{i:06d}@bench.example.com",
+            user_phone="010-{0:04d}-{1:04d}".format(*divmod((phone_base + i) % 10 ** 8, 10000)),
+            join_date=now
+        )
+        user_rows.append(user.to_dict())
+
+    account_ids = BankUtils.generate_account_numbers(users * accounts_per_user)
+    account_rows = []
+    for index, account_id in enumerate(account_ids):
+        account_type = ACCOUNT_TYPES[index % len(ACCOUNT_TYPES)]
+        account = Account(
+            account_id=account_id,
+            account_name=f"벤치{index}",
+            account_type=account_type,
+            account_password="1234",
+            balance=INITIAL_BALANCE,
+            user_id=user_rows[index // accounts_per_user]['user_id'],
+            create_date=now,
+            interest_rate=InterestCalculator.get_interest_rate_by_type(account_type),
+            last_interest_date=last_interest_date
+        )
+        account_rows.append(account.to_dict())
+
+    deposit_rows = []
+    for account_id, transaction_id in zip(account_ids, BankUtils.generate_transaction_ids(len(account_ids))):
+        deposit = Transaction.create_deposit_withdrawal(
+            transaction_id=transaction_id,
+            account_id=account_id,
+            transaction_type="입금",
+            amount=INITIAL_BALANCE,
+            balance_after=INITIAL_BALANCE
+        )
+        deposit.transaction_memo = "계좌 개설"
+        deposit_rows.append(deposit.to_dict())
+
+    with db.transaction():
+        db.execute_many(SQLQueries.INSERT_USER, user_rows)
+        db.execute_many(SQLQueries.INSERT_ACCOUNT, account_rows)
+        db.execute_many(SQLQueries.INSERT_TRANSACTION, deposit_rows)
+
+    return account_ids
+
+
+def run_operations(account_ids: List[str], mix: Dict[str, int], ops: int,
+                   seed_value: int, transaction_manager: TransactionManager
+                   ) -> Dict[str, List[Tuple[float, int, bool]]]:
+    """
+    작업을 ops번 실행하고 작업별 (지연 시간, DB 왕복 횟수, 성공 여부) 기록
+    (왕복 횟수는 현재 스레드 기준이므로 원장 기록기를 쓰면 0, 이때는 전체 왕복 횟수를 따로 측정)
+
+    Args:
+        account_ids: 대상 계좌번호
+        mix: 작업별 비율
+        ops: 실행할 작업 수
+        seed_value: 난수 시드 (작업자마다 다르게)
+        transaction_manager: 거래 매니저
+    """
+    rng = random.Random(seed_value)
+    db = transaction_manager.db
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    results = {name: [] for name in names}
+
+    for name in rng.choices(names, weights, k=ops):
+        amount = rng.randrange(1000, 50000, 1000)
+        account_id = rng.choice(account_ids)
+
+        before = db.get_round_trip_count()
+        start = time.perf_counter()
+
+        if name == 'deposit':
+            ok = transaction_manager.process_deposit(account_id, amount, "벤치마크")
+        elif name == 'withdraw':
+            ok = transaction_manager.process_withdraw(account_id, amount)
+        else:
+            to_account_id = rng.choice(account_ids)
+            while to_account_id == account_id and len(account_ids) > 1:
+                to_account_id = rng.choice(account_ids)
+            ok = transaction_manager.process_transfer(account_id, to_account_id, amount)
+
+        elapsed = time.perf_counter() - start
+        results[name].append((elapsed, db.get_round_trip_count() - before, ok))
+
+    return results
+
+
+async def run_operations_async(account_ids: List[str], mix: Dict[str, int], ops: int, seed_value: int,
+                               transaction_manager: AsyncTransactionManager
+                               ) -> Dict[str, List[Tuple[float, int, bool]]]:
+    """run_operations의 비동기 버전 (태스크 하나가 작업을 차례로 실행, 태스크끼리는 동시에 진행)"""
+    rng = random.Random(seed_value)
+    db = transaction_manager.db
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    results = {name: [] for name in names}
+
+    for name in rng.choices(names, weights, k=ops):
+        amount = rng.randrange(1000, 50000, 1000)
+        account_id = rng.choice(account_ids)
+
+        before = db.get_round_trip_count()
+        start = time.perf_counter()
+
+        if name == 'deposit':
+            ok = await transaction_manager.process_deposit(account_id, amount, "벤치마크")
+        elif name == 'withdraw':
+            ok = await transaction_manager.process_withdraw(account_id, amount)
+        else:
+            to_account_id = rng.choice(account_ids)
+            while to_account_id == account_id and len(account_ids) > 1:
+                to_account_id = rng.choice(account_ids)
+            ok = await transaction_manager.process_transfer(account_id, to_account_id, amount)
+
+        elapsed = time.perf_counter() - start
+        results[name].append((elapsed, db.get_round_trip_count() - before, ok))
+
+    return results
+
+
+async def async_workers(backend: str, db_path: str, account_ids: List[str], mix: Dict[str, int],
+                        ops: int, seed_value: int, tasks: int) -> Dict[str, List[Tuple[float, int, bool]]]:
+    """비동기 모드 작업자 (이벤트 루프 하나에서 tasks개의 태스크가 비동기 세션 풀을 공유)"""
+    options = {'path': db_path} if backend == 'sqlite' else {}
+    await open_async_database_connection(backend, **options)
+    try:
+        transaction_manager = AsyncTransactionManager()
+        worker_results = await asyncio.gather(*(
+            run_operations_async(account_ids, mix, ops, seed_value + task, transaction_manager)
+            for task in range(tasks)
+        ))
+    finally:
+        await close_async_database_connection()
+
+    results: Dict[str, list] = {}
+    for worker_result in worker_results:
+        merge_results(results, worker_result)
+    return results
+
+
+def build_managers(use_ledger: bool = False) -> TransactionManager:
+    """BankSystem과 같은 방식으로 매니저 연결"""
+    transaction_manager = TransactionManager(use_ledger=use_ledger)
+    account_manager = AccountManager(transaction_manager=transaction_manager)
+    transaction_manager.set_account_manager(account_manager)
+    return transaction_manager
+
+
+def process_worker(backend: str, db_path: str, account_ids: List[str], mix: Dict[str, int],
+                   ops: int, seed_value: int, use_ledger: bool
+                   ) -> Tuple[Dict[str, List[Tuple[float, int, bool]]], Optional[int]]:
+    """
+    프로세스 모드 작업자 (spawn으로 시작한 프로세스마다 새로 연결)
+
+    Returns:
+        Tuple: 작업별 기록, 원장 기록기를 쓰면 프로세스 전체 DB 왕복 횟수 (아니면 None)
+    """
+    db = connect(backend, db_path)
+    try:
+        transaction_manager = build_managers(use_ledger)
+        before = db.get_round_trip_count(current_thread_only=False)
+        results = run_operations(account_ids, mix, ops, seed_value, transaction_manager)
+        if not transaction_manager.use_ledger:
+            return results, None
+        close_ledger_writer()   # 남은 그룹을 커밋한 뒤 집계
+        return results, db.get_round_trip_count(current_thread_only=False) - before
+    finally:
+        close_ledger_writer()
+        close_database_connection()
+
+
+def merge_results(target: Dict[str, list], source: Dict[str, list]):
+    """작업자별 결과 합치기"""
+    for name, samples in source.items():
+        target.setdefault(name, []).extend(samples)
+
+
+def percentile_ms(latencies: List[float], q: int) -> float:
+    """지연 시간 백분위수 (밀리초)"""
+    if len(latencies) == 1:
+        return latencies[0] * 1000
+    return statistics.quantiles(latencies, n=100, method='inclusive')[q - 1] * 1000
+
+
+def print_report(results: Dict[str, list], elapsed: float, workers: int, mode: str,
+                 total_round_trips: Optional[int] = None):
+    """
+    작업별 지연 시간, TPS, 왕복 횟수 출력
+
+    total_round_trips가 있으면(원장 기록기 사용) 작업별 왕복 횟수는 나눌 수 없으므로
+    전체 왕복 횟수를 전체 작업 수로 나눈 값만 출력
+    """
+    total_ok = sum(ok for samples in results.values() for _, _, ok in samples)
+    total = sum(len(samples) for samples in results.values())
+
+    print(f"\n[거래 부하 결과] 작업자 {workers}개 ({mode}), {elapsed:.2f}초")
+    print("=" * 100)
+    print(f"{'작업':<10} {'건수':>8} {'실패':>6} {'TPS':>10} {'p50(ms)':>10} {'p95(ms)':>10} "
+          f"{'p99(ms)':>10} {'왕복/건':>8}")
+    print("-" * 100)
+
+    for name, samples in results.items():
+        if not samples:
+            continue
+        latencies = [latency for latency, _, _ in samples]
+        failures = sum(1 for _, _, ok in samples if not ok)
+        if total_round_trips is None:
+            round_trips = f"{sum(trips for _, trips, _ in samples) / len(samples):>8.1f}"
+        else:
+            round_trips = f"{'-':>8}"
+        print(f"{name:<10} {len(samples):>8,} {failures:>6,} {(len(samples) - failures) / elapsed:>10,.1f} "
+              f"{percentile_ms(latencies, 50):>10.2f} {percentile_ms(latencies, 95):>10.2f} "
+              f"{percentile_ms(latencies, 99):>10.2f} {round_trips}")
+
+    print("-" * 100)
+    total_line = f"{'전체':<10} {total:>8,} {total - total_ok:>6,} {total_ok / elapsed:>10,.1f}"
+    if total_round_trips is not None and total:
+        total_line += f" {'':>10} {'':>10} {'':>10} {total_round_trips / total:>8.1f}"
+    print(total_line)
+    print("=" * 100)
+
+
+def benchmark_interest(db, workers: int = 1):
+    """전체 계좌 이자 지급 처리량 측정 (입출금한 계좌는 마지막 이자 지급일이 갱신되어 제외됨)"""
+    admin_manager = AdminManager()
+    admin_id = f"BENCH{datetime.now():%H%M%S}"
+
+    before = db.get_round_trip_count()
+    start = time.perf_counter()
+    paid = admin_manager.execute_interest_payment(admin_id, confirm=False, workers=workers)
+    elapsed = time.perf_counter() - start
+    # 병렬 지급이면 구간 지급은 작업 프로세스에서 왕복하므로 구간 결과의 왕복 횟수를 더함
+    round_trips = db.get_round_trip_count() - before
+    round_trips += sum(result['worker_round_trips'] for result in admin_manager.last_interest_results)
+
+    paid_count = db.execute_query(SQLQueries.COUNT_INTEREST_PAYMENTS_BY_ADMIN, {'admin_id': admin_id})[0]['count']
+
+    print(f"\n[이자 지급 결과]")
+    print("=" * 100)
+    print(f"성공 여부: {paid}, 지급 계좌 {paid_count:,}개, {elapsed:.2f}초, "
+          f"{paid_count / elapsed:,.1f} 계좌/초, DB 왕복 {round_trips:,}회 (작업 프로세스 포함)")
+    print("=" * 100)
+
+
+def benchmark_reconcile(workers: int = 1):
+    """원장 대사 처리량 측정 (벤치마크 거래는 모두 정상 처리되므로 불일치가 0건이어야 함)"""
+    path = os.path.join(tempfile.mkdtemp(prefix='bank_reconcile_'), 'reconcile.csv')
+    result = ReconciliationManager(workers).run(path)
+
+    print(f"\n[원장 대사 결과] 작업 프로세스 {workers}개")
+    print("=" * 100)
+    ReconciliationManager.print_result(result)
+    print("=" * 100)
+
+
+def main():
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="은행 핵심 기능 부하 벤치마크")
+    parser.add_argument('--backend', choices=['sqlite', 'oracle'], default='sqlite')
+    parser.add_argument('--db', default=None, help="SQLite DB 파일 (기본값: 임시 파일)")
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--accounts-per-user', type=int, default=2)
+    parser.add_argument('--workers', type=int, default=8, help="작업 스레드/프로세스 수 (async 모드는 태스크 수)")
+    parser.add_argument('--mode', choices=['thread', 'process', 'async'], default='thread')
+    parser.add_argument('--ops', type=int, default=500, help="작업자당 작업 수")
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('deposit=40,withdraw=20,transfer=40'))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip-interest', action='store_true', help="이자 지급 측정 생략")
+    parser.add_argument('--ledger', action='store_true', help="거래 원장 그룹 커밋 사용")
+    parser.add_argument('--interest-workers', type=int, default=1, help="이자 지급 작업 프로세스 수 (2 이상이면 병렬 지급)")
+    parser.add_argument('--skip-reconcile', action='store_true', help="원장 대사 측정 생략")
+    parser.add_argument('--reconcile-workers', type=int, default=1, help="원장 대사 작업 프로세스 수 (2 이상이면 병렬 대사)")
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix='bank_bench_'), 'bench.db')
+    db = connect(args.backend, db_path)
+    print(f"백엔드: {db.backend.name}" + (f" ({db_path})" if args.backend == 'sqlite' else ""))
+
+    start = time.perf_counter()
+    account_ids = seed(db, args.users, args.accounts_per_user)
+    print(f"사용자 {args.users:,}명, 계좌 {len(account_ids):,}개 생성: {time.perf_counter() - start:.2f}초")
+
+    results: Dict[str, list] = {}
+    total_round_trips = None    # 원장 기록기 사용 시 전체 DB 왕복 횟수 (작업 스레드가 아닌 기록 스레드에서 왕복)
+    start = time.perf_counter()
+
+    if args.mode == 'thread':
+        transaction_manager = build_managers(args.ledger)
+        before = db.get_round_trip_count(current_thread_only=False)
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = [
+                executor.submit(run_operations, account_ids, args.mix, args.ops,
+                                args.seed + worker, transaction_manager)
+                for worker in range(args.workers)
+            ]
+            for future in futures:
+                merge_results(results, future.result())
+        if transaction_manager.use_ledger:
+            total_round_trips = db.get_round_trip_count(current_thread_only=False) - before
+    elif args.mode == 'async':
+        results = asyncio.run(async_workers(args.backend, db_path, account_ids, args.mix,
+                                            args.ops, args.seed, args.workers))
+    else:
+        # 작업 프로세스는 부모의 DB 연결/예약된 ID 블록을 물려받지 않도록 spawn으로 시작 (각자 다시 연결)
+        with ProcessPoolExecutor(max_workers=args.workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = [
+                executor.submit(process_worker, args.backend, db_path, account_ids, args.mix,
+                                args.ops, args.seed + worker, args.ledger)
+                for worker in range(args.workers)
+            ]
+            for future in futures:
+                worker_results, worker_round_trips = future.result()
+                merge_results(results, worker_results)
+                if worker_round_trips is not None:
+                    total_round_trips = (total_round_trips or 0) + worker_round_trips
+
+    print_report(results, time.perf_counter() - start, args.workers, args.mode, total_round_trips)
+
+    if args.ledger and args.mode == 'thread':
+        stats = get_ledger_writer().get_stats()
+        print(f"원장 그룹 커밋: 그룹 {stats['groups']:,}개, 평균 {stats['avg_group_size']:.1f}건/그룹, "
+              f"거래 기록 {stats['records']:,}건, 실패 {stats['failed_units']:,}건")
+
+    if not args.skip_interest:
+        benchmark_interest(db, args.interest_workers)
+
+    close_ledger_writer()
+    if not args.skip_reconcile:
+        benchmark_reconcile(args.reconcile_workers)
+
+    close_database_connection()
+
+
+if __name__ == "__main__":
+    main()